@@ -1,12 +1,11 @@
 import base64
 import hashlib
 
-from redis.cluster import RedisCluster as Redis
-
 from app.auth.modes import SessionAuthMode, get_session_auth_mode
 from app.auth.sessions.abstract_session_store import AbstractSessionStore
 from app.auth.sessions.noop_session_store import NoopSessionStore
 from app.core.config import app_config
+from app.storage.redis_connection import get_redis_cluster
 
 
 # RedisSessionStore implements the session store with redis as a backend storage
@@ -14,8 +13,7 @@ from app.core.config import app_config
 class RedisSessionStore(AbstractSessionStore):
     def __init__(self, session_secret_key: str) -> None:
         self.session_secret_key = session_secret_key
-        redis_cli = Redis(host=app_config.redis_host, port=app_config.redis_port)
-        self.redis_cli = redis_cli
+        self.redis_cli = get_redis_cluster()
 
     def get_session_token(self, key: str, field: str) -> str:
         session_id = self.__get_session_key(key)
@@ -1,16 +1,43 @@
+import asyncio
+from typing import Optional
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from app.core.config import app_config
+from app.core.embedding_cache.client import EmbeddingCacheClient
+from app.core.embedding_cache.query_cache import QueryEmbeddingCache
 from app.core.log.logger import Logger
 from app.models.azure_openai_model import (
     GrabGPTOpenAIModel,
     get_azure_openai_embeddings_model,
 )
 
+RETRYABLE_EMBEDDING_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
 
 class EmbeddingModelClient:
     """
     Class wrapper for azure openai embedding model
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCacheClient] = None,
+        query_embedding_cache: Optional[QueryEmbeddingCache] = None,
+    ) -> None:
+        self.__embedding_cache = embedding_cache
+        self.__query_embedding_cache = query_embedding_cache
+        self.__model_name = str(GrabGPTOpenAIModel.ADA_002)
         self.__logger = Logger(name=self.__class__.__name__)
 
     def init(self, model: str, timeout: int = 300) -> None:
@@ -20,6 +47,7 @@ class EmbeddingModelClient:
         self.__model = get_azure_openai_embeddings_model(
             model_name=model, timeout=timeout
         )
+        self.__model_name = str(model)
 
     def check_model_attribute(self) -> bool:
         """
@@ -27,20 +55,127 @@ class EmbeddingModelClient:
         """
         return hasattr(self, "_EmbeddingModelClient__model")
 
-    def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> list[float]:
         """
         Use Default embedding model if not initialize (text-embedding-ada-002)
+        Repeated queries are served from the query embedding cache when one is provided.
         """
 
         try:
+            if self.__query_embedding_cache is not None:
+                cached_embedding = await self.__query_embedding_cache.get(
+                    self.__model_name, text
+                )
+                if cached_embedding is not None:
+                    return cached_embedding
+
             if not self.check_model_attribute():
                 self.__model = get_azure_openai_embeddings_model(
                     model_name=GrabGPTOpenAIModel.ADA_002
                 )
-            return self.__model.embed_query(text)
+            embedding = await self.__model.aembed_query(text)
+
+            if self.__query_embedding_cache is not None:
+                await self.__query_embedding_cache.put(
+                    self.__model_name, text, embedding
+                )
+
+            return embedding  # noqa: TRY300, the except block wraps every failure above
 
         except Exception as e:
             log_message = " ".join(["Error:", str(e)])
             self.__logger.exception(log_message)
             error_message = "Unable to embed with azure_open_ai_model"
             raise Exception(error_message) from e
+
+    async def embed_documents(
+        self,
+        texts: list[str],
+        batch_size: int = app_config.embedding_batch_size,
+        max_concurrency: int = app_config.embedding_max_concurrency,
+    ) -> list[list[float]]:
+        """
+        Embed texts in batches of `batch_size`, with at most `max_concurrency` batches in flight.
+        Only the batches that failed with a retryable error are retried, the output order follows `texts`.
+        When an embedding cache is provided, only the chunks whose content hash is not cached are sent to azure.
+        """
+        if len(texts) == 0:
+            return []
+
+        try:
+            if not self.check_model_attribute():
+                self.__model = get_azure_openai_embeddings_model(
+                    model_name=GrabGPTOpenAIModel.ADA_002
+                )
+
+            embeddings: list[Optional[list[float]]] = [None] * len(texts)
+            if self.__embedding_cache is not None:
+                embeddings = await self.__embedding_cache.get_embeddings(
+                    self.__model_name, texts
+                )
+
+            missing_indexes = [
+                index for index, embedding in enumerate(embeddings) if embedding is None
+            ]
+            if len(missing_indexes) == 0:
+                return embeddings
+
+            missing_texts = [texts[index] for index in missing_indexes]
+
+            batch_size = max(batch_size, 1)
+            batches = [
+                missing_texts[index : index + batch_size]
+                for index in range(0, len(missing_texts), batch_size)
+            ]
+
+            semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+            async def embed_batch(batch: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    return await self.__embed_batch_with_retry(batch)
+
+            new_embeddings = [
+                embedding
+                for embedded_batch in await asyncio.gather(
+                    *[embed_batch(batch) for batch in batches]
+                )
+                for embedding in embedded_batch
+            ]
+
+            for index, embedding in zip(missing_indexes, new_embeddings, strict=True):
+                embeddings[index] = embedding
+
+            if self.__embedding_cache is not None:
+                await self.__embedding_cache.put_embeddings(
+                    self.__model_name, missing_texts, new_embeddings
+                )
+
+            return embeddings  # noqa: TRY300, the except block wraps every failure above
+
+        except Exception as e:
+            log_message = " ".join(["Error:", str(e)])
+            self.__logger.exception(log_message)
+            error_message = "Unable to embed documents with azure_open_ai_model"
+            raise Exception(error_message) from e
+
+    async def __embed_batch_with_retry(self, batch: list[str]) -> list[list[float]]:
+        """
+        Retry a single batch with exponential backoff when azure throttles or the connection drops.
+        """
+        for attempt in range(app_config.embedding_max_retries):
+            try:
+                return await self.__model.aembed_documents(batch)
+            except RETRYABLE_EMBEDDING_ERRORS as e:  # noqa: PERF203, each attempt is awaited before the next one
+                backoff_seconds = app_config.embedding_retry_backoff_seconds * (
+                    2**attempt
+                )
+                self.__logger.warning(
+                    "Embedding batch of %s failed, retrying in %ss | Error: %s",
+                    len(batch),
+                    backoff_seconds,
+                    e,
+                )
+                await asyncio.sleep(backoff_seconds)
+
+        # the last attempt is not retried, its error is raised to the caller
+        return await self.__model.aembed_documents(batch)
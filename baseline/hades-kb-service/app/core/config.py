@@ -30,6 +30,23 @@ class AppConfig(BaseSettings):
     grabgpt_api_key: str = ""
     grabgpt_openai_api_version: str = ""
 
+    # Embedding batching
+    embedding_batch_size: int = 16
+    embedding_max_concurrency: int = 4
+    embedding_max_retries: int = 3
+    embedding_retry_backoff_seconds: float = 1.0
+    embedding_cache_lru_size: int = 10000
+    query_embedding_cache_size: int = 2048
+    query_embedding_cache_ttl_seconds: int = 3600
+    query_embedding_cache_redis_enabled: bool = False
+
+    # Background ingestion jobs
+    ingestion_job_max_workers: int = 4
+    ingestion_job_queue_size: int = 100
+    ingestion_job_poll_interval_seconds: float = 1.0
+    # status streams end after this long, the job keeps running and can still be polled by uuid
+    ingestion_job_stream_timeout_seconds: float = 3600.0
+
     # LangSmith / LangChain
     langchain_endpoint: str = ""
     langchain_api_key: str = ""
@@ -66,9 +83,21 @@ class AppConfig(BaseSettings):
 
     # Other settings
     knowledge_base_default_query_limit: int = 20
+    knowledge_base_default_top_k: int = 100
+
+    # pgvector ANN search
+    pgvector_hnsw_ef_search: int = 100
+    # searches with attribute filters drop index candidates after the scan, so they look at more of them
+    pgvector_hnsw_filtered_ef_search: int = 400
+    pgvector_ivfflat_probes: int = 10
 
     # S3
     s3_bucket_name: str = ""
+    s3_upload_max_workers: int = 8
+
+    # Uploaded file parsing
+    file_parser_max_workers: int = 4
+    file_parser_max_tasks_per_child: int = 50
 
     # rag document header
     document_rag_secret_key: str = ""
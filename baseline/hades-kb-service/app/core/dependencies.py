@@ -1,23 +1,45 @@
+from contextlib import AbstractAsyncContextManager
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.azure_em.client import EmbeddingModelClient
+from app.core.config import app_config
+from app.core.embedding_cache.client import EmbeddingCacheClient, EmbeddingLRUCache
+from app.core.embedding_cache.query_cache import QueryEmbeddingCache
+from app.core.ingestion_job.client import IngestionJobQueue
 from app.core.ragdocument.client import RagDocumentClient
 from app.core.ragslack.client import RagSlackClient
 from app.core.transformer.client import TransformerClient
 from app.core.transformer.text_splitter.client import TextSplitterClient
-from app.storage.connection import get_session
+from app.storage.connection import get_async_session
+from app.storage.embedding_cache_db.client import EmbeddingCacheDbClient
+from app.storage.ingestion_job_db.client import IngestionJobDbClient
 from app.storage.ragdocument_db.client import RagDocumentDbClient
 from app.storage.ragslack_db.client import RagSlackDbClient
+from app.storage.redis_connection import get_redis_cluster
 
 # Singleton
 text_splitter_client = TextSplitterClient()
 transformer_client = TransformerClient(text_splitter=text_splitter_client)
+embedding_lru_cache = EmbeddingLRUCache(max_size=app_config.embedding_cache_lru_size)
+query_embedding_cache = QueryEmbeddingCache(
+    max_size=app_config.query_embedding_cache_size,
+    ttl_seconds=app_config.query_embedding_cache_ttl_seconds,
+    redis_client=get_redis_cluster()
+    if app_config.query_embedding_cache_redis_enabled
+    else None,
+)
+ingestion_job_queue = IngestionJobQueue(
+    ingestion_job_db=IngestionJobDbClient(db_session=get_async_session),
+    max_workers=app_config.ingestion_job_max_workers,
+    max_queue_size=app_config.ingestion_job_queue_size,
+)
 
 
 # Scoped
-def get_db_session() -> Session:
-    return get_session()
+def get_db_session() -> AbstractAsyncContextManager[AsyncSession]:
+    return get_async_session()
 
 
 def get_ragslack_db_session() -> RagSlackDbClient:
@@ -28,14 +50,30 @@ def get_ragdocument_db_session() -> RagDocumentDbClient:
     return RagDocumentDbClient(db_session=get_db_session)
 
 
-def get_embedding_model() -> EmbeddingModelClient:
-    return EmbeddingModelClient()
+def get_embedding_cache() -> EmbeddingCacheClient:
+    return EmbeddingCacheClient(
+        embedding_cache_db=EmbeddingCacheDbClient(db_session=get_db_session),
+        lru_cache=embedding_lru_cache,
+    )
+
+
+def get_embedding_model(
+    embedding_cache: EmbeddingCacheClient = Depends(get_embedding_cache),
+) -> EmbeddingModelClient:
+    return EmbeddingModelClient(
+        embedding_cache=embedding_cache,
+        query_embedding_cache=query_embedding_cache,
+    )
 
 
 def get_transformer_singleton() -> TransformerClient:
     return transformer_client
 
 
+def get_ingestion_job_queue_singleton() -> IngestionJobQueue:
+    return ingestion_job_queue
+
+
 def get_ragslack(
     ragslack_db: RagSlackDbClient = Depends(get_ragslack_db_session),
     embedding_model: EmbeddingModelClient = Depends(get_embedding_model),
@@ -0,0 +1,107 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from app.core.log.logger import Logger
+from app.storage.embedding_cache_db.client import EmbeddingCacheDbClient
+
+
+def get_content_hash(text: str) -> str:
+    """
+    Hash of the chunk with whitespace collapsed, so re-uploads that only differ in spacing hit the cache
+    """
+    normalized_text = " ".join(text.split())
+    return hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingLRUCache:
+    """
+    Thread safe in-process LRU in front of the persistent embedding cache, keyed by (model, content hash)
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.__max_size = max_size
+        self.__entries: OrderedDict[Tuple[str, str], list[float]] = OrderedDict()
+        self.__lock = Lock()
+
+    def get_many(self, model: str, content_hashes: list[str]) -> Dict[str, list[float]]:
+        found: Dict[str, list[float]] = {}
+        with self.__lock:
+            for content_hash in content_hashes:
+                key = (model, content_hash)
+                if key in self.__entries:
+                    self.__entries.move_to_end(key)
+                    found[content_hash] = self.__entries[key]
+        return found
+
+    def put_many(self, model: str, embeddings: Dict[str, list[float]]) -> None:
+        if self.__max_size <= 0:
+            return
+
+        with self.__lock:
+            for content_hash, embedding in embeddings.items():
+                self.__entries[(model, content_hash)] = embedding
+                self.__entries.move_to_end((model, content_hash))
+
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+
+class EmbeddingCacheClient:
+    """
+    Two tier embedding cache: the in-process LRU is checked first, then the embedding_cache table.
+    Hits from the table are promoted into the LRU.
+    """
+
+    def __init__(
+        self,
+        embedding_cache_db: EmbeddingCacheDbClient,
+        lru_cache: EmbeddingLRUCache,
+    ) -> None:
+        self.__embedding_cache_db = embedding_cache_db
+        self.__lru_cache = lru_cache
+        self.__logger = Logger(name=self.__class__.__name__)
+
+    async def get_embeddings(
+        self, model: str, texts: list[str]
+    ) -> list[Optional[list[float]]]:
+        """
+        Return the cached embedding for every text, None for a miss. The output order follows `texts`.
+        """
+        content_hashes = [get_content_hash(text) for text in texts]
+
+        found = self.__lru_cache.get_many(model, content_hashes)
+
+        missing_hashes = list(
+            {
+                content_hash
+                for content_hash in content_hashes
+                if content_hash not in found
+            }
+        )
+        if len(missing_hashes) != 0:
+            found_in_db = await self.__embedding_cache_db.read_embeddings(
+                model, missing_hashes
+            )
+            self.__lru_cache.put_many(model, found_in_db)
+            found.update(found_in_db)
+
+        self.__logger.debug(
+            "Embedding cache hit %s/%s chunks for %s",
+            len(found),
+            len(set(content_hashes)),
+            model,
+        )
+
+        return [found.get(content_hash) for content_hash in content_hashes]
+
+    async def put_embeddings(
+        self, model: str, texts: list[str], embeddings: list[list[float]]
+    ) -> None:
+        new_embeddings = {
+            get_content_hash(text): embedding
+            for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        self.__lru_cache.put_many(model, new_embeddings)
+        await self.__embedding_cache_db.insert_embeddings(model, new_embeddings)
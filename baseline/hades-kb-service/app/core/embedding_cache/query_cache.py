@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import re
+import time
+from array import array
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+from datadog import statsd
+from redis.cluster import RedisCluster as Redis
+
+from app.core.log.logger import Logger
+
+QUERY_EMBEDDING_CACHE_METRIC = "hades_kb_service.query_embedding_cache"
+QUERY_EMBEDDING_REDIS_KEY_PREFIX = "hades_kb_service:query_embedding"
+
+
+def normalize_query(query: str) -> str:
+    """
+    Same normalization that the knowledge base search applies before embedding a query
+    """
+    query = query.lower()
+    return re.sub(r"\n+", "", query)
+
+
+class QueryEmbeddingCache:
+    """
+    Size and TTL bounded cache for query embeddings, keyed by (model, normalized query).
+    The in-process tier is always used, the redis tier is optional and shared by every worker.
+    Redis calls run in a worker thread since the cluster client is blocking.
+    Redis failures are logged and treated as a miss, they never fail the search.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: int,
+        redis_client: Optional[Redis] = None,
+    ) -> None:
+        self.__max_size = max_size
+        self.__ttl_seconds = ttl_seconds
+        self.__redis_client = redis_client
+        self.__entries: OrderedDict[Tuple[str, str], Tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+        self.__lock = Lock()
+        self.__logger = Logger(name=self.__class__.__name__)
+
+    async def get(self, model: str, query: str) -> Optional[list[float]]:
+        key = (model, normalize_query(query))
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                expire_at, embedding = entry
+                if expire_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__track(model, "hit", "memory")
+                    return embedding
+                del self.__entries[key]
+
+        if self.__redis_client is not None:
+            embedding = await asyncio.to_thread(self.__get_from_redis, key)
+            if embedding is not None:
+                self.__put_in_memory(key, embedding)
+                self.__track(model, "hit", "redis")
+                return embedding
+
+        self.__track(model, "miss", "none")
+        return None
+
+    async def put(self, model: str, query: str, embedding: list[float]) -> None:
+        key = (model, normalize_query(query))
+        self.__put_in_memory(key, embedding)
+
+        if self.__redis_client is not None:
+            try:
+                await asyncio.to_thread(
+                    self.__redis_client.setex,
+                    self.__get_redis_key(key),
+                    self.__ttl_seconds,
+                    array("d", embedding).tobytes(),
+                )
+            except Exception as e:  # noqa: BLE001, caching is best effort
+                self.__logger.warning(
+                    "Set query embedding to redis failed | Error: %s", e
+                )
+
+    def __put_in_memory(self, key: Tuple[str, str], embedding: list[float]) -> None:
+        if self.__max_size <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.__ttl_seconds, embedding)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def __get_from_redis(self, key: Tuple[str, str]) -> Optional[list[float]]:
+        try:
+            result = self.__redis_client.get(self.__get_redis_key(key))
+        except Exception as e:  # noqa: BLE001, caching is best effort
+            self.__logger.warning(
+                "Get query embedding from redis failed | Error: %s", e
+            )
+            self.__track(key[0], "error", "redis")
+            return None
+
+        if result is None:
+            return None
+
+        return array("d", result).tolist()
+
+    def __get_redis_key(self, key: Tuple[str, str]) -> str:
+        model, query = key
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return f"{QUERY_EMBEDDING_REDIS_KEY_PREFIX}:{model}:{query_hash}"
+
+    def __track(self, model: str, result: str, tier: str) -> None:
+        statsd.increment(
+            QUERY_EMBEDDING_CACHE_METRIC,
+            tags=[f"result:{result}", f"tier:{tier}", f"model:{model}"],
+        )
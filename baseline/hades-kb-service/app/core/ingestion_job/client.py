@@ -0,0 +1,239 @@
+import asyncio
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.log.logger import Logger
+from app.storage.ingestion_job_db.client import IngestionJobDbClient
+from app.storage.ingestion_job_db.constant import (
+    FINISHED_JOB_STATUSES,
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_SUCCEEDED,
+)
+from app.storage.ingestion_job_db.models import IngestionJob
+
+
+class IngestionJobCancelledError(Exception):
+    pass
+
+
+class IngestionJobProgress:
+    """
+    Handed to a running job to report chunk progress.
+    Raise IngestionJobCancelledError once the job is cancelled, also when it was cancelled from another worker process.
+    """
+
+    def __init__(
+        self,
+        job_uuid: str,
+        ingestion_job_db: IngestionJobDbClient,
+        on_update: Callable[[str], None],
+    ) -> None:
+        self.__job_uuid = job_uuid
+        self.__ingestion_job_db = ingestion_job_db
+        self.__on_update = on_update
+        self.__total_chunks = 0
+        self.__processed_chunks = 0
+
+    async def add_total_chunks(self, chunks: int) -> None:
+        self.__total_chunks += chunks
+        await self.__save()
+
+    async def add_processed_chunks(self, chunks: int) -> None:
+        self.__processed_chunks += chunks
+        await self.__save()
+
+    async def __save(self) -> None:
+        is_running = await self.__ingestion_job_db.update_job_progress(
+            self.__job_uuid, self.__total_chunks, self.__processed_chunks
+        )
+        self.__on_update(self.__job_uuid)
+
+        if not is_running:
+            error_message = f"ingestion job {self.__job_uuid} is cancelled"
+            raise IngestionJobCancelledError(error_message)
+
+
+IngestionJobRunner = Callable[[IngestionJobProgress], Awaitable[dict]]
+
+
+def is_job_finished(job: Optional[IngestionJob]) -> bool:
+    """
+    A job that no longer exists is finished as well, nothing will update it anymore.
+    """
+    return job is None or job.status in FINISHED_JOB_STATUSES
+
+
+class IngestionJobQueue:
+    """
+    Bounded background queue for document ingestion, served by `max_workers` asyncio tasks on the serving loop.
+    Jobs are decoupled from the request that submitted them, a client disconnect does not stop the ingestion.
+    The job status lives in the ingestion_job table so every worker process can report and cancel it.
+    The local files of a job are deleted once it is finished, cancelled while queued or interrupted by a shutdown.
+    """
+
+    def __init__(
+        self,
+        ingestion_job_db: IngestionJobDbClient,
+        max_workers: int,
+        max_queue_size: int,
+    ) -> None:
+        self.__ingestion_job_db = ingestion_job_db
+        self.__max_workers = max(max_workers, 1)
+        self.__queue: asyncio.Queue[Tuple[str, IngestionJobRunner]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.__workers: list[asyncio.Task] = []
+        self.__running_jobs: Dict[str, asyncio.Task] = {}
+        self.__job_updated: Dict[str, asyncio.Event] = {}
+        self.__job_waiters: Dict[str, int] = {}
+        self.__job_files: Dict[str, list[str]] = {}
+        self.__logger = Logger(name=self.__class__.__name__)
+
+    def start(self) -> None:
+        if len(self.__workers) != 0:
+            return
+
+        self.__workers = [
+            asyncio.create_task(self.__work(), name=f"ingestion_job_worker_{index}")
+            for index in range(self.__max_workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Cancel the running jobs and fail them together with the jobs still queued,
+        their runners only live in this process so no other worker can pick them up.
+        """
+        interrupted_jobs = list(self.__running_jobs)
+        for task in [*self.__running_jobs.values(), *self.__workers]:
+            task.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+        self.__workers = []
+
+        while not self.__queue.empty():
+            job_uuid, _ = self.__queue.get_nowait()
+            interrupted_jobs.append(job_uuid)
+            self.__queue.task_done()
+
+        for job_uuid in interrupted_jobs:
+            self.__delete_job_files(job_uuid)
+            await self.__ingestion_job_db.finish_job(
+                job_uuid, JOB_STATUS_FAILED, error="interrupted by service shutdown"
+            )
+
+    async def submit(
+        self,
+        job_type: str,
+        runner: IngestionJobRunner,
+        local_file_paths: Sequence[str] = (),
+    ) -> IngestionJob:
+        """
+        `local_file_paths` are the local files read by the runner, e.g. the copies of the uploads,
+        they are deleted by the queue once nothing will run the job anymore.
+        """
+        job = await self.__ingestion_job_db.create_job(job_type)
+        self.__job_files[job.uuid] = list(local_file_paths)
+
+        try:
+            self.__queue.put_nowait((job.uuid, runner))
+        except asyncio.QueueFull as e:
+            self.__delete_job_files(job.uuid)
+            error_message = "ingestion job queue is full, please retry later"
+            await self.__ingestion_job_db.finish_job(
+                job.uuid, JOB_STATUS_FAILED, error=error_message
+            )
+            raise Exception(error_message) from e
+
+        return job
+
+    async def get_job(self, job_uuid: str) -> Optional[IngestionJob]:
+        return await self.__ingestion_job_db.get_job(job_uuid)
+
+    async def cancel(self, job_uuid: str) -> bool:
+        is_cancelled = await self.__ingestion_job_db.cancel_job(job_uuid)
+
+        # a job running in another process stops at its next progress update
+        running_job = self.__running_jobs.get(job_uuid)
+        if is_cancelled and running_job is not None:
+            running_job.cancel()
+        elif is_cancelled:
+            # still queued, the worker skips it
+            self.__delete_job_files(job_uuid)
+
+        self.__notify(job_uuid)
+        return is_cancelled
+
+    async def wait_for_update(self, job_uuid: str, timeout: float) -> None:
+        """
+        Return on the next status or progress change made in this process, or after `timeout` seconds.
+        """
+        event = self.__job_updated.setdefault(job_uuid, asyncio.Event())
+        self.__job_waiters[job_uuid] = self.__job_waiters.get(job_uuid, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.__job_waiters[job_uuid] -= 1
+            if self.__job_waiters[job_uuid] == 0:
+                del self.__job_waiters[job_uuid]
+                if self.__job_updated.get(job_uuid) is event:
+                    del self.__job_updated[job_uuid]
+
+    def __delete_job_files(self, job_uuid: str) -> None:
+        for local_file_path in self.__job_files.pop(job_uuid, []):
+            Path(local_file_path).unlink(missing_ok=True)
+
+    def __notify(self, job_uuid: str) -> None:
+        event = self.__job_updated.pop(job_uuid, None)
+        if event is not None:
+            event.set()
+
+    async def __work(self) -> None:
+        while True:
+            job_uuid, runner = await self.__queue.get()
+            try:
+                await self.__run(job_uuid, runner)
+            except Exception as e:  # a failed job must not stop the worker
+                description = f"ingestion job {job_uuid} failed"
+                log_message = f"Description: {description} |Error: {e!s}"
+                self.__logger.exception(log_message)
+            finally:
+                self.__running_jobs.pop(job_uuid, None)
+                self.__delete_job_files(job_uuid)
+                self.__notify(job_uuid)
+                self.__queue.task_done()
+
+    async def __run(self, job_uuid: str, runner: IngestionJobRunner) -> None:
+        # cancelled while it was still queued
+        if not await self.__ingestion_job_db.mark_job_running(job_uuid):
+            return
+        self.__notify(job_uuid)
+
+        progress = IngestionJobProgress(
+            job_uuid=job_uuid,
+            ingestion_job_db=self.__ingestion_job_db,
+            on_update=self.__notify,
+        )
+        task = asyncio.create_task(runner(progress))
+        self.__running_jobs[job_uuid] = task
+        await asyncio.wait([task])
+
+        if task.cancelled():
+            await self.__ingestion_job_db.finish_job(job_uuid, JOB_STATUS_CANCELLED)
+            return
+
+        error = task.exception()
+        if isinstance(error, IngestionJobCancelledError):
+            return
+
+        if error is not None:
+            await self.__ingestion_job_db.finish_job(
+                job_uuid, JOB_STATUS_FAILED, error=str(error)
+            )
+            raise error
+
+        await self.__ingestion_job_db.finish_job(
+            job_uuid, JOB_STATUS_SUCCEEDED, result=task.result()
+        )
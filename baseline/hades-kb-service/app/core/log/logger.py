@@ -22,7 +22,7 @@ class Logger:
         self.logger.addHandler(queue_handler)
 
     """
-    The 'tags' parameter in the logging methods (info, warn, error, debug, exception) of the Logger class is used to include additional contextual information in the log records.
+    The 'tags' parameter in the logging methods (info, warn, warning, error, debug, exception) of the Logger class is used to include additional contextual information in the log records.
     This parameter is a dictionary (or None) where each key-value pair represents a tag. These tags are added to the log records as extra fields.
 
     Here is an example of how to use the 'tags' parameter:
@@ -52,6 +52,11 @@ class Logger:
     ) -> None:
         self.logger.warning(message, *args, extra=tags)
 
+    def warning(
+        self, message: object, *args: object, tags: Mapping[str, object] | None = None
+    ) -> None:
+        self.logger.warning(message, *args, extra=tags)
+
     def error(
         self, message: object, *args: object, tags: Mapping[str, object] | None = None
     ) -> None:
@@ -1,8 +1,9 @@
-import re
-from typing import Dict, List
+from typing import List
 
 from app.core.azure_em.client import EmbeddingModelClient
+from app.core.embedding_cache.query_cache import normalize_query
 from app.core.log.logger import Logger
+from app.core.s3.file_parser import chunk_file_content
 from app.core.transformer.client import TransformerClient
 from app.models.azure_openai_model import (
     GrabGPTOpenAIModel,
@@ -54,11 +55,17 @@ class RagDocumentClient:
         """
         self.__embedding_model.init(model, timeout)
 
-    def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> list[float]:
         """
         Embed query with AzureOpenAIModel
         """
-        return self.__embedding_model.embed_query(text)
+        return await self.__embedding_model.embed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed a list of texts in concurrent batches with AzureOpenAIModel
+        """
+        return await self.__embedding_model.embed_documents(texts)
 
     def text_pre_processing(
         self,
@@ -72,9 +79,7 @@ class RagDocumentClient:
         """
         text = text.lower()
 
-        if chunk_overlap != 0 and chunk_overlap > chunk_size:
-            exception_message = "Chunk overlap is larger than chunk size"
-            raise Exception(exception_message)
+        self.__check_chunk_config(chunk_size, chunk_overlap)
 
         return self.__transformer.chunk_text(
             text=text,
@@ -83,11 +88,38 @@ class RagDocumentClient:
             splitter_selector=splitter_selector,
         )
 
-    def create_new_document_collection(
+    async def chunk_file_content(
+        self,
+        file_path: str,
+        filename: str,
+        chunk_size: int = 512,
+        chunk_overlap: int = 200,
+        splitter_selector: int = 1,
+    ) -> list[str]:
+        """
+        Same pre-processing as `text_pre_processing` for an uploaded file stored at `file_path`,
+        extracted page by page and chunked incrementally in the file parser process pool
+        """
+        self.__check_chunk_config(chunk_size, chunk_overlap)
+
+        return await chunk_file_content(
+            file_path,
+            filename,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            splitter_selector=splitter_selector,
+        )
+
+    def __check_chunk_config(self, chunk_size: int, chunk_overlap: int) -> None:
+        if chunk_overlap != 0 and chunk_overlap > chunk_size:
+            exception_message = "Chunk overlap is larger than chunk size"
+            raise Exception(exception_message)
+
+    async def create_new_document_collection(
         self, document_collection: CreateDocumentCollectionModel
     ) -> DocumentCollectionModel:
         new_document_collection_data = (
-            self.__ragdocument_db.create_new_document_collection(
+            await self.__ragdocument_db.create_new_document_collection(
                 DocumentCollection(
                     name=document_collection.name,
                     description=document_collection.description,
@@ -102,10 +134,10 @@ class RagDocumentClient:
             status=new_document_collection_data.status,
         )
 
-    def update_document_collection(
+    async def update_document_collection(
         self, document_collection: DocumentCollectionModel
     ) -> None:
-        self.__ragdocument_db.update_document_collection_data(
+        await self.__ragdocument_db.update_document_collection_data(
             DocumentCollection(
                 uuid=document_collection.uuid,
                 name=document_collection.name,
@@ -114,12 +146,21 @@ class RagDocumentClient:
             )
         )
 
-    def insert_embedding_document(self, embedded_document: DocumentEmbedding) -> None:
-        self.__ragdocument_db.insert_embedding_document(
+    async def insert_embedding_document(
+        self, embedded_document: DocumentEmbedding
+    ) -> None:
+        await self.__ragdocument_db.insert_embedding_document(
             embedded_document=embedded_document
         )
 
-    def knowledge_base_search(
+    async def insert_embedding_documents(
+        self, embedded_documents: list[DocumentEmbedding]
+    ) -> None:
+        await self.__ragdocument_db.insert_embedding_documents(
+            embedded_documents=embedded_documents
+        )
+
+    async def knowledge_base_search(
         self,
         request_input: DocumentKnowledgeBaseRequestModel,
     ) -> list[SearchKnowledgeBaseResult]:
@@ -130,80 +171,62 @@ class RagDocumentClient:
         if query == "":
             return []
 
-        query = query.lower()
-        query = re.sub(r"\n+", "", query)
+        query = normalize_query(query)
 
-        embeded_query = self.embed_query(query)
+        embeded_query = await self.embed_query(query)
 
-        results = self.__ragdocument_db.read_document_embedding_data(
+        results = await self.__ragdocument_db.read_document_embedding_data(
             embeded_query=embeded_query,
             document_collection_uuids=request_input.filter.document_collection_uuids,
+            k=request_input.top_k,
         )
 
-        document_information_ids = [
-            result.document_information_id for result in results
-        ]
-
-        document_informations = self.__ragdocument_db.get_document_informations_on_ids(
-            document_information_ids=document_information_ids
-        )
-        document_information_map: Dict[int, DocumentInformation] = {}
-        for document_information in document_informations:
-            document_information_map[document_information.id] = document_information
-
-        search_results: List[SearchKnowledgeBaseResult] = []
-        for result in results:
-            document_information_pair: DocumentInformation | None = (
-                document_information_map.get(result.document_information_id, None)
-            )
-            if document_information_pair is None:
-                continue
-
-            search_results.append(
-                SearchKnowledgeBaseResult(
-                    document_embedding=DocumentEmbeddingResponse(
-                        document_information_id=result.document_information_id,
-                        status=result.status,
-                        text_snipplet=result.text_snipplet,
-                        token_number=result.token_number,
-                    ),
-                    document_information=DocumentInformationModel(
-                        filename=document_information.filename,
-                        id=document_information_pair.id,
-                        document_last_updated=str(
-                            document_information_pair.document_last_updated
-                        ),
-                        status=document_information_pair.status,
-                        file_path=document_information_pair.file_path,
-                        file_type=document_information_pair.file_type,
+        search_results: List[SearchKnowledgeBaseResult] = [
+            SearchKnowledgeBaseResult(
+                document_embedding=DocumentEmbeddingResponse(
+                    document_information_id=document_embedding.document_information_id,
+                    status=document_embedding.status,
+                    text_snipplet=document_embedding.text_snipplet,
+                    token_number=document_embedding.token_number,
+                ),
+                document_information=DocumentInformationModel(
+                    filename=document_information.filename,
+                    id=document_information.id,
+                    document_last_updated=str(
+                        document_information.document_last_updated
                     ),
-                )
+                    status=document_information.status,
+                    file_path=document_information.file_path,
+                    file_type=document_information.file_type,
+                ),
             )
+            for document_embedding, document_information in results
+        ]
 
         return search_results
 
-    def insert_new_document_information(
+    async def insert_new_document_information(
         self, new_document: DocumentInformation, document_collection_uuid: str
     ) -> DocumentInformation:
-        return self.__ragdocument_db.insert_new_document_information(
+        return await self.__ragdocument_db.insert_new_document_information(
             new_document=new_document, document_collection_uuid=document_collection_uuid
         )
 
-    def update_document_information(
+    async def update_document_information(
         self,
         request_input: DocumentInformationRequestModel,
     ) -> None:
-        self.__ragdocument_db.update_document_information(request_input)
+        await self.__ragdocument_db.update_document_information(request_input)
 
-    def update_document_collection_mapping(
+    async def update_document_collection_mapping(
         self,
         request_input: DocumentCollectionMappingModel,
     ) -> None:
-        self.__ragdocument_db.update_document_collection_mapping(request_input)
+        await self.__ragdocument_db.update_document_collection_mapping(request_input)
 
-    def get_document_collection_metadata(
+    async def get_document_collection_metadata(
         self, document_collection_uuid: str
     ) -> DocumentCollectionMetadata:
-        return self.__ragdocument_db.get_document_collection_metadata(
+        return await self.__ragdocument_db.get_document_collection_metadata(
             document_collection_uuid
         )
@@ -1,9 +1,9 @@
-import re
 from typing import Dict, Optional, Tuple
 
 from fastapi.encoders import jsonable_encoder
 
 from app.core.azure_em.client import EmbeddingModelClient
+from app.core.embedding_cache.query_cache import normalize_query
 from app.core.log.logger import Logger
 from app.core.transformer.client import TransformerClient
 from app.models.utils import num_tokens_from_string
@@ -46,11 +46,17 @@ class RagSlackClient:
         """
         self.__embedding_model.init(model, timeout)
 
-    def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> list[float]:
         """
         Embed query with AzureOpenAIModel
         """
-        return self.__embedding_model.embed_query(text)
+        return await self.__embedding_model.embed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed a list of texts in concurrent batches with AzureOpenAIModel, unchanged texts are served from the embedding cache
+        """
+        return await self.__embedding_model.embed_documents(texts)
 
     def text_pre_processing(
         self,
@@ -75,7 +81,7 @@ class RagSlackClient:
             splitter_selector=splitter_selector,
         )
 
-    def knowledge_base_search(
+    async def knowledge_base_search(
         self, request_input: KnowledgeBaseRequestModel, embedding_operator: str
     ) -> list[SlackMessageEmbeddingDoc]:
         """
@@ -85,22 +91,23 @@ class RagSlackClient:
         if query == "":
             return []
 
-        query = query.lower()
-        query = re.sub(r"\n+", "", query)
+        query = normalize_query(query)
 
-        embeded_query = self.embed_query(query)
+        embeded_query = await self.embed_query(query)
 
-        result = self.__ragslack_db.read_slack_embedding_data(
+        # several chunks can belong to the same thread, keep enough neighbours to fill the requested page
+        result = await self.__ragslack_db.read_slack_embedding_data(
             embeded_query,
             embedding_operator,
             request_input.vector_threshold,
+            k=max(request_input.top_k, request_input.page * request_input.limit),
         )
 
         query_record = QueriesToSlackEmbeddingsRecords(
             query_summary=query, num_of_embedding_found=len(result)
         )
 
-        self.__ragslack_db.insert_query_to_embedding_records(query_record)
+        await self.__ragslack_db.insert_query_to_embedding_records(query_record)
 
         if len(result) == 0:
             return result
@@ -123,11 +130,13 @@ class RagSlackClient:
             if len(query_to_slack_mapping_docs) == 5:  # noqa: PLR2004: replace 5 with constant variable
                 break
 
-        self.__ragslack_db.insert_query_to_slack_mappings(query_to_slack_mapping_docs)
+        await self.__ragslack_db.insert_query_to_slack_mappings(
+            query_to_slack_mapping_docs
+        )
 
         return result
 
-    def read_slack_information(
+    async def read_slack_information(
         self,
         knowledge_base_result: list[SlackMessageEmbeddingDoc],
         limit: int,
@@ -150,11 +159,11 @@ class RagSlackClient:
         if len(ids) == 0:
             return [], Pagination()
 
-        return self.__ragslack_db.read_slack_information_by_id(
+        return await self.__ragslack_db.read_slack_information_by_id(
             filtered_ids, filter_list
         ), pagination
 
-    def insert_slack_information_to_db(
+    async def insert_slack_information_to_db(
         self, input_request: InsertRequestModel
     ) -> SlackMessageInformationDoc:
         """
@@ -167,9 +176,11 @@ class RagSlackClient:
             chat_history=jsonable_encoder(input_request.chat_history),
             is_embedded=False,
         )
-        return self.__ragslack_db.insert_slack_information_data(slack_information_doc)
+        return await self.__ragslack_db.insert_slack_information_data(
+            slack_information_doc
+        )
 
-    def insert_embeded_to_db(
+    async def insert_embeded_to_db(
         self, text_list: list[str], slack_information_doc: SlackMessageInformationDoc
     ) -> None:
         """
@@ -183,37 +194,38 @@ class RagSlackClient:
                 raise Exception(error_message)
 
             existing_doc = (
-                self.__ragslack_db.read_embedded_by_slack_information_channel_id(
+                await self.__ragslack_db.read_embedded_by_slack_information_channel_id(
                     [slack_information_doc.id]
                 )
             )
 
             if len(existing_doc) != 0:
-                self.__ragslack_db.delete_embedded_data(
+                await self.__ragslack_db.delete_embedded_data(
                     existing_doc[0].slack_message_information_id
                 )
                 self.logging_info("Deleted previous embed data", channel_id, message_ts)
 
-            slack_message_embedding_docs: list[SlackMessageEmbeddingDoc] = []
+            texts_to_insert = [text.strip() for text in text_list if text.strip()]
 
-            for text in text_list:
-                text_to_insert = text.strip()
-
-                if len(text_to_insert) == 0:
-                    continue
-
-                slack_message_embedding_docs.append(
-                    SlackMessageEmbeddingDoc(
-                        token_number=num_tokens_from_string(text_to_insert),
-                        embedding=self.embed_query(text_to_insert),
-                        slack_message_information_id=slack_information_doc.id,
-                    )
+            # chunks that were embedded before the summary changed are served from the embedding cache
+            embeddings = await self.embed_documents(texts_to_insert)
+            slack_message_embedding_docs: list[SlackMessageEmbeddingDoc] = [
+                SlackMessageEmbeddingDoc(
+                    token_number=num_tokens_from_string(text_to_insert),
+                    embedding=embedding,
+                    slack_message_information_id=slack_information_doc.id,
+                )
+                for text_to_insert, embedding in zip(
+                    texts_to_insert, embeddings, strict=True
                 )
+            ]
 
-            self.__ragslack_db.insert_embedding_data(slack_message_embedding_docs)
+            await self.__ragslack_db.insert_embedding_data(slack_message_embedding_docs)
             self.logging_info("Insert embed data successfully", channel_id, message_ts)
             slack_information_doc.is_embedded = True
-            self.__ragslack_db.update_slack_information_data(slack_information_doc)
+            await self.__ragslack_db.update_slack_information_data(
+                slack_information_doc
+            )
             self.logging_info(
                 "Update slack information data successfully", channel_id, message_ts
             )
@@ -228,30 +240,27 @@ class RagSlackClient:
         info_message = f"{message},id: {channel_id} | messagea_ts: {message_ts}"
         self.__logger.info(info_message)
 
-    def get_slack_messages(
+    async def get_slack_messages(
         self,
         filter_conditions: list[Dict[str, list[str]]],
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
     ) -> list[SlackMessageInformationDoc]:
         """Get slack messages with optional filtering"""
         try:
-            return self.__ragslack_db.get_slack_messages(
-                filter_conditions=filter_conditions,
-                limit=limit,
-                offset=offset
+            return await self.__ragslack_db.get_slack_messages(
+                filter_conditions=filter_conditions, limit=limit, offset=offset
             )
         except Exception as e:
             self.__logger.error(f"Failed to get slack messages: {e}")
             raise
 
-    def get_slack_messages_count(
-        self,
-        filter_conditions: list[Dict[str, list[str]]]
+    async def get_slack_messages_count(
+        self, filter_conditions: list[Dict[str, list[str]]]
     ) -> int:
         """Get total count of slack messages matching filter conditions"""
         try:
-            return self.__ragslack_db.get_slack_messages_count(filter_conditions)
+            return await self.__ragslack_db.get_slack_messages_count(filter_conditions)
         except Exception as e:
             self.__logger.error(f"Failed to get slack messages count: {e}")
             raise
@@ -1,8 +1,12 @@
+import asyncio
 import urllib
 import urllib.parse
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO
 
 import boto3
+from botocore.client import BaseClient
 
 from app.core.config import app_config
 from app.core.s3.constant import (
@@ -26,14 +30,32 @@ def get_media_server_url(s3_file_path: str, file_type: str) -> str:
     return f"{app_config.server_base_url}{GET_S3_MEDIA_ENDPOINT}?s3_file_path={urllib.parse.quote_plus(s3_file_path)}"
 
 
-def s3_upload_file(file_data: BytesIO, file_path: str) -> None:
-    """Uploads a file to S3 bucket. Accepts the file data in bytes io"""
-    s3 = boto3.client("s3")
-    s3.upload_fileobj(file_data, app_config.s3_bucket_name, file_path)
+# boto3 clients are thread safe, creating one per call reloads the botocore service model every time
+@lru_cache
+def get_s3_client() -> BaseClient:
+    return boto3.client("s3")
+
+
+@lru_cache
+def get_s3_upload_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=app_config.s3_upload_max_workers, thread_name_prefix="s3_upload"
+    )
+
+
+def s3_upload_file(file_data: BinaryIO, file_path: str) -> None:
+    """Uploads a file to S3 bucket. Accepts the file data as a binary file object, e.g. bytes io"""
+    get_s3_client().upload_fileobj(file_data, app_config.s3_bucket_name, file_path)
+
+
+async def s3_upload_file_async(file_data: BinaryIO, file_path: str) -> None:
+    """Uploads a file to S3 bucket in the s3 upload thread pool, without blocking the event loop"""
+    await asyncio.get_running_loop().run_in_executor(
+        get_s3_upload_pool(), s3_upload_file, file_data, file_path
+    )
 
 
 def s3_get_file(s3_file_path: str) -> bytes:
     """Gets File from S3 bucket. Returns the file data in bytes."""
-    s3 = boto3.client("s3")
-    obj = s3.get_object(Bucket=app_config.s3_bucket_name, Key=s3_file_path)
+    obj = get_s3_client().get_object(Bucket=app_config.s3_bucket_name, Key=s3_file_path)
     return obj["Body"].read()
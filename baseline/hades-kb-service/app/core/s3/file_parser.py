@@ -0,0 +1,80 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.config import app_config
+from app.core.s3.file_util import iter_file_content
+from app.core.transformer.client import TransformerClient
+from app.core.transformer.text_splitter.client import TextSplitterClient
+
+
+@lru_cache
+def get_file_parser_pool() -> ProcessPoolExecutor:
+    """
+    Worker processes for pdfminer / python-docx / openpyxl extraction and chunking, which is cpu bound and holds the GIL.
+    Workers are recycled after `file_parser_max_tasks_per_child` files, parser memory is not always released.
+    """
+    return ProcessPoolExecutor(
+        max_workers=app_config.file_parser_max_workers,
+        max_tasks_per_child=app_config.file_parser_max_tasks_per_child,
+    )
+
+
+@lru_cache
+def get_file_parser_semaphore() -> asyncio.Semaphore:
+    # a worker holds the extraction state of its file, so at most one file per worker is in flight to bound the memory
+    return asyncio.Semaphore(app_config.file_parser_max_workers)
+
+
+@lru_cache
+def get_worker_transformer() -> TransformerClient:
+    return TransformerClient(text_splitter=TextSplitterClient())
+
+
+def extract_file_chunks(
+    file_path: str,
+    filename: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    splitter_selector: int,
+) -> list[str]:
+    """
+    Runs inside a file parser worker. The file is read from `file_path`, extracted page by page and chunked incrementally,
+    neither the file bytes nor the full document text are built.
+    """
+    with Path(file_path).open("rb") as file_data:
+        return list(
+            get_worker_transformer().iter_chunk_text(
+                (text.lower() for text in iter_file_content(file_data, filename)),
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                splitter_selector=splitter_selector,
+            )
+        )
+
+
+async def chunk_file_content(
+    file_path: str,
+    filename: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    splitter_selector: int,
+) -> list[str]:
+    """Extracts and chunks a locally stored upload in the file parser process pool, only its path is sent to the worker"""
+    async with get_file_parser_semaphore():
+        return await asyncio.get_running_loop().run_in_executor(
+            get_file_parser_pool(),
+            extract_file_chunks,
+            file_path,
+            filename,
+            chunk_size,
+            chunk_overlap,
+            splitter_selector,
+        )
+
+
+def shutdown_file_parser_pool() -> None:
+    if get_file_parser_pool.cache_info().currsize != 0:
+        get_file_parser_pool().shutdown(cancel_futures=True)
+        get_file_parser_pool.cache_clear()
@@ -1,10 +1,19 @@
+import asyncio
+import csv
 import mimetypes
-from io import BytesIO
+import shutil
+import tempfile
+from collections.abc import Iterator
+from io import BytesIO, StringIO, TextIOWrapper
+from itertools import islice
+from typing import BinaryIO
 
 import docx
+import openpyxl
 import pandas as pd
 from fastapi import UploadFile
-from pdfminer.high_level import extract_text
+from pdfminer.high_level import extract_pages, extract_text
+from pdfminer.layout import LTTextContainer
 
 from app.core.s3.constant import FileType
 
@@ -39,30 +48,95 @@ def get_file_type(filename: str) -> str:
     raise ValueError(invalid_file_name_err)
 
 
-def get_file_content_from_bytes(file_content: bytes, filename: str) -> str:
-    file_type = get_file_type(filename)
-    match file_type:
+def iter_file_content(
+    file_data: BinaryIO, filename: str, block_size: int = 1000
+) -> Iterator[str]:
+    """
+    Yields the text of an uploaded file page by page for pdf,
+    and in blocks of `block_size` lines / paragraphs / rows for the other file types.
+    Only the current page or block is materialized, the caller decides how much text to buffer.
+    """
+    match get_file_type(filename):
         case FileType.TXT.value | FileType.CSV.value:
-            return file_content.decode("utf-8")
+            return __iter_text_content(file_data, block_size)
         case FileType.DOCX.value:
-            document_data = docx.Document(BytesIO(file_content))
-            return "\n".join([paragraph.text for paragraph in document_data.paragraphs])
+            return __iter_docx_content(file_data, block_size)
         case FileType.PDF.value:
-            return get_pdf_file_content(file_content)
-        case FileType.XLS.value | FileType.XLSX.value:
-            panda_excel_data = pd.ExcelFile(BytesIO(file_content))
-            content_to_return = ""
-            for sheet_name in panda_excel_data.sheet_names:
-                # Load a sheet into a DataFrame by name
-                dataframe = panda_excel_data.parse(sheet_name)
+            return __iter_pdf_content(file_data)
+        case FileType.XLSX.value:
+            return __iter_xlsx_content(file_data, block_size)
+        case FileType.XLS.value:
+            return __iter_xls_content(file_data)
+        case _:
+            return iter([str(file_data.read())])
+
+
+def __iter_text_content(file_data: BinaryIO, block_size: int) -> Iterator[str]:
+    lines = TextIOWrapper(file_data, encoding="utf-8", newline="")
+    while block := "".join(islice(lines, block_size)):
+        yield block
+
+
+def __iter_docx_content(file_data: BinaryIO, block_size: int) -> Iterator[str]:
+    paragraphs = iter(docx.Document(file_data).paragraphs)
+    while block := list(islice(paragraphs, block_size)):
+        yield "".join([f"{paragraph.text}\n" for paragraph in block])
+
+
+def __iter_pdf_content(file_data: BinaryIO) -> Iterator[str]:
+    for page_layout in extract_pages(file_data):
+        yield "".join(
+            [
+                element.get_text()
+                for element in page_layout
+                if isinstance(element, LTTextContainer)
+            ]
+        )
 
-                file_data = dataframe.to_csv(index=False)
 
-                content_to_return += file_data
-            return content_to_return
+def __iter_xlsx_content(file_data: BinaryIO, block_size: int) -> Iterator[str]:
+    """
+    Every sheet as csv, rows are read lazily in read only mode instead of building the whole sheet.
+    The cells are written as stored, unlike the former pandas export an empty header cell is not
+    renamed to `Unnamed: <index>` and an integer column with empty cells is not turned into floats.
+    """
+    workbook = openpyxl.load_workbook(file_data, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            rows = worksheet.iter_rows(values_only=True)
+            while block := list(islice(rows, block_size)):
+                yield __get_csv_text(block)
+    finally:
+        workbook.close()
+
+
+def __iter_xls_content(file_data: BinaryIO) -> Iterator[str]:
+    # the xls reader has no streaming mode, one sheet is loaded at a time
+    panda_excel_data = pd.ExcelFile(file_data)
+    for sheet_name in panda_excel_data.sheet_names:
+        yield panda_excel_data.parse(sheet_name).to_csv(index=False)
+
+
+def __get_csv_text(rows: list[tuple]) -> str:
+    csv_text = StringIO()
+    csv.writer(csv_text, lineterminator="\n").writerows(
+        [["" if value is None else value for value in row] for row in rows]
+    )
+    return csv_text.getvalue()
+
+
+async def save_upload_file_to_temporary_file(file: UploadFile) -> str:
+    """
+    Copies an uploaded file into a local temporary file in a worker thread and returns its path,
+    so the upload can be processed later without holding its bytes in memory. The caller deletes the file.
+    """
+    await file.seek(0)
+    with tempfile.NamedTemporaryFile(
+        prefix="hades-upload-", delete=False
+    ) as local_file:
+        await asyncio.to_thread(shutil.copyfileobj, file.file, local_file)
 
-    # default just convert to string before return
-    return str(file_content)
+    return local_file.name
 
 
 async def get_file_size(file: UploadFile) -> int:
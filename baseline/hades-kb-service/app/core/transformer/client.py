@@ -1,4 +1,5 @@
 import math
+from collections.abc import Iterable, Iterator
 from typing import Tuple
 
 import numpy as np
@@ -53,6 +54,46 @@ class TransformerClient:
             self.__logger.exception(log_message)
             return [text]
 
+    def iter_chunk_text(
+        self,
+        texts: Iterable[str],
+        chunk_size: int = 0,
+        chunk_overlap: int = 0,
+        splitter_selector: int = 0,
+        window_chunks: int = 8,
+    ) -> Iterator[str]:
+        """
+        Incremental `chunk_text` for a document that is extracted page by page.
+        Pages are buffered until about `window_chunks` chunks worth of tokens, then the buffer is split.
+        The last chunk of a window is carried into the next one, so chunks still span page boundaries.
+        """
+        if chunk_size <= 0:
+            chunk_size = 512
+
+        window_tokens = chunk_size * window_chunks
+        buffer: list[str] = []
+        buffer_tokens = 0
+
+        for text in texts:
+            buffer.append(text)
+            buffer_tokens += num_tokens_from_string(text)
+            if buffer_tokens < window_tokens:
+                continue
+
+            chunks = self.chunk_text(
+                "".join(buffer), chunk_size, chunk_overlap, splitter_selector
+            )
+            yield from chunks[:-1]
+
+            buffer = chunks[-1:]
+            buffer_tokens = num_tokens_from_string("".join(buffer))
+
+        remaining_text = "".join(buffer)
+        if remaining_text:
+            yield from self.chunk_text(
+                remaining_text, chunk_size, chunk_overlap, splitter_selector
+            )
+
     def compute_inner_product_similarity(
         self, query_vector: list[float], result_vector: list[float]
     ) -> float:
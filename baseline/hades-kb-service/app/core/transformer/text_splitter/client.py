@@ -1,15 +1,24 @@
+from threading import Lock
+from typing import Dict, Tuple
+
 from langchain_text_splitters import (
     CharacterTextSplitter,
     RecursiveCharacterTextSplitter,
+    TextSplitter,
 )
 
 from app.core.log.logger import Logger
 from app.core.transformer.text_splitter.models import TextSplitterEnum
 
+DEFAULT_ENCODING_NAME = "cl100k_base"
+
 
 class TextSplitterClient:
     def __init__(self) -> None:
         self.__logger = Logger(name=self.__class__.__name__)
+        # splitters keep no state between calls, one is built per (encoding, chunk_size, chunk_overlap, selector)
+        self.__splitters: Dict[Tuple[str, int, int, int], TextSplitter] = {}
+        self.__splitters_lock = Lock()
 
     def split_text(
         self,
@@ -35,10 +44,8 @@ class TextSplitterClient:
         self, text: str, chunk_size: int, chunk_overlap: int = 0
     ) -> list[str]:
         try:
-            text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-                encoding_name="cl100k_base",
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
+            text_splitter = self.get_text_splitter(
+                TextSplitterEnum.RECURSIVE.value, chunk_size, chunk_overlap
             )
 
             return text_splitter.split_text(text)
@@ -55,9 +62,7 @@ class TextSplitterClient:
         issues: https://github.com/langchain-ai/langchain/issues/10410
         """
         try:
-            text_splitter = CharacterTextSplitter.from_tiktoken_encoder(
-                encoding_name="cl100k_base",
-            )
+            text_splitter = self.get_text_splitter(TextSplitterEnum.DEFAULT.value)
 
             return text_splitter.split_text(text)
 
@@ -66,3 +71,46 @@ class TextSplitterClient:
             self.__logger.exception(log_message)
             # Raising for tracebility
             raise Exception(log_message) from e
+
+    def get_text_splitter(
+        self,
+        splitter_selector: int,
+        chunk_size: int = 0,
+        chunk_overlap: int = 0,
+        encoding_name: str = DEFAULT_ENCODING_NAME,
+    ) -> TextSplitter:
+        """
+        Registry of the tiktoken based splitters, the default splitter ignores chunk size and overlap
+        """
+        if splitter_selector == TextSplitterEnum.DEFAULT.value:
+            chunk_size, chunk_overlap = 0, 0
+
+        key = (encoding_name, chunk_size, chunk_overlap, splitter_selector)
+        text_splitter = self.__splitters.get(key)
+        if text_splitter is not None:
+            return text_splitter
+
+        with self.__splitters_lock:
+            if key not in self.__splitters:
+                self.__splitters[key] = self.__create_text_splitter(
+                    splitter_selector, chunk_size, chunk_overlap, encoding_name
+                )
+            return self.__splitters[key]
+
+    def __create_text_splitter(
+        self,
+        splitter_selector: int,
+        chunk_size: int,
+        chunk_overlap: int,
+        encoding_name: str,
+    ) -> TextSplitter:
+        if splitter_selector == TextSplitterEnum.DEFAULT.value:
+            return CharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name=encoding_name,
+            )
+
+        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name=encoding_name,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+        )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -8,7 +9,7 @@ from app.models.azure_openai_model import get_azure_openai_embeddings_model
 
 
 def chunk_data(data: str, chunk_size: int = 50) -> List[Dict[str, Any]]:
-    encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = get_tiktoken_encoding("cl100k_base")
     tokens = encoding.encode(data)
     chunks = []
     for i in range(0, len(tokens), chunk_size):
@@ -40,10 +41,16 @@ def generate_embedding(text: str) -> list[float]:
     return response
 
 
+# Encoders are immutable and safe to share, so they are loaded once per process
+@lru_cache
+def get_tiktoken_encoding(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
+    return tiktoken.get_encoding(encoding_name)
+
+
 # Calculate number of tokens
 def num_tokens_from_string(string: str, encoding_name: str = "cl100k_base") -> int:
     if not string:
         return 0
     # Returns the number of tokens in a text string
-    encoding = tiktoken.get_encoding(encoding_name)
+    encoding = get_tiktoken_encoding(encoding_name)
     return len(encoding.encode(string))
@@ -1,18 +1,24 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from typing import Any, Callable, Dict
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
 from app.core.log.logger import Logger
 from app.routes.doc_kb_route.handler import (
+    cancel_ingestion_job,
     create_new_document_collection,
     get_document_collection_metadata,
+    get_ingestion_job,
+    get_ingestion_job_events,
     ingest_new_doc_content,
     ingest_new_doc_content_stream_handler,
     ingest_new_doc_invoke_handler,
     ingest_new_doc_stream_handler,
     search_document_knowledge_base,
+    submit_ingest_new_doc_content_job,
+    submit_ingest_new_doc_job,
     update_document_collection,
     update_document_collection_mapping,
     update_document_information,
@@ -22,6 +28,7 @@ from app.routes.doc_kb_route.models import (
     DocumentCollectionMetadata,
     DocumentCollectionModel,
     DocumentInformationModel,
+    IngestionJobModel,
     IngestNewDocumentContentResponse,
     SearchKnowledgeBaseResult,
     UploadDocumentResponse,
@@ -49,7 +56,7 @@ async def ingest_new_doc_handler(
     summary="Allows user to ingest a list ofn new documents, and save it to knowledge base",
 )
 async def ingest_new_doc_handler_stream_endpoint(
-    stream_response: Callable[[None], Generator[str, Any, Any]] = Depends(
+    stream_response: Callable[[], AsyncGenerator[str, Any]] = Depends(
         ingest_new_doc_stream_handler
     ),
 ) -> StreamingResponse:
@@ -76,13 +83,68 @@ async def ingest_new_doc_content(
     summary="Allows user to ingest new doc based on passed in document content",
 )
 async def ingest_new_doc_content_stream(
-    stream_response: Callable[[None], Generator[str, Any, Any]] = Depends(
+    stream_response: Callable[[], AsyncGenerator[str, Any]] = Depends(
         ingest_new_doc_content_stream_handler
     ),
 ) -> DocumentInformationModel:
     return StreamingResponse(stream_response())
 
 
+@doc_kb_route.post(
+    "/doc_kb_route/ingest_job/ingest_new_doc",
+    responses=open_api_config,
+    summary="Allows user to queue the ingestion of a list of new documents, returns the ingestion job to follow",
+)
+async def submit_ingest_new_doc_job(
+    result: IngestionJobModel = Depends(submit_ingest_new_doc_job),
+) -> IngestionJobModel:
+    return result
+
+
+@doc_kb_route.post(
+    "/doc_kb_route/ingest_job/ingest_new_doc_content",
+    responses=open_api_config,
+    summary="Allows user to queue the ingestion of passed in document content, returns the ingestion job to follow",
+)
+async def submit_ingest_new_doc_content_job(
+    result: IngestionJobModel = Depends(submit_ingest_new_doc_content_job),
+) -> IngestionJobModel:
+    return result
+
+
+@doc_kb_route.get(
+    "/doc_kb_route/ingest_job/{job_uuid}",
+    responses=open_api_config,
+    summary="Allows user to get the status and chunk progress of an ingestion job",
+)
+async def get_ingestion_job(
+    result: IngestionJobModel = Depends(get_ingestion_job),
+) -> IngestionJobModel:
+    return result
+
+
+@doc_kb_route.get(
+    "/doc_kb_route/ingest_job/{job_uuid}/events",
+    responses=open_api_config,
+    summary="Allows user to follow the status and chunk progress of an ingestion job as server sent events",
+)
+async def get_ingestion_job_events(
+    events: Callable[[], AsyncGenerator[dict, Any]] = Depends(get_ingestion_job_events),
+) -> EventSourceResponse:
+    return EventSourceResponse(events())
+
+
+@doc_kb_route.post(
+    "/doc_kb_route/ingest_job/{job_uuid}/cancel",
+    responses=open_api_config,
+    summary="Allows user to cancel a pending or running ingestion job",
+)
+async def cancel_ingestion_job(
+    result: IngestionJobModel = Depends(cancel_ingestion_job),
+) -> IngestionJobModel:
+    return result
+
+
 @doc_kb_route.post(
     "/doc_kb_route/create_new_document_collection",
     responses=open_api_config,
@@ -1,24 +1,32 @@
 import asyncio
-import io
+import json
 import time
-from asyncio import AbstractEventLoop
-from collections.abc import Generator
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Dict, List
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 from fastapi import Depends, HTTPException, Request, UploadFile
 from fastapi.responses import JSONResponse
 
 from app.core.config import app_config
-from app.core.dependencies import get_ragdocument
+from app.core.dependencies import (
+    get_ingestion_job_queue_singleton,
+    get_ragdocument,
+)
+from app.core.ingestion_job.client import (
+    IngestionJobProgress,
+    IngestionJobQueue,
+    IngestionJobRunner,
+    is_job_finished,
+)
 from app.core.log.logger import Logger
 from app.core.ragdocument.client import RagDocumentClient
 from app.core.s3.bucket_util import (
     get_media_server_url,
     s3_construct_file_path,
-    s3_upload_file,
+    s3_upload_file_async,
 )
-from app.core.s3.file_util import get_file_content_from_bytes
+from app.core.s3.file_util import save_upload_file_to_temporary_file
 from app.models.utils import num_tokens_from_string
 from app.routes.doc_kb_route.models import (
     CreateDocumentCollectionModel,
@@ -30,14 +38,24 @@ from app.routes.doc_kb_route.models import (
     DocumentKnowledgeBaseRequestModel,
     FileMetadata,
     IngestDocumentContentRequest,
+    IngestionJobModel,
     IngestNewDocumentContentResponse,
     SearchKnowledgeBaseResult,
     UploadDocumentResponse,
 )
 from app.routes.utils import BaseResponse, get_exception_action_response
+from app.storage.ingestion_job_db.constant import (
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_SUCCEEDED,
+    JOB_TYPE_INGEST_NEW_DOC,
+    JOB_TYPE_INGEST_NEW_DOC_CONTENT,
+)
+from app.storage.ingestion_job_db.models import IngestionJob
 from app.storage.ragdocument_db.constant import (
     FILETYPE_FILE_CONTENT,
     FILETYPE_UPLOAD_FILE,
+    INACTIVE_STATUS,
 )
 from app.storage.ragdocument_db.models import (
     DocumentEmbedding,
@@ -66,14 +84,14 @@ def __check_rag_document_secret(request: Request) -> None:
         raise HTTPException(401, message)
 
 
-def update_document_collection_mapping(
+async def update_document_collection_mapping(
     request: Request,
     request_input: DocumentCollectionMappingModel,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
 ) -> dict:
     __check_rag_document_secret(request)
     try:
-        ragdocument.update_document_collection_mapping(request_input)
+        await ragdocument.update_document_collection_mapping(request_input)
 
     except Exception as e:  # noqa: BLE001, because we want to handle it
         return get_exception_action_response(
@@ -87,14 +105,14 @@ def update_document_collection_mapping(
     return STATUS_OK
 
 
-def create_new_document_collection(
+async def create_new_document_collection(
     request: Request,
     request_input: CreateDocumentCollectionModel,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
 ) -> DocumentCollectionModel:
     __check_rag_document_secret(request)
     try:
-        return ragdocument.create_new_document_collection(
+        return await ragdocument.create_new_document_collection(
             document_collection=request_input
         )
     except Exception as e:  # noqa: BLE001, because we want to handle it
@@ -108,14 +126,14 @@ def create_new_document_collection(
         )
 
 
-def update_document_collection(
+async def update_document_collection(
     request: Request,
     request_input: DocumentCollectionModel,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
 ) -> dict:
     __check_rag_document_secret(request)
     try:
-        ragdocument.update_document_collection(request_input)
+        await ragdocument.update_document_collection(request_input)
 
     except Exception as e:  # noqa: BLE001, because we want to handle it.
         return get_exception_action_response(
@@ -129,7 +147,7 @@ def update_document_collection(
     return STATUS_OK
 
 
-def search_document_knowledge_base(
+async def search_document_knowledge_base(
     request: Request,
     request_input: DocumentKnowledgeBaseRequestModel,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
@@ -137,7 +155,9 @@ def search_document_knowledge_base(
     __check_rag_document_secret(request)
     try:
         return {
-            "result": ragdocument.knowledge_base_search(request_input=request_input)
+            "result": await ragdocument.knowledge_base_search(
+                request_input=request_input
+            )
         }
     except Exception as e:  # noqa: BLE001, because we want to handle it
         return get_exception_action_response(
@@ -167,42 +187,29 @@ async def file_upload_document_rag_handler(
 async def ingest_new_doc_content_stream_handler(
     request_input: IngestDocumentContentRequest,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
-) -> Callable[[None], Generator[str, None, None]]:
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> Callable[[], AsyncGenerator[str, None]]:
     try:
-        # declare function for running doc content async request
-        def run_async_function_in_thread(loop: AbstractEventLoop) -> str:
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
-                __store_new_document_information(
-                    filename=request_input.filename,
-                    file_path=request_input.document_uri,
-                    document_collection_uuid=request_input.document_collection_uuid,
-                    file_content=request_input.document_content,
-                    file_type=FILETYPE_FILE_CONTENT,
-                    ragdocument=ragdocument,
-                )
-            )
+        job = await ingestion_job_queue.submit(
+            JOB_TYPE_INGEST_NEW_DOC_CONTENT,
+            __get_ingest_new_doc_content_runner(request_input, ragdocument),
+        )
+
+        def to_response(job: IngestionJob) -> str:
+            if job.status == JOB_STATUS_SUCCEEDED:
+                return IngestNewDocumentContentResponse(
+                    document_information=job.result["document_information"],
+                    status="OK",
+                    job_uuid=job.uuid,
+                ).__dict__.__str__()
 
             return IngestNewDocumentContentResponse(
-                document_information=result.__dict__,
-                status="OK",
+                status=__get_job_response_status(job),
+                document_information={},
+                job_uuid=job.uuid,
             ).__dict__.__str__()
 
-        loop = asyncio.new_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
-
-        # define new function for generating streaming response
-        def generate_streaming_response() -> Generator[str, None, None]:
-            future = executor.submit(run_async_function_in_thread, loop)
-            while not future.done():
-                time.sleep(1)
-                processing_str = IngestNewDocumentContentResponse(
-                    status="Processing", document_information={}
-                ).__dict__.__str__()
-                yield f"{processing_str}\n"
-            yield future.result()
-
-        return generate_streaming_response  # noqa: TRY300
+        return __stream_ingestion_job(job.uuid, ingestion_job_queue, to_response)
     except Exception as e:  # noqa: BLE001 because we want to handle it
         exception = get_exception_action_response(
             e=e,
@@ -248,6 +255,8 @@ async def ingest_new_doc_invoke_handler(
     document_collection_uuid: str,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
 ) -> UploadDocumentResponse | JSONResponse:
+    # checked before the uploads are saved to local files
+    __check_rag_document_secret(request)
     try:
         files_uploaded_by_user = await file_upload_document_rag_handler(files=files)
 
@@ -277,41 +286,36 @@ async def ingest_new_doc_stream_handler(
     files: List[UploadFile],
     document_collection_uuid: str,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
-) -> Callable[[None], Generator[str, None, None]]:
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> Callable[[], AsyncGenerator[str, None]]:
+    # checked before the uploads are saved to local files
+    __check_rag_document_secret(request)
     try:
         files_uploaded_by_user = await file_upload_document_rag_handler(files=files)
 
-        # declare function for running ingest doc async request
-        def run_async_function_in_thread(loop: AbstractEventLoop) -> str:
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
-                ingest_new_doc(
-                    request=request,
-                    files=files_uploaded_by_user,
-                    document_collection_uuid=document_collection_uuid,
-                    ragdocument=ragdocument,
-                ),
-            )
-            return UploadDocumentResponse(
-                files=result,
-                status="OK",
-            ).__dict__.__str__()
-
-        loop = asyncio.new_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
+        job = await __submit_ingest_new_doc_job(
+            request,
+            files_uploaded_by_user,
+            document_collection_uuid,
+            ragdocument,
+            ingestion_job_queue,
+        )
 
-        # define new function for generating streaming response
-        def generate_streaming_response() -> Generator[str, None, None]:
-            future = executor.submit(run_async_function_in_thread, loop)
-            while not future.done():
-                time.sleep(1)
-                processing_str = UploadDocumentResponse(
-                    status="Processing", files=[]
+        def to_response(job: IngestionJob) -> str:
+            if job.status == JOB_STATUS_SUCCEEDED:
+                return UploadDocumentResponse(
+                    files=job.result["files"],
+                    status="OK",
+                    job_uuid=job.uuid,
                 ).__dict__.__str__()
-                yield f"{processing_str}\n"
-            yield future.result()
 
-        return generate_streaming_response  # noqa: TRY300
+            return UploadDocumentResponse(
+                status=__get_job_response_status(job),
+                files=[],
+                job_uuid=job.uuid,
+            ).__dict__.__str__()
+
+        return __stream_ingestion_job(job.uuid, ingestion_job_queue, to_response)
     except Exception as e:  # noqa: BLE001 because we want to handle it
         exception = get_exception_action_response(
             e=e,
@@ -324,15 +328,136 @@ async def ingest_new_doc_stream_handler(
         return lambda: str(exception.body)
 
 
+async def submit_ingest_new_doc_job(
+    request: Request,
+    files: List[UploadFile],
+    document_collection_uuid: str,
+    ragdocument: RagDocumentClient = Depends(get_ragdocument),
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> IngestionJobModel:
+    __check_rag_document_secret(request)
+    try:
+        files_uploaded_by_user = await file_upload_document_rag_handler(files=files)
+
+        return __get_ingestion_job_model(
+            await __submit_ingest_new_doc_job(
+                request,
+                files_uploaded_by_user,
+                document_collection_uuid,
+                ragdocument,
+                ingestion_job_queue,
+            )
+        )
+    except Exception as e:  # noqa: BLE001, because we want to handle it
+        return get_exception_action_response(
+            e=e,
+            logger=logger,
+            name=submit_ingest_new_doc_job.__name__,
+            response=BaseResponse(
+                message=f"unable to submit_ingest_new_doc_job with exception: {e}"
+            ),
+        )
+
+
+async def submit_ingest_new_doc_content_job(
+    request: Request,
+    request_input: IngestDocumentContentRequest,
+    ragdocument: RagDocumentClient = Depends(get_ragdocument),
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> IngestionJobModel:
+    __check_rag_document_secret(request)
+    try:
+        return __get_ingestion_job_model(
+            await ingestion_job_queue.submit(
+                JOB_TYPE_INGEST_NEW_DOC_CONTENT,
+                __get_ingest_new_doc_content_runner(request_input, ragdocument),
+            )
+        )
+    except Exception as e:  # noqa: BLE001, because we want to handle it
+        return get_exception_action_response(
+            e=e,
+            logger=logger,
+            name=submit_ingest_new_doc_content_job.__name__,
+            response=BaseResponse(
+                message=f"unable to submit_ingest_new_doc_content_job with exception: {e}"
+            ),
+        )
+
+
+async def get_ingestion_job(
+    job_uuid: str,
+    request: Request,
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> IngestionJobModel:
+    __check_rag_document_secret(request)
+    return __get_ingestion_job_model(
+        await __get_existing_ingestion_job(job_uuid, ingestion_job_queue)
+    )
+
+
+async def get_ingestion_job_events(
+    job_uuid: str,
+    request: Request,
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> Callable[[], AsyncGenerator[dict, None]]:
+    """
+    Server sent events with the job status, one `progress` event per status or chunk progress change.
+    The stream ends with a single `finished` event, an `error` event with status_code 404 when the job was deleted,
+    or a `timeout` event after `ingestion_job_stream_timeout_seconds`. Disconnecting does not stop the job.
+    """
+    __check_rag_document_secret(request)
+    await __get_existing_ingestion_job(job_uuid, ingestion_job_queue)
+
+    async def generate_events() -> AsyncGenerator[dict, None]:
+        last_data = None
+        async for job in __poll_ingestion_job(job_uuid, ingestion_job_queue):
+            if job is None:
+                error = {
+                    "status_code": 404,
+                    "detail": __get_missing_job_message(job_uuid),
+                }
+                yield {"event": "error", "data": json.dumps(error)}
+                return
+
+            data = __get_ingestion_job_model(job).model_dump_json()
+
+            if is_job_finished(job):
+                yield {"event": "finished", "data": data}
+                return
+
+            if data != last_data:
+                yield {"event": "progress", "data": data}
+                last_data = data
+
+        yield {"event": "timeout", "data": last_data}
+
+    return generate_events
+
+
+async def cancel_ingestion_job(
+    job_uuid: str,
+    request: Request,
+    ingestion_job_queue: IngestionJobQueue = Depends(get_ingestion_job_queue_singleton),
+) -> IngestionJobModel:
+    __check_rag_document_secret(request)
+    await __get_existing_ingestion_job(job_uuid, ingestion_job_queue)
+
+    if not await ingestion_job_queue.cancel(job_uuid):
+        raise HTTPException(409, f"ingestion job {job_uuid} is already finished")
+
+    return __get_ingestion_job_model(await ingestion_job_queue.get_job(job_uuid))
+
+
 async def ingest_new_doc(
     request: Request,
     files: List[FileMetadata],
     document_collection_uuid: str,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
+    progress: Optional[IngestionJobProgress] = None,
 ) -> List[Dict]:
     __check_rag_document_secret(request)
 
-    uploaded_files = await __upload_file_to_s3_handler(files)
+    uploaded_files = await __upload_file_to_s3_handler(files, ragdocument)
 
     return [
         (
@@ -341,8 +466,9 @@ async def ingest_new_doc(
                     filename=uploaded_file.filename,
                     file_path=uploaded_file.file_path,
                     document_collection_uuid=document_collection_uuid,
-                    file_content=uploaded_file.file_content,
+                    splited_texts=uploaded_file.file_chunks,
                     ragdocument=ragdocument,
+                    progress=progress,
                 )
             ).__dict__
         )
@@ -350,14 +476,14 @@ async def ingest_new_doc(
     ]
 
 
-def update_document_information(
+async def update_document_information(
     request: Request,
     request_input: DocumentInformationRequestModel,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
 ) -> dict:
     __check_rag_document_secret(request)
     try:
-        ragdocument.update_document_information(request_input)
+        await ragdocument.update_document_information(request_input)
 
     except Exception as e:  # noqa: BLE001, because we want to handle it
         return get_exception_action_response(
@@ -372,7 +498,7 @@ def update_document_information(
         return STATUS_OK
 
 
-def get_document_collection_metadata(
+async def get_document_collection_metadata(
     document_collection_uuid: str,
     request: Request,
     ragdocument: RagDocumentClient = Depends(get_ragdocument),
@@ -380,7 +506,9 @@ def get_document_collection_metadata(
     __check_rag_document_secret(request)
 
     try:
-        return ragdocument.get_document_collection_metadata(document_collection_uuid)
+        return await ragdocument.get_document_collection_metadata(
+            document_collection_uuid
+        )
     except Exception as e:  # noqa: BLE001, because we want to handle it
         return get_exception_action_response(
             e=e,
@@ -395,13 +523,15 @@ def get_document_collection_metadata(
 async def __store_new_document_information(  # noqa: PLR0913
     filename: str,
     file_path: str,
-    file_content: str,
     document_collection_uuid: str,
     ragdocument: RagDocumentClient,
+    file_content: str = "",
+    splited_texts: Optional[List[str]] = None,
     file_type: str = FILETYPE_UPLOAD_FILE,
+    progress: Optional[IngestionJobProgress] = None,
 ) -> DocumentInformationModel:
     # insert document information first
-    document_information = ragdocument.insert_new_document_information(
+    document_information = await ragdocument.insert_new_document_information(
         new_document=DocumentInformation(
             filename=filename,
             file_path=file_path,
@@ -410,21 +540,25 @@ async def __store_new_document_information(  # noqa: PLR0913
         document_collection_uuid=document_collection_uuid,
     )
 
-    # split and embed file
-    splited_texts = ragdocument.text_pre_processing(
-        file_content,
-    )
+    # split the file unless it was already chunked while parsing, splitting is cpu bound so it is kept off the event loop
+    if splited_texts is None:
+        splited_texts = await asyncio.to_thread(
+            ragdocument.text_pre_processing,
+            file_content,
+        )
 
-    for splited_text in splited_texts:
-        # embed text
-        embedded_text = ragdocument.embed_query(splited_text)
-        document_embedding = DocumentEmbedding(
-            token_number=num_tokens_from_string(splited_text),
-            embedding=embedded_text,
-            document_information_id=document_information.id,
-            text_snipplet=splited_text,
+    try:
+        await __embed_and_insert_documents(
+            splited_texts, document_information.id, ragdocument, progress
+        )
+    except (Exception, asyncio.CancelledError):
+        # the document is incomplete, hide it from the collection
+        await ragdocument.update_document_information(
+            DocumentInformationRequestModel(
+                id=document_information.id, status=INACTIVE_STATUS
+            )
         )
-        ragdocument.insert_embedding_document(document_embedding)
+        raise
 
     return DocumentInformationModel(
         filename=document_information.filename,
@@ -439,33 +573,233 @@ async def __store_new_document_information(  # noqa: PLR0913
     )
 
 
-async def __upload_file_to_s3_handler(files: List[FileMetadata]) -> List[FileMetadata]:
+async def __embed_and_insert_documents(
+    splited_texts: List[str],
+    document_information_id: int,
+    ragdocument: RagDocumentClient,
+    progress: Optional[IngestionJobProgress],
+) -> None:
+    """
+    Embed and insert the chunks one window at a time, so only one window of embeddings is held in memory.
+    A window keeps every embedding batch in flight, progress is reported after each window.
+    """
+    if progress is not None:
+        await progress.add_total_chunks(len(splited_texts))
+
+    window_size = max(
+        app_config.embedding_batch_size * app_config.embedding_max_concurrency, 1
+    )
+    for index in range(0, len(splited_texts), window_size):
+        window = splited_texts[index : index + window_size]
+        embedded_texts = await ragdocument.embed_documents(window)
+        await ragdocument.insert_embedding_documents(
+            [
+                DocumentEmbedding(
+                    token_number=num_tokens_from_string(splited_text),
+                    embedding=embedded_text,
+                    document_information_id=document_information_id,
+                    text_snipplet=splited_text,
+                )
+                for splited_text, embedded_text in zip(
+                    window, embedded_texts, strict=True
+                )
+            ]
+        )
+
+        if progress is not None:
+            await progress.add_processed_chunks(len(window))
+
+
+def __get_ingest_new_doc_content_runner(
+    request_input: IngestDocumentContentRequest,
+    ragdocument: RagDocumentClient,
+) -> IngestionJobRunner:
+    async def run(progress: IngestionJobProgress) -> dict:
+        document_information = await __store_new_document_information(
+            filename=request_input.filename,
+            file_path=request_input.document_uri,
+            document_collection_uuid=request_input.document_collection_uuid,
+            file_content=request_input.document_content,
+            file_type=FILETYPE_FILE_CONTENT,
+            ragdocument=ragdocument,
+            progress=progress,
+        )
+        return {"document_information": document_information.__dict__}
+
+    return run
+
+
+async def __submit_ingest_new_doc_job(
+    request: Request,
+    files: List[FileMetadata],
+    document_collection_uuid: str,
+    ragdocument: RagDocumentClient,
+    ingestion_job_queue: IngestionJobQueue,
+) -> IngestionJob:
+    try:
+        return await ingestion_job_queue.submit(
+            JOB_TYPE_INGEST_NEW_DOC,
+            __get_ingest_new_doc_runner(
+                request, files, document_collection_uuid, ragdocument
+            ),
+            local_file_paths=[file.local_file_path for file in files],
+        )
+    except Exception:
+        # the job was not created, nothing else will read the local copies of the uploads
+        __delete_local_files(files)
+        raise
+
+
+def __get_ingest_new_doc_runner(
+    request: Request,
+    files: List[FileMetadata],
+    document_collection_uuid: str,
+    ragdocument: RagDocumentClient,
+) -> IngestionJobRunner:
+    async def run(progress: IngestionJobProgress) -> dict:
+        return {
+            "files": await ingest_new_doc(
+                request=request,
+                files=files,
+                document_collection_uuid=document_collection_uuid,
+                ragdocument=ragdocument,
+                progress=progress,
+            )
+        }
+
+    return run
+
+
+def __stream_ingestion_job(
+    job_uuid: str,
+    ingestion_job_queue: IngestionJobQueue,
+    to_response: Callable[[IngestionJob], str],
+) -> Callable[[], AsyncGenerator[str, None]]:
+    """
+    Stream one line per status or progress change until the job is finished, or no longer exists.
+    The job keeps running when the client disconnects, or when the stream times out while it is still processing.
+    """
+
+    async def generate_streaming_response() -> AsyncGenerator[str, None]:
+        async for job in __poll_ingestion_job(job_uuid, ingestion_job_queue):
+            if job is None:
+                yield BaseResponse(
+                    message=__get_missing_job_message(job_uuid), error=True
+                ).__dict__.__str__()
+                return
+
+            if is_job_finished(job):
+                yield to_response(job)
+                return
+
+            yield f"{to_response(job)}\n"
+
+    return generate_streaming_response
+
+
+async def __poll_ingestion_job(
+    job_uuid: str, ingestion_job_queue: IngestionJobQueue
+) -> AsyncGenerator[Optional[IngestionJob], None]:
+    """
+    Yield the job on every status or progress change, None once it no longer exists.
+    Polling stops when the job is finished or after `ingestion_job_stream_timeout_seconds`.
+    """
+    deadline = time.monotonic() + app_config.ingestion_job_stream_timeout_seconds
+    while True:
+        job = await ingestion_job_queue.get_job(job_uuid)
+        yield job
+
+        remaining_seconds = deadline - time.monotonic()
+        if is_job_finished(job) or remaining_seconds <= 0:
+            return
+
+        await ingestion_job_queue.wait_for_update(
+            job_uuid,
+            min(app_config.ingestion_job_poll_interval_seconds, remaining_seconds),
+        )
+
+
+def __get_job_response_status(job: IngestionJob) -> str:
+    if job.status in [JOB_STATUS_PENDING, JOB_STATUS_RUNNING]:
+        return "Processing"
+
+    return f"{job.status}: {job.error}" if job.error else job.status
+
+
+async def __get_existing_ingestion_job(
+    job_uuid: str, ingestion_job_queue: IngestionJobQueue
+) -> IngestionJob:
+    job = await ingestion_job_queue.get_job(job_uuid)
+    if job is None:
+        raise HTTPException(404, __get_missing_job_message(job_uuid))
+
+    return job
+
+
+def __get_missing_job_message(job_uuid: str) -> str:
+    return f"ingestion job {job_uuid} does not exist"
+
+
+def __get_ingestion_job_model(job: IngestionJob) -> IngestionJobModel:
+    return IngestionJobModel(
+        job_uuid=job.uuid,
+        job_type=job.job_type,
+        status=job.status,
+        total_chunks=job.total_chunks,
+        processed_chunks=job.processed_chunks,
+        result=job.result,
+        error=job.error,
+    )
+
+
+async def __upload_file_to_s3_handler(
+    files: List[FileMetadata], ragdocument: RagDocumentClient
+) -> List[FileMetadata]:
     # create a folder for each request
     request_folder = get_temporary_filename()
 
-    file_metadata_collection = []
-    for file in files:
-        # get file contents, convert them to io
-        file_data = io.BytesIO(file.file_content_byte)
+    # files are uploaded and parsed concurrently, the slowest file bounds the request instead of the sum
+    return list(
+        await asyncio.gather(
+            *[
+                __upload_and_parse_file(file, request_folder, ragdocument)
+                for file in files
+            ]
+        )
+    )
 
-        # construct the file path where we store the file in S3
-        file_path = s3_construct_file_path(file.filename, request_folder)
 
-        # upload the file to S3
-        s3_upload_file(file_data, file_path)
+async def __upload_and_parse_file(
+    file: FileMetadata, request_folder: str, ragdocument: RagDocumentClient
+) -> FileMetadata:
+    # construct the file path where we store the file in S3
+    file_path = s3_construct_file_path(file.filename, request_folder)
 
-        file_metadata_collection.append(
-            FileMetadata(
-                filename=file.filename,
-                file_content=get_file_content_from_bytes(
-                    file.file_content_byte,
-                    filename=file.filename,
+    # upload the file to S3 in the upload thread pool while it is parsed and chunked in the parser process pool,
+    # both read the local copy of the upload so its bytes are never held in memory
+    try:
+        file_data = await asyncio.to_thread(Path(file.local_file_path).open, "rb")
+        with file_data:
+            _, file_chunks = await asyncio.gather(
+                s3_upload_file_async(file_data, file_path),
+                ragdocument.chunk_file_content(
+                    file.local_file_path, filename=file.filename
                 ),
-                file_path=file_path,
-                file_content_byte=file.file_content_byte,
             )
-        )
-    return file_metadata_collection
+    finally:
+        Path(file.local_file_path).unlink(missing_ok=True)
+
+    return FileMetadata(
+        filename=file.filename,
+        file_content="",
+        file_path=file_path,
+        file_chunks=file_chunks,
+    )
+
+
+def __delete_local_files(files: List[FileMetadata]) -> None:
+    for file in files:
+        Path(file.local_file_path).unlink(missing_ok=True)
 
 
 async def convert_file_uploaded_to_file_metadata(
@@ -473,7 +807,7 @@ async def convert_file_uploaded_to_file_metadata(
 ) -> List[FileMetadata]:
     return [
         FileMetadata(
-            file_content_byte=await file.read(),
+            local_file_path=await save_upload_file_to_temporary_file(file),
             filename=file.filename,
             file_path="",
             file_content="",
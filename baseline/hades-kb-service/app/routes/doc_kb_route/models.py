@@ -6,6 +6,7 @@ from pydantic import (
     model_validator,
 )
 
+from app.core.constant import top_k
 from app.storage.ragdocument_db.constant import ACTIVE_STATUS, INACTIVE_STATUS
 
 
@@ -16,6 +17,7 @@ class DocumentKnowledgeBaseFilter(BaseModel):
 class DocumentKnowledgeBaseRequestModel(BaseModel):
     filter: DocumentKnowledgeBaseFilter
     query: str = ""
+    top_k: int = top_k
 
     @model_validator(mode="before")
     @classmethod
@@ -38,6 +40,11 @@ class DocumentKnowledgeBaseRequestModel(BaseModel):
             message = f"{message}{',' if is_missing else ''} filter_dict.document_collection_uuids"
             is_missing = True
 
+        k = value.get("top_k", top_k)
+        if not str(k).isdigit() or k < 1:
+            message = f"{message}{',' if is_missing else ''} top_k can only be more than 0, {k}"
+            is_missing = True
+
         if is_missing:
             raise RequestValidationError(errors=f"{message} | request body: {value}")
 
@@ -46,9 +53,11 @@ class DocumentKnowledgeBaseRequestModel(BaseModel):
 
 class FileMetadata(BaseModel):
     filename: str
-    file_content_byte: bytes
+    # the upload is kept in a local temporary file until it is sent to s3 and chunked
+    local_file_path: str = ""
     file_content: str
     file_path: str
+    file_chunks: List[str] = []
 
 
 class DocumentEmbeddingResponse(BaseModel):
@@ -225,8 +234,20 @@ class DocumentCollectionMetadata(BaseModel):
 class UploadDocumentResponse(BaseModel):
     status: str
     files: List[dict]
+    job_uuid: str | None = None
 
 
 class IngestNewDocumentContentResponse(BaseModel):
     status: str
     document_information: dict | None
+    job_uuid: str | None = None
+
+
+class IngestionJobModel(BaseModel):
+    job_uuid: str
+    job_type: str
+    status: str
+    total_chunks: int
+    processed_chunks: int
+    result: dict | None = None
+    error: str | None = None
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Optional
 
@@ -27,7 +28,7 @@ from app.routes.utils import get_exception_action_response
 logger = Logger(name="slack_kb_route_handler")
 
 
-def knowledge_base_handler(
+async def knowledge_base_handler(
     request_input: KnowledgeBaseRequestModel,
     transformer: TransformerClient = Depends(get_transformer_singleton),
     ragslack: RagSlackClient = Depends(get_ragslack),
@@ -36,13 +37,13 @@ def knowledge_base_handler(
 
     try:
         ragslack.init_embedding_model(GrabGPTOpenAIModel.ADA_002)
-        knowledge_search_result = ragslack.knowledge_base_search(request_input, "<#>")
+        knowledge_search_result = await ragslack.knowledge_base_search(request_input, "<#>")
 
         if len(knowledge_search_result) == 0:
             response.message = "No result is found"
             return response
 
-        slack_information_result, pagination_result = ragslack.read_slack_information(
+        slack_information_result, pagination_result = await ragslack.read_slack_information(
             knowledge_base_result=knowledge_search_result,
             filter_list=request_input.filter,
             limit=request_input.limit,
@@ -78,13 +79,13 @@ def knowledge_base_handler(
         )
 
 
-def insert_handler(
+async def insert_handler(
     request_input: InsertRequestModel,
     ragslack: RagSlackClient = Depends(get_ragslack),
 ) -> InsertResponseModel:
     response = InsertResponseModel()
     try:
-        slack_information_doc = ragslack.insert_slack_information_to_db(request_input)
+        slack_information_doc = await ragslack.insert_slack_information_to_db(request_input)
 
         if slack_information_doc.is_embedded:
             response.details = "Ingestion: Summary is previously embeded"
@@ -92,14 +93,16 @@ def insert_handler(
 
         ragslack.init_embedding_model(GrabGPTOpenAIModel.ADA_002)
 
-        text_list = ragslack.text_pre_processing(
+        # chunking tokenizes the summary, it runs in a worker thread instead of blocking the event loop
+        text_list = await asyncio.to_thread(
+            ragslack.text_pre_processing,
             text=request_input.chat_summary,
             splitter_selector=request_input.splitter_selector,
             chunk_size=request_input.chunk_config.chunk_size,
             chunk_overlap=request_input.chunk_config.chunk_overlap,
         )
 
-        ragslack.insert_embeded_to_db(text_list, slack_information_doc)
+        await ragslack.insert_embeded_to_db(text_list, slack_information_doc)
 
         return response  # noqa: TRY300: Redundant to put this statement to an else block
 
@@ -136,8 +139,8 @@ async def get_slack_messages_handler(
             filter_conditions.append({"channel_id": [channel_id]})
 
         # Get messages and total count
-        messages = rag_slack_client.get_slack_messages(filter_conditions, limit, offset)
-        total_count = rag_slack_client.get_slack_messages_count(filter_conditions)
+        messages = await rag_slack_client.get_slack_messages(filter_conditions, limit, offset)
+        total_count = await rag_slack_client.get_slack_messages_count(filter_conditions)
 
         # Convert to response model
         response_messages = [
@@ -9,7 +9,7 @@ from pydantic import (
     model_validator,
 )
 
-from app.core.constant import query_limit
+from app.core.constant import query_limit, top_k
 from app.core.transformer.text_splitter.models import text_splitter_mapper
 from app.routes.utils import BaseResponse, is_float
 from app.storage.ragslack_db.client import RagSlackDbClient
@@ -22,6 +22,7 @@ class KnowledgeBaseRequestModel(BaseModel):
     vector_threshold: float = 0.8
     page: int = 1
     is_agent: bool = False
+    top_k: int = top_k
 
     @model_validator(mode="before")
     @classmethod
@@ -32,6 +33,7 @@ class KnowledgeBaseRequestModel(BaseModel):
         limit = value.get("limit", 0)
         vector_threshold = value.get("vector_threshold", 0)
         page = value.get("page", 1)
+        k = value.get("top_k", top_k)
 
         if not str(value.get("query", "")).strip():
             message = f"{message}{',' if is_missing else ''} query"
@@ -53,6 +55,10 @@ class KnowledgeBaseRequestModel(BaseModel):
             message = f"{message}limit is not a digit or not in range 0 to 1, {limit}"
             is_missing = True
 
+        if not str(k).isdigit() or k < 1:
+            message = f"{message}top_k can only be more than 0, {k}"
+            is_missing = True
+
         if not isinstance(value.get("is_agent", False), bool):
             message = f"{message} is_agent field given is not bool type"
             is_missing = True
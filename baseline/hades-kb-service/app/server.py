@@ -1,3 +1,6 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 import toml
 from datadog import initialize
 from fastapi import FastAPI
@@ -6,16 +9,28 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from app.auth.modes import SessionAuthMode, get_session_auth_mode
 from app.core.config import app_config, logger
+from app.core.dependencies import ingestion_job_queue
+from app.core.s3.file_parser import shutdown_file_parser_pool
 from app.routes.api import router
 from app.tracing.tracer import trace_provider
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    # ingestion job workers run on the serving loop, the async db pool is bound to it
+    ingestion_job_queue.start()
+    yield
+    await ingestion_job_queue.stop()
+    shutdown_file_parser_pool()
+
+
 def get_app() -> FastAPI:
     project_metadata = toml.load("pyproject.toml")["tool"]["poetry"]
     app = FastAPI(
         title=project_metadata["name"],
         version=project_metadata["version"],
         description=project_metadata["description"],
+        lifespan=lifespan,
     )
     app.include_router(router)
 
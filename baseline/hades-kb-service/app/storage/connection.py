@@ -1,7 +1,8 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -9,6 +10,7 @@ from app.core.config import app_config
 
 # Replace with your actual configuration
 DATABASE_URL = f"postgresql+psycopg2://{app_config.postgres_db_user}:{app_config.postgres_db_password}@{app_config.postgres_db_host}:{app_config.postgres_db_port}/{app_config.postgres_db_name}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{app_config.postgres_db_user}:{app_config.postgres_db_password}@{app_config.postgres_db_host}:{app_config.postgres_db_port}/{app_config.postgres_db_name}"
 
 engine = create_engine(
     DATABASE_URL,
@@ -34,3 +36,31 @@ def get_session() -> Generator[Session, None, None]:
         raise Exception(error_message) from e
     finally:
         db.close()
+
+
+# the async engine shares the pool settings of the sync engine, request handlers should use this one
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    max_overflow=app_config.postgres_max_overflow,
+    pool_size=app_config.postgres_pool_size,
+    pool_timeout=app_config.postgres_pool_timeout,
+    pool_recycle=app_config.postgres_pool_recycle,
+)
+
+# expire_on_commit is disabled, reading an expired attribute would need a lazy load which async sessions cannot do
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autocommit=False, autoflush=False, expire_on_commit=False
+)
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        await db.rollback()
+        error_message = "db operation failed, rollback."
+        raise Exception(error_message) from e
+    finally:
+        await db.close()
@@ -0,0 +1,85 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.log.logger import Logger
+from app.storage.embedding_cache_db.models import EmbeddingCache
+
+
+class EmbeddingCacheDbClient:
+    def __init__(
+        self, db_session: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self.__db_session = db_session
+        self.__logger = Logger(name=self.__class__.__name__)
+
+    async def read_embeddings(
+        self, model: str, content_hashes: List[str]
+    ) -> Dict[str, list[float]]:
+        """
+        Method to bulk read cached embeddings by content hash.
+        A failed read is treated as a cache miss, the caller falls back to the embedding model.
+        """
+        try:
+            if len(content_hashes) == 0:
+                return {}
+
+            async with self.__db_session() as session:
+                rows = (
+                    await session.execute(
+                        select(
+                            EmbeddingCache.content_hash, EmbeddingCache.embedding
+                        ).where(
+                            EmbeddingCache.model == model,
+                            EmbeddingCache.content_hash.in_(content_hashes),
+                        )
+                    )
+                ).all()
+
+                return {
+                    row.content_hash: [float(value) for value in row.embedding]
+                    for row in rows
+                }
+
+        except Exception as e:  # cache miss on failure
+            description = "Read embedding cache failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
+            return {}
+
+    async def insert_embeddings(
+        self, model: str, embeddings: Dict[str, list[float]]
+    ) -> None:
+        """
+        Method to bulk insert embeddings into the cache, existing (model, content_hash) pairs are kept as they are.
+        """
+        try:
+            if len(embeddings) == 0:
+                return
+
+            async with self.__db_session() as session:
+                await session.execute(
+                    insert(EmbeddingCache)
+                    .values(
+                        [
+                            {
+                                "model": model,
+                                "content_hash": content_hash,
+                                "embedding": embedding,
+                            }
+                            for content_hash, embedding in embeddings.items()
+                        ]
+                    )
+                    .on_conflict_do_nothing(
+                        constraint="uk_embedding_cache_model_content_hash"
+                    )
+                )
+                await session.commit()
+
+        except Exception as e:  # caching is best effort
+            description = "Insert embedding cache failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
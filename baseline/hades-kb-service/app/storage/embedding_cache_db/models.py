@@ -0,0 +1,38 @@
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class EmbeddingCache(Base):
+    __tablename__ = "embedding_cache"
+    id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    model = Column(String, nullable=False)
+    content_hash = Column(String, nullable=False)
+    embedding = Column(Vector(1536), nullable=False)
+    created_at = Column(DateTime(timezone=False), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "model", "content_hash", name="uk_embedding_cache_model_content_hash"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"""<EmbeddingCache(model='{self.model}',
+        content_hash='{self.content_hash}'>"""
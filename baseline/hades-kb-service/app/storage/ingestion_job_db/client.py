@@ -0,0 +1,134 @@
+import uuid
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.log.logger import Logger
+from app.storage.ingestion_job_db.constant import (
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+)
+from app.storage.ingestion_job_db.models import IngestionJob
+
+
+class IngestionJobDbClient:
+    """
+    Every status change is a conditional update on the current status,
+    so a job cancelled by another worker process is never flipped back to running or succeeded.
+    """
+
+    def __init__(
+        self, db_session: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self.__db_session = db_session
+        self.__logger = Logger(name=self.__class__.__name__)
+
+    async def create_job(self, job_type: str) -> IngestionJob:
+        """
+        Method to create a new pending ingestion job.
+        """
+        try:
+            async with self.__db_session() as session:
+                job = IngestionJob(
+                    uuid=str(uuid.uuid4()),
+                    job_type=job_type,
+                    status=JOB_STATUS_PENDING,
+                    total_chunks=0,
+                    processed_chunks=0,
+                )
+                session.add(job)
+                await session.commit()
+                await session.refresh(job)
+
+                return job
+
+        except Exception as e:
+            description = "insert new ingestion job failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
+            raise Exception(log_message) from e
+
+    async def get_job(self, job_uuid: str) -> Optional[IngestionJob]:
+        try:
+            async with self.__db_session() as session:
+                return await session.scalar(
+                    select(IngestionJob).where(IngestionJob.uuid == job_uuid)
+                )
+
+        except Exception as e:
+            description = "read ingestion job failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
+            raise Exception(log_message) from e
+
+    async def mark_job_running(self, job_uuid: str) -> bool:
+        """
+        Return False when the job is no longer pending, e.g. it was cancelled while queued.
+        """
+        return await self.__update_job(
+            job_uuid, [JOB_STATUS_PENDING], status=JOB_STATUS_RUNNING
+        )
+
+    async def update_job_progress(
+        self, job_uuid: str, total_chunks: int, processed_chunks: int
+    ) -> bool:
+        """
+        Return False when the job is no longer running, the caller should stop working on it.
+        """
+        return await self.__update_job(
+            job_uuid,
+            [JOB_STATUS_RUNNING],
+            total_chunks=total_chunks,
+            processed_chunks=processed_chunks,
+        )
+
+    async def finish_job(
+        self,
+        job_uuid: str,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        return await self.__update_job(
+            job_uuid,
+            [JOB_STATUS_PENDING, JOB_STATUS_RUNNING],
+            status=status,
+            result=result,
+            error=error,
+        )
+
+    async def cancel_job(self, job_uuid: str) -> bool:
+        """
+        Return False when the job does not exist or is already finished.
+        """
+        return await self.__update_job(
+            job_uuid,
+            [JOB_STATUS_PENDING, JOB_STATUS_RUNNING],
+            status=JOB_STATUS_CANCELLED,
+        )
+
+    async def __update_job(
+        self, job_uuid: str, from_statuses: list[str], **values: object
+    ) -> bool:
+        try:
+            async with self.__db_session() as session:
+                updated = await session.execute(
+                    update(IngestionJob)
+                    .where(
+                        IngestionJob.uuid == job_uuid,
+                        IngestionJob.status.in_(from_statuses),
+                    )
+                    .values(**values)
+                )
+                await session.commit()
+
+                return updated.rowcount != 0
+
+        except Exception as e:
+            description = f"update ingestion job {job_uuid} failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
+            raise Exception(log_message) from e
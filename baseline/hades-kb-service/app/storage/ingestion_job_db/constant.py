@@ -0,0 +1,10 @@
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+
+FINISHED_JOB_STATUSES = [JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED, JOB_STATUS_CANCELLED]
+
+JOB_TYPE_INGEST_NEW_DOC = "ingest_new_doc"
+JOB_TYPE_INGEST_NEW_DOC_CONTENT = "ingest_new_doc_content"
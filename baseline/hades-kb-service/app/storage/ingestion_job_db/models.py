@@ -0,0 +1,38 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.declarative import declarative_base
+
+from app.storage.ingestion_job_db.constant import JOB_STATUS_PENDING
+
+Base = declarative_base()
+
+
+class IngestionJob(Base):
+    __tablename__ = "ingestion_job"
+    id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    uuid = Column(Text, nullable=False)
+    job_type = Column(Text, nullable=False)
+    status = Column(Text, nullable=False, default=JOB_STATUS_PENDING)
+    total_chunks = Column(BigInteger, nullable=False, default=0)
+    processed_chunks = Column(BigInteger, nullable=False, default=0)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=False), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"""<IngestionJob(uuid='{self.uuid}',
+        job_type='{self.job_type}'
+        status='{self.status}'>"""
@@ -1,11 +1,13 @@
 import time
 import uuid
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timezone
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Tuple
 
-from sqlalchemy import Float, and_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constant import top_k
 from app.core.log.logger import Logger
 from app.core.s3.bucket_util import get_media_server_url
 from app.routes.doc_kb_route.models import (
@@ -23,15 +25,21 @@ from app.storage.ragdocument_db.models import (
     DocumentEmbedding,
     DocumentInformation,
 )
+from app.storage.vector_search import (
+    execute_filtered_vector_search,
+    get_vector_search_clauses,
+)
 
 
 class RagDocumentDbClient:
-    def __init__(self, db_session: Callable[..., Session]) -> None:
+    def __init__(
+        self, db_session: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
         self.__db_session = db_session
         self.__logger = Logger(name=self.__class__.__name__)
 
     # create new document collection
-    def create_new_document_collection(
+    async def create_new_document_collection(
         self, document_collection: DocumentCollection
     ) -> DocumentCollection:
         """
@@ -43,12 +51,12 @@ class RagDocumentDbClient:
             f"{uuid.uuid4()!s}_{int(round(time.time() * 1000))!s}"
         )
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 session.add(document_collection)
-                session.commit()
+                await session.commit()
 
                 # get the new document collection inserted ID
-                session.refresh(document_collection)
+                await session.refresh(document_collection)
 
                 return document_collection
 
@@ -58,19 +66,19 @@ class RagDocumentDbClient:
             self.__logger.exception(log_message)
             raise Exception(log_message) from e
 
-    def update_document_collection_data(self, document: DocumentCollection) -> None:
+    async def update_document_collection_data(
+        self, document: DocumentCollection
+    ) -> None:
         """
         Method to update document collection data.
         """
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 # search to see if the document collection already exists
-                document_collection_db = (
-                    session.query(DocumentCollection)
-                    .filter(
+                document_collection_db = await session.scalar(
+                    select(DocumentCollection).filter(
                         DocumentCollection.uuid == document.uuid,
                     )
-                    .first()
                 )
 
                 if document_collection_db is None:
@@ -83,8 +91,8 @@ class RagDocumentDbClient:
                 document_collection_db.name = document.name
                 document_collection_db.status = document.status
 
-                session.merge(document_collection_db)
-                session.commit()
+                await session.merge(document_collection_db)
+                await session.commit()
 
         except Exception as e:
             description = "update document collection failed"
@@ -92,20 +100,18 @@ class RagDocumentDbClient:
             self.__logger.exception(log_message)
             raise Exception(log_message) from e
 
-    def update_document_information(
+    async def update_document_information(
         self, request_input: DocumentInformationRequestModel
     ) -> None:
         """
         Method to update document information
         """
         try:
-            with self.__db_session() as session:
-                document_information = (
-                    session.query(DocumentInformation)
-                    .filter(
+            async with self.__db_session() as session:
+                document_information = await session.scalar(
+                    select(DocumentInformation).filter(
                         DocumentInformation.id == request_input.id,
                     )
-                    .first()
                 )
 
                 if document_information is None:
@@ -114,23 +120,25 @@ class RagDocumentDbClient:
 
                 document_information.status = request_input.status
 
-                session.merge(document_information)
-                session.commit()
+                await session.merge(document_information)
+                await session.commit()
         except Exception as e:
             description = "Update document information data failed"
             log_message = f"Description: {description} |Error: {e!s}"
             self.__logger.exception(log_message)
             raise Exception(log_message) from e
 
-    def insert_embedding_document(self, embedded_document: DocumentEmbedding) -> None:
+    async def insert_embedding_document(
+        self, embedded_document: DocumentEmbedding
+    ) -> None:
         """
         Method to insert document embeddings
         """
 
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 session.add(embedded_document)
-                session.commit()
+                await session.commit()
         except Exception as e:
             description = "Insert document embedding data failed"
             log_message = f"Description: {description} |Error: {e!s}"
@@ -138,7 +146,27 @@ class RagDocumentDbClient:
 
             raise Exception(log_message) from e
 
-    def update_document_collection_mapping(
+    async def insert_embedding_documents(
+        self, embedded_documents: List[DocumentEmbedding]
+    ) -> None:
+        """
+        Method to bulk insert document embeddings within a single transaction
+        """
+        if len(embedded_documents) == 0:
+            return
+
+        try:
+            async with self.__db_session() as session:
+                session.add_all(embedded_documents)
+                await session.commit()
+        except Exception as e:
+            description = "Bulk insert document embedding data failed"
+            log_message = f"Description: {description} |Error: {e!s}"
+            self.__logger.exception(log_message)
+
+            raise Exception(log_message) from e
+
+    async def update_document_collection_mapping(
         self, document_collection_mapping: DocumentCollectionMappingModel
     ) -> None:
         """
@@ -146,10 +174,9 @@ class RagDocumentDbClient:
         """
 
         try:
-            with self.__db_session() as session:
-                document_collection_mapping_db = (
-                    session.query(DocumentCollectionMapping)
-                    .filter(
+            async with self.__db_session() as session:
+                document_collection_mapping_db = await session.scalar(
+                    select(DocumentCollectionMapping).filter(
                         and_(
                             DocumentCollectionMapping.document_collection_uuid
                             == document_collection_mapping.document_collection_uuid,
@@ -157,7 +184,6 @@ class RagDocumentDbClient:
                             == document_collection_mapping.document_information_id,
                         )
                     )
-                    .first()
                 )
                 if document_collection_mapping_db is None:
                     error_message = f"unable to find document collection mapping for document_collection_uuid: {document_collection_mapping.document_collection_uuid} and document_information_id: {document_collection_mapping.document_information_id}"
@@ -165,8 +191,8 @@ class RagDocumentDbClient:
                 document_collection_mapping_db.status = (
                     document_collection_mapping.status
                 )
-                session.merge(document_collection_mapping_db)
-                session.commit()
+                await session.merge(document_collection_mapping_db)
+                await session.commit()
         except Exception as e:
             description = "Update document collection data failed"
             log_message = f"Description: {description} |Error: {e!s}"
@@ -174,143 +200,89 @@ class RagDocumentDbClient:
 
             raise Exception(log_message) from e
 
-    def read_document_embedding_data(
+    async def read_document_embedding_data(
         self,
         embeded_query: List[float],
         document_collection_uuids: List[str],
         embedding_operator: str = "<#>",
         vector_threshold: float = 0.7,
-    ) -> list[DocumentEmbedding]:
+        k: int = top_k,
+    ) -> List[Tuple[DocumentEmbedding, DocumentInformation]]:
         """
-        Method to read document embedding data based on operator and limit.
-        Important: multiply with -1 if computing with inner product at pgvector. Due to how pgvector computing negative inner product.
-
+        Method to read the top k nearest document embedding data based on operator, along with its document information.
+        The order by and limit are pushed into SQL so the hnsw index on document_embedding.embedding is used,
+        with an exact scan fallback when the filters leave fewer than k rows.
+        Active collection, mapping and document checks are resolved in the same query through an EXISTS subquery,
+        which keeps one row per embedding even when a document belongs to several of the requested collections.
         """
         try:
-            if len(embeded_query) == 0:
+            if len(embeded_query) == 0 or len(document_collection_uuids) == 0:
                 return []
 
-            with self.__db_session() as session:
-                document_collections = session.query(DocumentCollection).filter(
-                    and_(
-                        DocumentCollection.uuid.in_(document_collection_uuids),
-                        DocumentCollection.status == ACTIVE_STATUS,
-                    )
+            async with self.__db_session() as session:
+                order_clause, similarity_clause = get_vector_search_clauses(
+                    DocumentEmbedding.embedding, embeded_query, embedding_operator
                 )
 
-                if document_collections is None or document_collections.count() == 0:
-                    # the document collection might be disabled
-                    return []
-
-                document_collection_mappings = session.query(
-                    DocumentCollectionMapping
-                ).filter(
-                    and_(
+                active_in_collections = (
+                    select(DocumentCollectionMapping.id)
+                    .join(
+                        DocumentCollection,
+                        DocumentCollection.uuid
+                        == DocumentCollectionMapping.document_collection_uuid,
+                    )
+                    .where(
+                        DocumentCollectionMapping.document_information_id
+                        == DocumentInformation.id,
                         DocumentCollectionMapping.document_collection_uuid.in_(
                             document_collection_uuids
                         ),
                         DocumentCollectionMapping.status == ACTIVE_STATUS,
+                        DocumentCollection.status == ACTIVE_STATUS,
                     )
+                    .exists()
                 )
 
-                if (
-                    document_collection_mappings is None
-                    or document_collection_mappings.count() == 0
-                ):
-                    # the document collection id provided has no document inside it
-                    return []
-
-                document_information_ids = [
-                    document_collection_mapping.document_information_id
-                    for document_collection_mapping in document_collection_mappings
-                ]
-
-                # search for the documents that are still active
-                document_informations_active = session.query(
-                    DocumentInformation
-                ).filter(
-                    and_(
-                        DocumentInformation.status == ACTIVE_STATUS,
-                        DocumentInformation.id.in_(document_information_ids),
-                    )
-                )
-
-                if (
-                    document_informations_active is None
-                    or document_informations_active.count() == 0
-                ):
-                    return []
-
-                document_information_ids = [
-                    document_information_active.id
-                    for document_information_active in document_informations_active
-                ]
-
-                base_clause_statement = DocumentEmbedding.embedding.op(
-                    embedding_operator, return_type=Float
-                )(embeded_query)
-
-                clause_statement = base_clause_statement.desc()
-
-                if embedding_operator == "<#>":
-                    clause_statement = -1 * clause_statement
-                    base_clause_statement = -1 * base_clause_statement
-
                 statement = (
-                    select(DocumentEmbedding)
-                    .order_by(clause_statement)
-                    .filter(
+                    select(DocumentEmbedding, DocumentInformation)
+                    .join(
+                        DocumentInformation,
+                        DocumentInformation.id
+                        == DocumentEmbedding.document_information_id,
+                    )
+                    .where(
                         and_(
                             DocumentEmbedding.status == ACTIVE_STATUS,
-                            DocumentEmbedding.document_information_id.in_(
-                                document_information_ids
-                            ),
-                            base_clause_statement > vector_threshold,
+                            DocumentInformation.status == ACTIVE_STATUS,
+                            active_in_collections,
+                            similarity_clause > vector_threshold,
                         )
                     )
+                    .order_by(order_clause)
+                    .limit(k)
                 )
 
-                result = session.scalars(statement).all()
-
-                if result is None:
-                    return []
-
-                return result
-
-        except Exception as e:
-            description = "Read document embedding data failed"
-            log_message = f"Description: {description} |Error: {e!s}"
-            self.__logger.exception(log_message)
-            raise Exception(log_message) from e
-
-    def get_document_informations_on_ids(
-        self, document_information_ids: List[int]
-    ) -> List[DocumentInformation]:
-        try:
-            with self.__db_session() as session:
-                return session.query(DocumentInformation).filter(
-                    DocumentInformation.id.in_(document_information_ids)
+                rows = await execute_filtered_vector_search(
+                    session, statement, k, embedding_operator
                 )
+                return [tuple(row) for row in rows]
 
         except Exception as e:
-            description = "Get document information data based on id failed"
+            description = "Read document embedding data failed"
             log_message = f"Description: {description} |Error: {e!s}"
             self.__logger.exception(log_message)
-
             raise Exception(log_message) from e
 
-    def insert_new_document_information(
+    async def insert_new_document_information(
         self, new_document: DocumentInformation, document_collection_uuid: str
     ) -> DocumentInformation:
         try:
             existing_doc_id = 0
-            with self.__db_session() as session:
-                existing_doc = (
-                    session.query(DocumentInformation)
-                    .filter(
+            async with self.__db_session() as session:
+                existing_doc = await session.scalar(
+                    select(DocumentInformation).filter(
                         DocumentInformation.file_path == new_document.file_path,
                     )
-                    .first()
                 )
 
                 if existing_doc is None:
@@ -319,28 +291,27 @@ class RagDocumentDbClient:
 
                     existing_doc = new_document
                 else:
-                    # get all the document embeddings that are linked to the current document, set them as inactive
-                    existing_doc_embeddings = session.query(DocumentEmbedding).filter(
-                        DocumentEmbedding.document_information_id == existing_doc.id,
+                    # set all the document embeddings that are linked to the current document as inactive
+                    await session.execute(
+                        update(DocumentEmbedding)
+                        .where(
+                            DocumentEmbedding.document_information_id
+                            == existing_doc.id,
+                        )
+                        .values(status=INACTIVE_STATUS)
                     )
-                    if existing_doc_embeddings is not None:
-                        for existing_doc_embedding in existing_doc_embeddings:
-                            existing_doc_embedding.status = INACTIVE_STATUS
-                            session.merge(existing_doc_embedding)
-                            session.commit()
 
                     # update the document information
                     existing_doc.document_last_updated = datetime.now(timezone.utc)
-                    session.merge(existing_doc)
+                    await session.merge(existing_doc)
 
-                session.commit()
+                await session.commit()
                 existing_doc_id = existing_doc.id
 
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 # check if the document is being added to the document collection already
-                existing_doc_collection_mapping = (
-                    session.query(DocumentCollectionMapping)
-                    .filter(
+                existing_doc_collection_mapping = await session.scalar(
+                    select(DocumentCollectionMapping).filter(
                         and_(
                             DocumentCollectionMapping.document_collection_uuid
                             == document_collection_uuid,
@@ -348,7 +319,6 @@ class RagDocumentDbClient:
                             == existing_doc_id,
                         )
                     )
-                    .first()
                 )
 
                 if existing_doc_collection_mapping is None:
@@ -360,13 +330,13 @@ class RagDocumentDbClient:
                         )
                     )
 
-                    session.commit()
+                    await session.commit()
                 elif (
                     existing_doc_collection_mapping.status == INACTIVE_STATUS
                 ):  # mapping exists and is inactive
                     existing_doc_collection_mapping.status = ACTIVE_STATUS
-                    session.merge(existing_doc_collection_mapping)
-                    session.commit()
+                    await session.merge(existing_doc_collection_mapping)
+                    await session.commit()
 
                 return existing_doc
 
@@ -376,17 +346,15 @@ class RagDocumentDbClient:
             self.__logger.exception(log_message)
             raise Exception(log_message) from e
 
-    def get_document_collection_metadata(
+    async def get_document_collection_metadata(
         self, document_collection_uuid: str
     ) -> DocumentCollectionMetadata:
         try:
-            with self.__db_session() as session:
-                document_collection = (
-                    session.query(DocumentCollection)
-                    .filter(
+            async with self.__db_session() as session:
+                document_collection = await session.scalar(
+                    select(DocumentCollection).filter(
                         DocumentCollection.uuid == document_collection_uuid,
                     )
-                    .first()
                 )
 
                 if document_collection is None:
@@ -400,17 +368,16 @@ class RagDocumentDbClient:
                     uuid=document_collection.uuid,
                 )
 
-                document_collection_mappings = session.query(
-                    DocumentCollectionMapping
-                ).filter(
-                    DocumentCollectionMapping.document_collection_uuid
-                    == document_collection_uuid
-                )
+                document_collection_mappings = (
+                    await session.scalars(
+                        select(DocumentCollectionMapping).filter(
+                            DocumentCollectionMapping.document_collection_uuid
+                            == document_collection_uuid
+                        )
+                    )
+                ).all()
 
-                if (
-                    document_collection_mappings is None
-                    or document_collection_mappings.count() == 0
-                ):
+                if len(document_collection_mappings) == 0:
                     return DocumentCollectionMetadata(
                         document_collection_metadata=document_collection_metadata,
                         document_informations=[],
@@ -428,9 +395,13 @@ class RagDocumentDbClient:
                     for document_collection_map_index in document_collection_mappings
                 ]
 
-                document_informations = session.query(DocumentInformation).filter(
-                    DocumentInformation.id.in_(document_information_ids)
-                )
+                document_informations = (
+                    await session.scalars(
+                        select(DocumentInformation).filter(
+                            DocumentInformation.id.in_(document_information_ids)
+                        )
+                    )
+                ).all()
 
                 document_information_metadata: List[DocumentInformationModel] = [
                     DocumentCollectionMappingMetadata(
@@ -82,9 +82,7 @@ class DocumentCollectionMapping(Base):
     __tablename__ = "document_collection_mapping"
     id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
     document_information_id = Column(BigInteger, ForeignKey("document_information.id"))
-    document_collection_uuid = Column(
-        BigInteger, ForeignKey("document_collection.uuid")
-    )
+    document_collection_uuid = Column(Text, ForeignKey("document_collection.uuid"))
     status = Column(Text, nullable=False, default=ACTIVE_STATUS)
     created_at = Column(DateTime(timezone=False), server_default=func.now())
     updated_at = Column(
@@ -1,9 +1,11 @@
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Callable, Dict, List, Optional
 
-from sqlalchemy import Float, and_, case, delete, desc, func, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, desc, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
+from app.core.constant import top_k
 from app.core.log.logger import Logger
 from app.storage.ragslack_db.models import (
     QueriesToSlackEmbeddingsRecords,
@@ -11,15 +13,21 @@ from app.storage.ragslack_db.models import (
     SlackMessageEmbeddingDoc,
     SlackMessageInformationDoc,
 )
+from app.storage.vector_search import (
+    get_vector_search_clauses,
+    set_vector_search_params,
+)
 
 
 class RagSlackDbClient:
-    def __init__(self, db_session: Callable[..., Session]) -> None:
+    def __init__(
+        self, db_session: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
         self.__db_session = db_session
         self.__logger = Logger(name=self.__class__.__name__)
 
     # insert data and multiple data might can createa a base class
-    def insert_slack_information_data(
+    async def insert_slack_information_data(
         self, document: SlackMessageInformationDoc
     ) -> SlackMessageInformationDoc:
         """
@@ -27,15 +35,13 @@ class RagSlackDbClient:
         """
         is_update = False
         try:
-            with self.__db_session() as session:
-                existing_doc = (
-                    session.query(SlackMessageInformationDoc)
-                    .filter(
+            async with self.__db_session() as session:
+                existing_doc = await session.scalar(
+                    select(SlackMessageInformationDoc).filter(
                         SlackMessageInformationDoc.channel_id == document.channel_id,
                         SlackMessageInformationDoc.main_thread_ts
                         == document.main_thread_ts,
                     )
-                    .first()
                 )
 
                 if existing_doc is None:
@@ -47,14 +53,14 @@ class RagSlackDbClient:
                     existing_doc.chat_summary = document.chat_summary
                     existing_doc.chat_history = document.chat_history
                     existing_doc.is_embedded = False
-                    session.merge(existing_doc)
+                    await session.merge(existing_doc)
 
-                session.commit()
+                await session.commit()
                 if not is_update:
-                    session.refresh(document)
+                    await session.refresh(document)
                     return document
 
-                session.refresh(existing_doc)
+                await session.refresh(existing_doc)
                 return existing_doc
 
         except Exception as e:
@@ -64,16 +70,16 @@ class RagSlackDbClient:
             error_message = "Insert slack information data failed"
             raise Exception(error_message) from e
 
-    def update_slack_information_data(
+    async def update_slack_information_data(
         self, document: SlackMessageInformationDoc
     ) -> None:
         """
         Method to update slack information data.
         """
         try:
-            with self.__db_session() as session:
-                session.merge(document)
-                session.commit()
+            async with self.__db_session() as session:
+                await session.merge(document)
+                await session.commit()
 
         except Exception as e:
             description = "update slack information failed"
@@ -82,7 +88,7 @@ class RagSlackDbClient:
             error_message = "update slack information data failed"
             raise Exception(error_message) from e
 
-    def insert_embedding_data(self, embedded_queries: list[Any]) -> None:
+    async def insert_embedding_data(self, embedded_queries: list[Any]) -> None:
         """
         Method to insert bulk data into table/schema, input is a list.
         """
@@ -91,10 +97,9 @@ class RagSlackDbClient:
             if len(embedded_queries) == 0:
                 return
 
-            with self.__db_session() as session:
-                for embedding in embedded_queries:
-                    session.add(embedding)
-                session.commit()
+            async with self.__db_session() as session:
+                session.add_all(embedded_queries)
+                await session.commit()
         except Exception as e:
             description = "Insert emedding data failed"
             log_message = f"Description: {description} |Error: {e!s}"
@@ -102,40 +107,36 @@ class RagSlackDbClient:
             error_message = "Insert embeded data failed"
             raise Exception(error_message) from e
 
-    def read_slack_embedding_data(
+    async def read_slack_embedding_data(
         self,
         embeded_query: list[float],
         embedding_operator: str,
         vector_threshold: float = 0.7,
+        k: int = top_k,
     ) -> list[SlackMessageEmbeddingDoc]:
         """
-        Method to read embedding data based on operator and limit.
-        Important: multiply with -1 if computing with inner product at pgvector. Due to how pgvector computing negative inner product.
-
+        Method to read the top k nearest embedding data based on operator.
+        The order by and limit are pushed into SQL so the hnsw index on slack_message_embedding.embedding is used.
         """
         try:
             if len(embeded_query) == 0:
                 return []
 
-            with self.__db_session() as session:
-                base_clause_statement = SlackMessageEmbeddingDoc.embedding.op(
-                    embedding_operator, return_type=Float
-                )(embeded_query)
+            async with self.__db_session() as session:
+                await set_vector_search_params(session, k)
 
-                clause_statement = base_clause_statement.desc()
-
-                if embedding_operator == "<#>":
-                    clause_statement = -1 * clause_statement
-                    base_clause_statement = -1 * base_clause_statement
+                order_clause, similarity_clause = get_vector_search_clauses(
+                    SlackMessageEmbeddingDoc.embedding, embeded_query, embedding_operator
+                )
 
-                statement = select(SlackMessageEmbeddingDoc).order_by(clause_statement)
+                statement = (
+                    select(SlackMessageEmbeddingDoc).order_by(order_clause).limit(k)
+                )
 
                 if vector_threshold != 0:
-                    statement = statement.filter(
-                        base_clause_statement > vector_threshold
-                    )
+                    statement = statement.filter(similarity_clause > vector_threshold)
 
-                result = session.scalars(statement).all()
+                result = (await session.scalars(statement)).all()
 
                 if result is None:
                     return []
@@ -168,7 +169,7 @@ class RagSlackDbClient:
 
         return filtered_result
 
-    def read_slack_information_by_id(
+    async def read_slack_information_by_id(
         self, ids: list[int], filter_list: Optional[Dict[str, list[str]]] = None
     ) -> list[SlackMessageInformationDoc] | None:
         """
@@ -179,9 +180,9 @@ class RagSlackDbClient:
             if len(ids) == 0:
                 return []
 
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 clause_statement_list = [SlackMessageInformationDoc.id.in_(ids)]
-                query_statement = session.query(SlackMessageInformationDoc)
+                query_statement = select(SlackMessageInformationDoc)
 
                 if filter_list is not None:
                     for key, value in filter_list.items():
@@ -197,10 +198,12 @@ class RagSlackDbClient:
                     value=SlackMessageInformationDoc.id,
                 )
                 return (
-                    query_statement.filter(and_(*clause_statement_list))
-                    .order_by(order_conditions)
-                    .all()
-                )
+                    await session.scalars(
+                        query_statement.filter(and_(*clause_statement_list)).order_by(
+                            order_conditions
+                        )
+                    )
+                ).all()
 
         except Exception as e:
             description = "Read slack information by id failed"
@@ -209,7 +212,7 @@ class RagSlackDbClient:
             error_message = "Read slack infromation data by id failed"
             raise Exception(error_message) from e
 
-    def read_embedded_by_slack_information_channel_id(
+    async def read_embedded_by_slack_information_channel_id(
         self, ids: list[int]
     ) -> list[SlackMessageEmbeddingDoc] | None:
         """
@@ -219,14 +222,16 @@ class RagSlackDbClient:
             if len(ids) == 0:
                 return []
 
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 return (
-                    session.query(SlackMessageEmbeddingDoc)
-                    .filter(
-                        SlackMessageEmbeddingDoc.slack_message_information_id.in_(ids)
+                    await session.scalars(
+                        select(SlackMessageEmbeddingDoc).filter(
+                            SlackMessageEmbeddingDoc.slack_message_information_id.in_(
+                                ids
+                            )
+                        )
                     )
-                    .all()
-                )
+                ).all()
 
         except Exception as e:
             description = "Read slack embedded data by slack information id failed"
@@ -235,19 +240,19 @@ class RagSlackDbClient:
             error_message = "Insert embedding data by slack information id failed"
             raise Exception(error_message) from e
 
-    def delete_embedded_data(self, unique_id: int) -> None:
+    async def delete_embedded_data(self, unique_id: int) -> None:
         """
         Method to delete embeded data in slack_embedding_table
         """
         try:
-            with self.__db_session() as session:
-                session.execute(
+            async with self.__db_session() as session:
+                await session.execute(
                     delete(SlackMessageEmbeddingDoc).where(
                         SlackMessageEmbeddingDoc.slack_message_information_id
                         == unique_id
                     )
                 )
-                session.commit()
+                await session.commit()
 
         except Exception as e:
             description = "Delete embedded data failed"
@@ -256,17 +261,17 @@ class RagSlackDbClient:
             error_message = "Delete embedded data failed"
             raise Exception(error_message) from e
 
-    def insert_query_to_embedding_records(
+    async def insert_query_to_embedding_records(
         self, query_record: QueriesToSlackEmbeddingsRecords
     ) -> None:
         """
         Method to insert query record related to slack embeddings data
         """
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 session.add(query_record)
-                session.commit()
-                session.refresh(query_record)
+                await session.commit()
+                await session.refresh(query_record)
                 return
 
         except Exception as e:
@@ -275,21 +280,20 @@ class RagSlackDbClient:
             self.__logger.exception(log_message)
             return
 
-    def insert_query_to_slack_mappings(
+    async def insert_query_to_slack_mappings(
         self, queries_to_slack_mapping_docs: list[QueriesToSlackInformationMapping]
     ) -> None:
         """
         Method to insert query to slack records mapping.
         """
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 if len(queries_to_slack_mapping_docs) == 0:
                     return
 
-                for record in queries_to_slack_mapping_docs:
-                    session.add(record)
+                session.add_all(queries_to_slack_mapping_docs)
 
-                session.commit()
+                await session.commit()
 
         except Exception as e:
             description = "Insert query mapping failed"
@@ -303,7 +307,7 @@ class RagSlackDbClient:
             key for key in filter_dict if not hasattr(SlackMessageInformationDoc, key)
         ]
 
-    def get_slack_messages(
+    async def get_slack_messages(
         self,
         filter_conditions: List[Dict[str, List[str]]],
         limit: int = 100,
@@ -313,7 +317,7 @@ class RagSlackDbClient:
         try:
             self.__logger.info(f"Getting slack messages with filter conditions: {filter_conditions}")
 
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 # Build base query
                 query = select(SlackMessageInformationDoc)
 
@@ -342,15 +346,17 @@ class RagSlackDbClient:
                 self.__logger.info(f"Executing query: {query}")
 
                 # Execute query
-                result = session.scalars(query).all()
+                result = (await session.scalars(query)).all()
                 self.__logger.info(f"Query returned {len(result) if result else 0} results")
 
                 # If no results, let's check if the channel exists at all
                 if not result and any("channel_id" in d for d in filter_conditions):
                     channel_id = next(d["channel_id"][0] for d in filter_conditions if "channel_id" in d)
-                    channel_check = session.query(SlackMessageInformationDoc).filter(
-                        SlackMessageInformationDoc.channel_id == channel_id
-                    ).first()
+                    channel_check = await session.scalar(
+                        select(SlackMessageInformationDoc).filter(
+                            SlackMessageInformationDoc.channel_id == channel_id
+                        )
+                    )
                     self.__logger.info(f"Channel {channel_id} exists in database: {channel_check is not None}")
 
                 return result if result else []
@@ -359,13 +365,13 @@ class RagSlackDbClient:
             self.__logger.error(f"Failed to get slack messages: {e}")
             raise
 
-    def get_slack_messages_count(
+    async def get_slack_messages_count(
         self,
         filter_conditions: List[Dict[str, List[str]]]
     ) -> int:
         """Get total count of slack messages matching filter conditions"""
         try:
-            with self.__db_session() as session:
+            async with self.__db_session() as session:
                 # Build base query
                 query = select(func.count()).select_from(SlackMessageInformationDoc)
 
@@ -386,7 +392,7 @@ class RagSlackDbClient:
                         query = query.filter(and_(*conditions))
 
                 # Execute query
-                return session.scalar(query) or 0
+                return await session.scalar(query) or 0
 
         except Exception as e:
             self.__logger.error(f"Failed to get slack messages count: {e}")
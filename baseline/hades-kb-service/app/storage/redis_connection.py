@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from redis.cluster import RedisCluster as Redis
+
+from app.core.config import app_config
+
+
+# a valid redis cluster must be available before calling this, the client is shared by every caller in the process
+@lru_cache
+def get_redis_cluster() -> Redis:
+    return Redis(host=app_config.redis_host, port=app_config.redis_port)
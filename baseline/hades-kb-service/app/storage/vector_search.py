@@ -0,0 +1,76 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float, Select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from app.core.config import app_config
+
+INNER_PRODUCT_OPERATOR = "<#>"
+# upper bound of hnsw.ef_search accepted by pgvector
+MAX_HNSW_EF_SEARCH = 1000
+
+
+def get_vector_search_clauses(
+    embedding_column: InstrumentedAttribute,
+    embeded_query: list[float],
+    embedding_operator: str,
+) -> tuple[ColumnElement, ColumnElement]:
+    """
+    Build the (order by, similarity) clauses for a pgvector search.
+    For `<#>` the order by clause stays as the raw `column <#> query` expression in ascending order,
+    any arithmetic on it prevents the planner from using the hnsw index (built with vector_ip_ops).
+    Important: pgvector returns the negative inner product for `<#>`, so the similarity is multiplied with -1.
+    The other operators are not indexed and keep their original order, by distance in descending order.
+    """
+    distance = embedding_column.op(embedding_operator, return_type=Float)(embeded_query)
+
+    if embedding_operator == INNER_PRODUCT_OPERATOR:
+        return distance.asc(), -1 * distance
+
+    return distance.desc(), distance
+
+
+async def set_vector_search_params(
+    session: AsyncSession,
+    k: int,
+    filtered: bool = False,  # noqa: FBT001, FBT002
+) -> None:
+    """
+    Set the ANN query time knobs for the current transaction only.
+    `hnsw.ef_search` must be at least k, otherwise the index scan returns fewer than k rows.
+    A `filtered` search drops candidates that fail its where clause after the index scan,
+    so it uses the larger `pgvector_hnsw_filtered_ef_search`.
+    """
+    ef_search = (
+        app_config.pgvector_hnsw_filtered_ef_search
+        if filtered
+        else app_config.pgvector_hnsw_ef_search
+    )
+
+    await session.execute(
+        text(
+            "SELECT set_config('hnsw.ef_search', :ef_search, true), set_config('ivfflat.probes', :probes, true)"
+        ),
+        {
+            "ef_search": str(min(max(ef_search, k), MAX_HNSW_EF_SEARCH)),
+            "probes": str(app_config.pgvector_ivfflat_probes),
+        },
+    )
+
+
+async def execute_filtered_vector_search(
+    session: AsyncSession, statement: Select, k: int, embedding_operator: str
+) -> list[Any]:
+    """
+    Run a top k vector search that also filters on other columns.
+    When the hnsw scan leaves fewer than k rows after filtering, the search is repeated as an exact scan
+    for the current transaction only, so a selective filter never loses rows to the approximate search.
+    """
+    await set_vector_search_params(session, k, filtered=True)
+    rows = (await session.execute(statement)).all()
+    if len(rows) >= k or embedding_operator != INNER_PRODUCT_OPERATOR:
+        return rows
+
+    await session.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+    return (await session.execute(statement)).all()
@@ -0,0 +1,11 @@
+-- +migrate Up notransaction
+-- the ivfflat index was built with lists = 100 on an empty table, so its centroids never reflected the data;
+-- hnsw does not need a training step and keeps recall stable as the table grows
+DROP INDEX CONCURRENTLY IF EXISTS index_embedding;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_slack_message_embedding_embedding_hnsw ON slack_message_embedding USING hnsw (embedding vector_ip_ops) WITH (m = 16, ef_construction = 64);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_document_embedding_embedding_hnsw ON document_embedding USING hnsw (embedding vector_ip_ops) WITH (m = 16, ef_construction = 64);
+
+-- +migrate Down notransaction
+DROP INDEX CONCURRENTLY IF EXISTS index_document_embedding_embedding_hnsw;
+DROP INDEX CONCURRENTLY IF EXISTS index_slack_message_embedding_embedding_hnsw;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_embedding ON slack_message_embedding USING ivfflat (embedding vector_ip_ops) WITH (lists = 100);
@@ -0,0 +1,16 @@
+-- +migrate Up
+CREATE TABLE embedding_cache (
+    id BIGSERIAL,
+    model VARCHAR(255) NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    embedding VECTOR(1536) NOT NULL,
+    created_at                  TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    updated_at                  TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id),
+    CONSTRAINT uk_embedding_cache_model_content_hash UNIQUE(model, content_hash)
+);
+
+CREATE INDEX index_embedding_cache_created_at ON embedding_cache(created_at);
+
+-- +migrate Down
+DROP TABLE IF EXISTS embedding_cache;
@@ -0,0 +1,11 @@
+-- +migrate Up notransaction
+-- supports the EXISTS subquery in read_document_embedding_data: mapping lookup by document, collection and status
+-- built concurrently so the document and embedding tables keep taking writes during the deploy
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_document_collection_mapping_info_id_collection_uuid_status ON document_collection_mapping(document_information_id, document_collection_uuid, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_document_collection_uuid_status ON document_collection(uuid, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_document_embedding_document_information_id_status ON document_embedding(document_information_id, status);
+
+-- +migrate Down notransaction
+DROP INDEX CONCURRENTLY IF EXISTS index_document_embedding_document_information_id_status;
+DROP INDEX CONCURRENTLY IF EXISTS index_document_collection_uuid_status;
+DROP INDEX CONCURRENTLY IF EXISTS index_document_collection_mapping_info_id_collection_uuid_status;
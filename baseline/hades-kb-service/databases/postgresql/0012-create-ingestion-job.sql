@@ -0,0 +1,21 @@
+-- +migrate Up
+CREATE TABLE ingestion_job (
+    id BIGSERIAL,
+    uuid VARCHAR(255) NOT NULL,
+    job_type VARCHAR(255) NOT NULL,
+    status VARCHAR(255) NOT NULL,
+    total_chunks BIGINT NOT NULL DEFAULT 0,
+    processed_chunks BIGINT NOT NULL DEFAULT 0,
+    result JSONB,
+    error TEXT,
+    created_at                  TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    updated_at                  TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id),
+    CONSTRAINT uk_ingestion_job_uuid UNIQUE(uuid)
+);
+
+CREATE INDEX index_ingestion_job_status ON ingestion_job(status);
+CREATE INDEX index_ingestion_job_created_at ON ingestion_job(created_at);
+
+-- +migrate Down
+DROP TABLE IF EXISTS ingestion_job;
@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from app.core.azure_em.client import EmbeddingModelClient
+from app.core.config import app_config
+
+
+class FakeEmbeddingModel:
+    def __init__(self, failures_before_success: int = 0) -> None:
+        self.failures_before_success = failures_before_success
+        self.calls: list[list[str]] = []
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        if self.failures_before_success > 0:
+            self.failures_before_success -= 1
+            message = "rate limited"
+            raise RateLimitError(
+                message,
+                response=httpx.Response(
+                    429, request=httpx.Request("POST", "http://localhost")
+                ),
+                body=None,
+            )
+        return [[float(len(text))] for text in texts]
+
+
+def get_embedding_client(model: FakeEmbeddingModel) -> EmbeddingModelClient:
+    client = EmbeddingModelClient()
+    client._EmbeddingModelClient__model = model  # noqa: SLF001, inject fake model
+    return client
+
+
+class TestEmbeddingModelClient:
+    def test_embed_documents_keeps_input_order(self) -> None:
+        model = FakeEmbeddingModel()
+        client = get_embedding_client(model)
+        texts = ["a" * length for length in range(1, 8)]
+
+        got = asyncio.run(
+            client.embed_documents(texts, batch_size=3, max_concurrency=2)
+        )
+
+        assert got == [[float(length)] for length in range(1, 8)]
+        assert sorted(len(call) for call in model.calls) == [1, 3, 3]
+
+    def test_embed_documents_retries_rate_limited_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(app_config, "embedding_retry_backoff_seconds", 0)
+        model = FakeEmbeddingModel(failures_before_success=1)
+        client = get_embedding_client(model)
+
+        got = asyncio.run(
+            client.embed_documents(["ab", "c"], batch_size=2, max_concurrency=1)
+        )
+
+        assert got == [[2.0], [1.0]]
+        assert len(model.calls) == 2  # noqa: PLR2004, one failure and one retry
+
+    def test_embed_documents_raises_after_max_retries(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(app_config, "embedding_retry_backoff_seconds", 0)
+        monkeypatch.setattr(app_config, "embedding_max_retries", 1)
+        client = get_embedding_client(FakeEmbeddingModel(failures_before_success=5))
+
+        with pytest.raises(Exception, match="Unable to embed documents"):
+            asyncio.run(client.embed_documents(["ab"], batch_size=1, max_concurrency=1))
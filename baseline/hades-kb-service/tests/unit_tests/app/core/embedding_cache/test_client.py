@@ -0,0 +1,64 @@
+import asyncio
+from typing import Dict, List
+
+from app.core.embedding_cache.client import (
+    EmbeddingCacheClient,
+    EmbeddingLRUCache,
+    get_content_hash,
+)
+
+MODEL = "text-embedding-ada-002"
+
+
+class FakeEmbeddingCacheDbClient:
+    def __init__(self) -> None:
+        self.rows: Dict[str, list[float]] = {}
+        self.read_calls: List[List[str]] = []
+
+    async def read_embeddings(
+        self, _: str, content_hashes: List[str]
+    ) -> Dict[str, list[float]]:
+        self.read_calls.append(content_hashes)
+        return {
+            content_hash: self.rows[content_hash]
+            for content_hash in content_hashes
+            if content_hash in self.rows
+        }
+
+    async def insert_embeddings(
+        self, _: str, embeddings: Dict[str, list[float]]
+    ) -> None:
+        self.rows.update(embeddings)
+
+
+class TestEmbeddingCache:
+    def test_get_content_hash_ignores_whitespace(self) -> None:
+        assert get_content_hash("hello  world\n") == get_content_hash("hello world")
+        assert get_content_hash("hello world") != get_content_hash("hello world!")
+
+    def test_lru_cache_evicts_least_recently_used(self) -> None:
+        lru_cache = EmbeddingLRUCache(max_size=2)
+        lru_cache.put_many(MODEL, {"a": [1.0], "b": [2.0]})
+        lru_cache.get_many(MODEL, ["a"])
+        lru_cache.put_many(MODEL, {"c": [3.0]})
+
+        assert lru_cache.get_many(MODEL, ["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+        assert lru_cache.get_many("another-model", ["a"]) == {}
+
+    def test_cache_client_reads_through_to_db(self) -> None:
+        db_client = FakeEmbeddingCacheDbClient()
+        db_client.rows[get_content_hash("from db")] = [1.0]
+        cache_client = EmbeddingCacheClient(
+            embedding_cache_db=db_client, lru_cache=EmbeddingLRUCache(max_size=10)
+        )
+        asyncio.run(cache_client.put_embeddings(MODEL, ["from put"], [[2.0]]))
+
+        got = asyncio.run(
+            cache_client.get_embeddings(MODEL, ["from db", "from put", "missing"])
+        )
+
+        assert got == [[1.0], [2.0], None]
+
+        # the db hit is promoted to the lru, so only the miss goes to the db again
+        asyncio.run(cache_client.get_embeddings(MODEL, ["from db", "missing"]))
+        assert db_client.read_calls[-1] == [get_content_hash("missing")]
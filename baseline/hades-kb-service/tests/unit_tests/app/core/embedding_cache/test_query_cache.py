@@ -0,0 +1,32 @@
+import asyncio
+
+from app.core.embedding_cache.query_cache import QueryEmbeddingCache, normalize_query
+
+MODEL = "text-embedding-ada-002"
+
+
+class TestQueryEmbeddingCache:
+    def test_normalize_query(self) -> None:
+        assert normalize_query("How To\n\nDeploy") == "how todeploy"
+
+    def test_get_uses_normalized_query(self) -> None:
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60)
+        asyncio.run(cache.put(MODEL, "How to deploy", [1.0]))
+
+        assert asyncio.run(cache.get(MODEL, "how to deploy")) == [1.0]
+        assert asyncio.run(cache.get(MODEL, "HOW TO DEPLOY\n")) == [1.0]
+        assert asyncio.run(cache.get("another-model", "how to deploy")) is None
+
+    def test_get_skips_expired_entry(self) -> None:
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=0)
+        asyncio.run(cache.put(MODEL, "how to deploy", [1.0]))
+
+        assert asyncio.run(cache.get(MODEL, "how to deploy")) is None
+
+    def test_put_evicts_least_recently_used(self) -> None:
+        cache = QueryEmbeddingCache(max_size=1, ttl_seconds=60)
+        asyncio.run(cache.put(MODEL, "first", [1.0]))
+        asyncio.run(cache.put(MODEL, "second", [2.0]))
+
+        assert asyncio.run(cache.get(MODEL, "first")) is None
+        assert asyncio.run(cache.get(MODEL, "second")) == [2.0]
@@ -0,0 +1,342 @@
+import asyncio
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from app.core.ingestion_job.client import (
+    IngestionJobProgress,
+    IngestionJobQueue,
+    is_job_finished,
+)
+from app.storage.ingestion_job_db.constant import (
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_SUCCEEDED,
+)
+from app.storage.ingestion_job_db.models import IngestionJob
+
+
+class FakeIngestionJobDbClient:
+    def __init__(self) -> None:
+        self.jobs: Dict[str, IngestionJob] = {}
+
+    async def create_job(self, job_type: str) -> IngestionJob:
+        job = IngestionJob(
+            uuid=f"job-{len(self.jobs)}",
+            job_type=job_type,
+            status=JOB_STATUS_PENDING,
+            total_chunks=0,
+            processed_chunks=0,
+        )
+        self.jobs[job.uuid] = job
+        return job
+
+    async def get_job(self, job_uuid: str) -> Optional[IngestionJob]:
+        return self.jobs.get(job_uuid)
+
+    async def mark_job_running(self, job_uuid: str) -> bool:
+        return self.__update(job_uuid, [JOB_STATUS_PENDING], status=JOB_STATUS_RUNNING)
+
+    async def update_job_progress(
+        self, job_uuid: str, total_chunks: int, processed_chunks: int
+    ) -> bool:
+        return self.__update(
+            job_uuid,
+            [JOB_STATUS_RUNNING],
+            total_chunks=total_chunks,
+            processed_chunks=processed_chunks,
+        )
+
+    async def finish_job(
+        self,
+        job_uuid: str,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        return self.__update(
+            job_uuid,
+            [JOB_STATUS_PENDING, JOB_STATUS_RUNNING],
+            status=status,
+            result=result,
+            error=error,
+        )
+
+    async def cancel_job(self, job_uuid: str) -> bool:
+        return self.__update(
+            job_uuid,
+            [JOB_STATUS_PENDING, JOB_STATUS_RUNNING],
+            status=JOB_STATUS_CANCELLED,
+        )
+
+    def __update(
+        self, job_uuid: str, from_statuses: list[str], **values: object
+    ) -> bool:
+        job = self.jobs.get(job_uuid)
+        if job is None or job.status not in from_statuses:
+            return False
+
+        for key, value in values.items():
+            setattr(job, key, value)
+        return True
+
+
+def create_local_files(directory: Path, count: int) -> list[str]:
+    local_file_paths = [str(directory / f"upload-{index}") for index in range(count)]
+    for local_file_path in local_file_paths:
+        Path(local_file_path).write_text("content")
+    return local_file_paths
+
+
+async def wait_until_finished(queue: IngestionJobQueue, job_uuid: str) -> IngestionJob:
+    while True:
+        job = await queue.get_job(job_uuid)
+        if job.status not in [JOB_STATUS_PENDING, JOB_STATUS_RUNNING]:
+            return job
+        await queue.wait_for_update(job_uuid, timeout=0.1)
+
+
+class TestIngestionJobQueue:
+    def test_job_reports_progress_and_result(self) -> None:
+        async def run(progress: IngestionJobProgress) -> dict:
+            await progress.add_total_chunks(4)
+            await progress.add_processed_chunks(4)
+            return {"files": []}
+
+        async def scenario() -> IngestionJob:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=1,
+            )
+            queue.start()
+            job = await queue.submit("ingest_new_doc", run)
+            job = await wait_until_finished(queue, job.uuid)
+            await queue.stop()
+            return job
+
+        job = asyncio.run(scenario())
+
+        assert job.status == JOB_STATUS_SUCCEEDED
+        assert job.result == {"files": []}
+        assert (job.total_chunks, job.processed_chunks) == (4, 4)
+
+    def test_failed_job_does_not_stop_the_worker(self) -> None:
+        async def fail(_: IngestionJobProgress) -> dict:
+            error_message = "embedding failed"
+            raise ValueError(error_message)
+
+        async def succeed(_: IngestionJobProgress) -> dict:
+            return {}
+
+        async def scenario() -> list[IngestionJob]:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=2,
+            )
+            queue.start()
+            failed_job = await queue.submit("ingest_new_doc", fail)
+            succeeded_job = await queue.submit("ingest_new_doc", succeed)
+            jobs = [
+                await wait_until_finished(queue, failed_job.uuid),
+                await wait_until_finished(queue, succeeded_job.uuid),
+            ]
+            await queue.stop()
+            return jobs
+
+        failed_job, succeeded_job = asyncio.run(scenario())
+
+        assert failed_job.status == JOB_STATUS_FAILED
+        assert failed_job.error == "embedding failed"
+        assert succeeded_job.status == JOB_STATUS_SUCCEEDED
+
+    def test_cancel_running_job(self) -> None:
+        started = asyncio.Event()
+
+        async def run(_: IngestionJobProgress) -> dict:
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        async def scenario() -> tuple[bool, IngestionJob]:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=1,
+            )
+            queue.start()
+            job = await queue.submit("ingest_new_doc", run)
+            await started.wait()
+            is_cancelled = await queue.cancel(job.uuid)
+            job = await wait_until_finished(queue, job.uuid)
+            await queue.stop()
+            return is_cancelled, job
+
+        is_cancelled, job = asyncio.run(scenario())
+
+        assert is_cancelled
+        assert job.status == JOB_STATUS_CANCELLED
+
+    def test_stop_fails_running_and_queued_jobs(self) -> None:
+        started = asyncio.Event()
+
+        async def run(_: IngestionJobProgress) -> dict:
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        async def scenario() -> list[IngestionJob]:
+            ingestion_job_db = FakeIngestionJobDbClient()
+            queue = IngestionJobQueue(
+                ingestion_job_db=ingestion_job_db,
+                max_workers=1,
+                max_queue_size=2,
+            )
+            queue.start()
+            running_job = await queue.submit("ingest_new_doc", run)
+            queued_job = await queue.submit("ingest_new_doc", run)
+            await started.wait()
+            await queue.stop()
+            return [
+                ingestion_job_db.jobs[running_job.uuid],
+                ingestion_job_db.jobs[queued_job.uuid],
+            ]
+
+        running_job, queued_job = asyncio.run(scenario())
+
+        assert running_job.status == JOB_STATUS_FAILED
+        assert queued_job.status == JOB_STATUS_FAILED
+        assert queued_job.error == "interrupted by service shutdown"
+
+    def test_finished_job_deletes_its_files(self, tmp_path: Path) -> None:
+        local_file_paths = create_local_files(tmp_path, 2)
+
+        async def run(_: IngestionJobProgress) -> dict:
+            return {}
+
+        async def scenario() -> None:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=1,
+            )
+            queue.start()
+            job = await queue.submit("ingest_new_doc", run, local_file_paths)
+            await wait_until_finished(queue, job.uuid)
+            await queue.stop()
+
+        asyncio.run(scenario())
+
+        assert not any(Path(path).exists() for path in local_file_paths)
+
+    def test_cancel_queued_job_deletes_its_files(self, tmp_path: Path) -> None:
+        local_file_paths = create_local_files(tmp_path, 1)
+
+        async def run(_: IngestionJobProgress) -> dict:
+            return {}
+
+        async def scenario() -> tuple[bool, bool]:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=1,
+            )
+            # no worker is started, the job stays queued
+            job = await queue.submit("ingest_new_doc", run, local_file_paths)
+            is_cancelled = await queue.cancel(job.uuid)
+            is_deleted = not Path(local_file_paths[0]).exists()
+            await queue.stop()
+            return is_cancelled, is_deleted
+
+        is_cancelled, is_deleted = asyncio.run(scenario())
+
+        assert is_cancelled
+        assert is_deleted
+
+    def test_skipped_job_deletes_its_files(self, tmp_path: Path) -> None:
+        local_file_paths = create_local_files(tmp_path, 1)
+        runs: list[str] = []
+
+        async def run(_: IngestionJobProgress) -> dict:
+            runs.append("run")
+            return {}
+
+        async def scenario() -> None:
+            ingestion_job_db = FakeIngestionJobDbClient()
+            queue = IngestionJobQueue(
+                ingestion_job_db=ingestion_job_db,
+                max_workers=1,
+                max_queue_size=2,
+            )
+            skipped_job = await queue.submit("ingest_new_doc", run, local_file_paths)
+            # cancelled from another worker process while it is queued
+            await ingestion_job_db.cancel_job(skipped_job.uuid)
+            next_job = await queue.submit("ingest_new_doc", run)
+            queue.start()
+            await wait_until_finished(queue, next_job.uuid)
+            await queue.stop()
+
+        asyncio.run(scenario())
+
+        assert runs == ["run"]
+        assert not Path(local_file_paths[0]).exists()
+
+    def test_stop_deletes_files_of_running_and_queued_jobs(
+        self, tmp_path: Path
+    ) -> None:
+        running_job_files, queued_job_files = create_local_files(tmp_path, 2)
+        started = asyncio.Event()
+
+        async def run(_: IngestionJobProgress) -> dict:
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        async def scenario() -> None:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=2,
+            )
+            queue.start()
+            await queue.submit("ingest_new_doc", run, [running_job_files])
+            await queue.submit("ingest_new_doc", run, [queued_job_files])
+            await started.wait()
+            await queue.stop()
+
+        asyncio.run(scenario())
+
+        assert not Path(running_job_files).exists()
+        assert not Path(queued_job_files).exists()
+
+    def test_full_queue_deletes_the_files_of_the_rejected_job(
+        self, tmp_path: Path
+    ) -> None:
+        local_file_paths = create_local_files(tmp_path, 1)
+
+        async def run(_: IngestionJobProgress) -> dict:
+            return {}
+
+        async def scenario() -> None:
+            queue = IngestionJobQueue(
+                ingestion_job_db=FakeIngestionJobDbClient(),
+                max_workers=1,
+                max_queue_size=1,
+            )
+            await queue.submit("ingest_new_doc", run)
+            try:
+                await queue.submit("ingest_new_doc", run, local_file_paths)
+            finally:
+                await queue.stop()
+
+        with pytest.raises(Exception, match="ingestion job queue is full"):
+            asyncio.run(scenario())
+
+        assert not Path(local_file_paths[0]).exists()
+
+    def test_missing_job_is_finished(self) -> None:
+        assert is_job_finished(None)
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from app.core.s3.file_parser import extract_file_chunks
+
+
+class TestFileParser:
+    def test_extract_file_chunks_lowercases_small_file_into_one_chunk(
+        self, tmp_path: Path
+    ) -> None:
+        file_path = tmp_path / "team.csv"
+        file_path.write_bytes(b"Name,Team\nHades,KB\n")
+
+        got = extract_file_chunks(
+            str(file_path),
+            "team.csv",
+            chunk_size=512,
+            chunk_overlap=200,
+            splitter_selector=1,
+        )
+
+        assert got == ["name,team\nhades,kb\n"]
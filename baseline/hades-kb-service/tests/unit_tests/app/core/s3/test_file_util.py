@@ -1,3 +1,6 @@
+from io import BytesIO
+
+import openpyxl
 import pytest
 
 from app.core.s3.constant import FileType
@@ -6,6 +9,7 @@ from app.core.s3.file_util import (
     get_filename,
     get_media_mime_type,
     is_valid_file_upload_type,
+    iter_file_content,
 )
 
 
@@ -89,3 +93,37 @@ class TestFileUtil:
 
         for test_case in test_cases:
             assert get_filename(test_case["file_path"]) == test_case["expected_output"]
+
+    def test_iter_file_content_yields_line_blocks(self) -> None:
+        got = list(
+            iter_file_content(BytesIO(b"a\nb\nc\n"), "/example/test.txt", block_size=2)
+        )
+
+        assert got == ["a\nb\n", "c\n"]
+
+    def test_iter_file_content_yields_xlsx_row_blocks(self) -> None:
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["name", "team"])
+        workbook.active.append(["hades", None])
+        workbook.create_sheet("second").append(["zion", "agents"])
+        file_data = BytesIO()
+        workbook.save(file_data)
+        file_data.seek(0)
+
+        got = list(iter_file_content(file_data, "/example/test.xlsx", block_size=1))
+
+        assert got == ["name,team\n", "hades,\n", "zion,agents\n"]
+
+    def test_iter_file_content_writes_xlsx_cells_as_stored(self) -> None:
+        # the former pandas export gave "name,Unnamed: 1,count\nhades,,1.0\nzion,agents,\n"
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["name", None, "count"])
+        workbook.active.append(["hades", None, 1])
+        workbook.active.append(["zion", "agents", None])
+        file_data = BytesIO()
+        workbook.save(file_data)
+        file_data.seek(0)
+
+        got = "".join(iter_file_content(file_data, "/example/test.xlsx"))
+
+        assert got == "name,,count\nhades,,1\nzion,agents,\n"
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from app.core.transformer.client import TransformerClient
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+class FakeTextSplitter:
+    """Splits on words, one token per word, without overlap."""
+
+    def __init__(self) -> None:
+        self.split_words: list[int] = []
+
+    def split_text(self, text: str, chunk_size: int, _: int, __: int = 0) -> list[str]:
+        words = text.split()
+        self.split_words.append(len(words))
+        return [
+            "".join(f"{word} " for word in words[index : index + chunk_size])
+            for index in range(0, len(words), chunk_size)
+        ]
+
+
+class TestTransformerClient:
+    def test_iter_chunk_text_splits_the_pages_window_by_window(self) -> None:
+        text_splitter = FakeTextSplitter()
+        client = TransformerClient(text_splitter=text_splitter)
+        pages = ["".join(f"p{page}w{word} " for word in range(5)) for page in range(10)]
+
+        with patch("app.core.transformer.client.num_tokens_from_string", count_words):
+            chunks = list(
+                client.iter_chunk_text(
+                    iter(pages), chunk_size=4, chunk_overlap=1, window_chunks=2
+                )
+            )
+
+        # no word is lost or repeated across the page and window boundaries
+        assert "".join(chunks) == "".join(pages)
+        assert all(count_words(chunk) <= 4 for chunk in chunks)  # noqa: PLR2004
+        # the document is never split as a whole
+        assert len(text_splitter.split_words) > 1
+        assert max(text_splitter.split_words) < count_words("".join(pages))
+
+    def test_iter_chunk_text_keeps_a_short_document_in_one_chunk(self) -> None:
+        client = TransformerClient(text_splitter=FakeTextSplitter())
+
+        with patch("app.core.transformer.client.num_tokens_from_string", count_words):
+            chunks = list(client.iter_chunk_text(["first page ", "second page "]))
+
+        assert chunks == ["first page second page "]
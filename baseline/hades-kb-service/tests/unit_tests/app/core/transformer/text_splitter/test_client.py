@@ -0,0 +1,21 @@
+from app.core.transformer.text_splitter.client import TextSplitterClient
+from app.core.transformer.text_splitter.models import TextSplitterEnum
+
+
+class TestTextSplitterClient:
+    def test_get_text_splitter_reuses_splitter_per_config(self) -> None:
+        client = TextSplitterClient()
+        recursive = TextSplitterEnum.RECURSIVE.value
+
+        splitter = client.get_text_splitter(recursive, 512, 200)
+
+        assert client.get_text_splitter(recursive, 512, 200) is splitter
+        assert client.get_text_splitter(recursive, 256, 200) is not splitter
+
+    def test_default_text_splitter_ignores_chunk_config(self) -> None:
+        client = TextSplitterClient()
+        default = TextSplitterEnum.DEFAULT.value
+
+        assert client.get_text_splitter(default, 512, 200) is client.get_text_splitter(
+            default
+        )
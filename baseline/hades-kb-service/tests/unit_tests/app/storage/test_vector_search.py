@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any
+
+from sqlalchemy import Executable, select
+from sqlalchemy.dialects import postgresql
+
+from app.storage.ragdocument_db.models import DocumentEmbedding
+from app.storage.vector_search import (
+    execute_filtered_vector_search,
+    get_vector_search_clauses,
+)
+
+
+class FakeResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> list[Any]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, search_results: list[list[Any]]) -> None:
+        self.search_results = search_results
+        self.statements: list[str] = []
+
+    async def execute(
+        self, statement: Executable, _: dict[str, str] | None = None
+    ) -> FakeResult:
+        self.statements.append(str(statement))
+        if "set_config" in str(statement):
+            return FakeResult([])
+        return FakeResult(self.search_results.pop(0))
+
+
+def compile_order_by(embedding_operator: str) -> str:
+    order_clause, _ = get_vector_search_clauses(
+        DocumentEmbedding.embedding, [0.1, 0.2], embedding_operator
+    )
+    statement = select(DocumentEmbedding.id).order_by(order_clause)
+    return str(statement.compile(dialect=postgresql.dialect())).split("ORDER BY ")[1]
+
+
+class TestVectorSearch:
+    def test_inner_product_orders_by_raw_distance_ascending(self) -> None:
+        assert compile_order_by("<#>") == (
+            "(document_embedding.embedding <#> %(embedding_1)s) ASC"
+        )
+
+    def test_other_operators_keep_descending_order(self) -> None:
+        assert compile_order_by("<=>") == (
+            "(document_embedding.embedding <=> %(embedding_1)s) DESC"
+        )
+
+    def test_filtered_search_falls_back_to_exact_scan(self) -> None:
+        session = FakeSession(search_results=[["row-1"], ["row-1", "row-2"]])
+        statement = select(DocumentEmbedding.id)
+
+        rows = asyncio.run(execute_filtered_vector_search(session, statement, 2, "<#>"))
+
+        assert rows == ["row-1", "row-2"]
+        assert "enable_indexscan" in session.statements[2]
+
+    def test_filtered_search_keeps_full_index_result(self) -> None:
+        session = FakeSession(search_results=[["row-1", "row-2"]])
+        statement = select(DocumentEmbedding.id)
+
+        rows = asyncio.run(execute_filtered_vector_search(session, statement, 2, "<#>"))
+
+        assert rows == ["row-1", "row-2"]
+        assert not any("enable_indexscan" in s for s in session.statements)
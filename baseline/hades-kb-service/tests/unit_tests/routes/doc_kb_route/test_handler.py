@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_ingestion_job_queue_singleton, get_ragdocument
+from app.server import app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app.dependency_overrides[get_ragdocument] = lambda: MagicMock()
+    app.dependency_overrides[get_ingestion_job_queue_singleton] = lambda: MagicMock()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "headers"),
+    [
+        ("/doc_kb_route/ingest_new_doc", {}),
+        ("/doc_kb_route/ingest_new_doc_stream", {}),
+        ("/doc_kb_route/ingest_new_doc_stream", {"rag-document-secret": "wrong"}),
+    ],
+)
+def test_upload_without_valid_secret_is_not_saved(
+    client: TestClient, endpoint: str, headers: dict
+) -> None:
+    with patch(
+        "app.routes.doc_kb_route.handler.save_upload_file_to_temporary_file",
+        AsyncMock(),
+    ) as save_upload_file:
+        response = client.post(
+            endpoint,
+            params={"document_collection_uuid": "collection"},
+            files=[("files", ("doc.txt", b"content", "text/plain"))],
+            headers=headers,
+        )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    save_upload_file.assert_not_called()
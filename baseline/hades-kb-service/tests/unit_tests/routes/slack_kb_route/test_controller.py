@@ -105,6 +105,12 @@ def get_knowledge_base_request_test_cases() -> (
     invalid_filter = deepcopy(valid_request)
     invalid_filter.filter = {"exxample_for_testing": 1}
 
+    top_k_is_zero = deepcopy(valid_request)
+    top_k_is_zero.top_k = 0
+
+    top_k_is_not_digit = deepcopy(valid_request)
+    top_k_is_not_digit.top_k = 1.2
+
     return [
         (200, valid_request),
         (422, no_query_request),
@@ -115,6 +121,8 @@ def get_knowledge_base_request_test_cases() -> (
         (422, page_is_not_digit),
         (422, page_is_less_than_one),
         (422, invalid_filter),
+        (422, top_k_is_zero),
+        (422, top_k_is_not_digit),
     ]
 
 
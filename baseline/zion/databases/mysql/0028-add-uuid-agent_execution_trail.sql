@@ -0,0 +1,12 @@
+-- +migrate Up
+-- trails are inserted behind the request, the uuid is assigned by zion so the response can return it
+ALTER TABLE `agent_execution_trail`
+ADD COLUMN `uuid` varchar(36) NOT NULL DEFAULT '';
+
+ALTER TABLE `agent_execution_trail`
+ADD KEY `index_uuid` (`uuid`);
+
+-- +migrate Down
+ALTER TABLE `agent_execution_trail`
+DROP KEY `index_uuid`,
+DROP COLUMN `uuid`;
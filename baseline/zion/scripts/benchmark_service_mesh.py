@@ -0,0 +1,52 @@
+"""
+Benchmark of `get_service_mesh` against fake GitLab and Datadog backends that sleep `--latency` seconds per call.
+
+"cold" is the first lookup of a service, the 2 mesh config downloads and the 2 QPS queries run at once,
+"warm" is the next lookup, served from the mesh config and QPS caches.
+
+Usage: python -m scripts.benchmark_service_mesh --latency 0.1 --repeat 5
+"""
+
+import argparse
+import time
+
+from zion.util.service_mesh import get_service_mesh
+from zion.util.tests.test_service_mesh import FakeDatadog, FakeGitlab, fake_backends
+
+
+def measure(latency_seconds: float) -> tuple[float, float]:
+    gitlab = FakeGitlab(latency_seconds=latency_seconds)
+    datadog = FakeDatadog(latency_seconds=latency_seconds)
+    with fake_backends(gitlab, datadog, revalidate_seconds=60):
+        start_time = time.perf_counter()
+        get_service_mesh("food-order", "prd")
+        cold_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        get_service_mesh("food-order", "prd")
+        warm_seconds = time.perf_counter() - start_time
+
+    return cold_seconds, warm_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure(args.latency) for _ in range(args.repeat)]
+    cold_seconds = min(cold for cold, _ in runs)
+    warm_seconds = min(warm for _, warm in runs)
+
+    print(f"get_service_mesh with {args.latency}s backends, best of {args.repeat}:")  # noqa: T201
+    # 2 downloads and 2 queries, one after the other
+    sequential_seconds = 4 * args.latency
+    print(  # noqa: T201
+        f"cold {cold_seconds * 1000:.2f} ms, sequential {sequential_seconds * 1000:.2f} ms"
+    )
+    print(f"warm {warm_seconds * 1000:.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -67,9 +67,12 @@ def get_agent_chain(
         "chat_history": lambda x: x["chat_history"],
     }
 
-    # Add additional system prompt variables
+    # Add additional system prompt variables, callables are evaluated on every run
     for key, value in system_prompt_variables.items():
-        input_values[key] = lambda _, value=value: value
+        if callable(value):
+            input_values[key] = lambda _, value=value: value()
+        else:
+            input_values[key] = lambda _, value=value: value
 
     lcel_flow = input_values | chat_prompt
 
@@ -0,0 +1,73 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Generic, TypeVar
+
+from zion.config import global_config, logger
+
+CompiledAgent = TypeVar("CompiledAgent")
+
+
+def get_agent_cache_key(**parts: Any) -> str:  # noqa: ANN401, any json-able agent configuration part
+    """Stable hash of everything a compiled agent is built from.
+    Pydantic models are dumped to dicts, anything else that json cannot encode falls back to str.
+    """
+
+    def default(value: Any) -> Any:  # noqa: ANN401
+        if hasattr(value, "model_dump"):
+            return value.model_dump()
+        return str(value)
+
+    encoded_parts = json.dumps(parts, sort_keys=True, default=default)
+    return hashlib.sha256(encoded_parts.encode("utf-8")).hexdigest()
+
+
+class CompiledAgentCache(Generic[CompiledAgent]):
+    """LRU cache of compiled agents (langgraph Pregel graphs and AgentExecutors).
+
+    A compiled agent is immutable once built, so one instance can serve concurrent requests.
+    The key must cover every input of the build, see `get_agent_cache_key`.
+    Plugin rows and resolved prompts are part of the key, so a changed plugin or prompt is a new entry
+    and the stale one ages out, `clear` drops everything right away after a plugin sync.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, CompiledAgent] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(
+        self, key: str, build: Callable[[], CompiledAgent]
+    ) -> CompiledAgent:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # build outside of the lock, two requests racing on a cold key both build and the first one is kept
+        compiled_agent = build()
+        if self.max_size <= 0:
+            return compiled_agent
+
+        with self._lock:
+            compiled_agent = self._entries.setdefault(key, compiled_agent)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return compiled_agent
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        logger.info("[CompiledAgentCache] cleared")
+
+
+compiled_agent_cache: CompiledAgentCache = CompiledAgentCache(
+    max_size=global_config.compiled_agent_cache_size
+)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any
+
+from langchain_core.runnables.schema import StreamEvent
+
+from zion.agent.zion_agent_classes import AgentType, ZionAgentOutput
+from zion.tool.agent_tool import ZionAgentActions
+
+# graph nodes whose model tokens are streamed, the other nodes only stream their tool calls
+STREAMED_AGENT_NODES: dict[AgentType, set[str]] = {
+    AgentType.react_agent: {"single_agent"},
+    AgentType.follow_up_convo_agent: {"single_agent"},
+    # able_to_answer_agent runs again on every retry of the multi agent, so its answer is only final
+    # once the graph ends, it is streamed at once from the graph output
+    AgentType.multi_agent: set(),
+}
+
+# node of create_react_agent that calls the model, the structured response is generated by another node
+REACT_AGENT_MODEL_NODE = "agent"
+
+# langgraph checkpoint namespace of a nested graph, e.g. "single_agent:<task id>|agent:<task id>"
+CHECKPOINT_NAMESPACE_SEPARATOR = "|"
+CHECKPOINT_NAMESPACE_END = ":"
+
+
+def get_agent_stream_output(
+    event: StreamEvent, streamed_nodes: set[str]
+) -> ZionAgentOutput | None:
+    """Map one astream_events (v2) event of a langgraph agent to a streamed output, None when it is not streamed.
+
+    Model tokens of the streamed nodes are streamed as they are generated, tool calls of every node
+    are streamed when they start and end, as agent_actions.
+    When the graph ends on an answer of a node that is not streamed, that answer is streamed at once.
+    """
+    kind = event.get("event", "")
+
+    if kind == "on_chat_model_stream":
+        return _get_model_token_output(event, streamed_nodes)
+
+    if kind in {"on_tool_start", "on_tool_end"}:
+        return _get_tool_call_output(event)
+
+    if kind == "on_chain_end" and len(event.get("parent_ids", [])) == 0:
+        # the graph itself ended
+        return _get_final_answer_output(event, streamed_nodes)
+
+    return None
+
+
+def _get_model_token_output(
+    event: StreamEvent, streamed_nodes: set[str]
+) -> ZionAgentOutput | None:
+    metadata = event.get("metadata", {})
+    chunk = event["data"].get("chunk", None)
+    # Empty content in the context of OpenAI or Anthropic usually means
+    # that the model is asking for a tool to be invoked.
+    # So we only yield non-empty content
+    if (
+        not chunk
+        or not chunk.content
+        or metadata.get("langgraph_node") != REACT_AGENT_MODEL_NODE
+        or _get_graph_node(metadata) not in streamed_nodes
+    ):
+        return None
+    return ZionAgentOutput(
+        output=chunk.content, langsmith_run_id=event.get("run_id", "")
+    )
+
+
+def _get_tool_call_output(event: StreamEvent) -> ZionAgentOutput:
+    agent_action = ZionAgentActions(
+        tool=event.get("name"), tool_input=event["data"].get("input")
+    )
+    if event.get("event") == "on_tool_end":
+        tool_output = event["data"].get("output")
+        agent_action.tool_call_id = getattr(tool_output, "tool_call_id", None)
+        agent_action.tool_output = getattr(tool_output, "content", tool_output)
+
+    return ZionAgentOutput(
+        output="",
+        agent_actions=[agent_action],
+        langsmith_run_id=event.get("run_id", ""),
+    )
+
+
+def _get_final_answer_output(
+    event: StreamEvent, streamed_nodes: set[str]
+) -> ZionAgentOutput | None:
+    messages = _get_messages(event["data"].get("output"))
+    if (
+        len(messages) == 0
+        or not messages[-1].content
+        or messages[-1].name in streamed_nodes
+    ):
+        return None
+    return ZionAgentOutput(
+        output=messages[-1].content, langsmith_run_id=event.get("run_id", "")
+    )
+
+
+def _get_graph_node(metadata: dict[str, Any]) -> str:
+    """Node of the outermost graph the event was emitted from."""
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    return checkpoint_ns.split(CHECKPOINT_NAMESPACE_SEPARATOR)[0].split(
+        CHECKPOINT_NAMESPACE_END
+    )[0]
+
+
+def _get_messages(graph_output: Any) -> list:  # noqa: ANN401, state of any zion agent graph
+    if not isinstance(graph_output, dict):
+        return []
+    return list(graph_output.get("messages") or [])
@@ -38,6 +38,8 @@ Thank you for your understanding and cooperation.
 """
 
 
+CREATE_MR_PROMPT_HUB_COMMIT = "create-mr-prompt"
+
 CREATE_MR_PROMPT = """
 You are an intelligent agent designed to assist with creating a Merge Request (MR) and identifying service names.
 
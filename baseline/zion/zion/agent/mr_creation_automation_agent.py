@@ -4,14 +4,15 @@ from langchain_core.messages import (
     HumanMessage,
     SystemMessage,
 )
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field
 
 from zion.agent.model import ChatGrabGPT
+from zion.agent.react_agent_builder import get_tool_node
 from zion.config import global_config
 from zion.tool.constant import mr_creation_search_tool_desc
 from zion.tool.glean_search import GleanSearchTool
+from zion.tool.mcp_client_pool import mcp_client_pool
 
 
 class MCPMrCreationAutomationAgentState(BaseModel):
@@ -32,8 +33,8 @@ async def create_mr_creation_automation_agent_node(
             "transport": "streamable_http",
         }
     }
-    mcp_client = MultiServerMCPClient(config)
-    tools = await mcp_client.get_tools()  # config URL MUST end with "/" to ensure the client does not enter streaming mode but correctly fetches the tools.
+    # config URL MUST end with "/" to ensure the client does not enter streaming mode but correctly fetches the tools.
+    tools = await mcp_client_pool.aget_tools(config)
 
     # append glean search tool to access the url provided by user
     glean_search = GleanSearchTool(description=mr_creation_search_tool_desc)
@@ -42,7 +43,7 @@ async def create_mr_creation_automation_agent_node(
     # Create the agent with proper configuration
     react_agent = create_react_agent(
         model=model,
-        tools=tools,
+        tools=get_tool_node(tools),
         response_format=MCPMrCreationAutomationAgentState,
         prompt=prompt,
     )
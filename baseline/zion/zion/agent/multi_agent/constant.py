@@ -117,3 +117,34 @@ keywords mapped to the category:
 
 You must match the EXACT keywords to categorize the message. If the exact keywords can't be found, the category should be 'Others'. If the first sentence does not match the format "@user has submitted a [keywords] ... ", the category should be 'Others'.
 """
+
+# prompt hub commits of the multi agent prompts, pulled with the langsmith handle prefix of the environment
+QUERY_CATEGORIZER_PROMPT_HUB_COMMIT = "ti-bot-multi-agent-query-categorizer"
+TI_BOT_PROMPT_HUB_COMMIT = "ti-bot-multi-agent-ti-bot"
+INTERNAL_SEARCH_PROMPT_HUB_COMMIT = "ti-bot-multi-agent-internal-search"
+ABLE_TO_ANSWER_PROMPT_HUB_COMMIT = "ti-bot-multi-agent-able-to-answer"
+ABLE_TO_ANSWER_DESCRIPTION_HUB_COMMIT = "ti-bot-multi-agent-able-to-answer-description"
+ANSWER_CONFIDENCE_SCORE_DESCRIPTION_HUB_COMMIT = (
+    "ti-bot-multi-agent-answer-confidence-score-description"
+)
+SOURCES_DESCRIPTION_HUB_COMMIT = "ti-bot-multi-agent-sources-description"
+SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT = (
+    "ti-bot-multi-agent-category-description"
+)
+EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT = (
+    "ti-bot-multi-agent-expected-category-description"
+)
+
+MULTI_AGENT_PROMPT_HUB_COMMITS = [
+    QUERY_CATEGORIZER_PROMPT_HUB_COMMIT,
+    TI_BOT_PROMPT_HUB_COMMIT,
+    INTERNAL_SEARCH_PROMPT_HUB_COMMIT,
+    ABLE_TO_ANSWER_PROMPT_HUB_COMMIT,
+]
+MULTI_AGENT_DESCRIPTION_HUB_COMMITS = [
+    ABLE_TO_ANSWER_DESCRIPTION_HUB_COMMIT,
+    ANSWER_CONFIDENCE_SCORE_DESCRIPTION_HUB_COMMIT,
+    SOURCES_DESCRIPTION_HUB_COMMIT,
+    SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
+    EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
+]
@@ -13,6 +13,7 @@ from zion.agent.multi_agent.classes import (
     MultiAgentStructuredRespDescriptions,
     Source,
 )
+from zion.agent.react_agent_builder import get_tool_node
 
 
 def create_internal_search_response(
@@ -33,7 +34,7 @@ def create_internal_search_agent_node(
 ) -> Callable:
     internal_search_agent = create_react_agent(
         model=model,
-        tools=internal_search_tools,
+        tools=get_tool_node(internal_search_tools),
         response_format=create_internal_search_response(descriptions),
         prompt=prompt,
     )
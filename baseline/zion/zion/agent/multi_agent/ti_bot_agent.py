@@ -10,6 +10,7 @@ from langgraph.prebuilt import create_react_agent
 from zion.agent.model import ChatGrabGPT
 from zion.agent.multi_agent.agent_actions import extract_agent_actions_from_messages
 from zion.agent.multi_agent.classes import AgentState
+from zion.agent.react_agent_builder import get_tool_node
 
 
 def create_ti_bot_agent_node(
@@ -17,7 +18,7 @@ def create_ti_bot_agent_node(
 ) -> Callable:
     ti_bot_agent = create_react_agent(
         model=model,
-        tools=ti_bot_tools,
+        tools=get_tool_node(ti_bot_tools),
         prompt=prompt,
     )
 
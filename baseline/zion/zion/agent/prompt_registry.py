@@ -0,0 +1,137 @@
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable
+
+from langchain import hub
+
+from zion.config import global_config, logger
+
+
+def pull_prompt_hub_commit(hub_commit: str) -> str:
+    prompt = hub.pull(
+        owner_repo_commit=hub_commit,
+        api_url=global_config.langchain_endpoint,
+        api_key=global_config.langchain_api_key,
+    )
+    return prompt.template
+
+
+def get_prompt_hub_handle(prompt_hub_commit: str) -> str:
+    """Prefix a prompt name with the LangSmith handle of this environment."""
+    return global_config.langsmith_handle_prefix + "/" + prompt_hub_commit
+
+
+class PromptRegistry:
+    """In-process cache of prompt hub templates keyed by hub commit / handle.
+
+    - fresh entries are served from memory
+    - entries older than `ttl_seconds` are still served, and refreshed once in the background (stale-while-revalidate)
+    - a failed refresh keeps the stale template, so a LangSmith outage only matters for prompts never pulled before
+    - cold entries are pulled on the registry's thread pool, `get_many` pulls all of its cold entries concurrently
+    - concurrent requests for the same cold entry share one pull
+    """
+
+    def __init__(
+        self,
+        pull_prompt: Callable[[str], str],
+        ttl_seconds: float,
+        pull_timeout_seconds: float,
+        max_workers: int,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.pull_timeout_seconds = pull_timeout_seconds
+        self._pull_prompt = pull_prompt
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prompt_registry"
+        )
+        self._templates: dict[str, tuple[float, str]] = {}
+        self._pulls: dict[str, Future[str]] = {}
+        self._lock = Lock()
+
+    def get(self, hub_commit: str) -> str:
+        """Get the template of a hub commit, raise when a cold pull fails or times out."""
+        template = self._lookup(hub_commit)
+        if isinstance(template, Future):
+            return template.result(timeout=self.pull_timeout_seconds)
+        return template
+
+    def get_many(self, hub_commits: Iterable[str]) -> dict[str, str]:
+        """Get the templates of several hub commits, commits that could not be pulled are left out."""
+        lookups = {hub_commit: self._lookup(hub_commit) for hub_commit in hub_commits}
+        templates: dict[str, str] = {}
+        deadline = time.monotonic() + self.pull_timeout_seconds
+
+        for hub_commit, template in lookups.items():
+            if not isinstance(template, Future):
+                templates[hub_commit] = template
+                continue
+
+            try:
+                templates[hub_commit] = template.result(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except Exception:  # noqa: BLE001, S112, the caller falls back to its default prompt
+                continue
+
+        return templates
+
+    def warm(self, hub_commits: Iterable[str]) -> None:
+        """Start pulling hub commits in the background, e.g. on startup."""
+        for hub_commit in hub_commits:
+            self._lookup(hub_commit)
+
+    def invalidate(self, hub_commit: str | None = None) -> None:
+        with self._lock:
+            if hub_commit is None:
+                self._templates.clear()
+            else:
+                self._templates.pop(hub_commit, None)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _lookup(self, hub_commit: str) -> str | Future[str]:
+        with self._lock:
+            cached = self._templates.get(hub_commit)
+            if cached is None:
+                return self._start_pull(hub_commit)
+
+            pulled_at, template = cached
+            if time.monotonic() - pulled_at >= self.ttl_seconds:
+                self._start_pull(hub_commit)
+            return template
+
+    def _start_pull(self, hub_commit: str) -> Future[str]:
+        # must be called with the lock held
+        pull = self._pulls.get(hub_commit)
+        if pull is None:
+            pull = self._executor.submit(self._pull, hub_commit)
+            self._pulls[hub_commit] = pull
+        return pull
+
+    def _pull(self, hub_commit: str) -> str:
+        try:
+            template = self._pull_prompt(hub_commit)
+            with self._lock:
+                self._templates[hub_commit] = (time.monotonic(), template)
+        except Exception as e:
+            logger.error(
+                "[PromptRegistry] Unable to pull hub commit",
+                tags={"hub_commit": hub_commit, "err": str(e)},
+            )
+            raise
+        else:
+            return template
+        finally:
+            with self._lock:
+                self._pulls.pop(hub_commit, None)
+
+
+prompt_registry = PromptRegistry(
+    pull_prompt=pull_prompt_hub_commit,
+    ttl_seconds=global_config.prompt_hub_cache_ttl_seconds,
+    pull_timeout_seconds=global_config.prompt_hub_pull_timeout_seconds,
+    max_workers=global_config.prompt_hub_max_workers,
+)
@@ -1,24 +1,33 @@
 # ruff: noqa: T201
 import asyncio
-import json
+import time
+from collections import deque
 from collections.abc import Sequence
-from typing import Annotated, Callable, Optional, TypedDict, Union
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Annotated, Any, Callable, Optional, TypedDict, Union
 
 from langchain_community.tools import BaseTool
 from langchain_core.messages import (
+    AnyMessage,
     BaseMessage,
     HumanMessage,
     SystemMessage,
+    ToolCall,
     ToolMessage,
 )
 from langchain_core.prompt_values import ChatPromptValue
 from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ContextThreadPoolExecutor, get_config_list
 from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode
+from langgraph.store.base import BaseStore
+from pydantic import BaseModel
 
 from zion.agent.model import ChatGrabGPT
 from zion.agent.zion_agent_classes import (
     ZionAgentInput,
 )
+from zion.config import global_config, logger
 from zion.util.optimize_token import OptimizeToken
 
 
@@ -28,93 +37,121 @@ class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
 
 
-# Type alias for tool arguments
-ToolArgs = Union[dict, str, int, float, bool, None]
-ToolResult = Union[str, dict, list, int, float, bool, None]
-
-
-def _execute_tool_coroutine(tool: BaseTool, tool_args: ToolArgs) -> ToolResult:
-    """Execute tool using coroutine method."""
-    if isinstance(tool_args, dict):
-        return asyncio.run(tool.coroutine(**tool_args))
-    return asyncio.run(tool.coroutine(tool_args))
-
-
-def _execute_tool_func(tool: BaseTool, tool_args: ToolArgs) -> ToolResult:
-    """Execute tool using func method."""
-    if isinstance(tool_args, dict):
-        if asyncio.iscoroutinefunction(tool.func):
-            return asyncio.run(tool.func(**tool_args))
-        return tool.func(**tool_args)
-
-    if asyncio.iscoroutinefunction(tool.func):
-        return asyncio.run(tool.func(tool_args))
-    return tool.func(tool_args)
-
-
-def _ensure_serializable(tool_result: ToolResult) -> ToolResult:
-    """Ensure tool result is JSON serializable."""
-    if hasattr(tool_result, "__dict__") and not isinstance(
-        tool_result, (str, int, float, bool, list, dict)
-    ):
-        return str(tool_result)
-    if not isinstance(tool_result, (str, int, float, bool, list, dict, type(None))):
-        return str(tool_result)
-    return tool_result
-
-
-def _execute_single_tool(tool: BaseTool, tool_args: ToolArgs) -> ToolResult:
-    """Execute a single tool and return the result."""
-    try:
-        # Use the underlying coroutine/function directly to avoid callback manager injection
-        if hasattr(tool, "coroutine") and tool.coroutine:
-            return _execute_tool_coroutine(tool, tool_args)
-        if hasattr(tool, "func") and tool.func:
-            return _execute_tool_func(tool, tool_args)
-        # Fallback to regular invoke
-        return tool.invoke(tool_args)
-    except (ValueError, TypeError, AttributeError) as e:
-        return f"Tool execution failed: {e!s}"
-
-
-def _create_tool_message(tool_call: dict, tool_result: ToolResult) -> ToolMessage:
-    """Create a ToolMessage from tool call and result."""
-    content = (
-        json.dumps(tool_result)
-        if isinstance(tool_result, (dict, list))
-        else str(tool_result)
+def get_tool_timeout_seconds(tool_name: str) -> float:
+    return global_config.tool_timeout_seconds_by_name.get(
+        tool_name, global_config.tool_timeout_seconds
+    )
+
+
+def _create_tool_timeout_message(tool_call: ToolCall) -> ToolMessage:
+    timeout_seconds = get_tool_timeout_seconds(tool_call["name"])
+    logger.error(
+        f"[ConcurrentToolNode] tool timed out after {timeout_seconds} seconds",
+        tags={"tool": tool_call["name"]},
     )
     return ToolMessage(
-        content=content,
+        content=f"Error: {tool_call['name']} timed out after {timeout_seconds} seconds, try another tool or answer without it.",
         name=tool_call["name"],
         tool_call_id=tool_call["id"],
+        status="error",
     )
 
 
-# Define our tool node
-def get_tool_node(tools: Sequence[BaseTool]) -> Callable:
-    tools_by_name = {tool.name: tool for tool in tools}
-
-    def tool_node(
-        state: AgentState, tools_by_name: Optional[list] = tools_by_name
-    ) -> dict:
-        outputs = []
-        for tool_call in state["messages"][-1].tool_calls:
-            if tool_call["name"] not in tools_by_name:
-                continue
-            tool = tools_by_name[tool_call["name"]]
-            tool_args = tool_call["args"]
+class ConcurrentToolNode(ToolNode):
+    """ToolNode that runs the tool calls of one model turn concurrently, each with its own timeout.
 
-            # Execute tool and ensure result is serializable
-            tool_result = _execute_single_tool(tool, tool_args)
-            tool_result = _ensure_serializable(tool_result)
+    At most `tool_max_concurrency` calls of one turn run at once, the others wait for a free slot. The timeout
+    of a call starts when the call starts, so waiting for a slot does not count. Nothing is shared between
+    invocations, so an agent tool that runs another agent never waits on the slots of its caller.
+    The tool messages are returned in the order of the tool calls, a call that times out gets an error message,
+    its slot is freed and its thread is left to finish in the background.
+    """
 
-            # Create and add tool message
-            outputs.append(_create_tool_message(tool_call, tool_result))
+    def _func(
+        self,
+        input: Union[list[AnyMessage], dict[str, Any], BaseModel],  # noqa: A002
+        config: RunnableConfig,
+        *,
+        store: Optional[BaseStore],
+    ) -> Any:  # noqa: ANN401, same as ToolNode
+        tool_calls, input_type = self._parse_input(input, store)
+        tool_configs = get_config_list(config, len(tool_calls))
+        outputs: list[Optional[ToolMessage]] = [None] * len(tool_calls)
+        pending_indexes = deque(range(len(tool_calls)))
+        # call index and deadline of the running calls
+        running: dict[Future, tuple[int, float]] = {}
+
+        # one thread per call, so a call that timed out never holds back the next one
+        executor = ContextThreadPoolExecutor(
+            max_workers=max(len(tool_calls), 1), thread_name_prefix="zion-tool"
+        )
+        try:
+            while pending_indexes or running:
+                while (
+                    pending_indexes
+                    and len(running) < global_config.tool_max_concurrency
+                ):
+                    index = pending_indexes.popleft()
+                    future = executor.submit(
+                        self._run_one,
+                        tool_calls[index],
+                        input_type,
+                        tool_configs[index],
+                    )
+                    running[future] = (
+                        index,
+                        time.monotonic()
+                        + get_tool_timeout_seconds(tool_calls[index]["name"]),
+                    )
+
+                next_deadline = min(deadline for _, deadline in running.values())
+                done, _ = wait(
+                    running,
+                    timeout=max(next_deadline - time.monotonic(), 0),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index, _ = running.pop(future)
+                    outputs[index] = future.result()
+
+                now = time.monotonic()
+                for future, (index, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[future]
+                        outputs[index] = _create_tool_timeout_message(tool_calls[index])
+        finally:
+            executor.shutdown(wait=False)
+
+        return self._combine_tool_outputs(outputs, input_type)
+
+    async def _afunc(
+        self,
+        input: Union[list[AnyMessage], dict[str, Any], BaseModel],  # noqa: A002
+        config: RunnableConfig,
+        *,
+        store: Optional[BaseStore],
+    ) -> Any:  # noqa: ANN401, same as ToolNode
+        tool_calls, input_type = self._parse_input(input, store)
+        semaphore = asyncio.Semaphore(global_config.tool_max_concurrency)
+
+        async def arun_one(tool_call: ToolCall) -> ToolMessage:
+            async with semaphore:
+                # the timeout starts once the call has a slot
+                try:
+                    return await asyncio.wait_for(
+                        self._arun_one(tool_call, input_type, config),
+                        timeout=get_tool_timeout_seconds(tool_call["name"]),
+                    )
+                except asyncio.TimeoutError:
+                    return _create_tool_timeout_message(tool_call)
+
+        outputs = await asyncio.gather(*(arun_one(call) for call in tool_calls))
+        return self._combine_tool_outputs(outputs, input_type)
 
-        return {"messages": outputs}
 
-    return tool_node
+# Define our tool node
+def get_tool_node(tools: Sequence[BaseTool]) -> ConcurrentToolNode:
+    return ConcurrentToolNode(tools)
 
 
 def get_call_model(model: ChatGrabGPT, system_prompt_str: str) -> Callable:
@@ -15,6 +15,7 @@ from zion.agent.model import ChatGrabGPT
 from zion.agent.multi_agent.agent_actions import extract_agent_actions_from_messages
 from zion.agent.multi_agent.classes import Source
 from zion.agent.multi_agent.constant import SOURCES_DESCRIPTION
+from zion.agent.react_agent_builder import get_tool_node
 from zion.tool.agent_tool import ZionAgentActions
 
 
@@ -68,7 +69,7 @@ def create_single_agent_node(
 ) -> Callable:
     single_agent = create_react_agent(
         model=model,
-        tools=single_agent_tools,
+        tools=get_tool_node(single_agent_tools),
         response_format=create_single_agent_response(descriptions),
         prompt=prompt,
     )
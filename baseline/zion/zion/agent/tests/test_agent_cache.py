@@ -0,0 +1,67 @@
+from zion.agent.agent_cache import CompiledAgentCache, get_agent_cache_key
+from zion.agent.zion_agent_classes import AgentConfig, AgentType
+
+
+def test_get_agent_cache_key() -> None:
+    agent_config = AgentConfig(agent_type=AgentType.react_agent)
+
+    key = get_agent_cache_key(
+        agent_profile="ti-bot", agent_config=agent_config, prompts={"a": "1", "b": "2"}
+    )
+
+    # stable across calls and independent of the dict order
+    assert key == get_agent_cache_key(
+        prompts={"b": "2", "a": "1"}, agent_config=agent_config, agent_profile="ti-bot"
+    )
+    # a changed prompt or config is a different agent
+    assert key != get_agent_cache_key(
+        agent_profile="ti-bot", agent_config=agent_config, prompts={"a": "1", "b": "3"}
+    )
+    assert key != get_agent_cache_key(
+        agent_profile="ti-bot",
+        agent_config=AgentConfig(agent_type=AgentType.multi_agent),
+        prompts={"a": "1", "b": "2"},
+    )
+
+
+def test_compiled_agent_cache_reuses_agent() -> None:
+    cache = CompiledAgentCache(max_size=2)
+    builds = []
+
+    def build() -> object:
+        builds.append(1)
+        return object()
+
+    agent = cache.get_or_build("key", build)
+
+    assert cache.get_or_build("key", build) is agent
+    assert len(builds) == 1
+
+
+def test_compiled_agent_cache_evicts_least_recently_used() -> None:
+    max_size = 2
+    cache = CompiledAgentCache(max_size=max_size)
+    first_agent = cache.get_or_build("first", object)
+    second_agent = cache.get_or_build("second", object)
+
+    # touch "first" so "second" is the least recently used one
+    cache.get_or_build("first", object)
+    cache.get_or_build("third", object)
+
+    assert len(cache) == max_size
+    assert cache.get_or_build("first", object) is first_agent
+    assert cache.get_or_build("second", object) is not second_agent
+
+
+def test_compiled_agent_cache_clear_and_disabled() -> None:
+    cache = CompiledAgentCache(max_size=2)
+    agent = cache.get_or_build("key", object)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get_or_build("key", object) is not agent
+
+    disabled_cache = CompiledAgentCache(max_size=0)
+    disabled_cache.get_or_build("key", object)
+
+    assert len(disabled_cache) == 0
@@ -0,0 +1,135 @@
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from zion.agent.agent_stream import STREAMED_AGENT_NODES, get_agent_stream_output
+from zion.agent.zion_agent_classes import AgentType
+
+SINGLE_AGENT_NODES = STREAMED_AGENT_NODES[AgentType.react_agent]
+MULTI_AGENT_NODES = STREAMED_AGENT_NODES[AgentType.multi_agent]
+
+
+def create_model_stream_event(content: str, graph_node: str, node: str) -> dict:
+    return {
+        "event": "on_chat_model_stream",
+        "run_id": "run-1",
+        "parent_ids": ["root"],
+        "metadata": {
+            "langgraph_node": node,
+            "langgraph_checkpoint_ns": f"{graph_node}:task-1|{node}:task-2",
+        },
+        "data": {"chunk": AIMessageChunk(content=content)},
+    }
+
+
+def create_graph_end_event(message: AIMessage) -> dict:
+    return {
+        "event": "on_chain_end",
+        "run_id": "run-1",
+        "parent_ids": [],
+        "metadata": {},
+        "data": {"output": {"messages": [message]}},
+    }
+
+
+def test_get_agent_stream_output_streams_answer_tokens() -> None:
+    output = get_agent_stream_output(
+        create_model_stream_event("Hello", "single_agent", "agent"),
+        SINGLE_AGENT_NODES,
+    )
+    assert output.output == "Hello"
+    assert output.langsmith_run_id == "run-1"
+
+    # tool call chunks without content
+    assert (
+        get_agent_stream_output(
+            create_model_stream_event("", "single_agent", "agent"),
+            SINGLE_AGENT_NODES,
+        )
+        is None
+    )
+    # structured response generation
+    assert (
+        get_agent_stream_output(
+            create_model_stream_event(
+                '{"sources": []}', "single_agent", "generate_structured_response"
+            ),
+            SINGLE_AGENT_NODES,
+        )
+        is None
+    )
+    # intermediate multi agent node
+    assert (
+        get_agent_stream_output(
+            create_model_stream_event("category", "query_categorizer_agent", "agent"),
+            MULTI_AGENT_NODES,
+        )
+        is None
+    )
+
+
+def test_get_agent_stream_output_streams_tool_calls() -> None:
+    tool_start = get_agent_stream_output(
+        {
+            "event": "on_tool_start",
+            "name": "glean_search",
+            "run_id": "run-2",
+            "data": {"input": {"query": "zion"}},
+        },
+        SINGLE_AGENT_NODES,
+    )
+    assert tool_start.output == ""
+    assert tool_start.agent_actions[0].tool == "glean_search"
+    assert tool_start.agent_actions[0].tool_input == {"query": "zion"}
+
+    tool_end = get_agent_stream_output(
+        {
+            "event": "on_tool_end",
+            "name": "glean_search",
+            "run_id": "run-2",
+            "data": {
+                "input": {"query": "zion"},
+                "output": ToolMessage(content="results", tool_call_id="call-1"),
+            },
+        },
+        SINGLE_AGENT_NODES,
+    )
+    assert tool_end.agent_actions[0].tool_call_id == "call-1"
+    assert tool_end.agent_actions[0].tool_output == "results"
+
+
+def test_get_agent_stream_output_streams_unstreamed_final_answer() -> None:
+    # already streamed token by token
+    assert (
+        get_agent_stream_output(
+            create_graph_end_event(AIMessage(content="answer", name="single_agent")),
+            SINGLE_AGENT_NODES,
+        )
+        is None
+    )
+
+    # multi agent ended on the query categorizer
+    output = get_agent_stream_output(
+        create_graph_end_event(
+            AIMessage(content="not answerable", name="query_categorizer_agent")
+        ),
+        MULTI_AGENT_NODES,
+    )
+    assert output.output == "not answerable"
+
+
+def test_get_agent_stream_output_streams_multi_agent_answer_at_graph_end() -> None:
+    # the able to answer agent runs again on a retry, its tokens are not final
+    assert (
+        get_agent_stream_output(
+            create_model_stream_event("draft", "able_to_answer_agent", "agent"),
+            MULTI_AGENT_NODES,
+        )
+        is None
+    )
+
+    output = get_agent_stream_output(
+        create_graph_end_event(
+            AIMessage(content="answer", name="able_to_answer_agent")
+        ),
+        MULTI_AGENT_NODES,
+    )
+    assert output.output == "answer"
@@ -0,0 +1,154 @@
+import time
+from threading import Event
+from typing import Callable
+
+import pytest
+
+from zion.agent.prompt_registry import PromptRegistry
+
+
+class FakePromptHub:
+    def __init__(self) -> None:
+        self.pulls: list[str] = []
+        self.version = 1
+        self.fail = False
+
+    def pull(self, hub_commit: str) -> str:
+        self.pulls.append(hub_commit)
+        if self.fail:
+            message = f"unable to pull {hub_commit}"
+            raise ValueError(message)
+        return f"{hub_commit} v{self.version}"
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_prompt_registry_caches_template() -> None:
+    prompt_hub = FakePromptHub()
+    registry = PromptRegistry(
+        pull_prompt=prompt_hub.pull,
+        ttl_seconds=60,
+        pull_timeout_seconds=5,
+        max_workers=2,
+    )
+
+    assert registry.get("prompt-a") == "prompt-a v1"
+    assert registry.get("prompt-a") == "prompt-a v1"
+    assert prompt_hub.pulls == ["prompt-a"]
+
+
+def test_prompt_registry_serves_stale_template_while_refreshing() -> None:
+    prompt_hub = FakePromptHub()
+    registry = PromptRegistry(
+        pull_prompt=prompt_hub.pull,
+        ttl_seconds=0,
+        pull_timeout_seconds=5,
+        max_workers=2,
+    )
+    registry.get("prompt-a")
+
+    prompt_hub.version = 2
+    # the stale template is returned right away, the refresh runs in the background
+    assert registry.get("prompt-a") == "prompt-a v1"
+    wait_until(lambda: registry.get("prompt-a") == "prompt-a v2")
+
+
+def test_prompt_registry_keeps_stale_template_on_failed_refresh() -> None:
+    prompt_hub = FakePromptHub()
+    registry = PromptRegistry(
+        pull_prompt=prompt_hub.pull,
+        ttl_seconds=0,
+        pull_timeout_seconds=5,
+        max_workers=2,
+    )
+    registry.get("prompt-a")
+
+    prompt_hub.fail = True
+    initial_pulls = len(prompt_hub.pulls)
+    assert registry.get("prompt-a") == "prompt-a v1"
+    # a refresh only starts once the previous one is done, so a second refresh means the failed one has finished
+    wait_until(
+        lambda: registry.get("prompt-a") == "prompt-a v1"
+        and len(prompt_hub.pulls) > initial_pulls + 1
+    )
+
+
+def test_prompt_registry_get_many_pulls_concurrently() -> None:
+    hub_commits = ["prompt-a", "prompt-b", "prompt-c"]
+    all_pulls_started = Event()
+    started_pulls: list[str] = []
+
+    def pull(hub_commit: str) -> str:
+        started_pulls.append(hub_commit)
+        if len(started_pulls) == len(hub_commits):
+            all_pulls_started.set()
+        # every pull waits for the others, this only finishes when they run concurrently
+        assert all_pulls_started.wait(timeout=5)
+        if hub_commit == "prompt-c":
+            message = "unable to pull prompt-c"
+            raise ValueError(message)
+        return hub_commit
+
+    registry = PromptRegistry(
+        pull_prompt=pull,
+        ttl_seconds=60,
+        pull_timeout_seconds=5,
+        max_workers=len(hub_commits),
+    )
+
+    templates = registry.get_many(hub_commits)
+
+    assert templates == {"prompt-a": "prompt-a", "prompt-b": "prompt-b"}
+    with pytest.raises(ValueError, match="unable to pull prompt-c"):
+        registry.get("prompt-c")
+
+
+def test_prompt_registry_warm_and_invalidate() -> None:
+    prompt_hub = FakePromptHub()
+    registry = PromptRegistry(
+        pull_prompt=prompt_hub.pull,
+        ttl_seconds=60,
+        pull_timeout_seconds=5,
+        max_workers=2,
+    )
+
+    registry.warm(["prompt-a", "prompt-b"])
+    assert registry.get("prompt-a") == "prompt-a v1"
+    assert registry.get("prompt-b") == "prompt-b v1"
+    # the gets are served by the pulls started on warm up
+    assert sorted(prompt_hub.pulls) == ["prompt-a", "prompt-b"]
+
+    prompt_hub.version = 2
+    registry.invalidate("prompt-a")
+    assert registry.get("prompt-a") == "prompt-a v2"
+    assert registry.get("prompt-b") == "prompt-b v1"
+
+
+def test_prompt_registry_get_many_waits_one_pull_timeout() -> None:
+    release_pulls = Event()
+
+    def pull(hub_commit: str) -> str:
+        release_pulls.wait(timeout=5)
+        return hub_commit
+
+    pull_timeout_seconds = 0.1
+    registry = PromptRegistry(
+        pull_prompt=pull,
+        ttl_seconds=60,
+        pull_timeout_seconds=pull_timeout_seconds,
+        max_workers=3,
+    )
+
+    started_at = time.monotonic()
+    templates = registry.get_many(["prompt-a", "prompt-b", "prompt-c"])
+    waited_seconds = time.monotonic() - started_at
+    release_pulls.set()
+
+    # the pulls share one deadline instead of waiting one timeout each
+    assert templates == {}
+    assert waited_seconds < pull_timeout_seconds * 2
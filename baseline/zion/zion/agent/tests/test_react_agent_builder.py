@@ -0,0 +1,119 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from zion.agent.react_agent_builder import get_tool_node
+from zion.config import global_config
+
+
+@tool
+def first_search(query: str) -> str:
+    """First search."""
+    time.sleep(0.5)
+    return f"first {query}"
+
+
+@tool
+def second_search(query: str) -> str:
+    """Second search."""
+    time.sleep(0.5)
+    return f"second {query}"
+
+
+@tool
+async def slow_search(query: str) -> str:
+    """Search that never answers in time."""
+    await asyncio.sleep(5)
+    return f"slow {query}"
+
+
+def create_tool_calls_message(tool_names: list[str]) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": tool_name, "args": {"query": "zion"}, "id": f"call-{i}"}
+            for i, tool_name in enumerate(tool_names)
+        ],
+    )
+
+
+def test_tool_node_runs_tool_calls_concurrently_in_order() -> None:
+    tool_node = get_tool_node([first_search, second_search])
+
+    start_time = time.perf_counter()
+    output = tool_node.invoke(
+        {"messages": [create_tool_calls_message(["second_search", "first_search"])]}
+    )
+
+    assert time.perf_counter() - start_time < 0.9  # noqa: PLR2004
+    assert [message.tool_call_id for message in output["messages"]] == [
+        "call-0",
+        "call-1",
+    ]
+    assert [message.content for message in output["messages"]] == [
+        "second zion",
+        "first zion",
+    ]
+
+
+def test_tool_node_times_out_slow_tool_calls() -> None:
+    tool_node = get_tool_node([first_search, slow_search])
+
+    with patch.object(
+        global_config, "tool_timeout_seconds_by_name", {"slow_search": 1}
+    ):
+        output = asyncio.run(
+            tool_node.ainvoke(
+                {
+                    "messages": [
+                        create_tool_calls_message(["slow_search", "first_search"])
+                    ]
+                }
+            )
+        )
+
+    assert output["messages"][0].status == "error"
+    assert "slow_search timed out" in output["messages"][0].content
+    assert output["messages"][1].content == "first zion"
+
+
+def test_tool_node_timeout_starts_when_the_call_starts() -> None:
+    tool_node = get_tool_node([first_search, second_search])
+
+    # one call at a time, the second call waits 0.5s for its slot but runs in time
+    with (
+        patch.object(global_config, "tool_max_concurrency", 1),
+        patch.object(global_config, "tool_timeout_seconds", 0.8),
+    ):
+        output = tool_node.invoke(
+            {"messages": [create_tool_calls_message(["first_search", "second_search"])]}
+        )
+
+    assert [message.content for message in output["messages"]] == [
+        "first zion",
+        "second zion",
+    ]
+
+
+def test_tool_node_runs_nested_tool_nodes_with_their_own_slots() -> None:
+    inner_tool_node = get_tool_node([first_search])
+
+    @tool
+    def agent_search(query: str) -> str:
+        """Search that runs another agent."""
+        output = inner_tool_node.invoke(
+            {"messages": [create_tool_calls_message(["first_search"])]}
+        )
+        return f"{query}: {output['messages'][0].content}"
+
+    tool_node = get_tool_node([agent_search])
+
+    with patch.object(global_config, "tool_max_concurrency", 1):
+        output = tool_node.invoke(
+            {"messages": [create_tool_calls_message(["agent_search"])]}
+        )
+
+    assert output["messages"][0].content == "zion: first zion"
@@ -1,13 +1,11 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any, Optional
 
 import yaml
 from fastapi import HTTPException
-from langchain import hub
 from langchain.agents import AgentExecutor
 from langchain_community.tools import BaseTool
 from langchain_core.prompts import PromptTemplate
@@ -18,7 +16,6 @@ from langchain_core.runnables import (
     RunnableSerializable,
 )
 from langchain_core.tracers.context import LangChainTracer, tracing_v2_enabled
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.prebuilt import create_react_agent
 from langgraph.pregel import Pregel
 from langsmith import Client as LangSmithClient
@@ -29,11 +26,13 @@ from pydantic import BaseModel
 from zion.agent.agent_builder import (
     get_agent_executor,
 )
+from zion.agent.agent_cache import compiled_agent_cache, get_agent_cache_key
 from zion.agent.agent_input_transformer import transform_chat_history
 from zion.agent.agent_output_parser import (
     CustomOpenAIToolsAgentOutputParser,
     structured_output_delimiter,
 )
+from zion.agent.agent_stream import STREAMED_AGENT_NODES, get_agent_stream_output
 from zion.agent.constant import (
     GRABGPT_AGENT_PROFILE_NAME,
     guardrails_error_message,
@@ -52,18 +51,30 @@ from zion.agent.multi_agent.classes import (
 )
 from zion.agent.multi_agent.constant import (
     ABLE_TO_ANSWER_DESCRIPTION,
+    ABLE_TO_ANSWER_DESCRIPTION_HUB_COMMIT,
     ABLE_TO_ANSWER_PROMPT,
+    ABLE_TO_ANSWER_PROMPT_HUB_COMMIT,
     ANSWER_CONFIDENCE_SCORE_DESCRIPTION,
+    ANSWER_CONFIDENCE_SCORE_DESCRIPTION_HUB_COMMIT,
     EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION,
+    EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
     INTERNAL_SEARCH_PROMPT,
+    INTERNAL_SEARCH_PROMPT_HUB_COMMIT,
+    MULTI_AGENT_DESCRIPTION_HUB_COMMITS,
+    MULTI_AGENT_PROMPT_HUB_COMMITS,
     QUERY_CATEGORIZER_PROMPT,
+    QUERY_CATEGORIZER_PROMPT_HUB_COMMIT,
     SLACK_WORKFLOW_CATEGORY_DESCRIPTION,
+    SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
     SOURCES_DESCRIPTION,
+    SOURCES_DESCRIPTION_HUB_COMMIT,
     TI_BOT_PROMPT,
+    TI_BOT_PROMPT_HUB_COMMIT,
 )
 from zion.agent.multi_agent.multi_agent_workflow import (
     get_ti_bot_multi_agent_system,
 )
+from zion.agent.prompt_registry import get_prompt_hub_handle, prompt_registry
 from zion.agent.react_agent_builder import (
     convert_input_to_react_agent_message_dict,
 )
@@ -84,7 +95,7 @@ from zion.agent.zion_agent_classes import (
     ZionRunnableConfig,
 )
 from zion.config import AgentProfile, global_config, is_langsmith_enabled, logger
-from zion.data.agent_execution_trail import AgentExecutionTrail, create_trail
+from zion.data.agent_execution_trail import AgentExecutionTrail, write_trail
 from zion.data.agent_plugin.constant import (
     AGENT_COMMON_PLUGIN_TYPE,
     AGENT_HTTP_PLUGIN_TYPE,
@@ -92,7 +103,7 @@ from zion.data.agent_plugin.constant import (
     AGENT_OPENAPI_PLUGIN_TYPE,
 )
 from zion.data.agent_plugin.data import QueryAgentPluginRequest
-from zion.data.agent_plugin.database_handler import get_agent_plugin_database
+from zion.data.agent_plugin.registry import agent_plugin_registry
 from zion.data.agent_plugin.util import get_agent_plugin_map
 from zion.tool.agent_plugins import (
     COMMON_PLUGINS,
@@ -107,11 +118,20 @@ from zion.tool.agent_tool import (
 )
 from zion.tool.gitlab_mr_creation_automation_tool import GitlabMrCreationAutomationTool
 from zion.tool.glean_search import GleanSearchTool
-from zion.tool.hades_kb_service import HadesKnowledgeBaseTool
+from zion.tool.mcp_client_pool import mcp_client_pool
 from zion.tool.orchestrator_tool import OrchestratorTool
 from zion.tool.requests_tool import RequestsTool
+from zion.tool.util import QUERY_SOURCE_CONFIG_KEY, USER_PROMPT_CONFIG_KEY
 from zion.util.common import get_current_time_in_iso8601_sgt
 
+MR_CREATION_AUTOMATION_CHANNELS = [
+    "#jiatian-test-dev2",
+    "#jiatian-test-dev3",
+    "#jiatian-test-prd",
+    "#chimera-users",
+    "#llmops",
+]
+
 
 class GuardrailsAgentOutput(BaseModel):
     output: Any
@@ -166,23 +186,16 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
         )
 
     def _assign_plugin_details_by_plugin_name(
-        self, plugin: BaseTool, agent_input: ZionAgentInput, agent_plugin: AgentPlugin
+        self, plugin: BaseTool, agent_plugin: AgentPlugin
     ) -> None:
-        if plugin.name == HadesKnowledgeBaseTool().name:
-            plugin.metadata = {"user_prompt": agent_input.input}
         if plugin.name == GleanSearchTool().name:
             glean_search = GleanSearchTool()
             glean_search.replace_glean_description(agent_plugin.metadata)
             plugin.description = glean_search.description
 
-    def _get_tools_from_agent_plugins(  # noqa:C901, PLR0912
-        self, agent_plugins: list[AgentPlugin], agent_input: ZionAgentInput
-    ) -> list:
-        """Get tools from agent_plugins."""
-        openapi_plugins: list[AgentPlugin] = []
-        tools: list[AgentPlugin] = []
-
-        agent_plugin_db = get_agent_plugin_database(
+    def _get_agent_plugin_db(self, agent_input: ZionAgentInput) -> list | None:
+        """Get the agent plugins the agent, channel and user of the input have access to."""
+        return agent_plugin_registry.get_agent_plugins(
             query_agent_plugin_req=QueryAgentPluginRequest(
                 agent_name=self.agent_profile.profile_name,
                 channel_name=agent_input.query_source.channel_name,
@@ -190,6 +203,16 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
             ),
         )
 
+    def _get_tools_from_agent_plugins(  # noqa:C901, PLR0912
+        self,
+        agent_plugins: list[AgentPlugin],
+        agent_input: ZionAgentInput,
+        agent_plugin_db: list | None,
+    ) -> list:
+        """Get tools from agent_plugins."""
+        openapi_plugins: list[AgentPlugin] = []
+        tools: list[AgentPlugin] = []
+
         if agent_plugin_db is None:
             # early return empty arr as we cant find any tools from db
             return []
@@ -210,9 +233,7 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
                 plugin = COMMON_PLUGINS[agent_plugin.name]
                 if isinstance(plugin, BaseTool) or issubclass(plugin, BaseTool):
                     plugin = plugin()
-                    self._assign_plugin_details_by_plugin_name(
-                        plugin, agent_input, agent_plugin
-                    )
+                    self._assign_plugin_details_by_plugin_name(plugin, agent_plugin)
 
                 if agent_plugin.metadata is not None and isinstance(plugin, BaseTool):
                     plugin.metadata = agent_plugin.metadata
@@ -261,74 +282,133 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
             tools += get_tools_from_database_result(openapi_plugins)
 
         # add mr creation automation plugin by default
-        if agent_input.query_source.channel_name in [
-            "#jiatian-test-dev2",
-            "#jiatian-test-dev3",
-            "#jiatian-test-prd",
-            "#chimera-users",
-            "#llmops",
-        ]:
+        if agent_input.query_source.channel_name in MR_CREATION_AUTOMATION_CHANNELS:
             mr_creation_tool = GitlabMrCreationAutomationTool()
             mr_creation_tool.metadata = {
                 "model_name": agent_input.agent_config.llm_model.model_name,
-                "query_source": agent_input.query_source,
             }
             tools.append(mr_creation_tool)
 
         return tools
 
-    def _get_follow_up_convo_agent(
+    def _get_tool_request_config(
+        self, agent_input: ZionAgentInput, config: ZionRunnableConfig | None
+    ) -> ZionRunnableConfig:
+        """Run config with the request values tools read through `get_tool_request_value`.
+
+        Compiled agents are shared across requests, so request values travel with the run instead of the tools.
+        """
+        tool_request_config = dict(config or {})
+        tool_request_config["configurable"] = {
+            **tool_request_config.get("configurable", {}),
+            USER_PROMPT_CONFIG_KEY: agent_input.input,
+            QUERY_SOURCE_CONFIG_KEY: agent_input.query_source,
+        }
+        return tool_request_config
+
+    def _get_compiled_agent_cache_key(
         self: ZionAgent,
         agent_input: ZionAgentInput,
-    ) -> Pregel:
-        agent_input.chat_history = transform_chat_history(agent_input.chat_history)
+        agent_plugin_db: list | None,
+        **prompts: Any,  # noqa: ANN401, resolved prompts and descriptions the agent is built with
+    ) -> str:
+        plugin_records = None
+        if agent_plugin_db is not None:
+            # the whole row, so an updated, moved or re-permissioned plugin gives a new key
+            plugin_records = [
+                {
+                    column.name: getattr(agent_plugin, column.name)
+                    for column in agent_plugin.__table__.columns
+                }
+                for agent_plugin in agent_plugin_db
+            ]
 
+        return get_agent_cache_key(
+            agent_profile=self.agent_profile.profile_name,
+            agent_type=agent_input.agent_config.agent_type,
+            plugins=agent_input.agent_config.plugins,
+            plugin_records=plugin_records,
+            mr_creation_automation=agent_input.query_source.channel_name
+            in MR_CREATION_AUTOMATION_CHANNELS,
+            llm_model=agent_input.agent_config.llm_model,
+            mcp_config=agent_input.agent_config.mcp_config,
+            prompts=prompts,
+        )
+
+    def _get_agent_tools(
+        self: ZionAgent,
+        agent_input: ZionAgentInput,
+        agent_plugin_db: list | None,
+        load_mcp_tools: bool = True,  # noqa: FBT001, FBT002
+    ) -> list:
         # Build tools
         agent_plugins = []
         if agent_input.agent_config.plugins is not None:
             agent_plugins = agent_input.agent_config.plugins
 
-        tools = self._get_tools_from_agent_plugins(agent_plugins, agent_input)
+        tools = self._get_tools_from_agent_plugins(
+            agent_plugins, agent_input, agent_plugin_db
+        )
 
-        # Load MCP tools asynchronously
-        if agent_input.agent_config.mcp_config is not None:
+        # Load MCP tools from the pooled sessions
+        if load_mcp_tools and agent_input.agent_config.mcp_config is not None:
             mcp_servers = agent_input.agent_config.mcp_config
-            mcp_tools = asyncio.run(self._load_mcp_tools(mcp_servers))
-            tools.extend(mcp_tools)
-
-        return get_single_agent_system(
-            tools=tools,
-            model=self._get_chat_open_ai(agent_input),
-            prompts=SingleAgentPrompts(single_agent_prompt=FOLLOW_UP_CONVO_AGENT_PROMPT),
-            descriptions=SingleAgentStructuredRespDescriptions(),
-        )
+            tools.extend(self._load_mcp_tools(mcp_servers))
 
-    def _get_multi_agent(
+        return tools
+
+    def _get_follow_up_convo_agent(
         self: ZionAgent,
         agent_input: ZionAgentInput,
     ) -> Pregel:
         agent_input.chat_history = transform_chat_history(agent_input.chat_history)
-        agent_prompts = self._get_multi_agent_prompts(agent_input)
-        agent_descriptions = self._get_multi_agent_descriptions(agent_input)
+        agent_plugin_db = self._get_agent_plugin_db(agent_input)
+
+        def build_follow_up_convo_agent() -> Pregel:
+            return get_single_agent_system(
+                tools=self._get_agent_tools(agent_input, agent_plugin_db),
+                model=self._get_chat_open_ai(agent_input),
+                prompts=SingleAgentPrompts(
+                    single_agent_prompt=FOLLOW_UP_CONVO_AGENT_PROMPT
+                ),
+                descriptions=SingleAgentStructuredRespDescriptions(),
+            )
 
-        # Build tools
-        agent_plugins = []
-        if agent_input.agent_config.plugins is not None:
-            agent_plugins = agent_input.agent_config.plugins
+        return compiled_agent_cache.get_or_build(
+            self._get_compiled_agent_cache_key(agent_input, agent_plugin_db),
+            build_follow_up_convo_agent,
+        )
 
-        tools = self._get_tools_from_agent_plugins(agent_plugins, agent_input)
+    def _get_multi_agent(
+        self: ZionAgent,
+        agent_input: ZionAgentInput,
+    ) -> Pregel:
+        agent_input.chat_history = transform_chat_history(agent_input.chat_history)
+        agent_templates = self._get_agent_templates(
+            MULTI_AGENT_PROMPT_HUB_COMMITS + MULTI_AGENT_DESCRIPTION_HUB_COMMITS
+        )
+        agent_prompts = self._get_multi_agent_prompts(agent_input, agent_templates)
+        agent_descriptions = self._get_multi_agent_descriptions(
+            agent_input, agent_templates
+        )
+        agent_plugin_db = self._get_agent_plugin_db(agent_input)
+
+        def build_multi_agent() -> Pregel:
+            return get_ti_bot_multi_agent_system(
+                tools=self._get_agent_tools(agent_input, agent_plugin_db),
+                model=self._get_chat_open_ai(agent_input),
+                prompts=agent_prompts,
+                descriptions=agent_descriptions,
+            )
 
-        # Load MCP tools asynchronously
-        if agent_input.agent_config.mcp_config is not None:
-            mcp_servers = agent_input.agent_config.mcp_config
-            mcp_tools = asyncio.run(self._load_mcp_tools(mcp_servers))
-            tools.extend(mcp_tools)
-
-        return get_ti_bot_multi_agent_system(
-            tools=tools,
-            model=self._get_chat_open_ai(agent_input),
-            prompts=agent_prompts,
-            descriptions=agent_descriptions,
+        return compiled_agent_cache.get_or_build(
+            self._get_compiled_agent_cache_key(
+                agent_input,
+                agent_plugin_db,
+                agent_prompts=agent_prompts,
+                agent_descriptions=agent_descriptions,
+            ),
+            build_multi_agent,
         )
 
     def _get_react_agent(
@@ -337,28 +417,36 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
     ) -> Pregel:
         base_system_prompt = self._get_base_system_prompt(agent_input)
         agent_input.chat_history = transform_chat_history(agent_input.chat_history)
+        agent_plugin_db = self._get_agent_plugin_db(agent_input)
+
+        def build_react_agent() -> Pregel:
+            return get_single_agent_system(
+                tools=self._get_agent_tools(agent_input, agent_plugin_db),
+                model=self._get_chat_open_ai(agent_input),
+                prompts=SingleAgentPrompts(base_system_prompt),
+                descriptions=SingleAgentStructuredRespDescriptions(),
+            )
 
-        # Build tools
-        agent_plugins = []
-        if agent_input.agent_config.plugins is not None:
-            agent_plugins = agent_input.agent_config.plugins
-
-        tools = self._get_tools_from_agent_plugins(agent_plugins, agent_input)
-
-        # Load MCP tools asynchronously
-        if agent_input.agent_config.mcp_config is not None:
-            mcp_servers = agent_input.agent_config.mcp_config
-            mcp_tools = asyncio.run(self._load_mcp_tools(mcp_servers))
-            tools.extend(mcp_tools)
-
-
-        return get_single_agent_system(
-            tools=tools,
-            model=self._get_chat_open_ai(agent_input),
-            prompts=SingleAgentPrompts(base_system_prompt),
-            descriptions=SingleAgentStructuredRespDescriptions(),
+        return compiled_agent_cache.get_or_build(
+            self._get_compiled_agent_cache_key(
+                agent_input, agent_plugin_db, base_system_prompt=base_system_prompt
+            ),
+            build_react_agent,
         )
 
+    def _get_langgraph_agent(
+        self: ZionAgent,
+        agent_input: ZionAgentInput,
+    ) -> Pregel | None:
+        """Get the langgraph agent of the agent type, None for the agent executor."""
+        if agent_input.agent_config.agent_type == AgentType.react_agent:
+            return self._get_react_agent(agent_input)
+        if agent_input.agent_config.agent_type == AgentType.multi_agent:
+            return self._get_multi_agent(agent_input)
+        if agent_input.agent_config.agent_type == AgentType.follow_up_convo_agent:
+            return self._get_follow_up_convo_agent(agent_input)
+        return None
+
     def _get_agent_executor(
         self: ZionAgent,
         agent_input: ZionAgentInput,
@@ -367,32 +455,41 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
         """Get the agent executor."""
         system_prompt, system_prompt_variables = self._get_system_prompt(agent_input)
         agent_input.chat_history = transform_chat_history(agent_input.chat_history)
+        agent_plugin_db = self._get_agent_plugin_db(agent_input)
+        max_iterations = agent_input.agent_config.agent_executor_config.max_iterations
 
-        # Build tools
-        agent_plugins = []
-        if agent_input.agent_config.plugins is not None:
-            agent_plugins = agent_input.agent_config.plugins
+        def build_agent_executor() -> AgentExecutor:
+            return get_agent_executor(
+                chat_open_ai=self._get_chat_open_ai(agent_input),
+                system_prompt=system_prompt,
+                system_prompt_variables=system_prompt_variables,
+                tools=self._get_agent_tools(
+                    agent_input, agent_plugin_db, load_mcp_tools=False
+                ),
+                input_class=ZionAgentInput,
+                max_iterations=max_iterations,
+                output_class=ZionAgentOutput,
+                output_parser=CustomOpenAIToolsAgentOutputParser,
+            )
 
-        tools = self._get_tools_from_agent_plugins(agent_plugins, agent_input)
-
-        return get_agent_executor(
-            chat_open_ai=self._get_chat_open_ai(agent_input),
-            system_prompt=system_prompt,
-            system_prompt_variables=system_prompt_variables,
-            tools=tools,
-            input_class=ZionAgentInput,
-            max_iterations=agent_input.agent_config.agent_executor_config.max_iterations,
-            output_class=ZionAgentOutput,
-            output_parser=CustomOpenAIToolsAgentOutputParser,
+        return compiled_agent_cache.get_or_build(
+            self._get_compiled_agent_cache_key(
+                agent_input,
+                agent_plugin_db,
+                system_prompt=system_prompt,
+                # callable variables are resolved per run, they do not change the executor
+                system_prompt_variables={
+                    key: value
+                    for key, value in system_prompt_variables.items()
+                    if not callable(value)
+                },
+                max_iterations=max_iterations,
+            ),
+            build_agent_executor,
         )
 
     def _pull_prompt_hub_commit(self, hub_commit: str) -> str:
-        prompt = hub.pull(
-            owner_repo_commit=hub_commit,
-            api_url=global_config.langchain_endpoint,
-            api_key=global_config.langchain_api_key,
-        )
-        return prompt.template
+        return prompt_registry.get(hub_commit)
 
     # prioritize in order: 1. prompt hub, 2. system_prompt in request, 3. fallback const
     def _get_base_system_prompt(self: ZionAgent, agent_input: ZionAgentInput) -> str:
@@ -429,15 +526,12 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
     def _get_formatted_agent_prompt(
         self: ZionAgent,
         agent_input: ZionAgentInput,
+        agent_templates: dict[str, str],
         prompt_hub_commit: str,
         fallback_prompt: str,
     ) -> str:
         try:
-            prompt = self._pull_prompt_hub_commit(
-                hub_commit=global_config.langsmith_handle_prefix
-                + "/"
-                + prompt_hub_commit
-            )
+            prompt = agent_templates[get_prompt_hub_handle(prompt_hub_commit)]
 
             prompt_template = PromptTemplate.from_template(prompt)
             # format prompt template with variables, e.g. channel_specific_instructions, and return str
@@ -458,26 +552,43 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
 
         return fallback_prompt
 
+    def _get_agent_templates(
+        self: ZionAgent, prompt_hub_commits: list[str]
+    ) -> dict[str, str]:
+        """Get the agent templates in one concurrent pull, waiting at most one pull timeout for all of them.
+
+        Templates that could not be pulled in time are left out, their agents fall back to the default prompts.
+        """
+        return prompt_registry.get_many(
+            get_prompt_hub_handle(prompt_hub_commit)
+            for prompt_hub_commit in prompt_hub_commits
+        )
+
     def _get_multi_agent_prompts(
-        self: ZionAgent, agent_input: ZionAgentInput
+        self: ZionAgent, agent_input: ZionAgentInput, agent_templates: dict[str, str]
     ) -> MultiAgentPrompts:
         prompts = MultiAgentPrompts()
-        query_categorizer_prompt_hub_commit = "ti-bot-multi-agent-query-categorizer"
-        ti_bot_prompt_hub_commit = "ti-bot-multi-agent-ti-bot"
-        internal_search_prompt_hub_commit = "ti-bot-multi-agent-internal-search"
-        able_to_answer_prompt_hub_commit = "ti-bot-multi-agent-able-to-answer"
 
         prompts["query_categorizer_agent_prompt"] = self._get_formatted_agent_prompt(
-            agent_input, query_categorizer_prompt_hub_commit, QUERY_CATEGORIZER_PROMPT
+            agent_input,
+            agent_templates,
+            QUERY_CATEGORIZER_PROMPT_HUB_COMMIT,
+            QUERY_CATEGORIZER_PROMPT,
         )
         prompts["ti_bot_agent_prompt"] = self._get_formatted_agent_prompt(
-            agent_input, ti_bot_prompt_hub_commit, TI_BOT_PROMPT
+            agent_input, agent_templates, TI_BOT_PROMPT_HUB_COMMIT, TI_BOT_PROMPT
         )
         prompts["internal_search_agent_prompt"] = self._get_formatted_agent_prompt(
-            agent_input, internal_search_prompt_hub_commit, INTERNAL_SEARCH_PROMPT
+            agent_input,
+            agent_templates,
+            INTERNAL_SEARCH_PROMPT_HUB_COMMIT,
+            INTERNAL_SEARCH_PROMPT,
         )
         prompts["able_to_answer_agent_prompt"] = self._get_formatted_agent_prompt(
-            agent_input, able_to_answer_prompt_hub_commit, ABLE_TO_ANSWER_PROMPT
+            agent_input,
+            agent_templates,
+            ABLE_TO_ANSWER_PROMPT_HUB_COMMIT,
+            ABLE_TO_ANSWER_PROMPT,
         )
 
         return prompts
@@ -485,50 +596,43 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
     def _get_multi_agent_descriptions(
         self: ZionAgent,
         agent_input: ZionAgentInput,
+        agent_templates: dict[str, str],
     ) -> MultiAgentStructuredRespDescriptions:
         descriptions = MultiAgentStructuredRespDescriptions()
-        able_to_answer_description_hub_commit = (
-            "ti-bot-multi-agent-able-to-answer-description"
-        )
-        answer_confidence_score_description_hub_commit = (
-            "ti-bot-multi-agent-answer-confidence-score-description"
-        )
-        sources_description_hub_commit = "ti-bot-multi-agent-sources-description"
-        slack_workflow_category_description_hub_commit = (
-            "ti-bot-multi-agent-category-description"
-        )
-        expected_slack_workflow_category_description_hub_commit = (
-            "ti-bot-multi-agent-expected-category-description"
-        )
 
         descriptions["able_to_answer_description"] = self._get_formatted_agent_prompt(
             agent_input,
-            able_to_answer_description_hub_commit,
+            agent_templates,
+            ABLE_TO_ANSWER_DESCRIPTION_HUB_COMMIT,
             ABLE_TO_ANSWER_DESCRIPTION,
         )
         descriptions["answer_confidence_score_description"] = (
             self._get_formatted_agent_prompt(
                 agent_input,
-                answer_confidence_score_description_hub_commit,
+                agent_templates,
+                ANSWER_CONFIDENCE_SCORE_DESCRIPTION_HUB_COMMIT,
                 ANSWER_CONFIDENCE_SCORE_DESCRIPTION,
             )
         )
         descriptions["sources_description"] = self._get_formatted_agent_prompt(
             agent_input,
-            sources_description_hub_commit,
+            agent_templates,
+            SOURCES_DESCRIPTION_HUB_COMMIT,
             SOURCES_DESCRIPTION,
         )
         descriptions["slack_workflow_category_description"] = (
             self._get_formatted_agent_prompt(
                 agent_input,
-                slack_workflow_category_description_hub_commit,
+                agent_templates,
+                SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
                 SLACK_WORKFLOW_CATEGORY_DESCRIPTION,
             )
         )
         descriptions["expected_slack_workflow_category_description"] = (
             self._get_formatted_agent_prompt(
                 agent_input,
-                expected_slack_workflow_category_description_hub_commit,
+                agent_templates,
+                EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION_HUB_COMMIT,
                 EXPECTED_SLACK_WORKFLOW_CATEGORY_DESCRIPTION,
             )
         )
@@ -566,21 +670,25 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
     def _get_system_prompt(
         self: ZionAgent, agent_input: ZionAgentInput
     ) -> tuple[str, dict[str, Any]]:
-        base_system_prompt = self._get_formatted_agent_prompt(agent_input)
+        base_system_prompt = self._get_base_system_prompt(agent_input)
         # Use f-string to interpolate the "base_system_prompt",
         # as the it may contain other f-string variables defined by API user,
         # This will allow LCEL to replace the variables inside the "base_system_prompt"
+        # The current time is left as a variable, so the prompt stays the same across runs
         system_prompt = "\n".join(
             (
                 f"{base_system_prompt}\n\n",
-                f"Current Time: {get_current_time_in_iso8601_sgt()}\n\n",
+                "Current Time: {current_time}\n\n",
                 "!!!Important!!! You must reply the response with following format regardless if you manage to answer it. {structured_output_instructions}",
                 "Format:\n<your answer in markdown format>\n",
             )
         )
 
         # system_prompt_variables is a dictionary of variables that will be reference as additional variables in LCEL later
-        system_prompt_variables: dict[str, Any] = {"structured_output_instructions": ""}
+        system_prompt_variables: dict[str, Any] = {
+            "structured_output_instructions": "",
+            "current_time": get_current_time_in_iso8601_sgt,
+        }
         if agent_input.system_prompt_variables is not None:
             system_prompt_variables.update(agent_input.system_prompt_variables)
 
@@ -626,7 +734,7 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
             if tracer and tracer.latest_run and tracer.latest_run.id is not None:
                 langsmith_run_id = tracer.latest_run.id.__str__()
 
-            return create_trail(
+            return write_trail(
                 agent_name=self.agent_profile.profile_name,
                 langsmith_project_name=self.agent_profile.langchain_project,
                 langsmith_run_id=langsmith_run_id,
@@ -806,50 +914,34 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
 
         return {}
 
-    async def _handle_ainvoke_react_agent(
+    async def _handle_astream_langgraph_agent(
         self,
         agent_input: ZionAgentInput,
-        agent: AgentExecutor | Pregel,
+        agent: Pregel,
         config: ZionRunnableConfig | None = None,
-    ) -> AsyncGenerator[ZionAgentOutput]:
-        # handle for react agent streaming
+    ) -> AsyncGenerator[dict[str, ZionAgentOutput]]:
+        # runs the agent once, streaming model tokens and tool calls as they happen
+        streamed_nodes = STREAMED_AGENT_NODES[agent_input.agent_config.agent_type]
         async for event in agent.astream_events(
             input=convert_input_to_react_agent_message_dict(agent_input),
             config=config,
             version="v2",
         ):
-            kind = event.get("event", "")
-
-            # only return even where the model is streaming
-            if kind != "on_chat_model_stream":
-                continue
-            data = event["data"]
-            chunk_content = data.get("chunk", None)
-            if not chunk_content or not chunk_content.content:
-                continue
-
-            # Empty content in the context of OpenAI or Anthropic usually means
-            # that the model is asking for a tool to be invoked.
-            # So we only yield non-empty content
-            yield {
-                "output": ZionAgentOutput(
-                    output=chunk_content.content,
-                    langsmith_run_id=event.get("run_id", ""),
-                )
-            }
+            output = get_agent_stream_output(event, streamed_nodes)
+            if output is not None:
+                yield {"output": output}
 
-    async def _load_mcp_tools(self, mcp_servers: dict[str, Any]) -> list:
-        """Load MCP tools asynchronously."""
+    def _load_mcp_tools(self, mcp_servers: dict[str, Any]) -> list:
+        """Load MCP tools from the MCP client pool."""
         try:
-            mcp_client = MultiServerMCPClient(mcp_servers)
-            return await mcp_client.get_tools()
+            return mcp_client_pool.get_tools(mcp_servers)
         except (
             Exception  # noqa: BLE001, because we want to handle it gracefully
         ) as e:
             logger.error(f"Failed to load MCP tools: {e}")
             return []
 
-    def invoke(  # noqa: C901, PLR0912
+    def invoke(
         self: ZionAgent,
         agent_input: dict,
         config: ZionRunnableConfig | None = None,
@@ -857,15 +949,10 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
         agent_input = self._before_invoke(config=config, agent_input=agent_input)
 
         typed_input = ZionAgentInput(**agent_input)
+        config = self._get_tool_request_config(typed_input, config)
 
-        agent: ZionAgent | Pregel
-        if typed_input.agent_config.agent_type == AgentType.react_agent:
-            agent = self._get_react_agent(typed_input)
-        elif typed_input.agent_config.agent_type == AgentType.multi_agent:
-            agent = self._get_multi_agent(typed_input)
-        elif typed_input.agent_config.agent_type == AgentType.follow_up_convo_agent:
-            agent = self._get_follow_up_convo_agent(typed_input)
-        else:
+        agent: AgentExecutor | Pregel | None = self._get_langgraph_agent(typed_input)
+        if agent is None:
             agent = self._get_agent_executor(typed_input, config)
 
         agent_actions: list[ZionAgentActions] = []
@@ -916,7 +1003,8 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
         else:
             trail_record = self._log_trail(tracer=tracer, agent_actions=agent_actions)
             if trail_record:
-                invoke_res["agent_execution_trail_id"] = trail_record.id
+                # the trail is written behind the request, it is identified by the uuid assigned before it is queued
+                invoke_res["agent_execution_trail_id"] = trail_record.uuid
                 invoke_res["langsmith_run_id"] = trail_record.langsmith_run_id.__str__()
 
             return invoke_res
@@ -930,31 +1018,17 @@ class ZionAgent(RunnableSerializable[ZionAgentInput, ZionAgentOutput]):
 
         try:
             typed_input = ZionAgentInput(**agent_input)
+            config = self._get_tool_request_config(typed_input, config)
 
-            agent: ZionAgent | Pregel
-            agent = self._get_react_agent(typed_input)
-            if typed_input.agent_config.agent_type == AgentType.react_agent:
+            langgraph_agent = self._get_langgraph_agent(typed_input)
+            if langgraph_agent is not None:
                 try:
-                    complete_chain = RunnableParallel(
-                        {
-                            # guardrail_parallel_chain_key: guardrails_chain,
-                            # temporarily disable guardrail chain to make use of api gateway guardrail
-                            llm_parallel_chain_key: lambda agent_input: agent.invoke(
-                                input=convert_input_to_react_agent_message_dict(
-                                    ZionAgentInput(**agent_input)
-                                ),
-                                config=config,
-                            ),
-                        }
-                    )
-                    await complete_chain.ainvoke(agent_input, config=config)
-
-                    async for event in self._handle_ainvoke_react_agent(
+                    async for output in self._handle_astream_langgraph_agent(
                         agent_input=typed_input,
-                        agent=self._get_react_agent(typed_input),
+                        agent=langgraph_agent,
                         config=config,
                     ):
-                        yield event
+                        yield output
                     return  # noqa: TRY300
                 except HTTPException:
                     yield {"output": {"output": guardrails_error_message}}
@@ -108,8 +108,8 @@ class ZionAgentOutput(BaseAgentOutput):
     # Structured response is a dictionary of key-value pairs returned by the agent
     # which defined in ZionAgentInput's `structured_response_schema`
     structured_response: dict[str, Any] | None = None
-    # Audit trail ID for Agent
-    agent_execution_trail_id: int | None = None
+    # Audit trail ID for Agent, the uuid of the trail which is saved after the response is returned
+    agent_execution_trail_id: str | None = None
     # Agent execution actions
     agent_actions: list[ZionAgentActions] | None = None
     # Langsmith run ID
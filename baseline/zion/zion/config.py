@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
 from zion.stats.datadog import DatadogClient
+from zion.stats.metrics_aggregator import MetricsAggregator, create_metrics_sink
 from zion.util.log.logger import Logger
 
 # config logger
@@ -38,6 +39,16 @@ class AppConfig(BaseSettings):
     mysql_db_host: str = ""
     mysql_db_port: int = 3306
     mysql_db_name: str = "zion"
+    # agent plugins are served from memory, changes made by other processes are picked up within this interval
+    agent_plugin_registry_refresh_seconds: float = 30
+    # a refresh reads again the plugins updated this long before the last seen one, to catch rows committed late
+    agent_plugin_registry_refresh_overlap_seconds: float = 10
+    # agent execution trails are written behind the request, in multi-row inserts from a background thread.
+    # once trail_queue_max_size rows are waiting, new rows are written in the request ("sync") or dropped ("drop")
+    trail_batch_size: int = 100
+    trail_flush_interval_seconds: float = 1
+    trail_queue_max_size: int = 10000
+    trail_queue_overflow_policy: str = "sync"
 
     # Gitlab
     grab_gitlab_access_token: str = ""
@@ -52,11 +63,27 @@ class AppConfig(BaseSettings):
 
     # Agent
     agent_log_verbose: bool = False
+    # max compiled agents (graphs / executors) kept per worker, 0 disables the cache
+    compiled_agent_cache_size: int = 128
+    # tool calls of one model turn run concurrently, at most tool_max_concurrency of them at once
+    tool_max_concurrency: int = 16
+    tool_timeout_seconds: float = 120
+    # per tool name overrides of tool_timeout_seconds, e.g. {"kibana_log_search": 180}
+    tool_timeout_seconds_by_name: dict[str, float] = {}
+    # results of deterministic tools (see zion/tool/cached_tool.py) are cached for the ttl of their tool class,
+    # backend: memory (LRU of tool_result_cache_size results per worker) or redis (shared, needs the redis package)
+    tool_result_cache_backend: str = "memory"
+    tool_result_cache_size: int = 1024
+    tool_result_cache_redis_url: str = ""
 
     # LangSmith / LangChain
     langchain_endpoint: str = ""
     langchain_api_key: str = ""
     langsmith_handle_prefix: str = ""
+    # prompt hub templates are served from memory and refreshed in the background once older than the ttl
+    prompt_hub_cache_ttl_seconds: float = 300
+    prompt_hub_pull_timeout_seconds: float = 10
+    prompt_hub_max_workers: int = 8
 
     # Kendra
     kendra_index_id: str = ""
@@ -78,6 +105,12 @@ class AppConfig(BaseSettings):
 
     # For Helix
     helix_base_url: str = ""
+    # exchanged helix tokens are reused until this long before they expire, and refreshed in the background
+    # once within helix_token_refresh_ahead_seconds of it
+    helix_token_expiry_margin_seconds: float = 300
+    helix_token_refresh_ahead_seconds: float = 1800
+    # lifetime assumed for a token that is not a jwt with an exp claim
+    helix_token_default_ttl_seconds: float = 3600
 
     # For Confluence
     confluence_base_url: str = ""
@@ -110,12 +143,26 @@ class AppConfig(BaseSettings):
 
     # For Token Optimization
     langchain_token_opt_project: str = ""
+    # token counts of messages kept per worker, so optimize token tokenizes a message once
+    token_count_cache_size: int = 4096
 
     # For kibana logs retrieval
     kibana_username: str = ""
     kibana_password: str = ""
     kibana_base_url: str = ""
 
+    # Keep-alive connection pools of the tools' upstreams, http2 needs the h2 package installed
+    http_client_timeout_seconds: float = 90
+    http_client_max_connections: int = 100
+    http_client_max_keepalive_connections: int = 20
+    http_client_keepalive_expiry_seconds: float = 30
+    http_client_http2: bool = False
+    # sync clients (requests), pool_connections is the number of hosts a client keeps a pool for
+    http_client_pool_connections: int = 10
+    http_client_pool_maxsize: int = 20
+    http_client_max_retries: int = 3
+    http_client_retry_backoff_seconds: float = 0.5
+
     # OTel settings (defaults)
     otel_python_logging_auto_instrumentation_enabled: str = ""
     otel_exporter_otlp_endpoint: str = "127.0.0.1:4317"
@@ -126,6 +173,10 @@ class AppConfig(BaseSettings):
     datadog_app_key: str = ""
     datadog_api_key: str = ""
     datadog_site: str = "datadoghq.com"
+    # tracked metrics are buffered and sent in the background to the sink: api, dogstatsd or local (kept in memory)
+    metrics_sink: str = "api"
+    metrics_flush_interval_seconds: float = 10
+    metrics_max_buffered_points: int = 100000
 
     # Gitlab settings
     gitlab_api_token: str = ""
@@ -144,8 +195,20 @@ class AppConfig(BaseSettings):
     request_system_prompt: str = ""
     response_system_prompt: str = ""
 
+    # remote OpenAPI specs are cached, and checked against their GitLab blob id once older than this
+    openapi_spec_revalidate_seconds: float = 300
+    # service mesh configs are cached the same way, the 7 day QPS of a service is cached for the ttl
+    # the service mesh tools are not in the tool result cache, these are their only cache
+    service_mesh_revalidate_seconds: float = 300
+    service_mesh_qps_ttl_seconds: float = 3600
+
     # MCP
     mcp_gitlab_mr_creation_template: str = ""
+    # MCP sessions are pooled, see zion/tool/mcp_client_pool.py
+    mcp_tool_list_ttl_seconds: float = 300
+    mcp_health_check_seconds: float = 30
+    mcp_session_idle_seconds: float = 600
+    mcp_timeout_seconds: float = 30
 
     # For TI Support
     ti_support_base_url: str = ""
@@ -244,6 +307,14 @@ statsd = DatadogClient(
     },
     env=global_config.environment,
     appname="zion",
+    metrics_aggregator=MetricsAggregator(
+        sink=create_metrics_sink(
+            global_config.metrics_sink, global_config.dd_statsd_socket_path
+        ),
+        flush_interval_seconds=global_config.metrics_flush_interval_seconds,
+        max_buffered_points=global_config.metrics_max_buffered_points,
+        logger=logger,
+    ),
 )
 
 
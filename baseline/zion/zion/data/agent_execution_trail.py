@@ -1,15 +1,27 @@
-from sqlalchemy import JSON, Column, DateTime, Integer, String, func, text
+import time
+import uuid
+from contextlib import suppress
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String, func, insert, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import select
 
+from zion.config import global_config, logger, statsd
 from zion.data.connection import get_session
 
+TRAIL_OVERFLOW_POLICY_SYNC = "sync"
+TRAIL_OVERFLOW_POLICY_DROP = "drop"
+
 AgentExecutionTrailBase = declarative_base()
 
 
 class AgentExecutionTrail(AgentExecutionTrailBase):
     __tablename__ = "agent_execution_trail"
     id = Column(Integer, primary_key=True, index=True)
+    uuid = Column(String(36), nullable=False, index=True)
     agent_name = Column(String(255), nullable=False)
     langsmith_run_id = Column(String(255), nullable=False)
     langsmith_project_name = Column(String(255), nullable=False)
@@ -33,6 +45,7 @@ def create_trail(
 
     with get_session() as db:
         db_trail = AgentExecutionTrail(
+            uuid=str(uuid.uuid4()),
             agent_name=agent_name,
             langsmith_run_id=langsmith_run_id,
             langsmith_project_name=langsmith_project_name,
@@ -44,11 +57,157 @@ def create_trail(
         return db_trail
 
 
-def get_trail(trail_id: int) -> AgentExecutionTrail | None:
-    """Get audit by record id."""
+def insert_trails(trails: list[dict]) -> None:
+    """Insert trail rows in one multi-row insert."""
+    with get_session() as db:
+        db.execute(insert(AgentExecutionTrail), trails)
+        db.commit()
+
+
+class AgentExecutionTrailWriter:
+    """Writes agent execution trails behind the request, in batches from a background thread.
+
+    Queued rows are inserted once `batch_size` of them are waiting or every `flush_interval_seconds`.
+    The queue holds at most `max_queue_size` rows, the overflow policy then writes the row in the caller
+    ("sync") or drops it ("drop"). Queued rows are written on flush and on close, they have no id until then,
+    so a trail is identified by the uuid assigned in `write_trail`.
+    """
+
+    def __init__(
+        self,
+        insert_trails: Callable[[list[dict]], None],
+        batch_size: int,
+        flush_interval_seconds: float,
+        max_queue_size: int,
+        overflow_policy: str = TRAIL_OVERFLOW_POLICY_SYNC,
+    ) -> None:
+        self.insert_trails = insert_trails
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.overflow_policy = overflow_policy
+        self._queue: Queue[dict] = Queue(maxsize=max_queue_size)
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._batch_ready = Event()
+        self._closed = Event()
+        self._flush_thread: Optional[Thread] = None
+
+    def write(self, trail: dict) -> None:
+        if self._closed.is_set():
+            self._insert([trail])
+            return
+
+        try:
+            self._queue.put_nowait(trail)
+        except Full:
+            statsd.track_count(
+                metric="agent_execution_trail.overflow",
+                tags=[f"policy:{self.overflow_policy}"],
+            )
+            if self.overflow_policy == TRAIL_OVERFLOW_POLICY_DROP:
+                logger.error(
+                    "[AgentExecutionTrailWriter] queue is full, trail dropped",
+                    tags={"agent_name": trail.get("agent_name")},
+                )
+                return
+            self._insert([trail])
+            return
+
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+        self._start()
+
+    def flush(self) -> None:
+        """Insert every queued row, `batch_size` rows per insert."""
+        with self._flush_lock:
+            statsd.track_gauge(
+                metric="agent_execution_trail.queue_depth",
+                value=self._queue.qsize(),
+                tags=[],
+            )
+            while True:
+                trails = []
+                with suppress(Empty):
+                    while len(trails) < self.batch_size:
+                        trails.append(self._queue.get_nowait())
+                if len(trails) == 0:
+                    return
+                self._insert(trails)
+
+    def close(self) -> None:
+        """Stop the flush thread and write what is left, called on shutdown."""
+        self._closed.set()
+        self._batch_ready.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=self.flush_interval_seconds)
+        self.flush()
+
+    def _insert(self, trails: list[dict]) -> None:
+        start_time = time.perf_counter()
+        result = "success"
+        try:
+            self.insert_trails(trails)
+        except Exception as e:  # noqa: BLE001, a failed insert never fails the flush thread
+            result = "error"
+            logger.error(
+                f"[AgentExecutionTrailWriter] failed to insert trails: {e!s}",
+                tags={"trails": len(trails)},
+            )
+        finally:
+            statsd.track_elapsed(
+                metric="agent_execution_trail.flush",
+                value=time.perf_counter() - start_time,
+                tags=[f"result:{result}"],
+            )
+            statsd.track_count_n(
+                metric="agent_execution_trail.rows",
+                value=len(trails),
+                tags=[f"result:{result}"],
+            )
+
+    def _start(self) -> None:
+        if self._flush_thread is not None or self._closed.is_set():
+            return
+        with self._lock:
+            if self._flush_thread is None:
+                self._flush_thread = Thread(
+                    target=self._run, name="zion-trail-flush", daemon=True
+                )
+                self._flush_thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._batch_ready.wait(self.flush_interval_seconds)
+            self._batch_ready.clear()
+            self.flush()
+
+
+def write_trail(
+    agent_name: str,
+    langsmith_run_id: str,
+    langsmith_project_name: str | None = "",
+    agent_actions: list | None = None,
+) -> AgentExecutionTrail:
+    """Queue a trail for the trail writer, the returned trail is not saved yet, it is identified by its uuid."""
+    if agent_actions is None:
+        agent_actions = []
+
+    trail = {
+        "uuid": str(uuid.uuid4()),
+        "agent_name": agent_name,
+        "langsmith_run_id": langsmith_run_id,
+        "langsmith_project_name": langsmith_project_name,
+        "agent_actions": agent_actions,
+    }
+    trail_writer.write(trail)
+    return AgentExecutionTrail(**trail)
+
+
+def get_trail(trail_id: str) -> AgentExecutionTrail | None:
+    """Get audit by its uuid, the agent_execution_trail_id returned with the agent output."""
     with get_session() as db:
         db_trail = db.execute(
-            select(AgentExecutionTrail).where(AgentExecutionTrail.id == trail_id)
+            select(AgentExecutionTrail).where(AgentExecutionTrail.uuid == trail_id)
         ).first()
         if db_trail is None:
             message = f"Audit with id {trail_id} not found"
@@ -68,3 +227,12 @@ def get_trails_by_agent_name(
         db_trails = query.offset(page * page_size).limit(page_size).all()
         has_more = (page + 1) * page_size < total
         return db_trails, has_more
+
+
+trail_writer = AgentExecutionTrailWriter(
+    insert_trails=insert_trails,
+    batch_size=global_config.trail_batch_size,
+    flush_interval_seconds=global_config.trail_flush_interval_seconds,
+    max_queue_size=global_config.trail_queue_max_size,
+    overflow_policy=global_config.trail_queue_overflow_policy,
+)
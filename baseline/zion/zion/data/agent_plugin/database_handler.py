@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.sql import and_, select, update
@@ -41,6 +42,23 @@ def get_agent_plugin_database(
         return [agent_plugin_data for (agent_plugin_data,) in agent_plugins]
 
 
+def get_agent_plugins_updated_since_database(
+    updated_since: Optional[datetime] = None,
+) -> list[AgentPlugin]:
+    """Gets the agent plugins for the plugin registry.
+    Without updated_since all plugins that are not moved are loaded,
+    otherwise every plugin updated since then, including the moved ones so the registry can drop them.
+    """
+    with get_session() as db:
+        query = select(AgentPlugin)
+        if updated_since is None:
+            query = query.filter(AgentPlugin.is_moved.is_(False))
+        else:
+            query = query.filter(AgentPlugin.updated_at >= updated_since)
+
+        return list(db.execute(query.order_by(AgentPlugin.id)).scalars().all())
+
+
 def get_all_agent_plugins_database(
     page: Optional[int] = None,
     page_size: Optional[int] = None,
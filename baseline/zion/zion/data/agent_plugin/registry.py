@@ -0,0 +1,283 @@
+import time
+from datetime import datetime, timedelta
+from threading import Lock, Thread
+from typing import Any, Callable, Optional
+
+from zion.config import global_config, logger
+from zion.data.agent_plugin.constant import (
+    AGENT_WHITELIST_ALL,
+    QUERY_ACCESS_CONTROL_SLACK_CHANNEL_NAME,
+    QUERY_ACCESS_CONTROL_USERNAME,
+)
+from zion.data.agent_plugin.data import AgentPlugin, QueryAgentPluginRequest
+from zion.data.agent_plugin.database_handler import (
+    get_agent_plugins_updated_since_database,
+)
+
+
+class AgentPluginAclIndex:
+    """Access control of every plugin that configures one agent, indexed by slack channel and username.
+
+    Mirrors construct_plugin_query_conditions: a plugin is public for channels when it does not configure
+    slack_channels, or configures null, an empty list or "*". It is public for users when it does not configure
+    users, or configures null or "*", an empty users list allows nobody.
+    """
+
+    def __init__(self) -> None:
+        self.plugin_ids: list[int] = []
+        self.public_channel_plugin_ids: set[int] = set()
+        self.channel_plugin_ids: dict[str, set[int]] = {}
+        self.public_user_plugin_ids: set[int] = set()
+        self.user_plugin_ids: dict[str, set[int]] = {}
+
+    def add(self, plugin_id: int, agent_acl: Any) -> None:  # noqa: ANN401, json value of the agent acl
+        self.plugin_ids.append(plugin_id)
+        self._add_acl_values(
+            plugin_id,
+            _get_json_key(agent_acl, QUERY_ACCESS_CONTROL_SLACK_CHANNEL_NAME),
+            self.public_channel_plugin_ids,
+            self.channel_plugin_ids,
+            empty_is_public=True,
+        )
+        self._add_acl_values(
+            plugin_id,
+            _get_json_key(agent_acl, QUERY_ACCESS_CONTROL_USERNAME),
+            self.public_user_plugin_ids,
+            self.user_plugin_ids,
+            empty_is_public=False,
+        )
+
+    def get_plugin_ids(self, channel_name: str, username: str) -> list[int]:
+        channel_plugin_ids = self.public_channel_plugin_ids
+        if channel_name != "":
+            channel_plugin_ids = channel_plugin_ids | self.channel_plugin_ids.get(
+                channel_name, set()
+            )
+
+        user_plugin_ids = self.public_user_plugin_ids
+        if username != "":
+            user_plugin_ids = user_plugin_ids | self.user_plugin_ids.get(
+                username, set()
+            )
+
+        return [
+            plugin_id
+            for plugin_id in self.plugin_ids
+            if plugin_id in channel_plugin_ids and plugin_id in user_plugin_ids
+        ]
+
+    def _add_acl_values(
+        self,
+        plugin_id: int,
+        acl_values: Any,  # noqa: ANN401, json value of the acl
+        public_plugin_ids: set[int],
+        plugin_ids_by_value: dict[str, set[int]],
+        empty_is_public: bool,  # noqa: FBT001
+    ) -> None:
+        if acl_values is _MISSING or acl_values is None:
+            public_plugin_ids.add(plugin_id)
+            return
+
+        if not isinstance(acl_values, list):
+            # json_contains matches a scalar against an equal scalar
+            acl_values = [acl_values]
+
+        if AGENT_WHITELIST_ALL in acl_values or (
+            empty_is_public and len(acl_values) == 0
+        ):
+            public_plugin_ids.add(plugin_id)
+            return
+
+        for acl_value in acl_values:
+            if isinstance(acl_value, str):
+                plugin_ids_by_value.setdefault(acl_value, set()).add(plugin_id)
+
+
+class AgentPluginSnapshot:
+    """Immutable view of the agent_plugin table, swapped as a whole on every refresh."""
+
+    def __init__(
+        self, agent_plugins: dict[int, AgentPlugin], updated_at: Optional[datetime]
+    ) -> None:
+        self.agent_plugins = agent_plugins
+        self.updated_at = updated_at
+        self.acl_indexes: dict[str, AgentPluginAclIndex] = {}
+
+        for plugin_id in sorted(agent_plugins):
+            agents_acl = _get_json_key(
+                _get_json_key(agent_plugins[plugin_id].api, "access_control"), "agents"
+            )
+            if not isinstance(agents_acl, dict):
+                continue
+
+            for agent_name, agent_acl in agents_acl.items():
+                self.acl_indexes.setdefault(agent_name, AgentPluginAclIndex()).add(
+                    plugin_id, agent_acl
+                )
+
+    def get_agent_plugins(
+        self, query_agent_plugin_req: QueryAgentPluginRequest
+    ) -> list[AgentPlugin]:
+        acl_index = self.acl_indexes.get(query_agent_plugin_req.agent_name)
+        if acl_index is None:
+            return []
+
+        agent_plugins = [
+            self.agent_plugins[plugin_id]
+            for plugin_id in acl_index.get_plugin_ids(
+                query_agent_plugin_req.channel_name, query_agent_plugin_req.username
+            )
+        ]
+
+        plugin_keyword = query_agent_plugin_req.plugin_keyword.lower()
+        if plugin_keyword != "":
+            agent_plugins = [
+                agent_plugin
+                for agent_plugin in agent_plugins
+                if plugin_keyword in agent_plugin.name_for_human.lower()
+                or plugin_keyword in agent_plugin.name_for_model.lower()
+            ]
+
+        return agent_plugins
+
+
+class AgentPluginRegistry:
+    """Process local copy of the agent_plugin table that answers plugin ACL queries in memory.
+
+    The first query loads every plugin, later queries are served from the current snapshot while a background
+    refresh reads the plugins updated since the last one, at most every `refresh_interval_seconds`.
+    A refresh starts `refresh_overlap_seconds` before the latest updated_at it has seen, so a row whose
+    transaction commits after a newer row is still picked up. Reading a plugin again is harmless.
+    `reload` replaces the snapshot right away, it is called after the plugins are changed from this process.
+    """
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float,
+        refresh_overlap_seconds: float = 0,
+        load_agent_plugins: Callable[
+            [Optional[datetime]], list[AgentPlugin]
+        ] = get_agent_plugins_updated_since_database,
+    ) -> None:
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.refresh_overlap_seconds = refresh_overlap_seconds
+        self._load_agent_plugins = load_agent_plugins
+        self._snapshot: Optional[AgentPluginSnapshot] = None
+        self._refreshed_at = 0.0
+        # serializes the loads, a request never waits on it once the first snapshot is loaded
+        self._load_lock = Lock()
+        self._refresh_state_lock = Lock()
+        self._is_refreshing = False
+
+    def get_agent_plugins(
+        self, query_agent_plugin_req: QueryAgentPluginRequest
+    ) -> list[AgentPlugin]:
+        """Gets the agent plugins based on the agent_name, username and channel_name"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._load_first_snapshot()
+        elif time.monotonic() - self._refreshed_at >= self.refresh_interval_seconds:
+            self._start_refresh()
+
+        return snapshot.get_agent_plugins(query_agent_plugin_req)
+
+    def reload(self) -> None:
+        """Load every plugin again, e.g. after a plugin sync."""
+        with self._load_lock:
+            self._reload()
+
+    def refresh(self) -> None:
+        """Apply the plugins updated since the last load to the snapshot."""
+        with self._load_lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.updated_at is None:
+                self._reload()
+                return
+
+            # updated_at only has second precision and rows can commit out of order, so the window overlaps
+            updated_plugins = self._load_agent_plugins(
+                snapshot.updated_at - timedelta(seconds=self.refresh_overlap_seconds)
+            )
+            self._refreshed_at = time.monotonic()
+            if len(updated_plugins) == 0:
+                return
+
+            agent_plugins = dict(snapshot.agent_plugins)
+            for agent_plugin in updated_plugins:
+                if agent_plugin.is_moved:
+                    agent_plugins.pop(agent_plugin.id, None)
+                else:
+                    agent_plugins[agent_plugin.id] = agent_plugin
+
+            self._snapshot = AgentPluginSnapshot(
+                agent_plugins,
+                _get_latest_updated_at(updated_plugins, snapshot.updated_at),
+            )
+
+    def _load_first_snapshot(self) -> AgentPluginSnapshot:
+        with self._load_lock:
+            if self._snapshot is None:
+                self._reload()
+            return self._snapshot
+
+    def _reload(self) -> None:
+        # must be called with the load lock held
+        agent_plugins = self._load_agent_plugins(None)
+        self._snapshot = AgentPluginSnapshot(
+            {agent_plugin.id: agent_plugin for agent_plugin in agent_plugins},
+            _get_latest_updated_at(agent_plugins, None),
+        )
+        self._refreshed_at = time.monotonic()
+
+    def _start_refresh(self) -> None:
+        with self._refresh_state_lock:
+            if self._is_refreshing:
+                return
+            self._is_refreshing = True
+
+        Thread(
+            target=self._refresh_in_background,
+            name="agent_plugin_registry",
+            daemon=True,
+        ).start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:  # noqa: BLE001, keep serving the current snapshot
+            logger.error(
+                "[AgentPluginRegistry] Unable to refresh agent plugins",
+                tags={"err": str(e)},
+            )
+            # retry on the next interval instead of on every request
+            self._refreshed_at = time.monotonic()
+        finally:
+            with self._refresh_state_lock:
+                self._is_refreshing = False
+
+
+_MISSING = object()
+
+
+def _get_json_key(value: Any, key: str) -> Any:  # noqa: ANN401, json value
+    """Same as json_extract on one key, _MISSING when the path does not exist."""
+    if not isinstance(value, dict) or key not in value:
+        return _MISSING
+    return value[key]
+
+
+def _get_latest_updated_at(
+    agent_plugins: list[AgentPlugin], updated_at: Optional[datetime]
+) -> Optional[datetime]:
+    for agent_plugin in agent_plugins:
+        if agent_plugin.updated_at is not None and (
+            updated_at is None or agent_plugin.updated_at > updated_at
+        ):
+            updated_at = agent_plugin.updated_at
+    return updated_at
+
+
+agent_plugin_registry = AgentPluginRegistry(
+    refresh_interval_seconds=global_config.agent_plugin_registry_refresh_seconds,
+    refresh_overlap_seconds=global_config.agent_plugin_registry_refresh_overlap_seconds,
+)
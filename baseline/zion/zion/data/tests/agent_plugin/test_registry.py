@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from zion.data.agent_plugin.data import AgentPlugin, QueryAgentPluginRequest
+from zion.data.agent_plugin.registry import AgentPluginRegistry
+
+AGENT_NAME = "ti-bot-level-zero"
+UPDATED_AT = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+REFRESH_OVERLAP = timedelta(seconds=10)
+
+
+def create_agent_plugin(
+    plugin_id: int,
+    agent_acl: Optional[dict],
+    name: str = "",
+    updated_at: datetime = UPDATED_AT,
+    is_moved: bool = False,  # noqa: FBT001, FBT002
+) -> AgentPlugin:
+    agents = {} if agent_acl is None else {AGENT_NAME: agent_acl}
+    return AgentPlugin(
+        id=plugin_id,
+        name_for_model=name or f"plugin_{plugin_id}",
+        name_for_human=name or f"Plugin {plugin_id}",
+        type="openapi",
+        api={"access_control": {"agents": agents}},
+        is_moved=is_moved,
+        updated_at=updated_at,
+    )
+
+
+class FakeAgentPluginTable:
+    def __init__(self, agent_plugins: list[AgentPlugin]) -> None:
+        self.agent_plugins = agent_plugins
+        self.loads: list[Optional[datetime]] = []
+
+    def load(self, updated_since: Optional[datetime]) -> list[AgentPlugin]:
+        self.loads.append(updated_since)
+        if updated_since is None:
+            return [plugin for plugin in self.agent_plugins if not plugin.is_moved]
+        return [
+            plugin
+            for plugin in self.agent_plugins
+            if plugin.updated_at >= updated_since
+        ]
+
+
+def get_plugin_ids(
+    registry: AgentPluginRegistry,
+    channel_name: str = "",
+    username: str = "",
+    plugin_keyword: str = "",
+) -> list[int]:
+    agent_plugins = registry.get_agent_plugins(
+        QueryAgentPluginRequest(
+            agent_name=AGENT_NAME,
+            channel_name=channel_name,
+            username=username,
+            plugin_keyword=plugin_keyword,
+        )
+    )
+    return [agent_plugin.id for agent_plugin in agent_plugins]
+
+
+def test_agent_plugin_registry_acl() -> None:
+    table = FakeAgentPluginTable(
+        [
+            # public, no acl configured
+            create_agent_plugin(1, {}),
+            create_agent_plugin(2, {"slack_channels": None, "users": ["*"]}),
+            create_agent_plugin(3, {"slack_channels": [], "users": None}),
+            # restricted to a channel
+            create_agent_plugin(4, {"slack_channels": ["#ti-bot"]}),
+            # restricted to a user, an empty users list allows nobody
+            create_agent_plugin(5, {"users": ["alice"]}),
+            create_agent_plugin(6, {"users": []}),
+            # not configured for the agent
+            create_agent_plugin(7, None),
+        ]
+    )
+    registry = AgentPluginRegistry(
+        refresh_interval_seconds=60, load_agent_plugins=table.load
+    )
+
+    assert get_plugin_ids(registry) == [1, 2, 3]
+    assert get_plugin_ids(registry, channel_name="#ti-bot") == [1, 2, 3, 4]
+    assert get_plugin_ids(registry, username="alice") == [1, 2, 3, 5]
+    assert get_plugin_ids(registry, channel_name="#other", username="bob") == [1, 2, 3]
+    # one load for every query
+    assert table.loads == [None]
+
+
+def test_agent_plugin_registry_plugin_keyword() -> None:
+    table = FakeAgentPluginTable(
+        [
+            create_agent_plugin(1, {}, name="Jira_Search"),
+            create_agent_plugin(2, {}, name="kibana"),
+        ]
+    )
+    registry = AgentPluginRegistry(
+        refresh_interval_seconds=60, load_agent_plugins=table.load
+    )
+
+    assert get_plugin_ids(registry, plugin_keyword="jira") == [1]
+
+
+def create_registry(table: FakeAgentPluginTable) -> AgentPluginRegistry:
+    return AgentPluginRegistry(
+        refresh_interval_seconds=60,
+        refresh_overlap_seconds=REFRESH_OVERLAP.total_seconds(),
+        load_agent_plugins=table.load,
+    )
+
+
+def test_agent_plugin_registry_refresh_applies_updated_plugins() -> None:
+    table = FakeAgentPluginTable(
+        [create_agent_plugin(1, {}), create_agent_plugin(2, {})]
+    )
+    registry = create_registry(table)
+    assert get_plugin_ids(registry) == [1, 2]
+
+    later = UPDATED_AT + timedelta(seconds=5)
+    table.agent_plugins = [
+        create_agent_plugin(1, {"slack_channels": ["#ti-bot"]}, updated_at=later),
+        create_agent_plugin(2, {}, updated_at=later, is_moved=True),
+        create_agent_plugin(3, {}, updated_at=later),
+    ]
+    registry.refresh()
+
+    assert table.loads == [None, UPDATED_AT - REFRESH_OVERLAP]
+    assert get_plugin_ids(registry) == [3]
+    assert get_plugin_ids(registry, channel_name="#ti-bot") == [1, 3]
+
+    registry.refresh()
+    assert table.loads[-1] == later - REFRESH_OVERLAP
+
+
+def test_agent_plugin_registry_refresh_reads_plugins_committed_late() -> None:
+    later = UPDATED_AT + timedelta(seconds=5)
+    table = FakeAgentPluginTable([create_agent_plugin(1, {}, updated_at=later)])
+    registry = create_registry(table)
+    assert get_plugin_ids(registry) == [1]
+
+    # updated before the latest seen plugin, but committed after the last load
+    table.agent_plugins.append(create_agent_plugin(2, {}, updated_at=UPDATED_AT))
+    registry.refresh()
+
+    assert get_plugin_ids(registry) == [1, 2]
@@ -0,0 +1,107 @@
+import time
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+from zion.data.agent_execution_trail import (
+    TRAIL_OVERFLOW_POLICY_DROP,
+    AgentExecutionTrailWriter,
+    write_trail,
+)
+
+
+class FakeTrailTable:
+    def __init__(self, insert_started: Event | None = None) -> None:
+        self.inserts: list[list[dict]] = []
+        self.insert_started = insert_started
+        self.release = Event()
+
+    def insert_trails(self, trails: list[dict]) -> None:
+        if self.insert_started is not None:
+            self.insert_started.set()
+            self.release.wait(5)
+        self.inserts.append(trails)
+
+
+def create_trail(i: int) -> dict:
+    return {
+        "agent_name": "zion",
+        "langsmith_run_id": f"run-{i}",
+        "langsmith_project_name": "",
+        "agent_actions": [],
+    }
+
+
+def test_trail_writer_batches_trails_into_multi_row_inserts() -> None:
+    table = FakeTrailTable()
+    trail_writer = AgentExecutionTrailWriter(
+        insert_trails=table.insert_trails,
+        batch_size=3,
+        flush_interval_seconds=60,
+        max_queue_size=100,
+    )
+
+    with patch("zion.data.agent_execution_trail.statsd", MagicMock()) as mock_statsd:
+        for i in range(7):
+            trail_writer.write(create_trail(i))
+        # a full batch wakes the flush thread before the flush interval
+        deadline = time.monotonic() + 5
+        while len(table.inserts) < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.01)
+        trail_writer.close()
+
+    assert [len(trails) for trails in table.inserts] == [3, 3, 1]
+    assert [
+        trail["langsmith_run_id"] for trails in table.inserts for trail in trails
+    ] == [f"run-{i}" for i in range(7)]
+    assert mock_statsd.track_gauge.called
+    assert all(
+        call.kwargs["tags"] == ["result:success"]
+        for call in mock_statsd.track_elapsed.call_args_list
+    )
+
+
+def test_trail_writer_applies_overflow_policy_when_queue_is_full() -> None:
+    insert_started = Event()
+    table = FakeTrailTable(insert_started)
+    trail_writer = AgentExecutionTrailWriter(
+        insert_trails=table.insert_trails,
+        batch_size=1,
+        flush_interval_seconds=60,
+        max_queue_size=2,
+        overflow_policy=TRAIL_OVERFLOW_POLICY_DROP,
+    )
+
+    with patch("zion.data.agent_execution_trail.statsd", MagicMock()) as mock_statsd:
+        # the flush thread is stuck inserting the first trail, the next 2 fill the queue
+        trail_writer.write(create_trail(0))
+        assert insert_started.wait(5)
+        for i in range(1, 4):
+            trail_writer.write(create_trail(i))
+        table.insert_started = None
+        table.release.set()
+        trail_writer.close()
+
+    assert [
+        trail["langsmith_run_id"] for trails in table.inserts for trail in trails
+    ] == [
+        "run-0",
+        "run-1",
+        "run-2",
+    ]
+    mock_statsd.track_count.assert_called_once_with(
+        metric="agent_execution_trail.overflow", tags=["policy:drop"]
+    )
+
+
+def test_write_trail_assigns_the_trail_uuid_before_it_is_queued() -> None:
+    with patch("zion.data.agent_execution_trail.trail_writer") as mock_trail_writer:
+        first_trail = write_trail(agent_name="zion", langsmith_run_id="")
+        second_trail = write_trail(agent_name="zion", langsmith_run_id="")
+
+    # without tracing both trails share the empty run id, the uuid still tells them apart
+    queued_trails = [call.args[0] for call in mock_trail_writer.write.call_args_list]
+    assert [trail["uuid"] for trail in queued_trails] == [
+        first_trail.uuid,
+        second_trail.uuid,
+    ]
+    assert first_trail.uuid != second_trail.uuid
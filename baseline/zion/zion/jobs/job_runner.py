@@ -1,3 +1,5 @@
+import asyncio
+
 from zion.jobs.daily_evaluation import JOB_NAME_DAILY_EVALUATION, daily_evaluation
 from zion.jobs.sync_agent_plugin import JOB_NAME_SYNC_AGENT_PLUGIN, sync_agent_plugin
 
@@ -21,5 +23,5 @@ async def job_runner(job_name: str) -> None:
     if inspect.iscoroutinefunction(job):
         await job()
     else:
-        # For sync jobs, just call them directly
-        job()
+        # For sync jobs, run them in a worker thread so they do not block the event loop
+        await asyncio.to_thread(job)
@@ -1,9 +1,17 @@
+from threading import Lock, Thread
+
 import yaml
 
+from zion.agent.agent_cache import compiled_agent_cache
+from zion.config import logger
+from zion.data.agent_plugin.constant import AGENT_OPENAPI_PLUGIN_TYPE
 from zion.data.agent_plugin.database_handler import (
+    get_all_agent_plugins_database,
     save_agent_plugin_to_db,
     set_all_plugin_to_is_moved,
 )
+from zion.data.agent_plugin.registry import agent_plugin_registry
+from zion.tool.agent_plugins import get_tools_from_database_result
 from zion.util.gitlab import (
     TI_BOT_PLUGIN_OPENAPI_FOLDER,
     TI_BOT_PLUGIN_REPO_ID,
@@ -14,6 +22,9 @@ from zion.util.gitlab import (
 
 JOB_NAME_SYNC_AGENT_PLUGIN = "sync_agent_plugin"
 
+# one warm up at a time, a sync that finishes during a warm up is covered by the specs it loads
+_warm_openapi_spec_cache_lock = Lock()
+
 
 def sync_agent_plugin() -> None:
     """Syncs the agent plugin from gitlab repository into the table `agent_plugin`. Stores all data such as access_control and include_paths.
@@ -32,6 +43,8 @@ def sync_agent_plugin() -> None:
 
     if openapi_plugins is None or len(openapi_plugins) == 0:
         # there is no plugin to be synced into DB, we abort the job
+        agent_plugin_registry.reload()
+        compiled_agent_cache.clear()
         return
 
     for plugin in openapi_plugins:
@@ -70,3 +83,48 @@ def sync_agent_plugin() -> None:
 
             # store the file content into database, if not update it
             save_agent_plugin_to_db(file_content_yaml)
+
+    agent_plugin_registry.reload()
+    # agents compiled with the previous plugins are no longer reachable
+    compiled_agent_cache.clear()
+
+    start_warming_openapi_spec_cache()
+
+
+def start_warming_openapi_spec_cache() -> None:
+    """Warm the OpenAPI spec cache of this process in a background thread, e.g. on startup and after a sync."""
+    if not _warm_openapi_spec_cache_lock.acquire(blocking=False):
+        return
+
+    Thread(
+        target=_warm_openapi_spec_cache_in_background,
+        name="warm_openapi_spec_cache",
+        daemon=True,
+    ).start()
+
+
+def _warm_openapi_spec_cache_in_background() -> None:
+    try:
+        warm_openapi_spec_cache()
+    except Exception as e:  # noqa: BLE001, the specs are loaded on first use instead
+        logger.error(
+            "[warm_openapi_spec_cache] Unable to warm OpenAPI spec cache",
+            tags={"err": str(e)},
+        )
+    finally:
+        _warm_openapi_spec_cache_lock.release()
+
+
+def warm_openapi_spec_cache() -> None:
+    """Build the tools of every OpenAPI plugin once, so agents find their specs in the OpenAPI spec cache."""
+    for agent_plugin in get_all_agent_plugins_database() or []:
+        if agent_plugin.type != AGENT_OPENAPI_PLUGIN_TYPE:
+            continue
+
+        try:
+            get_tools_from_database_result([agent_plugin])
+        except Exception as e:  # noqa: BLE001, one broken spec must not fail the sync
+            logger.error(
+                "[warm_openapi_spec_cache] Unable to load OpenAPI spec",
+                tags={"plugin": agent_plugin.name_for_model, "err": str(e)},
+            )
@@ -5,12 +5,13 @@ from typing import Annotated
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 
-from zion.config import global_config, is_langsmith_enabled, logger  # isort:skip, Always initialize environment variables first.
+from zion.config import global_config, is_langsmith_enabled, logger, statsd  # isort:skip, Always initialize environment variables first.
 
 import json
 import time
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
@@ -34,12 +35,20 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
 )
 from pydantic.main import BaseModel
 
+from zion.agent.agent_cache import compiled_agent_cache
+from zion.agent.constant import CREATE_MR_PROMPT_HUB_COMMIT
+from zion.agent.multi_agent.constant import (
+    MULTI_AGENT_DESCRIPTION_HUB_COMMITS,
+    MULTI_AGENT_PROMPT_HUB_COMMITS,
+)
+from zion.agent.prompt_registry import get_prompt_hub_handle, prompt_registry
 from zion.agent.zion_agent import (
     ZionAgent,
 )
 from zion.credentials.google import (
     init_google_credentials,
 )
+from zion.data.agent_execution_trail import trail_writer
 from zion.data.agent_plugin.constant import (
     AGENT_HTTP_PLUGIN_TYPE,
     AGENT_OPENAPI_PLUGIN_TYPE,
@@ -51,12 +60,12 @@ from zion.data.agent_plugin.data import (
 from zion.data.agent_plugin.database_handler import (
     create_agent_plugin,
     duplicate_agent_plugin_checking,
-    get_agent_plugin_database,
     get_all_agent_plugins_database,
     get_specific_agent_plugins_database,
     set_plugin_to_is_moved,
     update_agent_plugin,
 )
+from zion.data.agent_plugin.registry import agent_plugin_registry
 from zion.data.agent_plugin.util import get_agent_plugin_json
 from zion.evaluations.custom_evaluator import (
     able_to_answer_user_evaluator,
@@ -74,22 +83,56 @@ from zion.evaluations.level_zero_test_cases import (
     test_case_datas,
 )
 from zion.jobs.job_runner import job_runner
+from zion.jobs.sync_agent_plugin import start_warming_openapi_spec_cache
 from zion.openapi.openapi_plugin import OpenAPIPlugin
 from zion.openapi.util import (
     check_http_plugin_data,
     check_supported_openapi_url,
     check_valid_openapi_version,
 )
+from zion.tool.mcp_client_pool import mcp_client_pool
 from zion.util import helix
 from zion.util.gitlab import load_gitlab_file_in_dict
+from zion.util.http_client.client import (
+    aclose_async_http_clients,
+    bind_async_http_clients,
+    close_http_clients,
+)
 from zion.util.secure_endpoint import check_agent_secret
 from zion.util.service_mesh import get_service_mesh
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # pull the shared prompts in the background, so the first requests are served from the prompt registry
+    if is_langsmith_enabled():
+        prompt_registry.warm(
+            get_prompt_hub_handle(prompt_hub_commit)
+            for prompt_hub_commit in [
+                *MULTI_AGENT_PROMPT_HUB_COMMITS,
+                *MULTI_AGENT_DESCRIPTION_HUB_COMMITS,
+                CREATE_MR_PROMPT_HUB_COMMIT,
+            ]
+        )
+    # every pod loads the OpenAPI specs of the plugins in the background, not only the one that ran the sync job
+    start_warming_openapi_spec_cache()
+    bind_async_http_clients()
+    statsd.start()
+    yield
+    prompt_registry.shutdown()
+    mcp_client_pool.close()
+    close_http_clients()
+    await aclose_async_http_clients()
+    trail_writer.close()
+    statsd.close()
+
+
 ddtrace.patch(fastapi=True)
 app = FastAPI(
     title="Zion",
     version="1.0",
     description="Home of the LLM Agents",
+    lifespan=lifespan,
 )
 
 origins = [
@@ -193,7 +236,7 @@ async def get_agent_plugin(
     except ValueError as e:
         raise HTTPException(status_code=401, detail=f"Agent secret invalid: {e}") from e
 
-    db_agent_plugins = get_agent_plugin_database(
+    db_agent_plugins = agent_plugin_registry.get_agent_plugins(
         QueryAgentPluginRequest(
             agent_name=agent_name,
             channel_name=slack_channels,
@@ -583,6 +626,10 @@ async def plugin_request(
         else:
             set_plugin_to_is_moved(plugin_info_model)
 
+        agent_plugin_registry.reload()
+        # agents compiled with the previous plugin are no longer reachable
+        compiled_agent_cache.clear()
+
     except ValueError as valueErr:
         raise HTTPException(status_code=409, detail=str(valueErr)) from valueErr
     except KeyError as keyErr:
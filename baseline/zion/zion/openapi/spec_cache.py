@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Callable
+
+import yaml
+
+from zion.config import global_config, logger
+from zion.openapi.openapi_plugin import IncludeOpenAPIPath
+from zion.openapi.util import check_supported_openapi_url, reduce_openapi_spec
+from zion.util.gitlab import get_gitlab_file_blob_id, load_gitlab_file_with_blob_id
+
+OpenAPISpecKey = tuple[str, tuple[tuple[str, str], ...], tuple[str, ...], str]
+
+
+class OpenAPISpecCacheEntry:
+    def __init__(self, blob_id: str, open_api_spec: str) -> None:
+        self.blob_id = blob_id
+        self.open_api_spec = open_api_spec
+        self.revalidated_at = time.monotonic()
+
+
+class OpenAPISpecCache:
+    """Cache of reduced remote OpenAPI specs, rendered to yaml, keyed by (ref, include_paths, ignored keys, server url).
+
+    Every entry remembers the GitLab blob id (git SHA) it was built from.
+    Once `revalidate_seconds` passed, a HEAD request compares the blob id first,
+    the spec is only downloaded and reduced again when the file changed.
+    When GitLab is unavailable, the cached spec keeps being served.
+    """
+
+    def __init__(
+        self,
+        revalidate_seconds: float,
+        get_blob_id: Callable[[str], str] = get_gitlab_file_blob_id,
+        load_file: Callable[
+            [str], tuple[dict[str, Any], str]
+        ] = load_gitlab_file_with_blob_id,
+    ) -> None:
+        self.revalidate_seconds = revalidate_seconds
+        self._get_blob_id = get_blob_id
+        self._load_file = load_file
+        self._entries: dict[OpenAPISpecKey, OpenAPISpecCacheEntry] = {}
+        self._lock = Lock()
+
+    def get_open_api_spec(
+        self,
+        openapi_ref: str,
+        filter_paths: list[IncludeOpenAPIPath],
+        ignored_definition_keys: list[str],
+        server_url: str,
+    ) -> str:
+        """Get the reduced OpenAPI spec of the given ref as yaml, with `servers` set to the server url."""
+        key = (
+            openapi_ref,
+            tuple(
+                (filter_path.path, filter_path.method) for filter_path in filter_paths
+            ),
+            tuple(sorted(ignored_definition_keys)),
+            server_url,
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            if time.monotonic() - entry.revalidated_at < self.revalidate_seconds:
+                return entry.open_api_spec
+            if self._is_unchanged(openapi_ref, entry):
+                entry.revalidated_at = time.monotonic()
+                return entry.open_api_spec
+
+        check_supported_openapi_url(openapi_ref)
+        raw_spec, blob_id = self._load_file(openapi_ref)
+
+        open_api_spec = reduce_openapi_spec(
+            raw_spec, filter_paths, ignored_definition_keys
+        )
+        open_api_spec["servers"] = [{"url": server_url}]
+        entry = OpenAPISpecCacheEntry(blob_id, yaml.dump(open_api_spec, indent=2))
+
+        with self._lock:
+            self._entries[key] = entry
+
+        return entry.open_api_spec
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _is_unchanged(self, openapi_ref: str, entry: OpenAPISpecCacheEntry) -> bool:
+        try:
+            return self._get_blob_id(openapi_ref) == entry.blob_id
+        except Exception as e:  # noqa: BLE001, serve the cached spec while GitLab is unavailable
+            logger.error(
+                "[OpenAPISpecCache] Unable to revalidate OpenAPI spec, serving the cached one",
+                tags={"ref": openapi_ref, "err": str(e)},
+            )
+            return True
+
+
+open_api_spec_cache = OpenAPISpecCache(
+    revalidate_seconds=global_config.openapi_spec_revalidate_seconds
+)
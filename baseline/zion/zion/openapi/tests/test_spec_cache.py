@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from zion.openapi.spec_cache import OpenAPISpecCache
+from zion.openapi.util import IncludeOpenAPIPath
+
+OPENAPI_REF = "https://gitlab.myteksi.net/test-group/test-project/-/blob/master/testsdk/testpb/test.swagger.yml"
+SERVER_URL = "https://ti-support-bot.stg-myteksi.com"
+
+
+class FakeGitlabFile:
+    def __init__(self) -> None:
+        with Path.open("./zion/openapi/tests/openapi_20_sample.yaml") as f:
+            self.content = yaml.safe_load(f)
+        self.blob_id = "blob-1"
+        self.loads = 0
+        self.heads = 0
+        self.head_error: Exception | None = None
+
+    def load(self, _: str) -> tuple[dict[str, Any], str]:
+        self.loads += 1
+        return self.content, self.blob_id
+
+    def get_blob_id(self, _: str) -> str:
+        self.heads += 1
+        if self.head_error is not None:
+            raise self.head_error
+        return self.blob_id
+
+
+def get_open_api_spec(cache: OpenAPISpecCache) -> dict[str, Any]:
+    return yaml.safe_load(
+        cache.get_open_api_spec(
+            openapi_ref=OPENAPI_REF,
+            filter_paths=[IncludeOpenAPIPath(path="/hello", method="POST")],
+            ignored_definition_keys=["protobufAny"],
+            server_url=SERVER_URL,
+        )
+    )
+
+
+def test_open_api_spec_cache_reduces_and_caches_spec() -> None:
+    gitlab_file = FakeGitlabFile()
+    cache = OpenAPISpecCache(
+        revalidate_seconds=60,
+        get_blob_id=gitlab_file.get_blob_id,
+        load_file=gitlab_file.load,
+    )
+
+    open_api_spec = get_open_api_spec(cache)
+
+    assert list(open_api_spec["paths"]) == ["/hello"]
+    assert open_api_spec["servers"] == [{"url": SERVER_URL}]
+    assert get_open_api_spec(cache) == open_api_spec
+    assert gitlab_file.loads == 1
+    assert gitlab_file.heads == 0
+
+
+def test_open_api_spec_cache_revalidates_by_blob_id() -> None:
+    gitlab_file = FakeGitlabFile()
+    cache = OpenAPISpecCache(
+        revalidate_seconds=0,
+        get_blob_id=gitlab_file.get_blob_id,
+        load_file=gitlab_file.load,
+    )
+    get_open_api_spec(cache)
+
+    # unchanged file, only the blob id is checked
+    get_open_api_spec(cache)
+    assert gitlab_file.loads == 1
+    assert gitlab_file.heads == 1
+
+    # GitLab unavailable, the cached spec is served
+    gitlab_file.head_error = ConnectionError("gitlab is down")
+    get_open_api_spec(cache)
+    assert gitlab_file.loads == 1
+
+    # changed file, the spec is loaded again
+    gitlab_file.head_error = None
+    gitlab_file.blob_id = "blob-2"
+    get_open_api_spec(cache)
+    assert gitlab_file.loads == 2  # noqa: PLR2004
@@ -39,6 +39,15 @@ def load_remote_openapi_file(
 
     raw_spec = load_gitlab_file_in_dict(openapi_ref)
 
+    return reduce_openapi_spec(raw_spec, filter_paths, ignored_definition_keys)
+
+
+def reduce_openapi_spec(
+    raw_spec: dict[str, Any],
+    filter_paths: list[IncludeOpenAPIPath],
+    ignored_definition_keys: list[str],
+) -> dict[str, Any]:
+    """Reduce a OpenAPI (Swagger) specification to the included paths and the definitions they use."""
     if raw_spec.get("swagger") in supported_openapi_20_versions:
         return reduce_openapi_20_spec(raw_spec, filter_paths, ignored_definition_keys)
 
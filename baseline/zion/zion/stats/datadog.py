@@ -5,10 +5,16 @@ from datadog import api, initialize
 from datadog_api_client import ApiClient, Configuration
 from datadog_api_client.v2.api.logs_api import LogsApi
 
+from zion.stats.metrics_aggregator import ApiMetricsSink, MetricsAggregator
+
 
 class _Client:
     # Init a private Datadog Client with options as defined in datadog "initialize" function.
-    def __init__(self, options: dict) -> None:
+    # Tracked metrics are buffered by the metrics aggregator and sent from its thread, off the request path,
+    # the thread is started with `start`.
+    def __init__(
+        self, options: dict, metrics_aggregator: MetricsAggregator | None = None
+    ) -> None:
         self.configuration = Configuration(
             api_key={
                 "apiKeyAuth": options["api_key"],
@@ -21,6 +27,9 @@ class _Client:
         self.logs = LogsApi(self.api_client)
         self.metric = api.Metric
         self.event = api.Event
+        self.metrics_aggregator = metrics_aggregator or MetricsAggregator(
+            sink=ApiMetricsSink(), flush_interval_seconds=10, max_buffered_points=100000
+        )
 
     def get_event(self, event_id: Any):  # noqa: ANN202, ANN401, TODO(Huong): Add return value and re-enable this lint.
         return self.event.get(event_id)
@@ -37,8 +46,16 @@ class _Client:
         return self.metric.query(start=start_time, end=end_time, query=query)
 
     # Tracking methods ...
-    def send_metric(self, metric: str, value: int, tags: list[str], typ: str):  # noqa: ANN202, TODO(Huong): Add return value and re-enable this lint.
-        return self.metric.send(metric=metric, points=value, tags=tags, type=typ)
+    def send_metric(self, metric: str, value: int, tags: list[str], typ: str) -> None:
+        self.metrics_aggregator.record(metric, typ, value, tags)
+
+    def start(self) -> None:
+        """Start sending the tracked metrics in the background, called on startup."""
+        self.metrics_aggregator.start()
+
+    def close(self) -> None:
+        """Send the buffered metrics, called on shutdown."""
+        self.metrics_aggregator.close()
 
     def track_count(self, metric: str, tags: list[str]):  # noqa: ANN202, TODO(Huong): Add return value and re-enable this lint.
         return self.send_metric(f"{metric}.count", 1, tags, "count")
@@ -49,6 +66,9 @@ class _Client:
     def track_elapsed(self, metric: str, value: int, tags: list[str]):  # noqa: ANN202, TODO(Huong): Add return value and re-enable this lint.
         return self.send_metric(f"{metric}.elapsed", value, tags, "histogram")
 
+    def track_gauge(self, metric: str, value: float, tags: list[str]) -> None:
+        self.send_metric(f"{metric}.gauge", value, tags, "gauge")
+
 
 class DatadogClient(_Client):
     """Datadog client with common tracking methods"""
@@ -59,11 +79,20 @@ class DatadogClient(_Client):
     METRIC_EXTERNAL = "external"
     EVENT_EVALUATION = "evaluation"
 
-    def __init__(self, options: dict, env: str, appname: str) -> None:
-        super().__init__(options)
+    def __init__(
+        self,
+        options: dict,
+        env: str,
+        appname: str,
+        metrics_aggregator: MetricsAggregator | None = None,
+    ) -> None:
+        super().__init__(options, metrics_aggregator)
         self.env = env  # The common "env" tag value.
         self.appname = appname  # The common "appname" tag value.
         self.prefix = "pystatsd.llmkit"  # Default prefix added to all metrics.
+        # points dropped by the metrics aggregator are counted like any other metric
+        self.metrics_aggregator.dropped_metric = f"{self.prefix}.metrics.dropped.count"
+        self.metrics_aggregator.dropped_tags = self.system_tags()
 
     def system_tags(self) -> list[str]:
         """Gather all common tracking tags"""
@@ -81,6 +110,10 @@ class DatadogClient(_Client):
         tags = tags + self.system_tags()
         return super().track_elapsed(f"{self.prefix}.{metric}", value, tags)
 
+    def track_gauge(self, metric: str, value: float, tags: list[str]) -> None:
+        tags = tags + self.system_tags()
+        super().track_gauge(f"{self.prefix}.{metric}", value, tags)
+
     def track_success(self, metric: str, tags: list[str]):  # noqa: ANN201, TODO(Huong): Add return value and re-enable this lint.
         tags = ["success:true"] + tags  # noqa: RUF005, TODO(Huong): Consider `["success:true", *tags]` and re-enable this lint.
         return self.track_count(metric, tags)
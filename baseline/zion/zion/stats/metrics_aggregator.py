@@ -0,0 +1,211 @@
+import time  # noqa: INP001
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Any, Optional, Protocol
+
+from datadog import api
+from datadog.dogstatsd import DogStatsd
+
+METRIC_TYPE_COUNT = "count"
+METRIC_TYPE_GAUGE = "gauge"
+METRIC_TYPE_HISTOGRAM = "histogram"
+
+METRICS_SINK_API = "api"
+METRICS_SINK_DOGSTATSD = "dogstatsd"
+METRICS_SINK_LOCAL = "local"
+
+
+@dataclass
+class AggregatedMetric:
+    """One series over a flush interval.
+    Counts are summed, gauges keep their last value and histograms keep every (timestamp, value) point.
+    """
+
+    metric: str
+    typ: str
+    tags: tuple[str, ...]
+    points: list[tuple[float, float]] = field(default_factory=list)
+
+    def add(self, timestamp: float, value: float) -> None:
+        if self.typ == METRIC_TYPE_COUNT and self.points:
+            self.points[0] = (timestamp, self.points[0][1] + value)
+        elif self.typ == METRIC_TYPE_GAUGE and self.points:
+            self.points[0] = (timestamp, value)
+        else:
+            self.points.append((timestamp, value))
+
+
+class MetricsSink(Protocol):
+    def send(self, metrics: list[AggregatedMetric]) -> None: ...
+
+
+class ApiMetricsSink:
+    """Submits the series of one flush in a single Datadog API call."""
+
+    def send(self, metrics: list[AggregatedMetric]) -> None:
+        api.Metric.send(
+            metrics=[
+                {
+                    "metric": aggregated_metric.metric,
+                    "points": aggregated_metric.points,
+                    "tags": list(aggregated_metric.tags),
+                    "type": aggregated_metric.typ,
+                }
+                for aggregated_metric in metrics
+            ]
+        )
+
+
+class DogStatsdMetricsSink:
+    """Sends the series of one flush to the DogStatsD agent, over UDP or its unix socket."""
+
+    def __init__(self, socket_path: Optional[str] = None) -> None:
+        self.dogstatsd = DogStatsd(socket_path=socket_path or None)
+
+    def send(self, metrics: list[AggregatedMetric]) -> None:
+        for aggregated_metric in metrics:
+            tags = list(aggregated_metric.tags)
+            for _, value in aggregated_metric.points:
+                if aggregated_metric.typ == METRIC_TYPE_COUNT:
+                    self.dogstatsd.increment(aggregated_metric.metric, value, tags)
+                elif aggregated_metric.typ == METRIC_TYPE_GAUGE:
+                    self.dogstatsd.gauge(aggregated_metric.metric, value, tags)
+                else:
+                    self.dogstatsd.histogram(aggregated_metric.metric, value, tags)
+
+
+class LocalMetricsSink:
+    """Keeps the flushed series in memory, for tests and local runs."""
+
+    def __init__(self) -> None:
+        self.metrics: list[AggregatedMetric] = []
+
+    def send(self, metrics: list[AggregatedMetric]) -> None:
+        self.metrics.extend(metrics)
+
+
+def create_metrics_sink(sink: str, statsd_socket_path: str = "") -> MetricsSink:
+    if sink == METRICS_SINK_DOGSTATSD:
+        return DogStatsdMetricsSink(socket_path=statsd_socket_path)
+    if sink == METRICS_SINK_LOCAL:
+        return LocalMetricsSink()
+    return ApiMetricsSink()
+
+
+class MetricsAggregator:
+    """Process local buffer of metrics, shipped to a sink by a background thread.
+
+    Recording a metric only takes a lock, the series are pre-aggregated by (metric, type, tags)
+    and sent once per flush interval by the thread started with `start`, e.g. on server startup.
+    Until then, and after `close`, the series are only sent by `flush`, so importing the aggregator sends nothing.
+    Once `max_buffered_points` are waiting, new points are dropped and counted,
+    the drop count is sent as `dropped_metric` with `dropped_tags` on the next flush.
+    A local sink keeps the flushed series in memory, for tests.
+    """
+
+    def __init__(
+        self,
+        sink: MetricsSink,
+        flush_interval_seconds: float,
+        max_buffered_points: int,
+        logger: Any = None,  # noqa: ANN401, zion Logger, stats cannot import zion.config
+    ) -> None:
+        self.sink = sink
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffered_points = max_buffered_points
+        self.dropped_metric = "metrics.dropped"
+        self.dropped_tags: list[str] = []
+        self.dropped_points = 0
+        self._logger = logger
+        self._series: dict[tuple[str, str, tuple[str, ...]], AggregatedMetric] = {}
+        self._buffered_points = 0
+        self._unsent_dropped_points = 0
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._closed = Event()
+        self._flush_thread: Optional[Thread] = None
+
+    def count(self, metric: str, value: float, tags: list[str]) -> None:
+        self.record(metric, METRIC_TYPE_COUNT, value, tags)
+
+    def gauge(self, metric: str, value: float, tags: list[str]) -> None:
+        self.record(metric, METRIC_TYPE_GAUGE, value, tags)
+
+    def histogram(self, metric: str, value: float, tags: list[str]) -> None:
+        self.record(metric, METRIC_TYPE_HISTOGRAM, value, tags)
+
+    def record(self, metric: str, typ: str, value: float, tags: list[str]) -> None:
+        key = (metric, typ, tuple(sorted(tags)))
+        with self._lock:
+            aggregated_metric = self._series.get(key)
+            adds_point = aggregated_metric is None or typ == METRIC_TYPE_HISTOGRAM
+            if adds_point and self._buffered_points >= self.max_buffered_points:
+                self.dropped_points += 1
+                self._unsent_dropped_points += 1
+                return
+            if aggregated_metric is None:
+                aggregated_metric = AggregatedMetric(
+                    metric=metric, typ=typ, tags=key[2]
+                )
+                self._series[key] = aggregated_metric
+            aggregated_metric.add(time.time(), value)
+            if adds_point:
+                self._buffered_points += 1
+
+    def flush(self) -> None:
+        """Send the buffered series, a failed send drops them and counts the drop."""
+        with self._flush_lock:
+            with self._lock:
+                metrics = list(self._series.values())
+                buffered_points = self._buffered_points
+                unsent_dropped_points = self._unsent_dropped_points
+                self._series = {}
+                self._buffered_points = 0
+                self._unsent_dropped_points = 0
+
+            if unsent_dropped_points > 0:
+                metrics.append(
+                    AggregatedMetric(
+                        metric=self.dropped_metric,
+                        typ=METRIC_TYPE_COUNT,
+                        tags=tuple(self.dropped_tags),
+                        points=[(time.time(), unsent_dropped_points)],
+                    )
+                )
+            if len(metrics) == 0:
+                return
+
+            try:
+                self.sink.send(metrics)
+            except Exception:  # telemetry never fails the flush thread
+                with self._lock:
+                    self.dropped_points += buffered_points
+                    self._unsent_dropped_points += buffered_points
+                if self._logger is not None:
+                    self._logger.exception(
+                        "[MetricsAggregator] failed to send %s series",
+                        len(metrics),
+                        tags={"series": len(metrics)},
+                    )
+
+    def close(self) -> None:
+        """Stop the flush thread and send what is left."""
+        self._closed.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=self.flush_interval_seconds)
+        self.flush()
+
+    def start(self) -> None:
+        """Start the flush thread, once."""
+        if self._flush_thread is not None or self._closed.is_set():
+            return
+        with self._lock:
+            if self._flush_thread is None:
+                self._flush_thread = Thread(
+                    target=self._run, name="zion-metrics-flush", daemon=True
+                )
+                self._flush_thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.flush_interval_seconds):
+            self.flush()
@@ -0,0 +1,99 @@
+import time
+
+from zion.stats.metrics_aggregator import (
+    METRIC_TYPE_COUNT,
+    METRIC_TYPE_GAUGE,
+    METRIC_TYPE_HISTOGRAM,
+    LocalMetricsSink,
+    MetricsAggregator,
+)
+
+
+class FailingMetricsSink:
+    def send(self, _: list) -> None:
+        message = "datadog is down"
+        raise ConnectionError(message)
+
+
+def create_metrics_aggregator(
+    sink: LocalMetricsSink, max_buffered_points: int = 100
+) -> MetricsAggregator:
+    return MetricsAggregator(
+        sink=sink, flush_interval_seconds=60, max_buffered_points=max_buffered_points
+    )
+
+
+def test_metrics_aggregator_aggregates_by_metric_and_tags() -> None:
+    sink = LocalMetricsSink()
+    metrics_aggregator = create_metrics_aggregator(sink)
+
+    metrics_aggregator.count("agent.count", 1, ["success:true", "env:dev"])
+    metrics_aggregator.count("agent.count", 2, ["env:dev", "success:true"])
+    metrics_aggregator.count("agent.count", 1, ["success:false", "env:dev"])
+    metrics_aggregator.gauge("pool.size", 3, [])
+    metrics_aggregator.gauge("pool.size", 5, [])
+    metrics_aggregator.histogram("agent.elapsed", 0.5, [])
+    metrics_aggregator.histogram("agent.elapsed", 1.5, [])
+    assert sink.metrics == []
+
+    metrics_aggregator.close()
+
+    series = {
+        (metric.metric, metric.typ, metric.tags): [value for _, value in metric.points]
+        for metric in sink.metrics
+    }
+    assert series == {
+        ("agent.count", METRIC_TYPE_COUNT, ("env:dev", "success:true")): [3],
+        ("agent.count", METRIC_TYPE_COUNT, ("env:dev", "success:false")): [1],
+        ("pool.size", METRIC_TYPE_GAUGE, ()): [5],
+        ("agent.elapsed", METRIC_TYPE_HISTOGRAM, ()): [0.5, 1.5],
+    }
+
+
+def test_metrics_aggregator_counts_dropped_points() -> None:
+    sink = LocalMetricsSink()
+    metrics_aggregator = create_metrics_aggregator(sink, max_buffered_points=2)
+
+    metrics_aggregator.count("agent.count", 1, [])
+    for value in range(4):
+        metrics_aggregator.histogram("agent.elapsed", value, [])
+    # a count already buffered is still aggregated
+    metrics_aggregator.count("agent.count", 1, [])
+    metrics_aggregator.flush()
+
+    assert metrics_aggregator.dropped_points == 3  # noqa: PLR2004
+    assert [
+        (metric.metric, [value for _, value in metric.points])
+        for metric in sink.metrics
+    ] == [
+        ("agent.count", [2]),
+        ("agent.elapsed", [0]),
+        ("metrics.dropped", [3]),
+    ]
+
+    # points of a failed send are dropped and counted
+    metrics_aggregator.sink = FailingMetricsSink()
+    metrics_aggregator.count("agent.count", 1, [])
+    metrics_aggregator.flush()
+    assert metrics_aggregator.dropped_points == 4  # noqa: PLR2004
+    metrics_aggregator.close()
+
+
+def test_metrics_aggregator_sends_once_started() -> None:
+    sink = LocalMetricsSink()
+    metrics_aggregator = MetricsAggregator(
+        sink=sink, flush_interval_seconds=0.01, max_buffered_points=100
+    )
+
+    metrics_aggregator.count("agent.count", 1, [])
+    time.sleep(0.05)
+    # nothing is sent before the flush thread is started, e.g. on import
+    assert sink.metrics == []
+
+    metrics_aggregator.start()
+    deadline = time.monotonic() + 5
+    while sink.metrics == [] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    metrics_aggregator.close()
+
+    assert [metric.metric for metric in sink.metrics] == ["agent.count"]
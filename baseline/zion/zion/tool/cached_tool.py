@@ -0,0 +1,260 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, ClassVar, Protocol
+
+from langchain.tools import BaseTool
+
+from zion.config import global_config, logger, statsd
+
+TOOL_RESULT_CACHE_BACKEND_MEMORY = "memory"
+TOOL_RESULT_CACHE_BACKEND_REDIS = "redis"
+TOOL_RESULT_CACHE_METRIC = "tool_result_cache"
+REDIS_KEY_PREFIX = "zion:tool_result:"
+
+
+def _encode(value: Any) -> Any:  # noqa: ANN401
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+def get_tool_cache_key(tool_name: str, scope: str, args: dict[str, Any]) -> str:
+    """Stable hash of a tool call, the args are sorted by name so keyword order does not matter."""
+    encoded_call = json.dumps(
+        {"tool": tool_name, "scope": scope, "args": args},
+        sort_keys=True,
+        default=_encode,
+    )
+    return hashlib.sha256(encoded_call.encode("utf-8")).hexdigest()
+
+
+class ToolResultCacheBackend(Protocol):
+    # a remote backend is called from a worker thread by async tools, so it does not block the event loop
+    is_remote: bool
+
+    def get(self, key: str) -> tuple[bool, Any]: ...
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None: ...  # noqa: ANN401
+
+
+class MemoryToolResultBackend:
+    """LRU of tool results per worker, each entry expires after the ttl of its tool."""
+
+    is_remote = False
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:  # noqa: ANN401
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class RedisToolResultBackend:
+    """Tool results shared by every worker, stored as json with the ttl of their tool."""
+
+    is_remote = True
+
+    def __init__(self, redis_url: str) -> None:
+        # optional dependency, only needed when the redis backend is configured
+        import redis
+
+        self.redis = redis.Redis.from_url(redis_url)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        value = self.redis.get(f"{REDIS_KEY_PREFIX}{key}")
+        if value is None:
+            return False, None
+        return True, json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:  # noqa: ANN401
+        self.redis.set(
+            f"{REDIS_KEY_PREFIX}{key}",
+            json.dumps(value, default=_encode),
+            ex=max(math.ceil(ttl_seconds), 1),
+        )
+
+
+def create_tool_result_backend(
+    backend: str, max_size: int, redis_url: str = ""
+) -> ToolResultCacheBackend:
+    if backend == TOOL_RESULT_CACHE_BACKEND_REDIS:
+        return RedisToolResultBackend(redis_url)
+    return MemoryToolResultBackend(max_size)
+
+
+class ToolResultCache:
+    """Cache of tool results, hits and misses are tracked per tool.
+
+    Only returned results are cached, a tool that raises is called again next time.
+    A failing backend is logged and treated as a miss, it never fails the tool call.
+    """
+
+    def __init__(self, backend: ToolResultCacheBackend) -> None:
+        self.backend = backend
+
+    def get(self, tool_name: str, key: str) -> tuple[bool, Any]:
+        try:
+            hit, value = self.backend.get(key)
+        except Exception as e:  # noqa: BLE001, the cache never fails the tool call
+            logger.error(
+                f"[ToolResultCache] failed to get tool result: {e!s}",
+                tags={"tool": tool_name},
+            )
+            hit, value = False, None
+        statsd.track_count(
+            metric=TOOL_RESULT_CACHE_METRIC,
+            tags=[f"tool:{tool_name}", f"result:{'hit' if hit else 'miss'}"],
+        )
+        return hit, value
+
+    def set(self, tool_name: str, key: str, value: Any, ttl_seconds: float) -> None:  # noqa: ANN401
+        try:
+            self.backend.set(key, value, ttl_seconds)
+        except Exception as e:  # noqa: BLE001, the cache never fails the tool call
+            logger.error(
+                f"[ToolResultCache] failed to set tool result: {e!s}",
+                tags={"tool": tool_name},
+            )
+
+    async def aget(self, tool_name: str, key: str) -> tuple[bool, Any]:
+        if self.backend.is_remote:
+            return await asyncio.to_thread(self.get, tool_name, key)
+        return self.get(tool_name, key)
+
+    async def aset(
+        self,
+        tool_name: str,
+        key: str,
+        value: Any,  # noqa: ANN401
+        ttl_seconds: float,
+    ) -> None:
+        if self.backend.is_remote:
+            await asyncio.to_thread(self.set, tool_name, key, value, ttl_seconds)
+        else:
+            self.set(tool_name, key, value, ttl_seconds)
+
+
+def _cache_run(run: Callable) -> Callable:
+    run_signature = inspect.signature(run)
+
+    @functools.wraps(run)
+    def cached_run(self: "CachedTool", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if not self.cache_enabled:
+            return run(self, *args, **kwargs)
+
+        key = self.get_cache_key(run_signature, *args, **kwargs)
+        hit, value = tool_result_cache.get(self.name, key)
+        if hit:
+            return value
+
+        value = run(self, *args, **kwargs)
+        tool_result_cache.set(self.name, key, value, self.cache_ttl_seconds)
+        return value
+
+    return cached_run
+
+
+def _cache_arun(arun: Callable) -> Callable:
+    arun_signature = inspect.signature(arun)
+
+    @functools.wraps(arun)
+    async def cached_arun(self: "CachedTool", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if not self.cache_enabled:
+            return await arun(self, *args, **kwargs)
+
+        key = self.get_cache_key(arun_signature, *args, **kwargs)
+        hit, value = await tool_result_cache.aget(self.name, key)
+        if hit:
+            return value
+
+        value = await arun(self, *args, **kwargs)
+        await tool_result_cache.aset(self.name, key, value, self.cache_ttl_seconds)
+        return value
+
+    return cached_arun
+
+
+class CachedTool(BaseTool):
+    """BaseTool whose `_run` and `_arun` results are cached in `tool_result_cache`.
+
+    Meant for deterministic lookups, a call is keyed by tool name, its args and `get_cache_scope`.
+    Subclasses set `cache_ttl_seconds`, and `cache_enabled = False` to opt out.
+    The scope is built from the metadata keys in `cache_scope_keys`, the ACL and filter keys of the plugin,
+    so tools that may return different results never share them, while descriptions and other settings do not
+    split the cache.
+    """
+
+    cache_ttl_seconds: ClassVar[float] = 300
+    cache_enabled: ClassVar[bool] = True
+    cache_scope_keys: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__pydantic_init_subclass__(**kwargs)
+        if "_run" in cls.__dict__:
+            cls._run = _cache_run(cls.__dict__["_run"])
+        if "_arun" in cls.__dict__:
+            cls._arun = _cache_arun(cls.__dict__["_arun"])
+
+    def get_cache_scope(self) -> str:
+        metadata = self.metadata or {}
+        return json.dumps(
+            {key: metadata.get(key) for key in self.cache_scope_keys},
+            sort_keys=True,
+            default=_encode,
+        )
+
+    def get_cache_key(
+        self,
+        run_signature: inspect.Signature,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> str:
+        """Key of a call, only the tool args count, callback managers and configs passed by langchain do not."""
+        bound_args = run_signature.bind(self, *args, **kwargs)
+        bound_args.apply_defaults()
+        tool_args = {
+            name: value
+            for name, value in bound_args.arguments.items()
+            if name in self.args
+        }
+        return get_tool_cache_key(self.name, self.get_cache_scope(), tool_args)
+
+
+tool_result_cache = ToolResultCache(
+    backend=create_tool_result_backend(
+        global_config.tool_result_cache_backend,
+        max_size=global_config.tool_result_cache_size,
+        redis_url=global_config.tool_result_cache_redis_url,
+    )
+)
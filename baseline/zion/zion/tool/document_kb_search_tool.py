@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
-import requests
+import httpx
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -15,9 +15,14 @@ from pydantic import BaseModel, Field
 
 from zion.config import global_config, logger
 from zion.util.constant import DocumentTitle, DocumentUri
+from zion.util.http_client.client import (
+    hades_async_http_client,
+    hades_http_client,
+)
 
 HTTP_OK_STATUS = "OK"
 DOCUMENT_KB_SEARCH_LIMIT = 10
+HADES_DOCUMENT_KB_SEARCH_ENDPOINT = "/doc_kb_route/search_document_knowledge_base"
 
 
 class HadesDocumentKBSearchInput(BaseModel):
@@ -84,19 +89,21 @@ class HadesDocumentKBSearch(BaseTool):
             for document_collection in self.metadata.get("document_collection", [])
         ]
 
+    def _build_hades_document_kb_search_body(self, search_query: str) -> dict:
+        return {
+            "query": search_query,
+            "filter": {
+                "document_collection_uuids": self.__build_hades_document_kb_search_filter()
+            },
+        }
+
     def hades_document_kb_search_tool(self, search_query: str) -> str:
         """Used to search internal documentation for any additional context from Document KB Search"""
 
-        res = requests.post(
-            url=f"{global_config.hades_kb_service_base_url}/doc_kb_route/search_document_knowledge_base",
-            data=json.dumps(
-                {
-                    "query": search_query,
-                    "filter": {
-                        "document_collection_uuids": self.__build_hades_document_kb_search_filter()
-                    },
-                },
-            ),
+        res = hades_http_client.request(
+            "POST",
+            HADES_DOCUMENT_KB_SEARCH_ENDPOINT,
+            data=json.dumps(self._build_hades_document_kb_search_body(search_query)),
             headers={
                 "rag-document-secret": global_config.hades_document_rag_secret_key
             },
@@ -108,6 +115,32 @@ class HadesDocumentKBSearch(BaseTool):
             raise ToolException(err_msg)
         return json.dumps(HadesDocumentKBSearchResult(res.json()).result_items)
 
+    async def ahades_document_kb_search_tool(self, search_query: str) -> str:
+        """Used to search internal documentation for any additional context from Document KB Search asynchronously"""
+
+        try:
+            res = await hades_async_http_client.request(
+                "POST",
+                HADES_DOCUMENT_KB_SEARCH_ENDPOINT,
+                content=json.dumps(
+                    self._build_hades_document_kb_search_body(search_query)
+                ),
+                headers={
+                    "rag-document-secret": global_config.hades_document_rag_secret_key
+                },
+                timeout=20,
+            )
+        except httpx.HTTPError as e:
+            err_msg = f"Hades Document KB search failed with error: {e!s}"
+            logger.error(err_msg)
+            raise ToolException(err_msg) from e
+
+        if res.status_code != httpx.codes.OK:
+            err_msg = f"Hades Document KB search failed with status code `{res.status_code}` and reason `{res.reason_phrase}`, response: {res.text}"
+            logger.error(err_msg)
+            raise ToolException(err_msg)
+        return json.dumps(HadesDocumentKBSearchResult(res.json()).result_items)
+
     def _run(self, query: str, _: Optional[CallbackManagerForToolRun] = None) -> str:
         """Search internal documentation for additional context on user query"""
         return self.hades_document_kb_search_tool(query)
@@ -116,4 +149,4 @@ class HadesDocumentKBSearch(BaseTool):
         self, query: str, _: Optional[AsyncCallbackManagerForToolRun] = None
     ) -> str:
         """Search internal documentation for additional context on user query asynchronously"""
-        return self.hades_document_kb_search_tool(query)
+        return await self.ahades_document_kb_search_tool(query)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Any, Callable, ClassVar, Literal, Optional
 
@@ -5,12 +6,12 @@ from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain.tools import BaseTool
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 from pydantic import BaseModel, Field
 
 from zion.config import logger
+from zion.tool.cached_tool import CachedTool
 from zion.tool.glean_listshortcuts import GleanListshortcutsTool
 from zion.util.get_url_metadata.confluence import ExtractConfluenceDocument
 from zion.util.get_url_metadata.get_doc_type import DocumentType, get_doc_type
@@ -27,11 +28,12 @@ class GetDocumentContentInput(BaseModel):
     )
 
 
-class GetDocumentContentTool(BaseTool):
+class GetDocumentContentTool(CachedTool):
     name: str = "get_document_content"
     description: str = "Used to get document content for document links that has lack of context, or for document links that are attached by user in their messages"
     args_schema: type[BaseModel] = GetDocumentContentInput
     handle_tool_error: bool = True  # handle ToolExceptions
+    cache_ttl_seconds: ClassVar[float] = 600
     doc_type_getter: ClassVar[
         dict[Literal[DocumentType.ConfluenceDocument], Callable[[str], Document]]
     ] = {
@@ -67,6 +69,22 @@ class GetDocumentContentTool(BaseTool):
 
         return json.dumps([document_data.__dict__])
 
+    async def aget_document_content_tool(self, document_url: str) -> dict[str, Any]:
+        """Used to get document content for document links asynchronously"""
+
+        if document_url.startswith("go/"):
+            try:
+                glean = GleanListshortcutsTool()
+                go_link_url = await glean.aglean_listshortcuts_tool(document_url)
+            except Exception as e:
+                err_message = f"Unable to get document content with exception: {e!s}"
+                logger.exception(err_message)
+                raise ToolException(err_message) from e
+            document_url = go_link_url.replace('"', "")
+
+        # the document getters are built on sync SDKs, they run in a worker thread instead of blocking the event loop
+        return await asyncio.to_thread(self.get_document_content_tool, document_url)
+
     def _run(
         self, document_url: str, _: Optional[CallbackManagerForToolRun] = None
     ) -> str:
@@ -77,4 +95,4 @@ class GetDocumentContentTool(BaseTool):
         self, document_url: str, _: Optional[AsyncCallbackManagerForToolRun] = None
     ) -> str:
         """Used to get document content for document links that has lack of context, or for document links that are attached by user in their messages asyncrhonoously"""
-        return self.get_document_content_tool(document_url)
+        return await self.aget_document_content_tool(document_url)
@@ -1,4 +1,6 @@
+import contextvars
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from langchain.tools import BaseTool
@@ -40,9 +42,20 @@ class GetServiceDependenciesTool(BaseTool):
         """Get service upstream and downstream dependencies"""
         env = correct_env(env)
         if env == "prd_stg":
-            prd_mesh = get_service_mesh(service_name, "prd")
-            stg_mesh = get_service_mesh(service_name, "stg")
-            return {"production": prd_mesh, "staging": stg_mesh}
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                prd_mesh = executor.submit(
+                    contextvars.copy_context().run,
+                    get_service_mesh,
+                    service_name,
+                    "prd",
+                )
+                stg_mesh = executor.submit(
+                    contextvars.copy_context().run,
+                    get_service_mesh,
+                    service_name,
+                    "stg",
+                )
+            return {"production": prd_mesh.result(), "staging": stg_mesh.result()}
 
         try:
             return get_service_mesh(service_name, env)
@@ -7,10 +7,11 @@ from langchain.tools import BaseTool
 from langchain_core.tools import ToolException
 from pydantic import BaseModel, Field
 
-from zion.config import global_config, logger
+from zion.config import logger
 from zion.util import helix
 from zion.util.constant import GRAB_INDEX, K8S_INDEX
 from zion.util.convert import correct_env
+from zion.util.http_client.client import helix_http_client
 from zion.util.service_mesh import download_mesh_config
 
 ROLLOUT_PERCENTAGE = 100
@@ -50,7 +51,7 @@ class GetServicePlatformTool(BaseTool):
             if smi_config:
                 return self.get_index_from_smi(smi_config, service_name)
 
-            _, helix_token = helix.get_helix_token()()
+            _, helix_token = helix.get_helix_token()
             if helix_token is None:
                 # If helix token is None, return GRAB_INDEX
                 return GRAB_INDEX
@@ -88,8 +89,10 @@ class GetServicePlatformTool(BaseTool):
 
     def query_service_info(self, service: str, token: str) -> dict:
         try:
-            response = requests.get(
-                f"{global_config.helix_base_url}/api/catalog/entities/by-name/component/default/{service}",
+            response = helix_http_client.request(
+                "GET",
+                f"/api/catalog/entities/by-name/component/default/{service}",
+                metric_endpoint="/api/catalog/entities/by-name",
                 headers={"Authorization": f"Bearer {token}"},
                 timeout=5.0,
             )
@@ -98,6 +101,7 @@ class GetServicePlatformTool(BaseTool):
                     f"call helix filter failed when call {service}, plz retry it!"
                 )
                 return {}
+            helix.invalidate_helix_token_on_unauthorized(response)
             return response.json()
         except requests.exceptions.RequestException as err:
             logger.error("Oops: Something Else Happened!", err)
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from zion.config import global_config, logger, statsd
 from zion.stats.datadog import DatadogClient
 from zion.tool.sourcegraph import get_proto_file_path_by_service_name
+from zion.util.http_client.client import gitlab_http_client
 
 
 class GitlabEndpointToolInput(BaseModel):
@@ -49,10 +50,16 @@ class GitlabEndpointTool(BaseTool):
         stat_tags = ["service:gitlab", "endpoint:get_file_content"]
 
         encoded_file_path = quote(file_path, safe="")
-        url = f"https://gitlab.myteksi.net/api/v4/projects/{project_id}/repository/files/{encoded_file_path}?ref=master"
+        endpoint = (
+            f"/projects/{project_id}/repository/files/{encoded_file_path}?ref=master"
+        )
         # Example: https://gitlab.myteksi.net/api/v4/projects/17/repository/files/food%2Ffood-cart%2Fpb%2Foffers.proto?ref=master
-        response = requests.get(
-            url, headers={"PRIVATE-TOKEN": global_config.gitlab_api_token}, timeout=120
+        response = gitlab_http_client.request(
+            "GET",
+            endpoint,
+            metric_endpoint="/projects/repository/files",
+            headers={"PRIVATE-TOKEN": global_config.gitlab_api_token},
+            timeout=120,
         )
 
         # Tracking when request completes
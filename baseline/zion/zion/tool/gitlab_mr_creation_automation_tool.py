@@ -8,13 +8,13 @@ from langchain.callbacks.manager import (
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from zion.agent.constant import CREATE_MR_PROMPT
+from zion.agent.constant import CREATE_MR_PROMPT, CREATE_MR_PROMPT_HUB_COMMIT
 from zion.agent.model import ChatGrabGPT, GrabGPTEnum
 from zion.agent.mr_creation_automation_agent import (
     create_mr_creation_automation_agent_node,
 )
 from zion.config import global_config
-from zion.tool.util import get_prompt
+from zion.tool.util import QUERY_SOURCE_CONFIG_KEY, get_prompt, get_tool_request_value
 
 
 class GitlabMrCreationAutomationInput(BaseModel):
@@ -38,11 +38,11 @@ class GitlabMrCreationAutomationTool(BaseTool):
             "timeout": 300,
         }
         model = ChatGrabGPT(model=chat_grabgpt_data["model_name"], **chat_grabgpt_data)
-        query_source = self.metadata["query_source"]
+        query_source = get_tool_request_value(QUERY_SOURCE_CONFIG_KEY)
 
         result = await create_mr_creation_automation_agent_node(
             model=model,
-            prompt=get_prompt("create-mr-prompt", CREATE_MR_PROMPT),
+            prompt=get_prompt(CREATE_MR_PROMPT_HUB_COMMIT, CREATE_MR_PROMPT),
             query_source=query_source,
             query=query,
             chat_history=chat_history,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
-import requests
+import httpx
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -13,6 +13,10 @@ from langchain_core.tools import ToolException
 from pydantic import BaseModel, Field
 
 from zion.config import global_config, logger
+from zion.util.http_client.client import (
+    glean_async_http_client,
+    glean_http_client,
+)
 
 HTTP_OK_STATUS = "OK"
 
@@ -61,8 +65,9 @@ class GleanListshortcutsTool(BaseTool):
 
         req_body = self._build_glean_request_body(query)
 
-        res = requests.post(
-            url=f"{global_config.glean_base_url}/rest/api/v1/listshortcuts",
+        res = glean_http_client.request(
+            "POST",
+            "/rest/api/v1/listshortcuts",
             data=json.dumps(req_body),
             headers={"Authorization": f"Bearer {global_config.glean_bearer_token}"},
             timeout=20,
@@ -74,6 +79,31 @@ class GleanListshortcutsTool(BaseTool):
 
         return json.dumps(self.glean_res(res.json(), query))
 
+    async def aglean_listshortcuts_tool(self, query: str) -> str:
+        """Used to retrieve list of shortcuts for the given typed query from Glean asynchronously"""
+
+        req_body = self._build_glean_request_body(query)
+
+        try:
+            res = await glean_async_http_client.request(
+                "POST",
+                "/rest/api/v1/listshortcuts",
+                content=json.dumps(req_body),
+                headers={"Authorization": f"Bearer {global_config.glean_bearer_token}"},
+                timeout=20,
+            )
+        except httpx.HTTPError as e:
+            err_msg = f"Glean shortcuts failed with error: {e!s}"
+            logger.error(err_msg)
+            raise ToolException(err_msg) from e
+
+        if res.status_code != httpx.codes.OK:
+            err_msg = f"Glean shortcuts failed with status code `{res.status_code}` and reason `{res.reason_phrase}`, response: {res.text}"
+            logger.error(err_msg)
+            raise ToolException(err_msg)
+
+        return json.dumps(self.glean_res(res.json(), query))
+
     def _run(self, query: str, _: Optional[CallbackManagerForToolRun] = None) -> str:
         """Retrieve list of shortcuts for the given typed query"""
         return self.glean_listshortcuts_tool(query)
@@ -82,4 +112,4 @@ class GleanListshortcutsTool(BaseTool):
         self, query: str, _: Optional[AsyncCallbackManagerForToolRun] = None
     ) -> str:
         """Retrieve list of shortcuts for the given typed query asynchronously"""
-        return self.glean_listshortcuts_tool(query)
+        return await self.aglean_listshortcuts_tool(query)
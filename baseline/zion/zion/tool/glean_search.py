@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
-import requests
+import httpx
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from langchain.tools import BaseTool
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 from pydantic import BaseModel, Field
 
 from zion.config import global_config, logger
+from zion.tool.cached_tool import CachedTool
 from zion.tool.constant import general_search_tool_desc
 from zion.util.constant import DocumentTitle, DocumentUri
+from zion.util.http_client.client import (
+    glean_async_http_client,
+    glean_http_client,
+)
 
 HTTP_OK_STATUS = "OK"
 
@@ -83,12 +88,19 @@ class GleanRes:
         )
 
 
-class GleanSearchTool(BaseTool):
+class GleanSearchTool(CachedTool):
     name: str = "glean_search"
     description: str = general_search_tool_desc
     args_schema: type[BaseModel] = SearchInput
     handle_tool_error: bool = True  # handle ToolExceptions
     metadata: Optional[dict[str, Any]] = None
+    cache_ttl_seconds: ClassVar[float] = 300
+    # the datasource filter and the allowed wiki spaces and techdocs platforms change the results
+    cache_scope_keys: ClassVar[tuple[str, ...]] = (
+        "datasourcesFilter",
+        "wiki_space_collection",
+        "techdocs_platform_name_collection",
+    )
 
     def _build_glean_request_body(
         self,
@@ -165,8 +177,9 @@ class GleanSearchTool(BaseTool):
 
         req_body = self._build_glean_request_body(search_query, techdocs_only)
 
-        res = requests.post(
-            url=f"{global_config.glean_base_url}/rest/api/v1/search",
+        res = glean_http_client.request(
+            "POST",
+            "/rest/api/v1/search",
             data=json.dumps(req_body),
             headers={"Authorization": f"Bearer {global_config.glean_bearer_token}"},
             timeout=20,
@@ -176,7 +189,43 @@ class GleanSearchTool(BaseTool):
             logger.error(err_msg)
             raise ToolException(err_msg)
 
-        glean_results = GleanRes(res.json()).result_items
+        return self._filter_glean_results(res.json(), techdocs_only)
+
+    async def aglean_post_request(
+        self,
+        search_query: str,
+        techdocs_only: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[dict[str, Any]]:
+        """Used to search internal documentation for any additional context from Glean asynchronously"""
+
+        req_body = self._build_glean_request_body(search_query, techdocs_only)
+
+        try:
+            res = await glean_async_http_client.request(
+                "POST",
+                "/rest/api/v1/search",
+                content=json.dumps(req_body),
+                headers={"Authorization": f"Bearer {global_config.glean_bearer_token}"},
+                timeout=20,
+            )
+        except httpx.HTTPError as e:
+            err_msg = f"Glean search failed with error: {e!s}"
+            logger.error(err_msg)
+            raise ToolException(err_msg) from e
+
+        if res.status_code != httpx.codes.OK:
+            err_msg = f"Glean search failed with status code `{res.status_code}` and reason `{res.reason_phrase}`, response: {res.text}"
+            logger.error(err_msg)
+            raise ToolException(err_msg)
+
+        return self._filter_glean_results(res.json(), techdocs_only)
+
+    def _filter_glean_results(
+        self,
+        response: dict[str, Any],
+        techdocs_only: bool,  # noqa: FBT001
+    ) -> list[dict[str, Any]]:
+        glean_results = GleanRes(response).result_items
 
         # Remove results with https://wiki.grab.com/ URLs
         glean_results = [
@@ -246,6 +295,24 @@ class GleanSearchTool(BaseTool):
         techdocs_search = self.glean_post_request(search_query, techdocs_only=True)
         other_search = self.glean_post_request(search_query, techdocs_only=False)
 
+        return self._combine_glean_searches(techdocs_search, other_search)
+
+    async def aglean_search_tool(self, search_query: str) -> str:
+        """Used to search internal documentation for any additional context from Glean asynchronously"""
+
+        # both searches run concurrently
+        techdocs_search, other_search = await asyncio.gather(
+            self.aglean_post_request(search_query, techdocs_only=True),
+            self.aglean_post_request(search_query, techdocs_only=False),
+        )
+
+        return self._combine_glean_searches(techdocs_search, other_search)
+
+    def _combine_glean_searches(
+        self,
+        techdocs_search: list[dict[str, Any]],
+        other_search: list[dict[str, Any]],
+    ) -> str:
         combine_search = (
             techdocs_search[:SEARCH_SPACE_FILTER] + other_search[:SEARCH_SPACE_FILTER]
         )
@@ -260,4 +327,4 @@ class GleanSearchTool(BaseTool):
         self, query: str, _: Optional[AsyncCallbackManagerForToolRun] = None
     ) -> str:
         """Search internal documentation for additional context on user query asynchronously"""
-        return self.glean_search_tool(query)
+        return await self.aglean_search_tool(query)
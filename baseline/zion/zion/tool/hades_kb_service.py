@@ -1,17 +1,22 @@
 import json
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
-from langchain.tools import BaseTool
+import httpx
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 from pydantic import BaseModel, Field
 from requests import RequestException
 
 from zion.config import logger
+from zion.tool.cached_tool import CachedTool
 from zion.tool.constant import hades_kb_endpoint
+from zion.tool.util import USER_PROMPT_CONFIG_KEY, get_tool_request_value
 from zion.util.constant import DocumentTitle, DocumentUri
-from zion.util.http_client.client import hades_http_client
+from zion.util.http_client.client import (
+    hades_async_http_client,
+    hades_http_client,
+)
 
 
 class HadesServiceSearchInput(BaseModel):
@@ -48,7 +53,7 @@ class HadesKnowledgeBaseToolOutput(BaseModel):
     )
 
 
-class HadesKnowledgeBaseTool(BaseTool):
+class HadesKnowledgeBaseTool(CachedTool):
     name: str = "slack_conversation_tool"
     description: str = (
         "Contains previously resolved on-call Slack queries. The response is a list of documents where chat history is in page_content field and slack url in document_uri field. You MUST UNDERSTAND the whole chat history and summarise the chat history without cherry-picking a particular reply. For any chat history you use to generate the answer, you MUST return its unique slack url for user reference in this citation format '[[index]](<slack url>)'. The citation must be labelled with a meaningful title based on the summary."
@@ -60,6 +65,7 @@ class HadesKnowledgeBaseTool(BaseTool):
     args_schema: type[BaseModel] = HadesKnowledgeBaseToolInput
     handle_tool_error: bool = True
     metadata: Optional[dict[str, Any]] = None
+    cache_ttl_seconds: ClassVar[float] = 600
 
     def _run(self, query: str) -> str:
         """Use the tool."""
@@ -69,18 +75,43 @@ class HadesKnowledgeBaseTool(BaseTool):
     async def _arun(self, query: str) -> str:
         """Use the tool asynchronously."""
 
-        return self.get_similar_past_conversation(query=query)
+        return await self.aget_similar_past_conversation(query=query)
 
-    def get_similar_past_conversation(self, query: str) -> str:
-        original_query = ""
+    def _get_original_query(self) -> str:
+        # plugin metadata from the request replaces the user prompt of the run
         if self.metadata is not None:
-            original_query = self.metadata.get("user_prompt", "")
+            return self.metadata.get("user_prompt", "")
+        return get_tool_request_value(USER_PROMPT_CONFIG_KEY, "")
 
+    def get_cache_scope(self) -> str:
+        # the user prompt is part of the search text, so results are only shared for the same prompt
+        return json.dumps({"user_prompt": self._get_original_query()})
+
+    def _get_search_payload(self, query: str) -> dict:
         hades_service_search_input = HadesServiceSearchInput(
-            query=f"{query}. {original_query}"
+            query=f"{query}. {self._get_original_query()}"
         )
 
-        payload = hades_service_search_input.dict()
+        return hades_service_search_input.dict()
+
+    def _parse_search_response(self, response: dict) -> str:
+        parse_response = HadesKnowledgeBaseToolOutput(**response).result
+
+        document_list = [
+            Document(
+                page_content=result.chat_summary,
+                metadata={
+                    DocumentTitle: result.slack_url,
+                    DocumentUri: result.slack_url,
+                },
+            ).__dict__
+            for result in parse_response
+        ]
+
+        return json.dumps(document_list)
+
+    def get_similar_past_conversation(self, query: str) -> str:
+        payload = self._get_search_payload(query)
         try:
             with hades_http_client.get_session() as session:
                 response = hades_http_client.post(
@@ -90,22 +121,22 @@ class HadesKnowledgeBaseTool(BaseTool):
                     headers={},
                 )
 
-                parse_response = HadesKnowledgeBaseToolOutput(**response).result
-
-                document_list = [
-                    Document(
-                        page_content=result.chat_summary,
-                        metadata={
-                            DocumentTitle: result.slack_url,
-                            DocumentUri: result.slack_url,
-                        },
-                    ).__dict__
-                    for result in parse_response
-                ]
-
-                return json.dumps(document_list)
+                return self._parse_search_response(response)
 
         except RequestException as e:
             res_body_text = f"Failed to query hades service: {e!s}"
             logger.error(res_body_text)
             raise ToolException(res_body_text) from e
+
+    async def aget_similar_past_conversation(self, query: str) -> str:
+        payload = self._get_search_payload(query)
+        try:
+            response = await hades_async_http_client.post(
+                endpoint=hades_kb_endpoint, json=payload
+            )
+        except httpx.HTTPError as e:
+            res_body_text = f"Failed to query hades service: {e!s}"
+            logger.error(res_body_text)
+            raise ToolException(res_body_text) from e
+
+        return self._parse_search_response(response)
@@ -4,7 +4,6 @@ from datetime import datetime
 from typing import Any, Optional
 from urllib.parse import urlparse
 
-import requests
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -21,6 +20,10 @@ from zion.tool.models.kibana_search_tool_model import (
     KibanaLogRecord,
     KibanaLogRecordAggregated,
 )
+from zion.util.http_client.client import (
+    kibana_async_http_client,
+    kibana_http_client,
+)
 
 
 class KibanaLogSearchInput(BaseModel):
@@ -178,39 +181,38 @@ class KibanaLogSearch(BaseTool):
             auth = HTTPBasicAuth(
                 global_config.kibana_username, global_config.kibana_password
             )
-            result = requests.post(
-                global_config.kibana_base_url,
+            result = kibana_http_client.request(
+                "POST",
                 headers={"Content-Type": "application/json"},
                 json=request_body,
                 auth=auth,
             )
 
             # Check if the response is successful
-            records: list[KibanaLogRecord] = []
-            current: dict[str, KibanaLogRecordAggregated] = {}
+            if result.status_code == 200:
+                return self._get_records(result.json(), index)
+            logger.error(
+                f"Request failed with status code {result.status_code} and response: {result.text}"
+            )
+            return []
 
+        except Exception as e:
+            raise ToolException(str(e)) from e
+
+    async def _asearch_with_kibana(
+        self, request_body: Optional[dict[str, Any]], index: str = "k8s*"
+    ) -> list[str]:
+        try:
+            result = await kibana_async_http_client.request(
+                "POST",
+                headers={"Content-Type": "application/json"},
+                json=request_body,
+                auth=(global_config.kibana_username, global_config.kibana_password),
+            )
+
+            # Check if the response is successful
             if result.status_code == 200:
-                # Parse the JSON response content
-                response = result.json()
-                # Check if "hits" is in the response
-                if "rawResponse" in response and "hits" in response["rawResponse"]:
-                    responseHits = response["rawResponse"]["hits"]
-                    if "hits" in responseHits:
-                        for hit in responseHits["hits"]:
-                            self.extract_and_build_search_response_aggregated(
-                                current=current,
-                                base_url=self.get_kibana_base_url_from_opensearch(
-                                    global_config.kibana_base_url
-                                ),
-                                index=self.get_opensearch_index_url(index),
-                                response=hit,
-                                skip_truncate=False,
-                            )
-
-                for x in current:
-                    records.append(current[x].__repr__())  # noqa: PERF401
-
-                return records
+                return self._get_records(result.json(), index)
             logger.error(
                 f"Request failed with status code {result.status_code} and response: {result.text}"
             )
@@ -219,6 +221,30 @@ class KibanaLogSearch(BaseTool):
         except Exception as e:
             raise ToolException(str(e)) from e
 
+    def _get_records(self, response: dict[str, Any], index: str) -> list[str]:
+        records: list[KibanaLogRecord] = []
+        current: dict[str, KibanaLogRecordAggregated] = {}
+
+        # Check if "hits" is in the response
+        if "rawResponse" in response and "hits" in response["rawResponse"]:
+            responseHits = response["rawResponse"]["hits"]
+            if "hits" in responseHits:
+                for hit in responseHits["hits"]:
+                    self.extract_and_build_search_response_aggregated(
+                        current=current,
+                        base_url=self.get_kibana_base_url_from_opensearch(
+                            global_config.kibana_base_url
+                        ),
+                        index=self.get_opensearch_index_url(index),
+                        response=hit,
+                        skip_truncate=False,
+                    )
+
+        for x in current:
+            records.append(current[x].__repr__())  # noqa: PERF401
+
+        return records
+
     def _run(
         self,
         app_name: str,
@@ -247,7 +273,7 @@ class KibanaLogSearch(BaseTool):
         request_body = self._generate_request_body(
             index, app_name, message, date_from, date_to, filters
         )
-        return self._search_with_kibana(request_body, index)
+        return await self._asearch_with_kibana(request_body, index)
 
     def get_opensearch_index_url(self, index: str) -> str:
         if index == "grab-*":
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Future
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Any, Optional, TypeVar
+
+from langchain_core.tools import BaseTool, StructuredTool, ToolException
+from langchain_mcp_adapters.sessions import create_session
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession
+
+from zion.agent.agent_cache import get_agent_cache_key
+from zion.config import global_config, logger
+
+Result = TypeVar("Result")
+
+
+class McpServerSession:
+    """Long lived session to one MCP server, with its cached tool list.
+
+    The session is opened and closed by one task on the pool event loop,
+    the MCP transports run anyio task groups that must be exited by the task that entered them.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        connection: dict[str, Any],
+        open_session: Callable[
+            [dict[str, Any]], AbstractAsyncContextManager[ClientSession]
+        ],
+        load_tools: Callable[[ClientSession], Awaitable[list[BaseTool]]],
+    ) -> None:
+        self.server_name = server_name
+        self.connection = connection
+        self.session: Optional[ClientSession] = None
+        self.tools: dict[str, BaseTool] = {}
+        self.tools_loaded_at: Optional[float] = None
+        self.checked_at = time.monotonic()
+        self.used_at = time.monotonic()
+        self._open_session = open_session
+        self._load_tools = load_tools
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self, timeout_seconds: float) -> None:
+        opened = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(opened))
+        try:
+            await asyncio.wait_for(asyncio.shield(opened), timeout_seconds)
+        except BaseException:
+            self._task.cancel()
+            raise
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def is_healthy(
+        self, health_check_seconds: float, timeout_seconds: float
+    ) -> bool:
+        """Ping the server once the last check is older than `health_check_seconds`."""
+        if self.session is None:
+            return False
+        if time.monotonic() - self.checked_at < health_check_seconds:
+            return True
+
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout_seconds)
+        except Exception as e:  # noqa: BLE001, the session is reopened
+            logger.error(
+                "[McpClientPool] MCP server did not answer the ping, reconnecting",
+                tags={"server": self.server_name, "err": str(e)},
+            )
+            return False
+
+        self.checked_at = time.monotonic()
+        return True
+
+    async def get_tools(
+        self, tool_list_ttl_seconds: float, timeout_seconds: float
+    ) -> dict[str, BaseTool]:
+        if (
+            self.tools_loaded_at is None
+            or time.monotonic() - self.tools_loaded_at >= tool_list_ttl_seconds
+        ):
+            tools = await asyncio.wait_for(
+                self._load_tools(self.session), timeout_seconds
+            )
+            self.tools = {tool.name: tool for tool in tools}
+            self.tools_loaded_at = time.monotonic()
+        return self.tools
+
+    async def _run(self, opened: asyncio.Future) -> None:
+        try:
+            async with self._open_session(self.connection) as session:
+                await session.initialize()
+                self.session = session
+                opened.set_result(None)
+                await self._closing.wait()
+        except Exception as e:  # noqa: BLE001, surfaced to the opener or logged once the session is lost
+            if not opened.done():
+                opened.set_exception(e)
+            else:
+                logger.error(
+                    "[McpClientPool] MCP session closed unexpectedly",
+                    tags={"server": self.server_name, "err": str(e)},
+                )
+        finally:
+            self.session = None
+
+
+@dataclass(frozen=True)
+class McpSessionTimings:
+    tool_list_ttl_seconds: float
+    health_check_seconds: float
+    idle_seconds: float
+    timeout_seconds: float
+
+
+class McpClientPool:
+    """MCP sessions shared by every request, keyed by the server connection config.
+
+    Sessions live on a dedicated event loop thread, so agents built from sync code do not nest an event loop,
+    and only the first request of a config pays the connection setup and the tool listing.
+    A session is pinged once its last check is older than `health_check_seconds` and reopened when broken,
+    its tools are listed again once older than `tool_list_ttl_seconds`,
+    and it is closed after `idle_seconds` without being used, see `McpSessionTimings`.
+    """
+
+    def __init__(
+        self,
+        timings: McpSessionTimings,
+        open_session: Callable[
+            [dict[str, Any]], AbstractAsyncContextManager[ClientSession]
+        ] = create_session,
+        load_tools: Callable[
+            [ClientSession], Awaitable[list[BaseTool]]
+        ] = load_mcp_tools,
+    ) -> None:
+        self.timings = timings
+        self._open_session = open_session
+        self._load_tools = load_tools
+        # only touched from the pool event loop
+        self._sessions: dict[str, McpServerSession] = {}
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = Lock()
+
+    def get_tools(self, mcp_servers: dict[str, dict[str, Any]]) -> list[BaseTool]:
+        """Get the tools of every MCP server, from any thread, blocking until they are loaded."""
+        return self._submit(self._get_tools(mcp_servers)).result()
+
+    async def aget_tools(
+        self, mcp_servers: dict[str, dict[str, Any]]
+    ) -> list[BaseTool]:
+        """Get the tools of every MCP server, from any event loop."""
+        return await asyncio.wrap_future(self._submit(self._get_tools(mcp_servers)))
+
+    def close(self) -> None:
+        """Close every session and stop the pool event loop."""
+        with self._loop_lock:
+            loop = self._loop
+            self._loop = None
+        if loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_sessions(), loop).result(
+            self.timings.timeout_seconds
+        )
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _submit(self, coroutine: Coroutine[Any, Any, Result]) -> Future[Result]:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                Thread(
+                    target=self._loop.run_forever, name="mcp_client_pool", daemon=True
+                ).start()
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    async def _get_tools(
+        self, mcp_servers: dict[str, dict[str, Any]]
+    ) -> list[BaseTool]:
+        await self._close_idle_sessions()
+        server_tools = await asyncio.gather(
+            *(
+                self._get_server_tools(server_name, connection)
+                for server_name, connection in mcp_servers.items()
+            )
+        )
+        return [tool for tools in server_tools for tool in tools]
+
+    async def _get_server_tools(
+        self, server_name: str, connection: dict[str, Any]
+    ) -> list[BaseTool]:
+        session = await self._get_session(server_name, connection)
+        tools = await session.get_tools(
+            self.timings.tool_list_ttl_seconds, self.timings.timeout_seconds
+        )
+        return [
+            self._get_pooled_tool(server_name, connection, tool)
+            for tool in tools.values()
+        ]
+
+    async def _get_session(
+        self, server_name: str, connection: dict[str, Any]
+    ) -> McpServerSession:
+        key = get_agent_cache_key(connection=connection)
+        async with self._session_locks.setdefault(key, asyncio.Lock()):
+            session = self._sessions.get(key)
+            if session is not None and await session.is_healthy(
+                self.timings.health_check_seconds, self.timings.timeout_seconds
+            ):
+                session.used_at = time.monotonic()
+                return session
+
+            if session is not None:
+                del self._sessions[key]
+                await session.close()
+
+            session = McpServerSession(
+                server_name, connection, self._open_session, self._load_tools
+            )
+            await session.open(self.timings.timeout_seconds)
+            self._sessions[key] = session
+            return session
+
+    def _get_pooled_tool(
+        self, server_name: str, connection: dict[str, Any], tool: BaseTool
+    ) -> StructuredTool:
+        """Same tool, but every call runs on the current pool session of its server.
+
+        So a compiled agent keeps working after the session is reopened,
+        and the tool can be called from any thread or event loop.
+        """
+
+        async def call_pooled_tool(**arguments: Any) -> Any:  # noqa: ANN401, MCP tool arguments and output
+            session = await self._get_session(server_name, connection)
+            tools = await session.get_tools(
+                self.timings.tool_list_ttl_seconds, self.timings.timeout_seconds
+            )
+            if tool.name not in tools:
+                message = f"MCP tool {tool.name} is not served by {server_name} anymore"
+                raise ToolException(message)
+
+            try:
+                return await tools[tool.name].coroutine(**arguments)
+            except Exception:
+                # check the connection before the next call, instead of waiting for the health check interval
+                session.checked_at = float("-inf")
+                raise
+
+        async def acall_tool(**arguments: Any) -> Any:  # noqa: ANN401, MCP tool arguments and output
+            return await asyncio.wrap_future(
+                self._submit(call_pooled_tool(**arguments))
+            )
+
+        def call_tool(**arguments: Any) -> Any:  # noqa: ANN401, MCP tool arguments and output
+            return self._submit(call_pooled_tool(**arguments)).result()
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            func=call_tool,
+            coroutine=acall_tool,
+            response_format=tool.response_format,
+            metadata=tool.metadata,
+        )
+
+    async def _close_idle_sessions(self) -> None:
+        now = time.monotonic()
+        idle_keys = [
+            key
+            for key, session in self._sessions.items()
+            if now - session.used_at >= self.timings.idle_seconds
+            and not self._session_locks[key].locked()
+        ]
+        for key in idle_keys:
+            del self._session_locks[key]
+            await self._sessions.pop(key).close()
+
+    async def _close_sessions(self) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+
+
+mcp_client_pool = McpClientPool(
+    McpSessionTimings(
+        tool_list_ttl_seconds=global_config.mcp_tool_list_ttl_seconds,
+        health_check_seconds=global_config.mcp_health_check_seconds,
+        idle_seconds=global_config.mcp_session_idle_seconds,
+        timeout_seconds=global_config.mcp_timeout_seconds,
+    )
+)
@@ -7,10 +7,8 @@ from pydantic import BaseModel
 from zion.config import global_config
 from zion.data.agent_plugin.constant import AGENT_OPENAPI_PLUGIN_TYPE
 from zion.openapi.openapi_plugin import OpenAPIPlugin
-from zion.openapi.util import (
-    load_openapi_spec_from_http_plugin,
-    load_remote_openapi_file,
-)
+from zion.openapi.spec_cache import open_api_spec_cache
+from zion.openapi.util import load_openapi_spec_from_http_plugin
 
 
 class OpenAPIPluginToolSchema(BaseModel):
@@ -42,20 +40,20 @@ class OpenAPIPluginTool(BaseTool):
         )
 
         if plugin.api.ref != "":
-            open_api_spec = load_remote_openapi_file(
+            # cached, only downloaded again when the spec file changed in GitLab
+            open_api_spec = open_api_spec_cache.get_open_api_spec(
                 openapi_ref=plugin.api.ref,
-                filter_paths=plugin.api.include_paths,
+                filter_paths=plugin.api.include_paths or [],
                 ignored_definition_keys=ignored_definition_keys,
+                server_url=server_url,
             )
-            open_api_spec["servers"] = [{"url": server_url}]
         else:
-            open_api_spec = (
+            open_api_spec = yaml.dump(
                 load_openapi_spec_from_http_plugin(plugin.http_plugin_detail)
                 if plugin.http_plugin_detail is not None
-                else {}
+                else {},
+                indent=2,
             )
-
-        open_api_spec = yaml.dump(open_api_spec, indent=2)
         description = (
             f"Call this tool to get the OpenAPI spec (and usage guide) "
             f"for interacting with the {plugin.name_for_human} API. "
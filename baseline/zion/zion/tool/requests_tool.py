@@ -3,12 +3,16 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
+import httpx
 import requests
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from zion.data.agent_plugin.http_plugin import decrypt_base_headers_secret_value
 from zion.openapi.openapi_plugin import BaseHeaderConfig
+from zion.util.http_client.client import plugin_async_http_client
+
+REQUESTS_TOOL_TIMEOUT_SECONDS = 90
 
 
 class RequestsToolInput(BaseModel):
@@ -61,7 +65,7 @@ class RequestsTool(BaseTool):
     ) -> str:
         """Use the tool asynchronously."""
 
-        return self.http_request(
+        return await self.ahttp_request(
             http_method, http_full_url_with_query, http_headers, http_body
         )
 
@@ -75,21 +79,13 @@ class RequestsTool(BaseTool):
         res_body_text = ""
 
         try:
-            headers = json.loads(http_headers) if http_headers != "" else {}
-
-            header_config = [
-                BaseHeaderConfig(name=key, value=value)
-                for key, value in headers.items()
-            ]
-            decrypt_base_headers_secret_value(header_config)
-            headers = {
-                decrypted_header.name: decrypted_header.value
-                for decrypted_header in header_config
-            }
+            headers = self._get_headers(http_headers)
 
             if http_method.lower() == "get":
                 res = requests.get(
-                    url=http_full_url_with_query, headers=headers, timeout=90
+                    url=http_full_url_with_query,
+                    headers=headers,
+                    timeout=REQUESTS_TOOL_TIMEOUT_SECONDS,
                 )
                 res_body_text = res.json()
             elif http_method.lower() == "post":
@@ -98,7 +94,7 @@ class RequestsTool(BaseTool):
                     url=http_full_url_with_query,
                     headers=headers,
                     json=body,
-                    timeout=90,
+                    timeout=REQUESTS_TOOL_TIMEOUT_SECONDS,
                 )
                 res_body_text = res.json()
             elif http_method.lower() == "put":
@@ -107,7 +103,7 @@ class RequestsTool(BaseTool):
                     url=http_full_url_with_query,
                     headers=headers,
                     json=body,
-                    timeout=90,
+                    timeout=REQUESTS_TOOL_TIMEOUT_SECONDS,
                 )
                 res_body_text = res.json()
 
@@ -117,3 +113,53 @@ class RequestsTool(BaseTool):
             res_body_text = str(valueErr)
 
         return res_body_text
+
+    async def ahttp_request(
+        self,
+        http_method: str,
+        http_full_url_with_query: str,
+        http_headers: str = "",
+        http_body: str = "",
+    ) -> str:
+        res_body_text = ""
+
+        try:
+            headers = self._get_headers(http_headers)
+
+            if http_method.lower() == "get":
+                res = await plugin_async_http_client.request(
+                    "GET",
+                    http_full_url_with_query,
+                    headers=headers,
+                    timeout=REQUESTS_TOOL_TIMEOUT_SECONDS,
+                )
+                res_body_text = res.json()
+            elif http_method.lower() in {"post", "put"}:
+                body = json.loads(http_body) if http_body != "" else {}
+                res = await plugin_async_http_client.request(
+                    http_method.upper(),
+                    http_full_url_with_query,
+                    headers=headers,
+                    json=body,
+                    timeout=REQUESTS_TOOL_TIMEOUT_SECONDS,
+                )
+                res_body_text = res.json()
+
+        except httpx.HTTPError as e:
+            res_body_text = str(e)
+        except ValueError as valueErr:
+            res_body_text = str(valueErr)
+
+        return res_body_text
+
+    def _get_headers(self, http_headers: str) -> dict[str, str]:
+        headers = json.loads(http_headers) if http_headers != "" else {}
+
+        header_config = [
+            BaseHeaderConfig(name=key, value=value) for key, value in headers.items()
+        ]
+        decrypt_base_headers_secret_value(header_config)
+        return {
+            decrypted_header.name: decrypted_header.value
+            for decrypted_header in header_config
+        }
@@ -0,0 +1,103 @@
+import asyncio
+from typing import Any, ClassVar, Optional
+from unittest.mock import MagicMock, patch
+
+from langchain_core.tools import ToolException
+from pydantic import BaseModel, Field
+
+from zion.tool.cached_tool import (
+    CachedTool,
+    MemoryToolResultBackend,
+    ToolResultCache,
+)
+
+upstream_calls: list[str] = []
+
+
+class LookupInput(BaseModel):
+    query: str = Field(description="query")
+    limit: int = Field(default=5, description="limit")
+
+
+class LookupTool(CachedTool):
+    name: str = "lookup"
+    description: str = "Lookup."
+    args_schema: type[BaseModel] = LookupInput
+    handle_tool_error: bool = True
+    metadata: Optional[dict[str, Any]] = None
+    cache_ttl_seconds: ClassVar[float] = 60
+    cache_scope_keys: ClassVar[tuple[str, ...]] = ("space",)
+
+    def _run(self, query: str, limit: int = 5) -> str:
+        upstream_calls.append(query)
+        if query == "broken":
+            message = "upstream failed"
+            raise ToolException(message)
+        return f"{query}:{limit}"
+
+    async def _arun(self, query: str, limit: int = 5) -> str:
+        return self._run(query, limit)
+
+
+class UncachedLookupTool(LookupTool):
+    name: str = "uncached_lookup"
+    cache_enabled: ClassVar[bool] = False
+
+
+def test_cached_tool_caches_results_per_args_and_scope() -> None:
+    upstream_calls.clear()
+    with (
+        patch("zion.tool.cached_tool.statsd", MagicMock()) as mock_statsd,
+        patch(
+            "zion.tool.cached_tool.tool_result_cache",
+            ToolResultCache(MemoryToolResultBackend(max_size=16)),
+        ),
+    ):
+        lookup = LookupTool()
+        assert lookup.invoke({"query": "zion"}) == "zion:5"
+        # same call as a string input and with the default limit spelled out
+        assert lookup.invoke("zion") == "zion:5"
+        assert lookup.invoke({"limit": 5, "query": "zion"}) == "zion:5"
+        assert asyncio.run(lookup.ainvoke({"query": "zion"})) == "zion:5"
+        assert lookup.invoke({"query": "zion", "limit": 1}) == "zion:1"
+        # tools bound to another space do not share results, other metadata does not matter
+        assert LookupTool(metadata={"space": "ti"}).invoke("zion") == "zion:5"
+        assert LookupTool(metadata={"description": "other"}).invoke("zion") == "zion:5"
+        # errors are not cached
+        assert lookup.invoke("broken") == "upstream failed"
+        assert lookup.invoke("broken") == "upstream failed"
+        # opted out tools always call upstream
+        UncachedLookupTool().invoke("zion")
+        UncachedLookupTool().invoke("zion")
+
+    assert upstream_calls == [
+        "zion",
+        "zion",
+        "zion",
+        "broken",
+        "broken",
+        "zion",
+        "zion",
+    ]
+    results = [
+        call.kwargs["tags"]
+        for call in mock_statsd.track_count.call_args_list
+        if call.kwargs["tags"][1] == "result:hit"
+    ]
+    assert results == [["tool:lookup", "result:hit"]] * 4
+
+
+def test_memory_tool_result_backend_expires_and_evicts() -> None:
+    backend = MemoryToolResultBackend(max_size=2)
+    backend.set("expired", "value", ttl_seconds=0)
+    assert backend.get("expired") == (False, None)
+
+    backend.set("a", "1", ttl_seconds=60)
+    backend.set("b", "2", ttl_seconds=60)
+    assert backend.get("a") == (True, "1")
+    backend.set("c", "3", ttl_seconds=60)
+
+    # b is the least recently used entry
+    assert backend.get("b") == (False, None)
+    assert backend.get("a") == (True, "1")
+    assert len(backend) == 2  # noqa: PLR2004
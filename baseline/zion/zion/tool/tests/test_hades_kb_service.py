@@ -1,5 +1,9 @@
+import asyncio
+
+import httpx
 import pytest
 import requests_mock
+from langchain_core.runnables import RunnableLambda
 from langchain_core.tools import ToolException
 from requests import RequestException
 
@@ -9,6 +13,8 @@ from zion.tool.hades_kb_service import (
     HadesKnowledgeBaseTool,
     HadesKnowledgeBaseToolOutput,
 )
+from zion.tool.util import USER_PROMPT_CONFIG_KEY
+from zion.util.http_client.async_client import AsyncHttpClient
 
 
 @pytest.mark.parametrize(
@@ -40,3 +46,68 @@ def test_get_similar_past_conversation_error(url: str) -> None:
 
         with pytest.raises(ToolException):
             hades_http_client.get_similar_past_conversation(query="hi")
+
+
+def mock_hades_async_http_client(
+    monkeypatch: pytest.MonkeyPatch, transport: httpx.MockTransport
+) -> None:
+    monkeypatch.setattr(
+        "zion.tool.hades_kb_service.hades_async_http_client",
+        AsyncHttpClient(
+            name="hades_kb_service",
+            base_url=global_config.hades_kb_service_base_url,
+            transport=transport,
+        ),
+    )
+
+
+def test_aget_similar_past_conversation(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested_urls = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(200, json=HadesKnowledgeBaseToolOutput(result=[]).dict())
+
+    mock_hades_async_http_client(monkeypatch, httpx.MockTransport(handle))
+
+    async def search_twice() -> list[str]:
+        tool = HadesKnowledgeBaseTool()
+        return await asyncio.gather(
+            tool.aget_similar_past_conversation(query="hi"),
+            tool.aget_similar_past_conversation(query="hello"),
+        )
+
+    assert asyncio.run(search_twice()) == ["[]", "[]"]
+    assert (
+        requested_urls
+        == [f"{global_config.hades_kb_service_base_url}{hades_kb_endpoint}"] * 2
+    )
+
+
+def test_aget_similar_past_conversation_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_hades_async_http_client(
+        monkeypatch, httpx.MockTransport(lambda _: httpx.Response(500))
+    )
+
+    with pytest.raises(ToolException):
+        asyncio.run(HadesKnowledgeBaseTool().aget_similar_past_conversation(query="hi"))
+
+
+def test_search_payload_uses_user_prompt_of_run() -> None:
+    tool = HadesKnowledgeBaseTool()
+    search_in_run = RunnableLambda(
+        lambda query: (
+            tool._get_search_payload(query),  # noqa: SLF001
+            tool.get_cache_scope(),
+        )
+    )
+
+    payload, scope = search_in_run.invoke(
+        "job stuck",
+        config={"configurable": {USER_PROMPT_CONFIG_KEY: "why is my job stuck"}},
+    )
+
+    assert payload["query"] == "job stuck. why is my job stuck"
+    assert scope != tool.get_cache_scope()
@@ -0,0 +1,108 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+from zion.tool.mcp_client_pool import McpClientPool, McpSessionTimings
+
+MCP_SERVERS = {"echo": {"url": "http://echo/mcp/", "transport": "streamable_http"}}
+ECHO_ARGS_SCHEMA = {
+    "type": "object",
+    "properties": {"text": {"type": "string"}},
+    "required": ["text"],
+}
+
+
+class FakeSession:
+    def __init__(self, session_id: int) -> None:
+        self.session_id = session_id
+        self.is_alive = True
+        self.is_closed = False
+
+    async def initialize(self) -> None:
+        pass
+
+    async def send_ping(self) -> None:
+        if not self.is_alive:
+            message = "connection closed"
+            raise ConnectionError(message)
+
+
+class FakeMcpServer:
+    def __init__(self) -> None:
+        self.sessions: list[FakeSession] = []
+        self.tool_listings = 0
+
+    @asynccontextmanager
+    async def open_session(self, _: dict[str, Any]) -> AsyncIterator[FakeSession]:
+        session = FakeSession(len(self.sessions) + 1)
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.is_closed = True
+
+    async def load_tools(self, session: FakeSession) -> list[BaseTool]:
+        self.tool_listings += 1
+
+        async def echo(text: str) -> str:
+            return f"{text} from session {session.session_id}"
+
+        return [
+            StructuredTool(
+                name="echo",
+                description="Echo the text",
+                args_schema=ECHO_ARGS_SCHEMA,
+                coroutine=echo,
+            )
+        ]
+
+
+def create_mcp_client_pool(
+    server: FakeMcpServer, health_check_seconds: float
+) -> McpClientPool:
+    return McpClientPool(
+        McpSessionTimings(
+            tool_list_ttl_seconds=60,
+            health_check_seconds=health_check_seconds,
+            idle_seconds=60,
+            timeout_seconds=5,
+        ),
+        open_session=server.open_session,
+        load_tools=server.load_tools,
+    )
+
+
+def test_mcp_client_pool_reuses_session_and_tool_list() -> None:
+    server = FakeMcpServer()
+    pool = create_mcp_client_pool(server, health_check_seconds=60)
+
+    try:
+        tools = pool.get_tools(MCP_SERVERS)
+        assert [tool.name for tool in pool.get_tools(MCP_SERVERS)] == ["echo"]
+        assert len(server.sessions) == 1
+        assert server.tool_listings == 1
+
+        assert tools[0].invoke({"text": "hello"}) == "hello from session 1"
+    finally:
+        pool.close()
+
+    assert server.sessions[0].is_closed
+
+
+def test_mcp_client_pool_reconnects_broken_session() -> None:
+    server = FakeMcpServer()
+    pool = create_mcp_client_pool(server, health_check_seconds=0)
+
+    try:
+        tools = pool.get_tools(MCP_SERVERS)
+        server.sessions[0].is_alive = False
+
+        # a tool loaded before the reconnect runs on the new session
+        assert tools[0].invoke({"text": "hello"}) == "hello from session 2"
+        assert server.sessions[0].is_closed
+        # the tools are listed again on the new session
+        assert server.tool_listings == len(server.sessions)
+    finally:
+        pool.close()
@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING, Any, Optional, TypedDict
 if TYPE_CHECKING:
     from datetime import datetime
 
-import requests
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -23,6 +22,7 @@ from zion.tool.constant import general_search_tool_desc
 from zion.util import helix
 from zion.util.constant import DocumentTitle, DocumentUri
 from zion.util.helix import SERVICE_ACCOUNT_NAME
+from zion.util.http_client.client import helix_http_client
 
 HTTP_OK_STATUS = "OK"
 
@@ -242,8 +242,9 @@ class UniversalSearchTool(BaseTool):
             if metadata.get("PageNumber") is not None:
                 req_body["PageNumber"] = metadata["PageNumber"]
 
-        res = requests.post(
-            url=f"{global_config.helix_base_url}/api/kendra/{strategy}",
+        res = helix_http_client.request(
+            "POST",
+            f"/api/kendra/{strategy}",
             data=json.dumps(req_body),
             headers={
                 "x-auth-concedo-token": concedo_token,
@@ -252,6 +253,7 @@ class UniversalSearchTool(BaseTool):
             },
             timeout=10,
         )
+        helix.invalidate_helix_token_on_unauthorized(res)
 
         if res.reason != HTTP_OK_STATUS:
             err_msg = f"Kendra search failed with status code `{res.status_code}` and reason `{res.reason}`, response: {res.text}"
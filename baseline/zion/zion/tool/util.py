@@ -1,8 +1,14 @@
 from pathlib import Path
+from typing import Any
 
-from langchain import hub
+from langchain_core.runnables.config import ensure_config
 
-from zion.config import global_config, logger
+from zion.agent.prompt_registry import get_prompt_hub_handle, prompt_registry
+from zion.config import logger
+
+# request values the agent passes to its tools in the run config, see ZionAgent._get_tool_request_config
+USER_PROMPT_CONFIG_KEY = "user_prompt"
+QUERY_SOURCE_CONFIG_KEY = "query_source"
 
 
 def read_file(file_path: str) -> str:
@@ -14,23 +20,12 @@ def read_file(file_path: str) -> str:
     raise ValueError(err_msg)
 
 
-def _pull_prompt_hub_commit(hub_commit: str) -> str:
-    prompt = hub.pull(
-        owner_repo_commit=hub_commit,
-        api_url=global_config.langchain_endpoint,
-        api_key=global_config.langchain_api_key,
-    )
-    return prompt.template
-
-
 def get_prompt(
     prompt_hub_commit: str,
     fallback_prompt: str,
 ) -> str:
     try:
-        return _pull_prompt_hub_commit(
-            hub_commit=global_config.langsmith_handle_prefix + "/" + prompt_hub_commit
-        )
+        return prompt_registry.get(get_prompt_hub_handle(prompt_hub_commit))
 
     except (
         Exception  # noqa: BLE001, because we want to handle it gracefully
@@ -41,3 +36,11 @@ def get_prompt(
         )
 
     return fallback_prompt
+
+
+def get_tool_request_value(key: str, default: Any = None) -> Any:  # noqa: ANN401
+    """Request value of the current run, read from the configurable of the run config.
+
+    Compiled agents and their tools are shared across requests, so request values are never bound into a tool.
+    """
+    return ensure_config().get("configurable", {}).get(key, default)
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from datetime import datetime, timedelta
+from threading import Lock
 
 import pytz
 from datadog_api_client import ApiClient, Configuration
@@ -43,6 +44,19 @@ dd_config = Configuration(
         "appKeyAuth": global_config.datadog_app_key,
     },
 )
+dd_config.unstable_operations["query_scalar_data"] = True
+
+_metrics_api: MetricsApi | None = None
+_metrics_api_lock = Lock()
+
+
+def get_metrics_api() -> MetricsApi:
+    """Metrics API on one ApiClient, its connection pool is reused by every query."""
+    global _metrics_api  # noqa: PLW0603, lazily built singleton
+    with _metrics_api_lock:
+        if _metrics_api is None:
+            _metrics_api = MetricsApi(ApiClient(dd_config))
+        return _metrics_api
 
 
 # async def get_downstream_qps(service_name: str) -> dict:
@@ -51,8 +65,6 @@ def get_downstream_qps(service_name: str, env: str, endpoint_name: str = "*") ->
     if env == "":
         return {"Error": f"Environment value `{env}` is missing or not supported."}
 
-    dd_config.unstable_operations["query_scalar_data"] = True
-    api_client = ApiClient(dd_config)
     default_tags = DD_TAGS[env]
     body = ScalarFormulaQueryRequest(
         data=ScalarFormulaRequest(
@@ -87,7 +99,7 @@ def get_downstream_qps(service_name: str, env: str, endpoint_name: str = "*") ->
             type=ScalarFormulaRequestType.SCALAR_REQUEST,
         ),
     )
-    api_instance = MetricsApi(api_client)
+    api_instance = get_metrics_api()
     try:
         response = api_instance.query_scalar_data(body=body)
         logger.info(f"DEBUG: get_downstream_qps got Response: {response}")
@@ -129,8 +141,6 @@ def get_upstream_qps(service_name: str, env: str) -> dict:
     if env == "":
         return {"Error": f"Environment value `{env}` is missing or not supported."}
 
-    dd_config.unstable_operations["query_scalar_data"] = True
-    api_client = ApiClient(dd_config)
     default_tags = DD_TAGS[env]
     body = ScalarFormulaQueryRequest(
         data=ScalarFormulaRequest(
@@ -165,7 +175,7 @@ def get_upstream_qps(service_name: str, env: str) -> dict:
             type=ScalarFormulaRequestType.SCALAR_REQUEST,
         ),
     )
-    api_instance = MetricsApi(api_client)
+    api_instance = get_metrics_api()
     try:
         response = api_instance.query_scalar_data(body=body)
         logger.info(
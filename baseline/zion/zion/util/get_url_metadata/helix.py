@@ -2,15 +2,15 @@ import re
 from dataclasses import dataclass
 from typing import Any
 
-import requests
 from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
-from zion.config import global_config, logger
+from zion.config import logger
 from zion.tool.universal_search import HTTP_OK_STATUS
 from zion.util import helix
 from zion.util.constant import DocumentTitle, DocumentUri
 from zion.util.get_url_metadata.util import convert_html_to_markdown, remove_html_tags
+from zion.util.http_client.client import helix_http_client
 
 
 @dataclass
@@ -58,8 +58,10 @@ class ExtractHelixEntityMetadata:
         """calls helix to get helix entity metadata"""
         api_endpoint = f"/api/catalog/entities/by-name/{helix_entity_metadata.kind}/{helix_entity_metadata.namespace}/{helix_entity_metadata.entity_name}"
 
-        res = requests.get(
-            url=f"{global_config.helix_base_url}{api_endpoint}",
+        res = helix_http_client.request(
+            "GET",
+            api_endpoint,
+            metric_endpoint="/api/catalog/entities/by-name",
             headers={
                 "x-auth-concedo-token": concedo_token,
                 "Authorization": f"Bearer {helix_token}",
@@ -67,6 +69,7 @@ class ExtractHelixEntityMetadata:
             },
             timeout=10,
         )
+        helix.invalidate_helix_token_on_unauthorized(res)
         if res.reason != HTTP_OK_STATUS:
             err_msg = f"Kendra 'query_for_entity_metadata' failed with status code `{res.status_code}` and reason `{res.reason}`, response: {res.text}"
             logger.error(err_msg)
@@ -213,15 +216,17 @@ class ExtractHelixTechdocsContent:
 
         concedo_token, helix_token = helix.get_helix_token()
 
-        url_to_query = f"{global_config.helix_base_url}/api/techdocs/static/docs{document_title_url}/index.html"
-        res = requests.get(
-            url=url_to_query,
+        res = helix_http_client.request(
+            "GET",
+            f"/api/techdocs/static/docs{document_title_url}/index.html",
+            metric_endpoint="/api/techdocs/static/docs",
             headers={
                 "x-auth-concedo-token": concedo_token,
                 "Authorization": f"Bearer {helix_token}",
             },
             timeout=10,
         )
+        helix.invalidate_helix_token_on_unauthorized(res)
 
         if res.reason != HTTP_OK_STATUS:
             err_msg = f"Kendra 'query_helix_for_techdocs' failed with status code `{res.status_code}` and reason `{res.reason}`, response: {res.text}"
@@ -86,23 +86,39 @@ def is_gitlab_blob_url(blob_url: str) -> bool:
 
 def load_gitlab_file_in_dict(blob_url: str) -> dict[str, Any]:
     """Load GitLab file from the given URL and return th content as a dictionary"""
+    file_content, _ = load_gitlab_file_with_blob_id(blob_url)
+    return file_content
+
+
+def load_gitlab_file_with_blob_id(blob_url: str) -> tuple[dict[str, Any], str]:
+    """Load GitLab file from the given URL, return the content as a dictionary and the blob id (git SHA) of the file"""
     project_handle, branch_name, file_path = parse_gitlab_url(blob_url)
 
-    # Get the project from GitLab
-    project = gl_client.projects.get(project_handle)
+    # Lazy project, only the file is requested from GitLab
+    project = gl_client.projects.get(project_handle, lazy=True)
 
     # Get the file from GitLab
     file = project.files.get(file_path, ref=branch_name)
 
     if file_path.endswith(".json"):
-        return json.loads(file.decode())
+        return json.loads(file.decode()), file.blob_id
 
     if file_path.endswith((".yml", ".yaml")):
-        return yaml.safe_load(file.decode())
+        return yaml.safe_load(file.decode()), file.blob_id
 
     raise gitlab_load_dict_error
 
 
+def get_gitlab_file_blob_id(blob_url: str) -> str:
+    """Get the blob id (git SHA) of the GitLab file at the given URL with a HEAD request, without downloading it"""
+    project_handle, branch_name, file_path = parse_gitlab_url(blob_url)
+
+    project = gl_client.projects.get(project_handle, lazy=True)
+    file_headers = project.files.head(file_path, ref=branch_name)
+
+    return file_headers["X-Gitlab-Blob-Id"]
+
+
 # Input: https://gitlab.myteksi.net/techops-automation/helix-copilot/helix-copilot/-/blob/master/helixcopilotsdk/helixcopilotpb/helixcopilot.swagger.yml
 # Output: techops-automation/helix-copilot/helix-copilot, master, helixcopilotsdk/helixcopilotpb/helixcopilot.swagger.yml
 def parse_gitlab_url(url: str) -> tuple[str, str, str]:
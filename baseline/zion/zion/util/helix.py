@@ -1,28 +1,170 @@
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from threading import Lock, Thread
+from typing import Callable, Optional
+
+import jwt
 import requests
 
-from zion.config import global_config
+from zion.config import global_config, logger, statsd
 from zion.util.concedo import sign_concedo_token
+from zion.util.http_client.client import helix_http_client
 
 SERVICE_ACCOUNT_NAME = "svc.apex.tibot"
+METRIC_HELIX_TOKEN = "helix_token"  # noqa: S105, name of the metric, not a token
+
+
+@dataclass(frozen=True)
+class HelixToken:
+    concedo_token: str
+    helix_token: str
+    expires_at: float
+
+
+def exchange_helix_token() -> HelixToken:
+    """Signs a concedo token and exchanges it for a helix token.
+    The pair expires with the first of the two tokens to expire.
+    """
+    concedo_token = sign_concedo_token()
+
+    res = helix_http_client.request(
+        "POST",
+        "/api/exchangeToken",
+        headers={"Authorization": f"Bearer {concedo_token}"},
+        timeout=5,
+    )
+    res_body_text = res.json()
+    helix_token = res_body_text["token"]
+
+    return HelixToken(
+        concedo_token=concedo_token,
+        helix_token=helix_token,
+        expires_at=min(get_token_expiry(concedo_token), get_token_expiry(helix_token)),
+    )
+
+
+def get_token_expiry(token: str) -> float:
+    """exp claim of a jwt, the signature is verified by whoever the token is sent to."""
+    try:
+        return float(jwt.decode(token, options={"verify_signature": False})["exp"])
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        # not a jwt, or no expiry, it is assumed to live for the default ttl
+        return time.time() + global_config.helix_token_default_ttl_seconds
+
+
+class HelixTokenManager:
+    """Cache of the exchanged helix token, shared by every thread.
+
+    The token is reused until `expiry_margin_seconds` before it expires. Once within `refresh_ahead_seconds`
+    of its expiry, one background refresh is started and the cached token keeps being served.
+    When no valid token is cached, the first caller refreshes and concurrent callers wait for it (single flight).
+    A token rejected by helix is dropped with `invalidate`, see `invalidate_helix_token_on_unauthorized`.
+    """
+
+    def __init__(
+        self,
+        expiry_margin_seconds: float,
+        refresh_ahead_seconds: float,
+        exchange_token: Callable[[], HelixToken] = exchange_helix_token,
+    ) -> None:
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._exchange_token = exchange_token
+        self._token: Optional[HelixToken] = None
+        self._refresh_lock = Lock()
+        self._background_refresh: Optional[Thread] = None
+        self._background_refresh_lock = Lock()
+
+    def get_token(self) -> HelixToken:
+        token = self._token
+        if token is not None and self._is_valid(token):
+            statsd.track_count(metric=METRIC_HELIX_TOKEN, tags=["result:hit"])
+            if time.time() >= token.expires_at - self.refresh_ahead_seconds:
+                self._start_background_refresh()
+            return token
+
+        with self._refresh_lock:
+            # refreshed by another caller while waiting for the lock
+            token = self._token
+            if token is not None and self._is_valid(token):
+                statsd.track_count(metric=METRIC_HELIX_TOKEN, tags=["result:hit"])
+                return token
+            return self._refresh()
+
+    def invalidate(self) -> None:
+        self._token = None
+
+    def _is_valid(self, token: HelixToken) -> bool:
+        return time.time() < token.expires_at - self.expiry_margin_seconds
+
+    def _refresh(self) -> HelixToken:
+        try:
+            token = self._exchange_token()
+        except Exception:
+            statsd.track_count(metric=METRIC_HELIX_TOKEN, tags=["result:refresh_error"])
+            raise
+        statsd.track_count(metric=METRIC_HELIX_TOKEN, tags=["result:refresh"])
+        self._token = token
+        return token
+
+    def _start_background_refresh(self) -> None:
+        # not the refresh lock, a hit does not wait for a refresh in flight
+        with self._background_refresh_lock:
+            if (
+                self._background_refresh is not None
+                and self._background_refresh.is_alive()
+            ):
+                return
+            self._background_refresh = Thread(
+                target=self._refresh_in_background,
+                name="zion-helix-token-refresh",
+                daemon=True,
+            )
+            self._background_refresh.start()
+
+    def _refresh_in_background(self) -> None:
+        with self._refresh_lock:
+            token = self._token
+            if (
+                token is not None
+                and time.time() < token.expires_at - self.refresh_ahead_seconds
+            ):
+                return
+            try:
+                self._refresh()
+            except Exception as e:  # noqa: BLE001, the cached token is served until it expires
+                logger.error(
+                    f"[HelixTokenManager] background refresh failed: {e!s}",
+                )
+
+
+helix_token_manager = HelixTokenManager(
+    expiry_margin_seconds=global_config.helix_token_expiry_margin_seconds,
+    refresh_ahead_seconds=global_config.helix_token_refresh_ahead_seconds,
+)
 
 
 # first is concedo token
 # second is helix token
 def get_helix_token() -> tuple[str, str]:
     """Gets concedo token and helix token.
-    performs exchange token using the concedo token to get a jwt token for helix.
+    performs exchange token using the concedo token to get a jwt token for helix,
+    the tokens are cached by the helix token manager until shortly before they expire.
     """
     try:
-        concedo_token = sign_concedo_token()
-
-        res = requests.post(
-            url=f"{global_config.helix_base_url}/api/exchangeToken",
-            headers={"Authorization": f"Bearer {concedo_token}"},
-            timeout=5,
-        )
-        res_body_text = res.json()
-
-        return concedo_token, res_body_text["token"]
+        token = helix_token_manager.get_token()
     except (requests.exceptions.RequestException, Exception) as e:
         err_msg = f"Unable to get helix exchange token with error: {e!s}"
         raise ConnectionError(err_msg) from e
+    else:
+        return token.concedo_token, token.helix_token
+
+
+def invalidate_helix_token_on_unauthorized(response: requests.Response) -> None:
+    """Drop the cached tokens when helix rejects them, e.g. revoked before they expire, the next call exchanges new ones."""
+    if response.status_code == HTTPStatus.UNAUTHORIZED:
+        logger.error(
+            "[HelixTokenManager] helix rejected the cached token, invalidating it"
+        )
+        helix_token_manager.invalidate()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+from typing import Any, Optional
+
+import httpx
+
+from zion.config import global_config
+
+
+class AsyncHttpClient:
+    """Keep-alive connection pool of one upstream, for tools that run natively async.
+
+    An httpx.AsyncClient is bound to the event loop it is used on, so the pool is only kept on the event loop
+    of the server, bound on startup with `bind_event_loop` and closed on shutdown with `aclose`.
+    Requests from any other event loop, e.g. asyncio.run in a worker thread, use a client of their own
+    that is closed with the request, so no client outlives its event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = "",
+        timeout_seconds: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.name = name
+        self.base_url = base_url
+        self.timeout_seconds = (
+            global_config.http_client_timeout_seconds
+            if timeout_seconds is None
+            else timeout_seconds
+        )
+        self._transport = transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = Lock()
+
+    def bind_event_loop(self) -> None:
+        """Keep the connection pool on the running event loop."""
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+
+    def get_client(self) -> Optional[httpx.AsyncClient]:
+        """Get the pooled client, None when the running event loop is not the bound one."""
+        if asyncio.get_running_loop() is not self._loop:
+            return None
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = self._create_client()
+            return self._client
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str = "",
+        **kwargs: Any,  # noqa: ANN401, forwarded to httpx
+    ) -> httpx.Response:
+        url = f"{self.base_url}{endpoint}"
+        client = self.get_client()
+        if client is not None:
+            return await client.request(method, url, **kwargs)
+
+        # the response is read before the client is closed
+        async with self._create_client() as unpooled_client:
+            return await unpooled_client.request(method, url, **kwargs)
+
+    async def get(
+        self,
+        endpoint: str = "",
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        **kwargs: Any,  # noqa: ANN401, forwarded to httpx
+    ) -> dict:
+        """
+        Perform a GET request on the pooled client.
+        """
+        response = await self.request(
+            "GET", endpoint, params=params, headers=headers, **kwargs
+        )
+        response.raise_for_status()  # Raise an exception for 4xx/5xx responses if any
+        return response.json()
+
+    async def post(
+        self,
+        endpoint: str = "",
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        **kwargs: Any,  # noqa: ANN401, forwarded to httpx
+    ) -> dict | None:
+        """
+        Perform a POST request on the pooled client.
+        """
+        response = await self.request(
+            "POST", endpoint, data=data, json=json, headers=headers, **kwargs
+        )
+        response.raise_for_status()  # Raise an exception for 4xx/5xx responses if any
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the pooled client, on the bound event loop."""
+        with self._lock:
+            client = self._client
+            self._client = None
+            self._loop = None
+        if client is not None:
+            await client.aclose()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=global_config.http_client_max_connections,
+                max_keepalive_connections=global_config.http_client_max_keepalive_connections,
+                keepalive_expiry=global_config.http_client_keepalive_expiry_seconds,
+            ),
+            http2=global_config.http_client_http2,
+            transport=self._transport,
+        )
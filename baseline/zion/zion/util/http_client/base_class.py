@@ -1,47 +1,126 @@
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any, Optional
 
 import requests
-from requests import RequestException, Session
+from requests import RequestException, Response, Session
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from zion.config import logger
+from zion.config import global_config, logger, statsd
+from zion.stats.datadog import DatadogClient
+
+# retried with backoff, together with connection errors, for idempotent methods only
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def get_default_retry() -> Retry:
+    """Retry policy of the http clients unless one is given, with the retries and backoff of the global config."""
+    return Retry(
+        total=global_config.http_client_max_retries,
+        backoff_factor=global_config.http_client_retry_backoff_seconds,
+        status_forcelist=RETRY_STATUS_CODES,
+        # the last response is returned instead of raising, callers check the status
+        raise_on_status=False,
+    )
 
 
 class HttpClient:
-    def __init__(self, name: str, base_url: str) -> None:
+    """Pooled HTTP client of one upstream, shared by every thread.
+
+    The session and its connection pool live as long as the client, so connections are kept alive across calls.
+    Connection errors and `RETRY_STATUS_CODES` are retried with exponential backoff, see `get_default_retry`,
+    requests get a default timeout, and the latency of every request is tracked as a histogram per endpoint.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = "",
+        pool_maxsize: Optional[int] = None,
+        retry: Optional[Retry] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> None:
         self.base_url = base_url
+        self.timeout_seconds = (
+            global_config.http_client_timeout_seconds
+            if timeout_seconds is None
+            else timeout_seconds
+        )
         self.session = requests.Session()
         self.__logger = logger
         self.__name = name
 
+        # Create an HTTPAdapter object and configure connection pooling and retries
+        adapter = HTTPAdapter(
+            pool_connections=global_config.http_client_pool_connections,
+            pool_maxsize=(
+                global_config.http_client_pool_maxsize
+                if pool_maxsize is None
+                else pool_maxsize
+            ),
+            max_retries=get_default_retry() if retry is None else retry,
+        )
+
+        # Mount the HTTPAdpater object to the session
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """
-        Context manager to provide a session and ensure proper cleanup.
+        Context manager to provide the pooled session and handle its errors.
         """
         try:
-            # Create an HTTPAdapter object and configure connection pooling and retries
-            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=5, max_retries=3)
-
-            # Mount the HTTPAdpater object to the session
-            self.session.mount("https://", adapter)
-            self.session.mount("http://", adapter)
             yield self.session
         except ConnectionError as e:
-            error_message = f"Hades kb service client error: {e!s}"
+            error_message = f"{self.__name} client error: {e!s}"
             self.__logger.exception(error_message)
         except RequestException as e:
             res_body_text = f"http request failed: {e!s}"
             self.__logger.exception(res_body_text)
             raise RequestException(res_body_text) from e
+
+    def request(
+        self,
+        method: str,
+        endpoint: str = "",
+        session: Optional[Session] = None,
+        metric_endpoint: Optional[str] = None,
+        **kwargs: Any,  # noqa: ANN401, forwarded to requests
+    ) -> Response:
+        """
+        Perform a request on the pooled session.
+        `metric_endpoint` tags the latency histogram, it defaults to the endpoint without its query.
+        """
+        kwargs.setdefault("timeout", self.timeout_seconds)
+        if session is None:
+            session = self.session
+
+        start_time = time.perf_counter()
+        status = "error"
+        try:
+            response = session.request(method, f"{self.base_url}{endpoint}", **kwargs)
+            status = str(response.status_code)
+            return response
         finally:
-            self.session.close()
+            if metric_endpoint is None:
+                metric_endpoint = endpoint.split("?")[0] or "/"
+            statsd.track_elapsed(
+                metric=DatadogClient.METRIC_EXTERNAL,
+                value=time.perf_counter() - start_time,
+                tags=[
+                    f"service:{self.__name}",
+                    f"endpoint:{metric_endpoint}",
+                    f"method:{method.upper()}",
+                    f"status:{status}",
+                ],
+            )
 
     def get(
         self,
-        session: Session,
+        session: Optional[Session] = None,
         endpoint: str = "",
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
@@ -53,13 +132,15 @@ class HttpClient:
         if headers:
             kwargs.setdefault("headers", {}).update(headers)
 
-        response = session.get(f"{self.base_url}{endpoint}", params=params, **kwargs)
+        response = self.request(
+            "GET", endpoint, session=session, params=params, **kwargs
+        )
         response.raise_for_status()  # Raise an exception for 4xx/5xx responses if any
         return response.json()
 
     def post(
         self,
-        session: Session,
+        session: Optional[Session] = None,
         endpoint: str = "",
         data: Optional[dict] = None,
         json: Optional[dict] = None,
@@ -72,8 +153,11 @@ class HttpClient:
         if headers:
             kwargs.setdefault("headers", {}).update(headers)
 
-        response = session.post(
-            f"{self.base_url}{endpoint}", data=data, json=json, **kwargs
+        response = self.request(
+            "POST", endpoint, session=session, data=data, json=json, **kwargs
         )
         response.raise_for_status()  # Raise an exception for 4xx/5xx responses if any
         return response.json()
+
+    def close(self) -> None:
+        self.session.close()
@@ -1,8 +1,58 @@
 from zion.config import global_config
+from zion.util.http_client.async_client import AsyncHttpClient
 from zion.util.http_client.base_class import HttpClient
 
 # Base Url
 hades_kb_service_url = global_config.hades_kb_service_base_url
+gitlab_api_url = "https://gitlab.myteksi.net/api/v4"
 
-# Singleton http client
+# Singleton http clients, one connection pool per upstream
 hades_http_client = HttpClient(name="hades_kb_service", base_url=hades_kb_service_url)
+glean_http_client = HttpClient(name="glean", base_url=global_config.glean_base_url)
+# helix also serves the kendra search
+helix_http_client = HttpClient(name="helix", base_url=global_config.helix_base_url)
+kibana_http_client = HttpClient(name="kibana", base_url=global_config.kibana_base_url)
+gitlab_http_client = HttpClient(name="gitlab", base_url=gitlab_api_url)
+
+# Singleton async http clients, one connection pool per upstream
+hades_async_http_client = AsyncHttpClient(
+    name="hades_kb_service", base_url=hades_kb_service_url
+)
+glean_async_http_client = AsyncHttpClient(
+    name="glean", base_url=global_config.glean_base_url
+)
+kibana_async_http_client = AsyncHttpClient(
+    name="kibana", base_url=global_config.kibana_base_url
+)
+# for the urls of the http / openapi plugins
+plugin_async_http_client = AsyncHttpClient(name="agent_plugin")
+async_http_clients = (
+    hades_async_http_client,
+    glean_async_http_client,
+    kibana_async_http_client,
+    plugin_async_http_client,
+)
+
+
+def close_http_clients() -> None:
+    """Close the connection pools of the http clients."""
+    for http_client in (
+        hades_http_client,
+        glean_http_client,
+        helix_http_client,
+        kibana_http_client,
+        gitlab_http_client,
+    ):
+        http_client.close()
+
+
+def bind_async_http_clients() -> None:
+    """Keep the connection pools of the async http clients on the running event loop, the one of the server."""
+    for async_http_client in async_http_clients:
+        async_http_client.bind_event_loop()
+
+
+async def aclose_async_http_clients() -> None:
+    """Close the connection pools of the async http clients."""
+    for async_http_client in async_http_clients:
+        await async_http_client.aclose()
@@ -1,5 +1,8 @@
+import hashlib
 import json
-from typing import Any
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
 
 from langchain.schema import AIMessage, HumanMessage
 from langchain_core.documents import Document
@@ -31,6 +34,79 @@ from zion.util.gpt import (
     split_document,
 )
 
+# message fields that are not sent to the model, so they do not change the token count
+MESSAGE_FIELDS_NOT_TOKENIZED = {"id", "response_metadata", "usage_metadata"}
+
+
+class MessageTokenCounter:
+    """LRU cache of the token count of each message, as counted by get_num_tokens_from_messages.
+
+    get_num_tokens_from_messages is the sum of a count per message plus the priming of the reply,
+    so the count of any list of messages is a sum of cached counts and every message is tokenized once.
+    Messages are keyed by a hash of their fields, a message whose content is changed in place is a new entry.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._token_counts: OrderedDict[str, int] = OrderedDict()
+        self._lock = Lock()
+
+    def get_message_token_count(
+        self, chat_open_ai: ChatGrabGPT, message: BaseMessage
+    ) -> int:
+        key = get_message_token_count_key(chat_open_ai.model_name, message)
+        return self._get_or_count(
+            key,
+            lambda: chat_open_ai.get_num_tokens_from_messages([message])
+            - self.get_reply_token_count(chat_open_ai),
+        )
+
+    def get_reply_token_count(self, chat_open_ai: ChatGrabGPT) -> int:
+        return self._get_or_count(
+            chat_open_ai.model_name,
+            lambda: chat_open_ai.get_num_tokens_from_messages([]),
+        )
+
+    def get_num_tokens_from_messages(
+        self, chat_open_ai: ChatGrabGPT, messages: list[BaseMessage]
+    ) -> int:
+        return self.get_reply_token_count(chat_open_ai) + sum(
+            self.get_message_token_count(chat_open_ai, message) for message in messages
+        )
+
+    def _get_or_count(self, key: str, count: Callable[[], int]) -> int:
+        with self._lock:
+            if key in self._token_counts:
+                self._token_counts.move_to_end(key)
+                return self._token_counts[key]
+
+        # tokenize outside of the lock, a message counted twice by racing requests has the same count
+        token_count = count()
+        if self.max_size <= 0:
+            return token_count
+
+        with self._lock:
+            self._token_counts[key] = token_count
+            self._token_counts.move_to_end(key)
+            while len(self._token_counts) > self.max_size:
+                self._token_counts.popitem(last=False)
+
+        return token_count
+
+
+def get_message_token_count_key(model_name: str, message: BaseMessage) -> str:
+    encoded_message = json.dumps(
+        message.model_dump(exclude=MESSAGE_FIELDS_NOT_TOKENIZED),
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(f"{model_name}:{encoded_message}".encode()).hexdigest()
+
+
+message_token_counter = MessageTokenCounter(
+    max_size=global_config.token_count_cache_size
+)
+
 
 def is_message_gpt_function_call(message: BaseMessageChunk) -> bool:
     """is_message_gpt_function_call checks if the given message is a AI Message Chunk trying to perform function calling"""
@@ -140,8 +216,8 @@ class OptimizeDocumentResultToken:
         self, messages: list[BaseMessage]
     ) -> list[BaseMessage]:
         self.messages = messages
-        num_tokens = self.optimize_token_chat_open_ai.get_num_tokens_from_messages(
-            self.messages
+        num_tokens = message_token_counter.get_num_tokens_from_messages(
+            self.optimize_token_chat_open_ai, self.messages
         )
         if (num_tokens - self.max_token) > self.max_token_difference_to_optimize:
             # the document user pass in is too long, we dont perform optimize token
@@ -182,6 +258,10 @@ class OptimizeDocumentResultToken:
                         longest_doc = Document(page_content=message.content)
                         document_item_collection: list[Document] = [longest_doc]
                         longest_doc_index = 0
+                    # only the shortened message is recounted, the message is changed in place
+                    message_token_count = message_token_counter.get_message_token_count(
+                        self.optimize_token_chat_open_ai, message
+                    )
                     self.shorten_documents(
                         index,
                         document_item_collection,
@@ -189,12 +269,13 @@ class OptimizeDocumentResultToken:
                         longest_doc,
                         message,
                     )
-
-                num_tokens = (
-                    self.optimize_token_chat_open_ai.get_num_tokens_from_messages(
-                        self.messages
+                    num_tokens += (
+                        message_token_counter.get_message_token_count(
+                            self.optimize_token_chat_open_ai, self.messages[index]
+                        )
+                        - message_token_count
                     )
-                )
+
                 if num_tokens < self.max_token:
                     break
 
@@ -246,16 +327,19 @@ class OptimizeMessageToken:
         iterate through message, add last n messages into message until it is less than token limit
         """
         new_messages: list[BaseMessage] = []
+        num_token = message_token_counter.get_reply_token_count(
+            self.optimize_token_chat_open_ai
+        )
         reversed_messages = reversed(messages)
         for message in reversed_messages:
-            new_messages.append(message)
-            num_token = self.optimize_token_chat_open_ai.get_num_tokens_from_messages(
-                new_messages
+            # running sum of the cached count of each message, instead of recounting new_messages
+            num_token += message_token_counter.get_message_token_count(
+                self.optimize_token_chat_open_ai, message
             )
             if num_token >= token_limit:
-                # remove last element as it exceeded limit
-                new_messages.pop()
+                # leave out the message that exceeded limit
                 break
+            new_messages.append(message)
 
         return list(reversed(new_messages))
 
@@ -265,14 +349,14 @@ class OptimizeMessageToken:
         """Get the token limit for chat history between human and ai message"""
 
         # get the total token count for all messages
-        total_token_count = (
-            self.optimize_token_chat_open_ai.get_num_tokens_from_messages(self.messages)
+        total_token_count = message_token_counter.get_num_tokens_from_messages(
+            self.optimize_token_chat_open_ai, self.messages
         )
 
         # get the total count for all conversation messages, aka messages with type human and ai
         conversation_message_token_count = (
-            self.optimize_token_chat_open_ai.get_num_tokens_from_messages(
-                conversation_message
+            message_token_counter.get_num_tokens_from_messages(
+                self.optimize_token_chat_open_ai, conversation_message
             )
         )
         non_conversation_token_count = (
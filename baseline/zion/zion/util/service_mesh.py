@@ -1,6 +1,11 @@
 import base64
+import contextvars
+import copy
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Optional
 from urllib.parse import quote
 
 import requests
@@ -9,6 +14,105 @@ import yaml
 from zion.config import global_config, logger, statsd
 from zion.stats.datadog import DatadogClient
 from zion.util.datadog.datadog_client import get_downstream_qps, get_upstream_qps
+from zion.util.http_client.client import gitlab_api_url, gitlab_http_client
+
+MESH_CONFIG_PROJECT_ID = 15891
+
+
+class MeshConfigCacheEntry:
+    def __init__(self, blob_id: str, mesh_config: dict) -> None:
+        self.blob_id = blob_id
+        self.mesh_config = mesh_config
+        self.revalidated_at = time.monotonic()
+
+
+class MeshConfigCache:
+    """Cache of downloaded service mesh configs, keyed by file path.
+
+    Every entry remembers the GitLab blob id (git SHA) it was parsed from.
+    Once `revalidate_seconds` passed, a HEAD request compares the blob id first,
+    the file is only downloaded again when it changed.
+    When GitLab is unavailable, the cached config keeps being served.
+    """
+
+    def __init__(
+        self,
+        revalidate_seconds: float,
+        get_blob_id: Callable[[str], Optional[str]],
+    ) -> None:
+        self.revalidate_seconds = revalidate_seconds
+        self._get_blob_id = get_blob_id
+        self._entries: dict[str, MeshConfigCacheEntry] = {}
+        self._lock = Lock()
+
+    def get(self, file_path: str) -> Optional[dict]:
+        """Cached config of the file, None when it is not cached or changed."""
+        with self._lock:
+            entry = self._entries.get(file_path)
+
+        if entry is None:
+            return None
+        if time.monotonic() - entry.revalidated_at >= self.revalidate_seconds:
+            if not self._is_unchanged(file_path, entry):
+                return None
+            entry.revalidated_at = time.monotonic()
+        # callers are free to change the config they get
+        return copy.deepcopy(entry.mesh_config)
+
+    def set(self, file_path: str, blob_id: str, mesh_config: dict) -> None:
+        with self._lock:
+            self._entries[file_path] = MeshConfigCacheEntry(
+                blob_id, copy.deepcopy(mesh_config)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _is_unchanged(self, file_path: str, entry: MeshConfigCacheEntry) -> bool:
+        try:
+            return self._get_blob_id(file_path) == entry.blob_id
+        except Exception as e:  # noqa: BLE001, serve the cached config while GitLab is unavailable
+            logger.error(
+                "[MeshConfigCache] Unable to revalidate mesh config, serving the cached one",
+                tags={"file_path": file_path, "err": str(e)},
+            )
+            return True
+
+
+class QpsCache:
+    """Cache of the QPS between a service and its upstreams or downstreams, for `ttl_seconds`.
+    QPS are averaged over the last 7 days, so they barely move within the ttl.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, str, str], tuple[float, dict]] = {}
+        self._lock = Lock()
+
+    def get_or_query(
+        self,
+        direction: str,
+        get_qps: Callable[[str, str], dict],
+        service_name: str,
+        env: str,
+    ) -> dict:
+        key = (direction, service_name, env)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return dict(entry[1])
+
+        qps = get_qps(service_name, env)
+        # errors, such as an unsupported env, are not cached
+        if qps is not None and "Error" not in qps:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), dict(qps))
+        return qps
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 def get_service_mesh(
@@ -20,15 +124,39 @@ def get_service_mesh(
         "event_type": "tools.mesh",
     }
 
-    # List upstreams and downstreams
-    streams = download_upstreams_downstreams(service_name, env)
+    # List upstreams and downstreams from GitLab, while querying service QPS from Datadog
+    # each call runs in a copy of the caller context, so the tracing and request contextvars follow it
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        streams_future = executor.submit(
+            contextvars.copy_context().run,
+            download_upstreams_downstreams,
+            service_name,
+            env,
+        )
+        upstream_qps_future = executor.submit(
+            contextvars.copy_context().run,
+            qps_cache.get_or_query,
+            "upstream",
+            get_upstream_qps,
+            service_name,
+            env,
+        )
+        downstream_qps_future = executor.submit(
+            contextvars.copy_context().run,
+            qps_cache.get_or_query,
+            "downstream",
+            get_downstream_qps,
+            service_name,
+            env,
+        )
+    streams = streams_future.result()
     result = {"env": streams.get("env"), "service": streams.get("service")}
 
     # Query service QPS
     upstream_qps, downstream_qps = {}, {}
     try:
-        upstream_qps = get_upstream_qps(service_name, env)
-        downstream_qps = get_downstream_qps(service_name, env)
+        upstream_qps = upstream_qps_future.result()
+        downstream_qps = downstream_qps_future.result()
         logger.info(
             "DEBUG: Queried Upstream QPS for service name `%s`. Received: %s",
             service_name,
@@ -83,6 +211,15 @@ def download_mesh_config(
     # -> It's recommended to add the asterisk (*) before the boolean parameter (this case, maybe we should keep the boolean parameters as the last ones).
     # The asterisk (*) in the function definition forces `outbound` to be a keyword-only argument, and providing a default value makes it optional.
 
+    if outbound == 1:
+        file_path = f"services/{service_name}/{env}/smi-outbound-config.yaml"
+    else:
+        file_path = f"services/{service_name}/{env}/smi-inbound-config.yaml"
+
+    mesh_config = mesh_config_cache.get(file_path)
+    if mesh_config is not None:
+        return mesh_config
+
     # Before triggering external request
     start_time = time.perf_counter()
     log_tags = {
@@ -94,17 +231,16 @@ def download_mesh_config(
         "tool:download_mesh_config",
     ]
 
-    if outbound == 1:
-        file_path = f"services/{service_name}/{env}/smi-outbound-config.yaml"
-    else:
-        file_path = f"services/{service_name}/{env}/smi-inbound-config.yaml"
-
-    encoded_file_path = quote(file_path, safe="")
-    url = f"https://gitlab.myteksi.net/api/v4/projects/15891/repository/files/{encoded_file_path}?ref=main"
+    endpoint = get_mesh_config_endpoint(file_path)
+    url = f"{gitlab_api_url}{endpoint}"
     # Example: https://gitlab.myteksi.net/api/v4/projects/15891/repository/files/services%2Fabacus%2Fprd%2Fsmi-inbound-config.yaml?ref=main
 
-    response = requests.get(
-        url, headers={"PRIVATE-TOKEN": global_config.gitlab_api_token}, timeout=10
+    response = gitlab_http_client.request(
+        "GET",
+        endpoint,
+        metric_endpoint="/projects/repository/files",
+        headers={"PRIVATE-TOKEN": global_config.gitlab_api_token},
+        timeout=10,
     )
 
     # Tracking when request completes
@@ -141,10 +277,32 @@ def download_mesh_config(
     # The request got success
     statsd.track_success(metric=DatadogClient.METRIC_EXTERNAL, tags=stat_tags)
 
-    file_content = response.json()["content"]
-    file_content = base64.b64decode(file_content).decode("utf-8")
+    response_body = response.json()
+    file_content = base64.b64decode(response_body["content"]).decode("utf-8")
+    mesh_config = yaml.safe_load(file_content)
+
+    if isinstance(mesh_config, dict) and response_body.get("blob_id"):
+        mesh_config_cache.set(file_path, response_body["blob_id"], mesh_config)
+    return mesh_config
 
-    return yaml.safe_load(file_content)
+
+def get_mesh_config_endpoint(file_path: str) -> str:
+    encoded_file_path = quote(file_path, safe="")
+    return f"/projects/{MESH_CONFIG_PROJECT_ID}/repository/files/{encoded_file_path}?ref=main"
+
+
+def get_mesh_config_blob_id(file_path: str) -> Optional[str]:
+    """Get the blob id (git SHA) of the mesh config file with a HEAD request, without downloading it"""
+    response = gitlab_http_client.request(
+        "HEAD",
+        get_mesh_config_endpoint(file_path),
+        metric_endpoint="/projects/repository/files",
+        headers={"PRIVATE-TOKEN": global_config.gitlab_api_token},
+        timeout=10,
+    )
+    if response.status_code != requests.codes.ok:
+        return None
+    return response.headers.get("X-Gitlab-Blob-Id")
 
 
 def download_upstreams_downstreams(service_name: str, env: str) -> dict:
@@ -153,8 +311,25 @@ def download_upstreams_downstreams(service_name: str, env: str) -> dict:
     log_tags = {
         "event_type": "tools.mesh",
     }
+    # both files are downloaded at once, each in a copy of the caller context
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        inbound_future = executor.submit(
+            contextvars.copy_context().run,
+            download_mesh_config,
+            service_name,
+            env,
+            outbound=False,
+        )
+        outbound_future = executor.submit(
+            contextvars.copy_context().run,
+            download_mesh_config,
+            service_name,
+            env,
+            outbound=True,
+        )
+
     downstreams = []
-    inbound_resp = download_mesh_config(service_name, env, outbound=False)
+    inbound_resp = inbound_future.result()
     logger.info(
         f"DEBUG: download_upstreams_downstreams for service `{service_name}` in {env}. Received inbound Response: {inbound_resp}",
         tags=log_tags,
@@ -166,7 +341,7 @@ def download_upstreams_downstreams(service_name: str, env: str) -> dict:
                 downstreams.append(s_name)
 
     upstreams = []
-    outbound_resp = download_mesh_config(service_name, env, outbound=True)
+    outbound_resp = outbound_future.result()
     logger.info(
         f"DEBUG: download_upstreams_downstreams for service `{service_name}` in {env}. Received outbound Response: {outbound_resp}",
         tags=log_tags,
@@ -184,3 +359,10 @@ def download_upstreams_downstreams(service_name: str, env: str) -> dict:
         "downstreams": downstreams,
         "upstreams": upstreams,
     }
+
+
+mesh_config_cache = MeshConfigCache(
+    revalidate_seconds=global_config.service_mesh_revalidate_seconds,
+    get_blob_id=get_mesh_config_blob_id,
+)
+qps_cache = QpsCache(ttl_seconds=global_config.service_mesh_qps_ttl_seconds)
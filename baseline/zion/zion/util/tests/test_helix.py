@@ -0,0 +1,99 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+import jwt
+
+from zion.config import global_config
+from zion.util.helix import (
+    HelixToken,
+    HelixTokenManager,
+    get_token_expiry,
+    invalidate_helix_token_on_unauthorized,
+)
+
+
+class FakeHelix:
+    def __init__(self, lifetime_seconds: float) -> None:
+        self.lifetime_seconds = lifetime_seconds
+        self.exchanges = 0
+        self.exchanged = Event()
+
+    def exchange_token(self) -> HelixToken:
+        self.exchanges += 1
+        # slow enough for concurrent callers to pile up on the refresh
+        time.sleep(0.1)
+        self.exchanged.set()
+        return HelixToken(
+            concedo_token=f"concedo-{self.exchanges}",
+            helix_token=f"helix-{self.exchanges}",
+            expires_at=time.time() + self.lifetime_seconds,
+        )
+
+
+def test_get_token_expiry() -> None:
+    expires_at = int(time.time()) + 3600
+    token = jwt.encode({"exp": expires_at}, "secret" * 8, "HS256")
+    assert get_token_expiry(token) == expires_at
+    # not a jwt, it lives for the default ttl
+    assert get_token_expiry("opaque") >= (
+        time.time() + global_config.helix_token_default_ttl_seconds - 1
+    )
+
+
+@patch("zion.util.helix.statsd")
+def test_helix_token_manager_caches_token_with_single_flight_refresh(
+    mock_statsd: object,
+) -> None:
+    helix = FakeHelix(lifetime_seconds=3600)
+    helix_token_manager = HelixTokenManager(
+        expiry_margin_seconds=60,
+        refresh_ahead_seconds=600,
+        exchange_token=helix.exchange_token,
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: helix_token_manager.get_token(), range(8)))
+
+    assert helix.exchanges == 1
+    assert {token.helix_token for token in tokens} == {"helix-1"}
+    assert helix_token_manager.get_token() == tokens[0]
+    mock_statsd.track_count.assert_any_call(
+        metric="helix_token", tags=["result:refresh"]
+    )
+    mock_statsd.track_count.assert_any_call(metric="helix_token", tags=["result:hit"])
+
+    # an expired token is refreshed
+    helix_token_manager.invalidate()
+    assert helix_token_manager.get_token() not in tokens
+    assert helix.exchanges == 2  # noqa: PLR2004
+
+
+def test_helix_token_manager_refreshes_ahead_of_expiry() -> None:
+    # within the refresh ahead window right away, but still valid
+    helix = FakeHelix(lifetime_seconds=300)
+    helix_token_manager = HelixTokenManager(
+        expiry_margin_seconds=60,
+        refresh_ahead_seconds=600,
+        exchange_token=helix.exchange_token,
+    )
+
+    with patch("zion.util.helix.statsd"):
+        first_token = helix_token_manager.get_token()
+        helix.exchanged.clear()
+
+        # the cached token is served while it is refreshed in the background
+        assert helix_token_manager.get_token() == first_token
+        assert helix.exchanged.wait(timeout=5)
+        helix_token_manager._background_refresh.join(timeout=5)  # noqa: SLF001
+        assert helix_token_manager.get_token() != first_token
+
+
+def test_invalidate_helix_token_on_unauthorized() -> None:
+    with patch("zion.util.helix.helix_token_manager") as mock_helix_token_manager:
+        invalidate_helix_token_on_unauthorized(MagicMock(status_code=200))
+        mock_helix_token_manager.invalidate.assert_not_called()
+
+        invalidate_helix_token_on_unauthorized(MagicMock(status_code=401))
+        mock_helix_token_manager.invalidate.assert_called_once()
@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import requests
+import requests_mock
+
+from zion.util.http_client.async_client import AsyncHttpClient
+from zion.util.http_client.base_class import RETRY_STATUS_CODES, HttpClient
+
+POOL_MAXSIZE = 5
+
+
+def test_http_client_reuses_pooled_session() -> None:
+    http_client = HttpClient(
+        name="test", base_url="http://upstream", pool_maxsize=POOL_MAXSIZE
+    )
+    adapter = http_client.session.get_adapter("http://upstream")
+    assert adapter._pool_maxsize == POOL_MAXSIZE  # noqa: SLF001
+    assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+
+    with requests_mock.Mocker(session=http_client.session) as m:
+        m.get("http://upstream/search?q=zion", json={"results": []})
+        with http_client.get_session() as session:
+            assert session is http_client.session
+            assert http_client.get(session, "/search", params={"q": "zion"}) == {
+                "results": []
+            }
+        # the session is not closed by get_session
+        with http_client.get_session() as session:
+            assert session is http_client.session
+        assert m.last_request.timeout == http_client.timeout_seconds
+
+
+def test_http_client_tracks_latency_per_endpoint() -> None:
+    http_client = HttpClient(name="test", base_url="http://upstream")
+
+    with (
+        requests_mock.Mocker(session=http_client.session) as m,
+        patch("zion.util.http_client.base_class.statsd") as mock_statsd,
+    ):
+        m.post(
+            "http://upstream/search/123?ref=main", status_code=requests.codes.not_found
+        )
+        response = http_client.request(
+            "post", "/search/123?ref=main", metric_endpoint="/search"
+        )
+        assert response.status_code == requests.codes.not_found
+        m.get("http://upstream/docs?ref=main", json={})
+        http_client.request("GET", "/docs?ref=main")
+
+    assert [
+        call.kwargs["tags"] for call in mock_statsd.track_elapsed.call_args_list
+    ] == [
+        ["service:test", "endpoint:/search", "method:POST", "status:404"],
+        ["service:test", "endpoint:/docs", "method:GET", "status:200"],
+    ]
+
+
+def test_async_http_client_pools_only_on_bound_event_loop() -> None:
+    async_http_client = AsyncHttpClient(
+        name="test",
+        base_url="http://upstream",
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={})),
+    )
+
+    async def serve() -> None:
+        async_http_client.bind_event_loop()
+        client = async_http_client.get_client()
+        assert await async_http_client.get("/search") == {}
+        assert async_http_client.get_client() is client
+        await async_http_client.aclose()
+        assert client.is_closed
+
+    async def request_from_other_loop() -> None:
+        # a loop that is not bound gets a client per request, closed with the request
+        assert async_http_client.get_client() is None
+        assert await async_http_client.get("/search") == {}
+
+    asyncio.run(serve())
+    asyncio.run(request_from_other_loop())
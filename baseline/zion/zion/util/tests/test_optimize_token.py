@@ -1,3 +1,6 @@
+import time
+from unittest.mock import patch
+
 from langchain.schema import AIMessage, HumanMessage, SystemMessage
 from langchain_core.documents import Document
 from langchain_core.messages import (
@@ -12,6 +15,7 @@ from zion.util.gpt import (
     get_model_token_limit,
 )
 from zion.util.optimize_token import (
+    MessageTokenCounter,
     OptimizeDocumentResultToken,
     OptimizeMessageToken,
     is_contain_function_call,
@@ -275,3 +279,102 @@ def test_optimize_message_token() -> None:
     messages_returned = optimize_message_token.optimize_token(messages=messages)
 
     assert messages_returned == message_expected
+
+
+def create_long_chat_history(turns: int) -> list[BaseMessage]:
+    """Chat history where every turn searched, with a large tool output."""
+    messages: list[BaseMessage] = [SystemMessage(content="You are TI Bot")]
+    for turn in range(turns):
+        messages += [
+            HumanMessage(content=f"What is service {turn}?"),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "glean_search",
+                        "args": {"query": f"service {turn}"},
+                        "id": f"call-{turn}",
+                    }
+                ],
+            ),
+            ToolMessage(
+                content=" ".join([f"service {turn} document"] * 500),
+                name="glean_search",
+                tool_call_id=f"call-{turn}",
+            ),
+            AIMessage(content=f"Service {turn} is a grab kit service."),
+        ]
+    return messages
+
+
+def test_message_token_counter_matches_get_num_tokens_from_messages() -> None:
+    model_name = GrabGPTChatModelEnum.AZURE_GPT4O
+    model = ChatGrabGPT(
+        model=model_name,
+        api_key=global_config.openai_api_key,
+        base_url=global_config.openai_endpoint,
+    )
+    message_token_counter = MessageTokenCounter(max_size=100)
+    messages = create_long_chat_history(turns=3)
+
+    for end in range(len(messages) + 1):
+        assert message_token_counter.get_num_tokens_from_messages(
+            model, messages[:end]
+        ) == model.get_num_tokens_from_messages(messages[:end])
+
+    # a message changed in place is counted again
+    messages[3].content = "shortened"
+    assert message_token_counter.get_num_tokens_from_messages(
+        model, messages
+    ) == model.get_num_tokens_from_messages(messages)
+
+
+def test_optimize_message_token_long_chat_history_benchmark() -> None:
+    model_name = GrabGPTChatModelEnum.AZURE_GPT4O
+    model = ChatGrabGPT(
+        model=model_name,
+        api_key=global_config.openai_api_key,
+        base_url=global_config.openai_endpoint,
+    )
+    optimize_message_token = OptimizeMessageToken(
+        chat_open_ai=model, max_token=get_model_token_limit(model_name)
+    )
+    messages = create_long_chat_history(turns=200)
+    tokenized_messages = []
+    get_num_tokens_from_messages = ChatGrabGPT.get_num_tokens_from_messages
+
+    def count_tokenized_messages(
+        chat_open_ai: ChatGrabGPT, messages: list[BaseMessage]
+    ) -> int:
+        tokenized_messages.extend(messages)
+        return get_num_tokens_from_messages(chat_open_ai, messages)
+
+    with (
+        patch(
+            "zion.util.optimize_token.message_token_counter",
+            MessageTokenCounter(max_size=len(messages) * 2),
+        ),
+        patch.object(
+            ChatGrabGPT, "get_num_tokens_from_messages", count_tokenized_messages
+        ),
+    ):
+        start_time = time.perf_counter()
+        optimized_messages = optimize_message_token.optimize_token(messages=messages)
+        cold_seconds = time.perf_counter() - start_time
+        cold_tokenized_messages = len(tokenized_messages)
+
+        # the next turn of the same conversation only tokenizes its new messages
+        start_time = time.perf_counter()
+        optimize_message_token.optimize_token(
+            messages=[*messages, HumanMessage(content="What is TI Bot?")]
+        )
+        warm_seconds = time.perf_counter() - start_time
+
+    print(  # noqa: T201
+        f"optimize token of {len(messages)} messages: cold {cold_seconds:.3f}s, warm {warm_seconds:.3f}s"
+    )
+    # every message is tokenized once, instead of once per message kept
+    assert cold_tokenized_messages <= len(messages)
+    assert len(tokenized_messages) - cold_tokenized_messages == 1
+    assert optimized_messages[-1] == messages[-1]
+    assert len(optimized_messages) < len(messages)
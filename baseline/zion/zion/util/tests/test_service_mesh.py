@@ -0,0 +1,151 @@
+import base64
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+from zion.util.service_mesh import (
+    MeshConfigCache,
+    QpsCache,
+    get_mesh_config_blob_id,
+    get_service_mesh,
+)
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+MESH_CONFIGS = {
+    "smi-inbound-config.yaml": {"downstreams": ["food-cart-outbound", "grab-pay"]},
+    "smi-outbound-config.yaml": {"upstreams": [{"name": "food-offers-grpc"}]},
+}
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        status_code: int,
+        body: Any = None,  # noqa: ANN401
+        headers: dict | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.text = str(body)
+
+    def json(self) -> Any:  # noqa: ANN401
+        return self.body
+
+
+class FakeGitlab:
+    def __init__(self, latency_seconds: float = 0) -> None:
+        self.latency_seconds = latency_seconds
+        self.blob_id = "blob-1"
+        self.requests: list[str] = []
+        self.request_ids: list[str | None] = []
+
+    def request(self, method: str, endpoint: str, **_: Any) -> FakeResponse:  # noqa: ANN401
+        self.requests.append(method)
+        self.request_ids.append(request_id.get())
+        time.sleep(self.latency_seconds)
+        mesh_config = next(
+            config for name, config in MESH_CONFIGS.items() if name in endpoint
+        )
+        if method == "HEAD":
+            return FakeResponse(200, headers={"X-Gitlab-Blob-Id": self.blob_id})
+        return FakeResponse(
+            200,
+            {
+                "blob_id": self.blob_id,
+                "content": base64.b64encode(yaml.dump(mesh_config).encode()).decode(),
+            },
+        )
+
+
+class FakeDatadog:
+    def __init__(self, latency_seconds: float = 0) -> None:
+        self.latency_seconds = latency_seconds
+        self.queries = 0
+        self.request_ids: list[str | None] = []
+
+    def get_upstream_qps(self, *_: str) -> dict:
+        self.queries += 1
+        self.request_ids.append(request_id.get())
+        time.sleep(self.latency_seconds)
+        return {"food-offers": 12.5}
+
+    def get_downstream_qps(self, *_: str) -> dict:
+        self.queries += 1
+        self.request_ids.append(request_id.get())
+        time.sleep(self.latency_seconds)
+        return {"food-cart": 30.0, "grab-pay": 5.0}
+
+
+@contextmanager
+def fake_backends(
+    gitlab: FakeGitlab, datadog: FakeDatadog, revalidate_seconds: float
+) -> Iterator[None]:
+    with (
+        patch("zion.util.service_mesh.statsd", MagicMock()),
+        patch("zion.util.service_mesh.gitlab_http_client", gitlab),
+        patch("zion.util.service_mesh.get_upstream_qps", datadog.get_upstream_qps),
+        patch("zion.util.service_mesh.get_downstream_qps", datadog.get_downstream_qps),
+        patch(
+            "zion.util.service_mesh.mesh_config_cache",
+            MeshConfigCache(
+                revalidate_seconds=revalidate_seconds,
+                get_blob_id=get_mesh_config_blob_id,
+            ),
+        ),
+        patch("zion.util.service_mesh.qps_cache", QpsCache(ttl_seconds=60)),
+    ):
+        yield
+
+
+def get_service_mesh_with_fake_backends(
+    gitlab: FakeGitlab, datadog: FakeDatadog, revalidate_seconds: float
+) -> dict:
+    with fake_backends(gitlab, datadog, revalidate_seconds):
+        cold_mesh = get_service_mesh("food-order", "prd")
+        warm_mesh = get_service_mesh("food-order", "prd")
+
+    assert warm_mesh == cold_mesh
+    return cold_mesh
+
+
+def test_get_service_mesh_serves_warm_calls_from_cache() -> None:
+    gitlab, datadog = FakeGitlab(), FakeDatadog()
+
+    mesh = get_service_mesh_with_fake_backends(gitlab, datadog, revalidate_seconds=60)
+
+    assert mesh["result"]["upstreams"] == ["food-offers"]
+    assert mesh["result"]["downstreams"] == ["food-cart", "grab-pay"]
+    assert mesh["result"]["downstream_qps"] == {"food-cart": 30.0, "grab-pay": 5.0}
+    # the cold call downloads both files and queries both QPS once, the warm call is served from the caches
+    assert gitlab.requests == ["GET", "GET"]
+    assert datadog.queries == 2  # noqa: PLR2004
+
+
+def test_get_service_mesh_revalidates_mesh_config_by_blob_id() -> None:
+    gitlab, datadog = FakeGitlab(), FakeDatadog()
+
+    get_service_mesh_with_fake_backends(gitlab, datadog, revalidate_seconds=0)
+
+    # unchanged files are only checked with a HEAD request
+    assert gitlab.requests == ["GET", "GET", "HEAD", "HEAD"]
+    assert datadog.queries == 2  # noqa: PLR2004
+
+
+def test_get_service_mesh_keeps_the_caller_context() -> None:
+    gitlab, datadog = FakeGitlab(), FakeDatadog()
+
+    token = request_id.set("request-1")
+    try:
+        get_service_mesh_with_fake_backends(gitlab, datadog, revalidate_seconds=60)
+    finally:
+        request_id.reset(token)
+
+    # the worker threads see the contextvars of the request
+    assert gitlab.request_ids == ["request-1", "request-1"]
+    assert datadog.request_ids == ["request-1", "request-1"]